@@ -0,0 +1,63 @@
+"""Time taken by `import narwhals`, see the lazy imports in `narwhals/__init__.py`.
+
+Each import runs in a fresh interpreter. Run with [asv](https://asv.readthedocs.io)
+(see `benchmarks/overhead.py`), or without it:
+
+    python -m benchmarks.imports
+
+which prints the best time of each import, without the time the interpreter
+takes to start.
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+import timeit
+
+IMPORTS = {
+    "narwhals": "import narwhals",
+    "narwhals.stable.v1": "import narwhals.stable.v1",
+    # Accessing a public object imports the modules it needs.
+    "narwhals.DataFrame": "import narwhals; narwhals.DataFrame",
+}
+
+
+def timeraw_import_narwhals() -> str:
+    return IMPORTS["narwhals"]
+
+
+def timeraw_import_stable_v1() -> str:
+    return IMPORTS["narwhals.stable.v1"]
+
+
+def timeraw_import_dataframe() -> str:
+    return IMPORTS["narwhals.DataFrame"]
+
+
+def _best_of(code: str, repeat: int) -> float:
+    return min(
+        timeit.repeat(
+            lambda: subprocess.run([sys.executable, "-c", code], check=True),  # noqa: S603
+            repeat=repeat,
+            number=1,
+        )
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    startup = _best_of("pass", args.repeat)
+    print(f"{'import':<20} {'time (ms)':>10}")  # noqa: T201
+    for name, code in IMPORTS.items():
+        seconds = _best_of(code, args.repeat) - startup
+        print(f"{name:<20} {seconds * 1e3:>10.1f}")  # noqa: T201
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,352 @@
+"""Overhead of calling `DataFrame`, `Series` and `Expr` methods through Narwhals.
+
+Each operation is timed through Narwhals and as the equivalent direct call on
+the native object, for each backend and input size. Run with
+[asv](https://asv.readthedocs.io), from the root of the repository:
+
+    asv continuous --factor 1.1 --split main HEAD
+
+which flags any benchmark which got more than 10% slower. Or, without asv:
+
+    python -m benchmarks.overhead --sizes 10 --max-overhead-us 50
+
+which prints the overhead of each operation, and exits with an error if any of
+them exceeds the given number of microseconds.
+"""
+
+# The calls in `OPERATIONS` all take the same arguments, used or not.
+# ruff: noqa: ARG005
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from typing import Any
+from typing import Callable
+from typing import ClassVar
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pyarrow.compute as pc
+
+import narwhals.stable.v1 as nw
+
+BACKENDS = ["pandas", "polars", "pyarrow"]
+SIZES = [10, 100_000, 10_000_000]
+
+
+def make_data(size: int) -> dict[str, Any]:
+    rng = np.random.default_rng(0)
+    return {"a": np.arange(size) % 100, "b": rng.random(size)}
+
+
+def make_other() -> dict[str, Any]:
+    return {"a": np.arange(100), "d": np.arange(100) * 2.0}
+
+
+CONSTRUCTORS: dict[str, Callable[[dict[str, Any]], Any]] = {
+    "pandas": pd.DataFrame,
+    "polars": pl.DataFrame,
+    "pyarrow": pa.table,
+}
+
+
+# Operation name -> (Narwhals call, {backend: equivalent native call}). Calls take
+# a frame (Narwhals or native), its `b` column, and a small frame to join with.
+OPERATIONS: dict[str, tuple[Callable[..., Any], dict[str, Callable[..., Any]]]] = {
+    "DataFrame.select": (
+        lambda df, s, other: df.select("a", "b"),
+        {
+            "pandas": lambda df, s, other: df[["a", "b"]],
+            "polars": lambda df, s, other: df.select("a", "b"),
+            "pyarrow": lambda df, s, other: df.select(["a", "b"]),
+        },
+    ),
+    "DataFrame.with_columns": (
+        lambda df, s, other: df.with_columns(c=nw.col("b") * 2),
+        {
+            "pandas": lambda df, s, other: df.assign(c=df["b"] * 2),
+            "polars": lambda df, s, other: df.with_columns(c=pl.col("b") * 2),
+            "pyarrow": lambda df, s, other: df.append_column(
+                "c", pc.multiply(df["b"], 2)
+            ),
+        },
+    ),
+    "DataFrame.filter": (
+        lambda df, s, other: df.filter(nw.col("a") > 50),
+        {
+            "pandas": lambda df, s, other: df[df["a"] > 50],
+            "polars": lambda df, s, other: df.filter(pl.col("a") > 50),
+            "pyarrow": lambda df, s, other: df.filter(pc.greater(df["a"], 50)),
+        },
+    ),
+    "DataFrame.sort": (
+        lambda df, s, other: df.sort("b"),
+        {
+            "pandas": lambda df, s, other: df.sort_values("b"),
+            "polars": lambda df, s, other: df.sort("b"),
+            "pyarrow": lambda df, s, other: df.sort_by("b"),
+        },
+    ),
+    "DataFrame.head": (
+        lambda df, s, other: df.head(5),
+        {
+            "pandas": lambda df, s, other: df.head(5),
+            "polars": lambda df, s, other: df.head(5),
+            "pyarrow": lambda df, s, other: df.slice(0, 5),
+        },
+    ),
+    "DataFrame.rename": (
+        lambda df, s, other: df.rename({"a": "x"}),
+        {
+            "pandas": lambda df, s, other: df.rename(columns={"a": "x"}),
+            "polars": lambda df, s, other: df.rename({"a": "x"}),
+            "pyarrow": lambda df, s, other: df.rename_columns(["x", "b"]),
+        },
+    ),
+    "DataFrame.drop": (
+        lambda df, s, other: df.drop("b"),
+        {
+            "pandas": lambda df, s, other: df.drop(columns="b"),
+            "polars": lambda df, s, other: df.drop("b"),
+            "pyarrow": lambda df, s, other: df.drop(["b"]),
+        },
+    ),
+    "DataFrame.group_by": (
+        lambda df, s, other: df.group_by("a").agg(nw.col("b").sum()),
+        {
+            "pandas": lambda df, s, other: df.groupby("a", sort=False, dropna=False)
+            .agg({"b": "sum"})
+            .reset_index(),
+            "polars": lambda df, s, other: df.group_by("a").agg(pl.col("b").sum()),
+            "pyarrow": lambda df, s, other: df.group_by("a").aggregate([("b", "sum")]),
+        },
+    ),
+    "DataFrame.join": (
+        lambda df, s, other: df.join(other, left_on="a", right_on="a"),
+        {
+            "pandas": lambda df, s, other: df.merge(other, on="a"),
+            "polars": lambda df, s, other: df.join(other, on="a"),
+            "pyarrow": lambda df, s, other: df.join(other, "a"),
+        },
+    ),
+    "DataFrame.__getitem__": (
+        lambda df, s, other: df["b"],
+        {
+            "pandas": lambda df, s, other: df["b"],
+            "polars": lambda df, s, other: df["b"],
+            "pyarrow": lambda df, s, other: df["b"],
+        },
+    ),
+    "DataFrame.schema": (
+        lambda df, s, other: df.schema,
+        {
+            "pandas": lambda df, s, other: df.dtypes,
+            "polars": lambda df, s, other: df.schema,
+            "pyarrow": lambda df, s, other: df.schema,
+        },
+    ),
+    "Series.sum": (
+        lambda df, s, other: s.sum(),
+        {
+            "pandas": lambda df, s, other: s.sum(),
+            "polars": lambda df, s, other: s.sum(),
+            "pyarrow": lambda df, s, other: pc.sum(s),
+        },
+    ),
+    "Series.mean": (
+        lambda df, s, other: s.mean(),
+        {
+            "pandas": lambda df, s, other: s.mean(),
+            "polars": lambda df, s, other: s.mean(),
+            "pyarrow": lambda df, s, other: pc.mean(s),
+        },
+    ),
+    "Series.is_null": (
+        lambda df, s, other: s.is_null(),
+        {
+            "pandas": lambda df, s, other: s.isna(),
+            "polars": lambda df, s, other: s.is_null(),
+            "pyarrow": lambda df, s, other: pc.is_null(s),
+        },
+    ),
+    "Series.__add__": (
+        lambda df, s, other: s + 1,
+        {
+            "pandas": lambda df, s, other: s + 1,
+            "polars": lambda df, s, other: s + 1,
+            "pyarrow": lambda df, s, other: pc.add(s, 1),
+        },
+    ),
+    "Series.cast": (
+        lambda df, s, other: s.cast(nw.Float32),
+        {
+            "pandas": lambda df, s, other: s.astype("float32"),
+            "polars": lambda df, s, other: s.cast(pl.Float32),
+            "pyarrow": lambda df, s, other: s.cast(pa.float32()),
+        },
+    ),
+    "Series.to_numpy": (
+        lambda df, s, other: s.to_numpy(),
+        {
+            "pandas": lambda df, s, other: s.to_numpy(),
+            "polars": lambda df, s, other: s.to_numpy(),
+            "pyarrow": lambda df, s, other: s.to_numpy(),
+        },
+    ),
+    # Only builds the expression, which pandas and PyArrow have no equivalent of.
+    "Expr.build": (
+        lambda df, s, other: nw.col("b").abs().alias("c") > 1,
+        {
+            "pandas": lambda df, s, other: None,
+            "polars": lambda df, s, other: pl.col("b").abs().alias("c") > 1,
+            "pyarrow": lambda df, s, other: None,
+        },
+    ),
+    "Expr.sum": (
+        lambda df, s, other: df.select(nw.col("b").sum()),
+        {
+            "pandas": lambda df, s, other: pd.DataFrame({"b": [df["b"].sum()]}),
+            "polars": lambda df, s, other: df.select(pl.col("b").sum()),
+            "pyarrow": lambda df, s, other: pa.table({"b": [pc.sum(df["b"])]}),
+        },
+    ),
+    "Expr.abs": (
+        lambda df, s, other: df.select(nw.col("b").abs()),
+        {
+            "pandas": lambda df, s, other: df[["b"]].abs(),
+            "polars": lambda df, s, other: df.select(pl.col("b").abs()),
+            "pyarrow": lambda df, s, other: pa.table({"b": pc.abs(df["b"])}),
+        },
+    ),
+    "Expr.is_between": (
+        lambda df, s, other: df.select(nw.col("b").is_between(0.25, 0.75)),
+        {
+            "pandas": lambda df, s, other: df[["b"]].assign(
+                b=df["b"].between(0.25, 0.75)
+            ),
+            "polars": lambda df, s, other: df.select(pl.col("b").is_between(0.25, 0.75)),
+            "pyarrow": lambda df, s, other: pa.table(
+                {
+                    "b": pc.and_(
+                        pc.greater_equal(df["b"], 0.25), pc.less_equal(df["b"], 0.75)
+                    )
+                }
+            ),
+        },
+    ),
+}
+
+
+class Overhead:
+    """Time each operation through Narwhals (`time_narwhals`) and natively."""
+
+    params: ClassVar = (BACKENDS, SIZES, list(OPERATIONS))
+    param_names: ClassVar = ["backend", "size", "operation"]
+    # Inputs with 10 million rows take a while to build.
+    timeout = 300
+
+    def setup(self, backend: str, size: int, operation: str) -> None:
+        native = CONSTRUCTORS[backend](make_data(size))
+        native_other = CONSTRUCTORS[backend](make_other())
+        self.native_args = (native, native["b"], native_other)
+        df = nw.from_native(native, eager_only=True)
+        self.args = (df, df["b"], nw.from_native(native_other, eager_only=True))
+        self.narwhals_call, native_calls = OPERATIONS[operation]
+        self.native_call = native_calls[backend]
+        try:
+            self.narwhals_call(*self.args)
+        except (AttributeError, NotImplementedError) as exc:
+            # Not supported by this backend yet: asv skips the benchmark.
+            raise NotImplementedError(str(exc)) from exc
+
+    def time_narwhals(self, *_: Any) -> None:
+        self.narwhals_call(*self.args)
+
+    def time_native(self, *_: Any) -> None:
+        self.native_call(*self.native_args)
+
+
+class Wrapping:
+    """Time converting native objects to Narwhals ones, and back."""
+
+    params: ClassVar = (BACKENDS, [10])
+    param_names: ClassVar = ["backend", "size"]
+
+    def setup(self, backend: str, size: int) -> None:
+        self.native = CONSTRUCTORS[backend](make_data(size))
+        self.df = nw.from_native(self.native, eager_only=True)
+
+    def time_from_native(self, *_: Any) -> None:
+        nw.from_native(self.native, eager_only=True)
+
+    def time_to_native(self, *_: Any) -> None:
+        nw.to_native(self.df)
+
+    def time_from_native_series(self, *_: Any) -> None:
+        nw.from_native(self.native["b"], series_only=True)
+
+
+def _best_of(call: Callable[..., Any], args: tuple[Any, ...]) -> float:
+    timer = timeit.Timer(lambda: call(*args))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=5, number=number)) / number
+
+
+def overhead(backend: str, size: int, operation: str) -> tuple[float, float] | None:
+    """Best time (in seconds) of `operation` through Narwhals, and natively.
+
+    Returns `None` if the backend doesn't support the operation.
+    """
+    benchmark = Overhead()
+    try:
+        benchmark.setup(backend, size, operation)
+    except NotImplementedError:
+        return None
+    return (
+        _best_of(benchmark.narwhals_call, benchmark.args),
+        _best_of(benchmark.native_call, benchmark.native_args),
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS, default=BACKENDS)
+    parser.add_argument("--sizes", nargs="+", type=int, default=[10])
+    parser.add_argument("--operations", nargs="+", choices=list(OPERATIONS))
+    parser.add_argument(
+        "--max-overhead-us",
+        type=float,
+        help="Fail if Narwhals adds more than this many microseconds to any operation.",
+    )
+    args = parser.parse_args(argv)
+
+    print(  # noqa: T201
+        f"{'backend':<8} {'size':>10} {'operation':<24} "
+        f"{'native (us)':>12} {'narwhals (us)':>14} {'overhead (us)':>14}"
+    )
+    failed = []
+    for backend in args.backends:
+        for size in args.sizes:
+            for operation in args.operations or OPERATIONS:
+                result = overhead(backend, size, operation)
+                if result is None:
+                    print(f"{backend:<8} {size:>10} {operation:<24} {'unsupported':>12}")  # noqa: T201
+                    continue
+                narwhals_us, native_us = (t * 1e6 for t in result)
+                extra_us = narwhals_us - native_us
+                flag = ""
+                if args.max_overhead_us is not None and extra_us > args.max_overhead_us:
+                    failed.append((backend, size, operation))
+                    flag = "  <-- above threshold"
+                print(  # noqa: T201
+                    f"{backend:<8} {size:>10} {operation:<24} "
+                    f"{native_us:>12.1f} {narwhals_us:>14.1f} {extra_us:>14.1f}{flag}"
+                )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
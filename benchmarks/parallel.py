@@ -0,0 +1,106 @@
+"""Speedup of partitioning pandas operations over processes, see `nw.Config`.
+
+Each operation is timed with `nw.Config(n_processes=...)` for several numbers
+of processes, the first of which (`1`) runs sequentially. Run with
+[asv](https://asv.readthedocs.io) (see `benchmarks/overhead.py`), or without it:
+
+    python -m benchmarks.parallel --n-processes 1 2 4
+
+which prints the time of each operation and its speedup over sequential
+execution. Speedups are bounded by the number of available CPU cores.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import timeit
+import warnings
+from typing import Any
+from typing import Callable
+from typing import ClassVar
+
+import numpy as np
+import pandas as pd
+
+import narwhals.stable.v1 as nw
+
+N_ROWS = 1_000_000
+N_GROUPS = 10_000
+
+
+def make_data() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "key": rng.integers(0, N_GROUPS, N_ROWS),
+            "a": rng.random(N_ROWS),
+            "s": rng.choice(["foo", "bar", "baz"], N_ROWS),
+        }
+    )
+
+
+def _complex_group_by(df: nw.DataFrame[Any]) -> Any:
+    with warnings.catch_warnings():
+        # The warning about calling a Python function on each group is the point.
+        warnings.simplefilter("ignore", UserWarning)
+        return df.group_by("key").agg((nw.col("a") * 2).sum())
+
+
+OPERATIONS: dict[str, Callable[[nw.DataFrame[Any]], Any]] = {
+    # Python function called on each group: partitions of the groups.
+    "group_by.apply": _complex_group_by,
+    # Partial aggregations of partitions of rows.
+    "group_by.mean": lambda df: df.group_by("key").agg(nw.col("a").mean()),
+    # Elementwise: partitions of rows.
+    "with_columns": lambda df: df.with_columns(
+        nw.col("s").str.to_uppercase(), b=nw.col("a") * 2
+    ),
+}
+
+
+class Parallel:
+    params: ClassVar = (list(OPERATIONS), [1, 2, 4])
+    param_names: ClassVar = ["operation", "n_processes"]
+
+    def setup(self, operation: str, n_processes: int) -> None:
+        self.df = nw.from_native(make_data(), eager_only=True)
+        self.call = OPERATIONS[operation]
+        self.n_processes = n_processes
+
+    def time_operation(self, *_: Any) -> None:
+        with nw.Config(n_processes=self.n_processes):
+            self.call(self.df)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--operations", nargs="+", choices=list(OPERATIONS))
+    parser.add_argument("--n-processes", nargs="+", type=int, default=[1, 2, 4])
+    args = parser.parse_args(argv)
+
+    n_cores = (
+        len(os.sched_getaffinity(0))
+        if hasattr(os, "sched_getaffinity")
+        else os.cpu_count()
+    )
+    print(f"{n_cores} CPU cores available")  # noqa: T201
+    print(f"{'operation':<16} {'n_processes':>11} {'time (s)':>9} {'speedup':>8}")  # noqa: T201
+    df = nw.from_native(make_data(), eager_only=True)
+    for operation in args.operations or OPERATIONS:
+        call = OPERATIONS[operation]
+        sequential = None
+        for n_processes in args.n_processes:
+            with nw.Config(n_processes=n_processes):
+                seconds = min(timeit.repeat(lambda: call(df), repeat=3, number=1))  # noqa: B023
+            sequential = sequential or seconds
+            print(  # noqa: T201
+                f"{operation:<16} {n_processes:>11} {seconds:>9.3f} "
+                f"{sequential / seconds:>7.2f}x"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,57 +1,171 @@
-from narwhals import selectors
-from narwhals import stable
-from narwhals.dataframe import DataFrame
-from narwhals.dataframe import LazyFrame
-from narwhals.dtypes import Boolean
-from narwhals.dtypes import Categorical
-from narwhals.dtypes import Date
-from narwhals.dtypes import Datetime
-from narwhals.dtypes import Duration
-from narwhals.dtypes import Enum
-from narwhals.dtypes import Float32
-from narwhals.dtypes import Float64
-from narwhals.dtypes import Int8
-from narwhals.dtypes import Int16
-from narwhals.dtypes import Int32
-from narwhals.dtypes import Int64
-from narwhals.dtypes import Object
-from narwhals.dtypes import String
-from narwhals.dtypes import UInt8
-from narwhals.dtypes import UInt16
-from narwhals.dtypes import UInt32
-from narwhals.dtypes import UInt64
-from narwhals.dtypes import Unknown
-from narwhals.expression import Expr
-from narwhals.expression import all
-from narwhals.expression import all_horizontal
-from narwhals.expression import col
-from narwhals.expression import len
-from narwhals.expression import lit
-from narwhals.expression import max
-from narwhals.expression import mean
-from narwhals.expression import min
-from narwhals.expression import sum
-from narwhals.expression import sum_horizontal
-from narwhals.functions import concat
-from narwhals.functions import get_level
-from narwhals.functions import show_versions
-from narwhals.schema import Schema
-from narwhals.series import Series
-from narwhals.translate import from_native
-from narwhals.translate import get_native_namespace
-from narwhals.translate import narwhalify
-from narwhals.translate import to_native
-from narwhals.utils import is_ordered_categorical
-from narwhals.utils import maybe_align_index
-from narwhals.utils import maybe_convert_dtypes
-from narwhals.utils import maybe_set_index
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from narwhals import diagnostics
+    from narwhals import selectors
+    from narwhals import stable
+    from narwhals.config import Config
+    from narwhals.dataframe import DataFrame
+    from narwhals.dataframe import LazyFrame
+    from narwhals.dtypes import Boolean
+    from narwhals.dtypes import Categorical
+    from narwhals.dtypes import Date
+    from narwhals.dtypes import Datetime
+    from narwhals.dtypes import Duration
+    from narwhals.dtypes import Enum
+    from narwhals.dtypes import Float32
+    from narwhals.dtypes import Float64
+    from narwhals.dtypes import Int8
+    from narwhals.dtypes import Int16
+    from narwhals.dtypes import Int32
+    from narwhals.dtypes import Int64
+    from narwhals.dtypes import Object
+    from narwhals.dtypes import String
+    from narwhals.dtypes import UInt8
+    from narwhals.dtypes import UInt16
+    from narwhals.dtypes import UInt32
+    from narwhals.dtypes import UInt64
+    from narwhals.dtypes import Unknown
+    from narwhals.expression import Expr
+    from narwhals.expression import all
+    from narwhals.expression import all_horizontal
+    from narwhals.expression import col
+    from narwhals.expression import len
+    from narwhals.expression import lit
+    from narwhals.expression import max
+    from narwhals.expression import mean
+    from narwhals.expression import min
+    from narwhals.expression import sum
+    from narwhals.expression import sum_horizontal
+    from narwhals.functions import concat
+    from narwhals.functions import from_shared_memory
+    from narwhals.functions import get_level
+    from narwhals.functions import read_ipc
+    from narwhals.functions import scan_csv
+    from narwhals.functions import scan_ipc
+    from narwhals.functions import scan_parquet
+    from narwhals.functions import show_versions
+    from narwhals.profiling import profile
+    from narwhals.schema import Schema
+    from narwhals.series import Series
+    from narwhals.translate import from_native
+    from narwhals.translate import get_native_namespace
+    from narwhals.translate import narwhalify
+    from narwhals.translate import to_native
+    from narwhals.utils import is_ordered_categorical
+    from narwhals.utils import maybe_align_index
+    from narwhals.utils import maybe_convert_dtypes
+    from narwhals.utils import maybe_set_index
 
 __version__ = "1.1.2"
 
+# Public objects are only imported from their submodule when they're first
+# accessed (PEP 562), so that `import narwhals` doesn't need to load the
+# dataframe, series and expression modules. So are the submodules which used to
+# be imported by `import narwhals`, and so were available as its attributes.
+_LAZY_IMPORTS = {
+    "dataframe": "narwhals.dataframe",
+    "dependencies": "narwhals.dependencies",
+    "diagnostics": "narwhals.diagnostics",
+    "dtypes": "narwhals.dtypes",
+    "expression": "narwhals.expression",
+    "functions": "narwhals.functions",
+    "schema": "narwhals.schema",
+    "selectors": "narwhals.selectors",
+    "series": "narwhals.series",
+    "stable": "narwhals.stable",
+    "translate": "narwhals.translate",
+    "typing": "narwhals.typing",
+    "utils": "narwhals.utils",
+    "Config": "narwhals.config",
+    "DataFrame": "narwhals.dataframe",
+    "LazyFrame": "narwhals.dataframe",
+    "Boolean": "narwhals.dtypes",
+    "Categorical": "narwhals.dtypes",
+    "Date": "narwhals.dtypes",
+    "Datetime": "narwhals.dtypes",
+    "Duration": "narwhals.dtypes",
+    "Enum": "narwhals.dtypes",
+    "Float32": "narwhals.dtypes",
+    "Float64": "narwhals.dtypes",
+    "Int8": "narwhals.dtypes",
+    "Int16": "narwhals.dtypes",
+    "Int32": "narwhals.dtypes",
+    "Int64": "narwhals.dtypes",
+    "Object": "narwhals.dtypes",
+    "String": "narwhals.dtypes",
+    "UInt8": "narwhals.dtypes",
+    "UInt16": "narwhals.dtypes",
+    "UInt32": "narwhals.dtypes",
+    "UInt64": "narwhals.dtypes",
+    "Unknown": "narwhals.dtypes",
+    "Expr": "narwhals.expression",
+    "all": "narwhals.expression",
+    "all_horizontal": "narwhals.expression",
+    "col": "narwhals.expression",
+    "len": "narwhals.expression",
+    "lit": "narwhals.expression",
+    "max": "narwhals.expression",
+    "mean": "narwhals.expression",
+    "min": "narwhals.expression",
+    "sum": "narwhals.expression",
+    "sum_horizontal": "narwhals.expression",
+    "concat": "narwhals.functions",
+    "get_level": "narwhals.functions",
+    "from_shared_memory": "narwhals.functions",
+    "read_ipc": "narwhals.functions",
+    "scan_csv": "narwhals.functions",
+    "scan_ipc": "narwhals.functions",
+    "scan_parquet": "narwhals.functions",
+    "show_versions": "narwhals.functions",
+    "profile": "narwhals.profiling",
+    "Schema": "narwhals.schema",
+    "Series": "narwhals.series",
+    "from_native": "narwhals.translate",
+    "get_native_namespace": "narwhals.translate",
+    "narwhalify": "narwhals.translate",
+    "to_native": "narwhals.translate",
+    "is_ordered_categorical": "narwhals.utils",
+    "maybe_align_index": "narwhals.utils",
+    "maybe_convert_dtypes": "narwhals.utils",
+    "maybe_set_index": "narwhals.utils",
+}
+
+
+def __getattr__(name: str) -> Any:
+    from importlib import import_module
+
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        msg = f"module 'narwhals' has no attribute {name!r}"
+        raise AttributeError(msg) from None
+    if module_name == f"narwhals.{name}":
+        value = import_module(module_name)
+    else:
+        value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
+
+
 __all__ = [
+    "diagnostics",
     "selectors",
     "concat",
     "get_level",
+    "from_shared_memory",
+    "read_ipc",
+    "scan_csv",
+    "scan_ipc",
+    "scan_parquet",
     "to_native",
     "from_native",
     "is_ordered_categorical",
@@ -94,6 +208,8 @@ __all__ = [
     "Date",
     "narwhalify",
     "show_versions",
+    "profile",
     "stable",
     "Schema",
+    "Config",
 ]
@@ -9,11 +9,14 @@ from typing import overload
 
 from narwhals._arrow.utils import translate_dtype
 from narwhals._arrow.utils import validate_dataframe_comparand
+from narwhals._arrow.utils import write_ipc_file
+from narwhals._explain import note_strategy
 from narwhals._expression_parsing import evaluate_into_exprs
 from narwhals.dependencies import get_numpy
 from narwhals.dependencies import get_pyarrow
 from narwhals.dependencies import get_pyarrow_parquet
 from narwhals.utils import flatten
+from narwhals.utils import scale_bytes
 
 if TYPE_CHECKING:
     from typing_extensions import Self
@@ -26,6 +29,12 @@ if TYPE_CHECKING:
 
 
 class ArrowDataFrame:
+    __slots__ = (
+        "_native_dataframe",
+        "_implementation",
+        "_backend_version",
+    )
+
     # --- not in the spec ---
     def __init__(
         self, native_dataframe: Any, *, backend_version: tuple[int, ...]
@@ -35,9 +44,9 @@ class ArrowDataFrame:
         self._backend_version = backend_version
 
     def __narwhals_namespace__(self) -> ArrowNamespace:
-        from narwhals._arrow.namespace import ArrowNamespace
+        from narwhals._arrow.namespace import get_arrow_namespace
 
-        return ArrowNamespace(backend_version=self._backend_version)
+        return get_arrow_namespace(self._backend_version)
 
     def __native_namespace__(self) -> Any:
         return get_pyarrow()
@@ -161,8 +170,13 @@ class ArrowDataFrame:
                 self._native_dataframe.__class__.from_arrays([])
             )
         names = [s.name for s in new_series]
+        # Broadcast scalars (e.g. `nw.lit(1)` or `nw.col('a').sum()`) if any other
+        # expression returns a full column.
+        length = max(len(s) for s in new_series)
         pa = get_pyarrow()
-        df = pa.Table.from_arrays([s._native_series for s in new_series], names=names)
+        df = pa.Table.from_arrays(
+            [validate_dataframe_comparand(length, s) for s in new_series], names=names
+        )
         return self._from_native_dataframe(df)
 
     def with_columns(
@@ -229,6 +243,7 @@ class ArrowDataFrame:
         if how == "left":  # type: ignore[comparison-overlap]
             raise NotImplementedError
 
+        note_strategy("join: hash join (pyarrow.Table.join)")
         return self._from_native_dataframe(
             self._native_dataframe.join(
                 other._native_dataframe,
@@ -269,10 +284,40 @@ class ArrowDataFrame:
     def to_pandas(self) -> Any:
         return self._native_dataframe.to_pandas()
 
-    def to_numpy(self) -> Any:
-        import numpy as np
+    def to_arrow(self) -> Any:
+        return self._native_dataframe
 
-        return np.column_stack([col.to_numpy() for col in self._native_dataframe.columns])
+    def to_numpy(self, order: Literal["c", "fortran"] = "fortran") -> Any:
+        pa = get_pyarrow()
+        np = get_numpy()
+        df = self._native_dataframe
+
+        # Find the result dtype from the schema (as `col.to_numpy()` would return
+        # it), then fill a preallocated array chunk by chunk.
+        dtypes = []
+        for col in df.columns:
+            if col.null_count and pa.types.is_integer(col.type):
+                dtypes.append(np.dtype("float64"))
+            elif col.null_count and pa.types.is_boolean(col.type):
+                dtypes.append(np.dtype("object"))
+            else:
+                dtypes.append(pa.array([], col.type).to_numpy(zero_copy_only=False).dtype)
+        try:
+            dtype = np.result_type(*dtypes) if dtypes else np.dtype("float64")
+        except TypeError:
+            # e.g. datetimes and numbers
+            dtype = np.dtype("object")
+
+        result = np.empty(
+            (df.num_rows, df.num_columns), dtype=dtype, order="C" if order == "c" else "F"
+        )
+        for i, col in enumerate(df.columns):
+            start = 0
+            for chunk in col.chunks:
+                stop = start + len(chunk)
+                result[start:stop, i] = chunk.to_numpy(zero_copy_only=False)
+                start = stop
+        return result
 
     def to_dict(self, *, as_series: bool) -> Any:
         df = self._native_dataframe
@@ -288,20 +333,33 @@ class ArrowDataFrame:
         else:
             return {name: col.to_pylist() for name, col in names_and_values}
 
-    def with_row_index(self, name: str) -> Self:
+    def with_row_index(self, name: str, offset: int) -> Self:
         pa = get_pyarrow()
+        np = get_numpy()
         df = self._native_dataframe
 
-        row_indices = pa.array(range(df.num_rows))
-        return self._from_native_dataframe(df.append_column(name, row_indices))
+        # Number the rows chunk by chunk, following the existing chunk layout,
+        # so that the table doesn't need to be rechunked.
+        chunk_lengths = (
+            [len(chunk) for chunk in df.column(0).chunks]
+            if df.num_columns
+            else [df.num_rows]
+        )
+        bounds = np.cumsum([offset, *chunk_lengths])
+        row_indices = pa.chunked_array(
+            [np.arange(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])],
+            type=pa.int64(),
+        )
+        return self._from_native_dataframe(df.add_column(0, name, row_indices))
 
     def filter(
         self,
         *predicates: IntoArrowExpr,
     ) -> Self:
-        from narwhals._arrow.namespace import ArrowNamespace
+        from narwhals._arrow.namespace import get_arrow_namespace
 
-        plx = ArrowNamespace(backend_version=self._backend_version)
+        note_strategy("filter: boolean mask")
+        plx = get_arrow_namespace(self._backend_version)
         expr = plx.all_horizontal(*predicates)
         # Safety: all_horizontal's expression only returns a single column.
         mask = expr._call(self)[0]
@@ -346,6 +404,9 @@ class ArrowDataFrame:
         msg = "clone is not yet supported on PyArrow tables"
         raise NotImplementedError(msg)
 
+    def estimated_size(self, unit: str = "b") -> int | float:
+        return scale_bytes(self._native_dataframe.get_total_buffer_size(), unit)
+
     def is_empty(self: Self) -> bool:
         return self.shape[0] == 0
 
@@ -372,6 +433,9 @@ class ArrowDataFrame:
         new_cols = [mapping.get(c, c) for c in df.column_names]
         return self._from_native_dataframe(df.rename_columns(new_cols))
 
-    def write_parquet(self, file: Any) -> Any:
+    def write_parquet(self, file: Any, **kwargs: Any) -> Any:
         pp = get_pyarrow_parquet()
-        pp.write_table(self._native_dataframe, file)
+        pp.write_table(self._native_dataframe, file, **kwargs)
+
+    def write_ipc(self, file: Any, *, compression: str | None) -> Any:
+        write_ipc_file(self._native_dataframe, file, compression=compression)
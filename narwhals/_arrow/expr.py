@@ -17,6 +17,16 @@ if TYPE_CHECKING:
 
 
 class ArrowExpr:
+    __slots__ = (
+        "_call",
+        "_depth",
+        "_function_name",
+        "_root_names",
+        "_output_names",
+        "_implementation",
+        "_backend_version",
+    )
+
     def __init__(
         self,
         call: Callable[[ArrowDataFrame], list[ArrowSeries]],
@@ -71,9 +81,9 @@ class ArrowExpr:
         )
 
     def __narwhals_namespace__(self) -> ArrowNamespace:
-        from narwhals._arrow.namespace import ArrowNamespace
+        from narwhals._arrow.namespace import get_arrow_namespace
 
-        return ArrowNamespace(backend_version=self._backend_version)
+        return get_arrow_namespace(self._backend_version)
 
     def __narwhals_expr__(self) -> None: ...
 
@@ -132,9 +142,9 @@ class ArrowExpr:
         return reuse_series_implementation(self, "len", returns_scalar=True)
 
     def filter(self, *predicates: Any) -> Self:
-        from narwhals._arrow.namespace import ArrowNamespace
+        from narwhals._arrow.namespace import get_arrow_namespace
 
-        plx = ArrowNamespace(backend_version=self._backend_version)
+        plx = get_arrow_namespace(self._backend_version)
         expr = plx.all_horizontal(*predicates)
         return reuse_series_implementation(self, "filter", other=expr)
 
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 from typing import Any
 from typing import Callable
 
+from narwhals._explain import note_strategy
 from narwhals._expression_parsing import is_simple_aggregation
 from narwhals._expression_parsing import parse_into_exprs
 from narwhals.dependencies import get_pyarrow
@@ -73,6 +74,7 @@ def agg_arrow(
             break
 
     if all_simple_aggs:
+        note_strategy("group_by: vectorized agg")
         # Mapping from output name to
         # (aggregation_args, pyarrow_output_name)  # noqa: ERA001
         simple_aggregations: dict[str, tuple[tuple[Any, ...], str]] = {}
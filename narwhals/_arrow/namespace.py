@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from functools import reduce
 from typing import TYPE_CHECKING
 from typing import Any
@@ -185,16 +186,35 @@ class ArrowNamespace:
         *,
         how: str = "vertical",
     ) -> ArrowDataFrame:
-        dfs: list[Any] = [item._native_dataframe for item in items]
+        from narwhals._arrow.scan import ArrowScanFrame
+        from narwhals._arrow.scan import materialize
+
+        items = list(items)
+        dfs: list[Any] = [materialize(item)._native_dataframe for item in items]
 
         if how == "horizontal":
-            return ArrowDataFrame(
+            result = ArrowDataFrame(
                 horizontal_concat(dfs),
                 backend_version=self._backend_version,
             )
-        if how == "vertical":
-            return ArrowDataFrame(
+        elif how == "vertical":
+            result = ArrowDataFrame(
                 vertical_concat(dfs),
                 backend_version=self._backend_version,
             )
-        raise NotImplementedError
+        else:
+            raise NotImplementedError
+        if isinstance(items[0], ArrowScanFrame):
+            # Converted to the library the scan reads into, if any.
+            return items[0]._maybe_convert(result)  # type: ignore[no-any-return]
+        return result
+
+
+@lru_cache(maxsize=None)
+def get_arrow_namespace(backend_version: tuple[int, ...]) -> ArrowNamespace:
+    """Return the (shared) namespace for `backend_version`.
+
+    Namespaces hold no state besides the backend version, so compliant objects
+    can reuse one instance rather than building a new one for every expression node.
+    """
+    return ArrowNamespace(backend_version=backend_version)
@@ -0,0 +1,489 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import Iterable
+from typing import Sequence
+
+from narwhals._arrow.dataframe import ArrowDataFrame
+from narwhals._arrow.utils import convert_table
+from narwhals._arrow.utils import translate_dtype
+from narwhals._explain import note_strategy
+from narwhals._expression_parsing import is_elementwise
+from narwhals._expression_parsing import parse_into_exprs
+from narwhals.dependencies import get_pyarrow
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+    from narwhals._arrow.expr import ArrowExpr
+    from narwhals._arrow.namespace import ArrowNamespace
+    from narwhals._arrow.typing import IntoArrowExpr
+    from narwhals.dtypes import DType
+
+# Aggregations which can be answered from Parquet footer statistics.
+STATISTICS_AGGREGATIONS = {"min", "max", "null_count"}
+
+
+class ArrowScanFrame:
+    """Lazy frame backed by a `pyarrow.dataset.Dataset`.
+
+    Column projections and filters are recorded and only applied when the
+    data is read. For Parquet datasets, row counts, null counts, and min/max
+    values are answered from the file footers when their statistics are
+    complete, without reading any data pages.
+
+    For partitioned datasets, filters on partition columns are used to skip
+    the files of partitions which can't match. Elementwise filters are
+    applied to each record batch as it's read, so only the matching rows of
+    the selected columns are ever held in memory.
+
+    Any other operation collects into an `ArrowDataFrame` first. If
+    `target_namespace` is given (e.g. `pandas`), results are converted to that
+    library once they've been computed with PyArrow.
+    """
+
+    def __init__(
+        self,
+        native_dataset: Any,
+        *,
+        backend_version: tuple[int, ...],
+        columns: list[str] | None = None,
+        predicates: Sequence[Sequence[ArrowExpr]] = (),
+        batch_size: int | None = None,
+        target_namespace: Any = None,
+    ) -> None:
+        self._native_dataframe = native_dataset
+        self._implementation = "arrow"  # for compatibility with ArrowDataFrame
+        self._backend_version = backend_version
+        self._columns = columns
+        # One list of predicates per `filter` call, applied in order.
+        self._predicates = [list(stage) for stage in predicates]
+        self._parquet_metadata_cache: list[Any] | None = None
+        self._pruned_cache: tuple[Any, list[list[ArrowExpr]]] | None = None
+        self._batch_size = batch_size
+        self._target_namespace = target_namespace
+
+    def __narwhals_namespace__(self) -> ArrowNamespace:
+        from narwhals._arrow.namespace import get_arrow_namespace
+
+        return get_arrow_namespace(self._backend_version)
+
+    def __native_namespace__(self) -> Any:
+        return get_pyarrow()
+
+    def __narwhals_lazyframe__(self) -> Self:
+        return self
+
+    def _from_scan(
+        self,
+        *,
+        columns: list[str] | None,
+        predicates: Sequence[Sequence[ArrowExpr]],
+    ) -> Self:
+        return self.__class__(
+            self._native_dataframe,
+            backend_version=self._backend_version,
+            columns=columns,
+            predicates=predicates,
+            batch_size=self._batch_size,
+            target_namespace=self._target_namespace,
+        )
+
+    def _from_native_table(self, table: Any) -> ArrowDataFrame:
+        return ArrowDataFrame(table, backend_version=self._backend_version)
+
+    def _to_result(self, table: Any) -> Any:
+        """Wrap `table`, converting it to the target library if there is one."""
+        if self._target_namespace is None:
+            return self._from_native_table(table)
+        from narwhals.translate import from_native
+
+        native_frame = convert_table(table, self._target_namespace)
+        return from_native(native_frame, eager_only=True)._compliant_frame
+
+    def _maybe_convert(self, result: Any) -> Any:
+        if self._target_namespace is not None and isinstance(result, ArrowDataFrame):
+            return self._to_result(result._native_dataframe)
+        return result
+
+    def __getattr__(self, attr: str) -> Any:
+        # Operations which can't be pushed into the scan are run on the
+        # materialized table. Expressions have already been parsed with the
+        # Arrow namespace, so this happens before converting the result.
+        if attr.startswith("_"):
+            raise AttributeError(attr)
+        attribute = getattr(self._from_native_table(self._to_table(None)), attr)
+        if not callable(attribute):
+            return attribute
+
+        def func(*args: Any, **kwargs: Any) -> Any:
+            # Other scan frames (e.g. the right-hand side of a join) are
+            # materialized too.
+            result = attribute(
+                *[materialize(arg) for arg in args],
+                **{name: materialize(value) for name, value in kwargs.items()},
+            )
+            return self._maybe_convert(result)
+
+        return func
+
+    def group_by(self, *keys: str | Iterable[str]) -> Any:
+        grouped = self._from_native_table(self._to_table(None)).group_by(*keys)
+        if self._target_namespace is None:
+            return grouped
+        return _ConvertingGroupBy(grouped, self._maybe_convert)
+
+    def _scan_options(self) -> dict[str, Any]:
+        if self._batch_size is None:
+            return {}
+        return {"batch_size": self._batch_size}
+
+    # --- metadata ---
+    @property
+    def columns(self) -> list[str]:
+        if self._columns is not None:
+            return self._columns
+        return self._native_dataframe.schema.names  # type: ignore[no-any-return]
+
+    @property
+    def schema(self) -> dict[str, DType]:
+        schema = self._native_dataframe.schema
+        return {name: translate_dtype(schema.field(name).type) for name in self.columns}
+
+    def collect_schema(self) -> dict[str, DType]:
+        return self.schema
+
+    def __len__(self) -> int:
+        dataset, predicates = self._pruned()
+        if not predicates:
+            # PyArrow answers this from the Parquet footers.
+            return dataset.count_rows()  # type: ignore[no-any-return]
+        return self._to_table(self.columns).num_rows  # type: ignore[no-any-return]
+
+    # --- scan-level operations ---
+    def select(
+        self,
+        *exprs: IntoArrowExpr,
+        **named_exprs: IntoArrowExpr,
+    ) -> Any:
+        if exprs and not named_exprs and all(isinstance(x, str) for x in exprs):
+            note_strategy("select: projection pushed into scan")
+            return self._from_scan(columns=list(exprs), predicates=self._predicates)  # type: ignore[arg-type]
+        if not self._pruned()[1]:
+            result = self._select_from_statistics(*exprs, **named_exprs)
+            if result is not None:
+                note_strategy("select: computed from Parquet statistics")
+                return self._maybe_convert(result)
+        root_names = _root_names([*exprs, *named_exprs.values()])
+        result = self._from_native_table(self._to_table(root_names)).select(
+            *exprs, **named_exprs
+        )
+        return self._maybe_convert(result)
+
+    def filter(self, *predicates: IntoArrowExpr) -> Self:
+        plx = self.__narwhals_namespace__()
+        exprs = parse_into_exprs(*predicates, namespace=plx)
+        note_strategy("filter: pushed into scan")
+        return self._from_scan(
+            columns=self._columns, predicates=[*self._predicates, exprs]
+        )
+
+    def head(self, n: int) -> Any:
+        dataset, predicates = self._pruned()
+        if n >= 0 and not predicates:
+            note_strategy("head: only the first rows are read")
+            return self._to_result(
+                dataset.head(n, columns=self.columns, **self._scan_options())
+            )
+        return self._to_result(self._to_table(self.columns)).head(n)
+
+    def null_count(self) -> Any:
+        plx = self.__narwhals_namespace__()
+        if not self._pruned()[1]:
+            result = self._select_from_statistics(plx.all().null_count())
+            if result is not None:
+                note_strategy("null_count: computed from Parquet statistics")
+                return self._maybe_convert(result)
+        return self._to_result(self._to_table(self.columns)).null_count()
+
+    def lazy(self) -> Self:
+        return self
+
+    def collect(self) -> Any:
+        return self._to_result(self._to_table(self.columns))
+
+    # --- reading ---
+    def _to_table(self, columns: list[str] | None) -> Any:
+        """Read `columns` (or all selected ones, if `None`), applying any filters."""
+        columns = self.columns if columns is None else columns
+        dataset, predicates = self._pruned()
+        if dataset is not self._native_dataframe:
+            note_strategy(
+                f"scan: {len(dataset.files)} of {len(self._native_dataframe.files)} "
+                "files left after partition pruning"
+            )
+        note_strategy(f"scan: read columns {columns}")
+        options = self._scan_options()
+        if not predicates:
+            return dataset.to_table(columns=columns, **options)
+        needed = _root_names([expr for stage in predicates for expr in stage])
+        if needed is not None:
+            needed = list(dict.fromkeys([*columns, *needed]))
+        if not all(is_elementwise(expr) for stage in predicates for expr in stage):
+            note_strategy("scan: filters applied after reading")
+            df = self._from_native_table(dataset.to_table(columns=needed, **options))
+            for stage in predicates:
+                df = df.filter(*stage)
+            return df._native_dataframe.select(columns)
+        # Elementwise filters give the same result when applied to each batch,
+        # so we only keep the matching rows of each batch in memory.
+        note_strategy("scan: filters applied to each record batch while reading")
+        pa = get_pyarrow()
+        tables = []
+        for batch in dataset.to_batches(columns=needed, **options):
+            df = self._from_native_table(pa.Table.from_batches([batch]))
+            for stage in predicates:
+                df = df.filter(*stage)
+            tables.append(df._native_dataframe.select(columns))
+        if not tables:
+            return dataset.schema.empty_table().select(columns)
+        return pa.concat_tables(tables)
+
+    # --- partitions ---
+    def _partition_columns(self) -> set[str]:
+        partitioning = getattr(self._native_dataframe, "partitioning", None)
+        if partitioning is None:
+            return set()
+        return set(partitioning.schema.names)
+
+    def _pruned(self) -> tuple[Any, list[list[ArrowExpr]]]:
+        """Dataset restricted to the partitions which can match, and the filters
+        which still need to be applied after reading it."""
+        if self._pruned_cache is None:
+            self._pruned_cache = self._prune_partitions()
+        return self._pruned_cache
+
+    def _prune_partitions(self) -> tuple[Any, list[list[ArrowExpr]]]:
+        dataset = self._native_dataframe
+        partition_columns = self._partition_columns()
+        if not partition_columns:
+            return dataset, self._predicates
+        # Elementwise filters commute, so those in leading `filter` calls can
+        # be split into ones on partition columns (evaluated once per file)
+        # and the rest. Anything after a non-elementwise filter must see all
+        # rows which passed the previous filters, so it's left as-is.
+        partition_predicates: list[ArrowExpr] = []
+        other_predicates: list[ArrowExpr] = []
+        remaining = list(self._predicates)
+        while remaining and all(is_elementwise(expr) for expr in remaining[0]):
+            for expr in remaining.pop(0):
+                if set(expr._root_names) <= partition_columns:  # type: ignore[arg-type]
+                    partition_predicates.append(expr)
+                else:
+                    other_predicates.append(expr)
+        if not partition_predicates:
+            return dataset, self._predicates
+        if other_predicates:
+            remaining.insert(0, other_predicates)
+
+        import pyarrow.dataset as ds
+
+        pa = get_pyarrow()
+        fragments = list(dataset.get_fragments())
+        keys = pa.Table.from_pylist(
+            [ds.get_partition_keys(f.partition_expression) for f in fragments],
+            schema=dataset.partitioning.schema,
+        )
+        plx = self.__narwhals_namespace__()
+        mask = plx.all_horizontal(*partition_predicates)._call(
+            self._from_native_table(keys)
+        )[0]
+        selected = [
+            fragment
+            for fragment, keep in zip(fragments, mask._native_series.to_pylist())
+            if keep
+        ]
+        pruned = ds.FileSystemDataset(
+            selected,
+            schema=dataset.schema,
+            format=dataset.format,
+            filesystem=dataset.filesystem,
+        )
+        return pruned, remaining
+
+    # --- statistics ---
+    def _parquet_metadata(self) -> list[Any] | None:
+        """Footer metadata of each file in the dataset, if it's Parquet."""
+        import pyarrow.dataset as ds
+
+        dataset = self._pruned()[0]
+        if not isinstance(dataset, ds.FileSystemDataset) or not isinstance(
+            dataset.format, ds.ParquetFileFormat
+        ):
+            return None
+        if self._parquet_metadata_cache is None:
+            self._parquet_metadata_cache = [
+                fragment.metadata for fragment in dataset.get_fragments()
+            ]
+        return self._parquet_metadata_cache
+
+    def _select_from_statistics(
+        self, *exprs: IntoArrowExpr, **named_exprs: IntoArrowExpr
+    ) -> ArrowDataFrame | None:
+        """Evaluate simple aggregations from Parquet footers.
+
+        Returns `None` if any of the expressions can't be answered that way,
+        or if the statistics are incomplete.
+        """
+        metadata = self._parquet_metadata()
+        if metadata is None:
+            return None
+        pa = get_pyarrow()
+        schema = self._native_dataframe.schema
+        names: list[str] = []
+        arrays: list[Any] = []
+        items = [(expr, None) for expr in exprs] + [
+            (expr, name) for name, expr in named_exprs.items()
+        ]
+        for expr, alias in items:
+            if not hasattr(expr, "__narwhals_expr__"):
+                return None
+            function_name = expr._function_name  # type: ignore[union-attr]
+            output_names = expr._output_names  # type: ignore[union-attr]
+            if function_name == "len":
+                names.append(alias or output_names[0])  # type: ignore[index]
+                arrays.append(pa.array([len(self)], type=pa.int64()))
+                continue
+            root, _, aggregation = function_name.partition("->")
+            if (
+                expr._depth != 1  # type: ignore[union-attr]
+                or root not in ("col", "all")
+                or aggregation not in STATISTICS_AGGREGATIONS
+            ):
+                return None
+            input_names = expr._root_names if root == "col" else self.columns  # type: ignore[union-attr]
+            if output_names is None:
+                output_names = input_names
+            if alias is not None:
+                output_names = [alias]
+            for input_name, output_name in zip(input_names, output_names):  # type: ignore[arg-type]
+                field = schema.field(input_name)
+                if aggregation == "null_count":
+                    value = _null_count_from_statistics(metadata, input_name)
+                    dtype = pa.int64()
+                elif _supports_min_max_statistics(field.type):
+                    value = _min_max_from_statistics(metadata, input_name, aggregation)
+                    dtype = field.type
+                else:
+                    return None
+                if value is _MISSING:
+                    return None
+                names.append(output_name)
+                arrays.append(pa.array([value], type=dtype))
+        if not names:
+            return None
+        return self._from_native_table(pa.Table.from_arrays(arrays, names=names))
+
+
+_MISSING = object()
+
+
+def materialize(frame: Any) -> Any:
+    """Read `frame` into an `ArrowDataFrame` if it's an `ArrowScanFrame`, for
+    operations which need the data of several frames (e.g. `join` or `concat`).
+    Anything else is returned as is."""
+    if isinstance(frame, ArrowScanFrame):
+        return frame._from_native_table(frame._to_table(None))
+    return frame
+
+
+class _ConvertingGroupBy:
+    """Group-by whose aggregations are converted to the scan's target library."""
+
+    def __init__(self, grouped: Any, convert: Callable[[Any], Any]) -> None:
+        self._grouped = grouped
+        self._convert = convert
+
+    def agg(self, *aggs: Any, **named_aggs: Any) -> Any:
+        return self._convert(self._grouped.agg(*aggs, **named_aggs))
+
+
+def _root_names(exprs: Iterable[Any]) -> list[str] | None:
+    """Return the columns needed to evaluate `exprs`, or `None` if all of them are."""
+    names: list[str] = []
+    for expr in exprs:
+        if isinstance(expr, str):
+            names.append(expr)
+        elif (root_names := getattr(expr, "_root_names", None)) is not None:
+            names.extend(root_names)
+        else:
+            return None
+    return list(dict.fromkeys(names))
+
+
+def _column_chunks(metadata: list[Any], name: str) -> Iterable[tuple[Any, Any]]:
+    """Yield `(row_group, column_chunk)` pairs for top-level column `name`.
+
+    Raises `KeyError` if the column isn't stored in one of the files (e.g. if
+    it's a partition column).
+    """
+    for file_metadata in metadata:
+        paths = [
+            file_metadata.schema.column(i).path for i in range(file_metadata.num_columns)
+        ]
+        index = paths.index(name) if name in paths else None
+        if index is None:
+            raise KeyError(name)
+        for i in range(file_metadata.num_row_groups):
+            row_group = file_metadata.row_group(i)
+            yield row_group, row_group.column(index)
+
+
+def _null_count_from_statistics(metadata: list[Any], name: str) -> Any:
+    null_count = 0
+    try:
+        for _, column_chunk in _column_chunks(metadata, name):
+            statistics = column_chunk.statistics
+            if statistics is None or not statistics.has_null_count:
+                return _MISSING
+            null_count += statistics.null_count
+    except KeyError:
+        return _MISSING
+    return null_count
+
+
+def _min_max_from_statistics(metadata: list[Any], name: str, aggregation: str) -> Any:
+    values = []
+    try:
+        for row_group, column_chunk in _column_chunks(metadata, name):
+            statistics = column_chunk.statistics
+            if row_group.num_rows == 0:
+                continue
+            if statistics is None:
+                return _MISSING
+            if statistics.has_min_max:
+                values.append(getattr(statistics, aggregation))
+            elif not (
+                statistics.has_null_count and statistics.null_count == row_group.num_rows
+            ):
+                return _MISSING
+    except KeyError:
+        return _MISSING
+    if not values:
+        return None
+    return min(values) if aggregation == "min" else max(values)
+
+
+def _supports_min_max_statistics(dtype: Any) -> bool:
+    # Parquet statistics for strings may be truncated, and for timestamps
+    # may lose precision when converted to Python objects, so we only
+    # trust them for the following types.
+    pa = get_pyarrow()
+    return bool(
+        pa.types.is_integer(dtype)
+        or pa.types.is_floating(dtype)
+        or pa.types.is_boolean(dtype)
+        or pa.types.is_date32(dtype)
+    )
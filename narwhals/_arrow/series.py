@@ -11,6 +11,7 @@ from narwhals._arrow.utils import validate_column_comparand
 from narwhals.dependencies import get_numpy
 from narwhals.dependencies import get_pyarrow
 from narwhals.dependencies import get_pyarrow_compute
+from narwhals.diagnostics import record_slow_path
 
 if TYPE_CHECKING:
     from typing_extensions import Self
@@ -20,6 +21,13 @@ if TYPE_CHECKING:
 
 
 class ArrowSeries:
+    __slots__ = (
+        "_name",
+        "_native_series",
+        "_implementation",
+        "_backend_version",
+    )
+
     def __init__(
         self, native_series: Any, *, name: str, backend_version: tuple[int, ...]
     ) -> None:
@@ -176,9 +184,9 @@ class ArrowSeries:
         return pc.count(self._native_series)  # type: ignore[no-any-return]
 
     def __narwhals_namespace__(self) -> ArrowNamespace:
-        from narwhals._arrow.namespace import ArrowNamespace
+        from narwhals._arrow.namespace import get_arrow_namespace
 
-        return ArrowNamespace(backend_version=self._backend_version)
+        return get_arrow_namespace(self._backend_version)
 
     @property
     def name(self) -> str:
@@ -250,6 +258,9 @@ class ArrowSeries:
     def null_count(self: Self) -> int:
         return self._native_series.null_count  # type: ignore[no-any-return]
 
+    def has_nulls(self: Self) -> bool:
+        return self._native_series.null_count > 0  # type: ignore[no-any-return]
+
     def head(self, n: int) -> Self:
         ser = self._native_series
         if n >= 0:
@@ -286,6 +297,8 @@ class ArrowSeries:
 
     def zip_with(self: Self, mask: Self, other: Self) -> Self:
         pc = get_pyarrow_compute()
+        if any(series._native_series.num_chunks > 1 for series in (self, mask, other)):
+            record_slow_path("zip_with.combine_chunks")
 
         return self._from_native_series(
             pc.replace_with_mask(
@@ -3,7 +3,10 @@ from __future__ import annotations
 from typing import Any
 
 from narwhals import dtypes
+from narwhals.dependencies import get_cudf
+from narwhals.dependencies import get_modin
 from narwhals.dependencies import get_pyarrow
+from narwhals.diagnostics import record_slow_path
 from narwhals.utils import isinstance_or_issubclass
 
 
@@ -128,6 +131,9 @@ def validate_dataframe_comparand(length: int, other: Any) -> Any:
 
     If the comparison isn't supported, return `NotImplemented` so that the
     "right-hand-side" operation (e.g. `__radd__`) can be tried.
+
+    If RHS is length 1, broadcast it to `length` (keeping its Arrow type)
+    without going through Python objects.
     """
     from narwhals._arrow.dataframe import ArrowDataFrame
     from narwhals._arrow.series import ArrowSeries
@@ -135,14 +141,21 @@ def validate_dataframe_comparand(length: int, other: Any) -> Any:
     if isinstance(other, ArrowDataFrame):
         return NotImplemented
     if isinstance(other, ArrowSeries):
-        if len(other) == 1:
-            pa = get_pyarrow()
-            return pa.chunked_array([[other.item()] * length])
+        if len(other) == 1 and length != 1:
+            return broadcast_scalar(other._native_series[0], length)
         return other._native_series
     msg = "Please report a bug"  # pragma: no cover
     raise AssertionError(msg)
 
 
+def broadcast_scalar(value: Any, length: int) -> Any:
+    """Repeat Arrow scalar `value` into a chunked array of length `length`."""
+    pa = get_pyarrow()
+    if not value.is_valid:
+        return pa.chunked_array([pa.nulls(length, type=value.type)])
+    return pa.chunked_array([pa.repeat(value, length)])
+
+
 def horizontal_concat(dfs: list[Any]) -> Any:
     """
     Concatenate (native) DataFrames horizontally.
@@ -182,4 +195,73 @@ def vertical_concat(dfs: list[Any]) -> Any:
             raise TypeError(msg)
 
     pa = get_pyarrow()
+    if len(dfs) > 1:
+        record_slow_path("concat.combine_chunks")
     return pa.concat_tables(dfs).combine_chunks()
+
+
+def write_parquet_dataset(
+    table: Any,
+    base_dir: str,
+    *,
+    partition_by: list[str] | None,
+    row_group_size: int | None,
+    compression: str | None,
+    max_rows_per_file: int | None,
+) -> None:
+    """
+    Write a (native) Table as a directory of Parquet files.
+
+    If `partition_by` is given, files are laid out using Hive-style
+    `key=value` directories. Files are written in parallel.
+    """
+    import pyarrow.dataset as ds
+
+    file_format = ds.ParquetFileFormat()
+    file_options = (
+        file_format.make_write_options(compression=compression)
+        if compression is not None
+        else file_format.make_write_options()
+    )
+    kwargs: dict[str, Any] = {}
+    if max_rows_per_file is not None:
+        kwargs["max_rows_per_file"] = max_rows_per_file
+        # PyArrow requires row groups to fit in a single file.
+        kwargs["max_rows_per_group"] = min(max_rows_per_file, 1024 * 1024)
+    if row_group_size is not None:
+        kwargs["min_rows_per_group"] = row_group_size
+        kwargs["max_rows_per_group"] = row_group_size
+    ds.write_dataset(
+        table,
+        base_dir,
+        format=file_format,
+        file_options=file_options,
+        partitioning=partition_by,
+        partitioning_flavor="hive" if partition_by else None,
+        existing_data_behavior="overwrite_or_ignore",
+        use_threads=True,
+        **kwargs,
+    )
+
+
+def write_ipc_file(table: Any, file: Any, *, compression: str | None) -> None:
+    """Write a (native) Table to an Arrow IPC file."""
+    pa = get_pyarrow()
+    options = pa.ipc.IpcWriteOptions(compression=compression)
+    with pa.ipc.new_file(file, table.schema, options=options) as writer:
+        writer.write_table(table)
+
+
+def convert_table(table: Any, native_namespace: Any) -> Any:
+    """
+    Convert a (native) Table to a native dataframe of `native_namespace`.
+
+    For pandas, each column gets its own block, so that numeric columns
+    without nulls are zero-copy views of the Arrow buffers.
+    """
+    if native_namespace is get_cudf():  # pragma: no cover
+        return native_namespace.DataFrame.from_arrow(table)
+    df = table.to_pandas(split_blocks=True)
+    if native_namespace is get_modin():  # pragma: no cover
+        return native_namespace.DataFrame(df)
+    return df
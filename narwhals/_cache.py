@@ -0,0 +1,312 @@
+"""Result cache for `LazyFrame.collect`, see the `cache_max_bytes` option of `Config`.
+
+Results are keyed by a fingerprint of the LazyFrame's plan (see `_explain`): its
+operations, their arguments, and its inputs. Expressions are fingerprinted by
+the calls which built them (see `_expression_nodes`), or if they weren't built
+with the public API, by the code of their closures and the values they close
+over. Inputs read with `scan_*` are fingerprinted by their files' paths, sizes
+and modification times, and in-memory Polars data (which can't change) by its
+identity. Anything which can't be fingerprinted reliably makes the plan
+uncacheable: that includes native LazyFrames which read files themselves, and
+Dask frames.
+
+pandas-like results are mutable, so the cache keeps its own copy of them, and
+returns a new copy on each hit.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import itertools
+import os
+import threading
+import uuid
+import weakref
+from collections import OrderedDict
+from datetime import date
+from datetime import datetime
+from datetime import time
+from datetime import timedelta
+from decimal import Decimal
+from pathlib import Path
+from pathlib import PurePath
+from types import FunctionType
+from types import ModuleType
+from typing import TYPE_CHECKING
+from typing import Any
+
+from narwhals._explain import PlanNode
+from narwhals._explain import _is_evaluated
+from narwhals._explain import _plan_of
+from narwhals.config import get_option
+from narwhals.dependencies import get_dask
+from narwhals.dependencies import get_numpy
+from narwhals.dependencies import get_pandas
+from narwhals.dependencies import get_polars
+from narwhals.dependencies import get_pyarrow
+
+if TYPE_CHECKING:
+    from narwhals.dataframe import DataFrame
+    from narwhals.dataframe import LazyFrame
+
+_LOCK = threading.Lock()
+
+# Results kept in memory: fingerprint -> (compliant DataFrame, size in bytes).
+_MEMORY: OrderedDict[str, tuple[Any, int]] = OrderedDict()
+
+# Objects are identified by a token which is never reused, unlike `id`.
+# Tokens only mean something in this process, hence `_SESSION`.
+_SESSION = uuid.uuid4().hex
+_TOKENS: dict[int, int] = {}
+_COUNTER = itertools.count()
+
+
+class _Uncacheable(Exception):  # noqa: N818
+    pass
+
+
+def _token(obj: Any) -> tuple[str, int]:
+    key = id(obj)
+    with _LOCK:
+        if key not in _TOKENS:
+            try:
+                weakref.finalize(obj, _TOKENS.pop, key, None)
+            except TypeError:
+                raise _Uncacheable from None
+            _TOKENS[key] = next(_COUNTER)
+        return (_SESSION, _TOKENS[key])
+
+
+def _file_stats(source: Any) -> list[tuple[str, int, int]]:
+    path = Path(source)
+    files = sorted(path.rglob("*")) if path.is_dir() else [path]
+    stats = []
+    for file in files:
+        stat = file.stat()
+        if not file.is_dir():
+            stats.append((str(file.resolve()), stat.st_size, stat.st_mtime_ns))
+    return stats
+
+
+def _describe(value: Any) -> Any:
+    """Convert `value` to something whose `repr` identifies it."""
+    from narwhals.dtypes import DType
+    from narwhals.expression import Expr
+    from narwhals.series import Series
+
+    if value is None or isinstance(
+        value, (bool, int, float, str, bytes, date, datetime, time, timedelta, Decimal)
+    ):
+        return value
+    if (np := get_numpy()) is not None and isinstance(value, np.generic):
+        return (type(value).__name__, value.item())
+    if isinstance(value, PlanNode):
+        return _describe_node(value)
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, *(_describe(item) for item in value))
+    if isinstance(value, dict):
+        return ("dict", *((_describe(k), _describe(v)) for k, v in value.items()))
+    if isinstance(value, Expr):
+        if value._node is not None:
+            return ("expr", _describe(value._node))
+        return ("expr", _describe(value._call))
+    if isinstance(value, Series):
+        return ("series", _token(value._compliant_series))
+    if isinstance(value, PurePath):
+        return ("path", str(value))
+    if isinstance(value, ModuleType):
+        return ("module", value.__name__)
+    if isinstance(value, (type, DType)):
+        return ("dtype", type(value).__qualname__, repr(value))
+    if isinstance(value, FunctionType) and value.__module__.startswith("narwhals"):
+        # Narwhals' own closures, e.g. `lambda plx: self._call(plx).alias(name)`.
+        code = value.__code__
+        try:
+            cells = [cell.cell_contents for cell in value.__closure__ or ()]
+        except ValueError:  # pragma: no cover
+            raise _Uncacheable from None
+        return (
+            "function",
+            code.co_filename,
+            code.co_firstlineno,
+            code.co_name,
+            _describe(value.__defaults__),
+            _describe(value.__kwdefaults__),
+            _describe(cells),
+        )
+    if callable(value):
+        # User-defined functions could depend on anything, so only the very same
+        # function is considered equal.
+        return ("callable", _token(value))
+    if type(value).__module__.startswith("narwhals") and hasattr(value, "__dict__"):
+        # E.g. the `self` of `ExprStringNamespace` methods.
+        return ("object", type(value).__qualname__, _describe(vars(value)))
+    raise _Uncacheable
+
+
+def _describe_node(node: PlanNode) -> Any:
+    if node.func is not None:
+        return (
+            node.operation,
+            _describe(node.args),
+            _describe(node.kwargs),
+        )
+    if node.operation.startswith("scan_"):
+        return (
+            node.operation,
+            _describe(node.kwargs),
+            _file_stats(node.kwargs["source"]),
+        )
+    native_frame = getattr(node.source, "_native_dataframe", node.source)
+    if (pl := get_polars()) is not None and isinstance(native_frame, pl.LazyFrame):
+        # In-memory Polars data can't change, so the very same LazyFrame always
+        # has the same result, unless it reads files (which `scan_*` handles).
+        if "SCAN" in native_frame.explain(optimized=False):
+            raise _Uncacheable
+    elif (dd := get_dask()) is not None and isinstance(native_frame, dd.DataFrame):
+        # Dask frames read files, or pandas frames which can change in place.
+        raise _Uncacheable
+    return ("SOURCE", _token(native_frame))
+
+
+def fingerprint(frame: LazyFrame[Any]) -> str | None:
+    """Key of `frame`'s result in the cache, or `None` if it can't be cached."""
+    from narwhals import __version__
+
+    try:
+        description = _describe_node(_plan_of(frame))
+    except (_Uncacheable, OSError, RecursionError):
+        # E.g. thousands of chained operations, which aren't worth describing.
+        return None
+    key = repr((__version__, get_option("positional_index"), description))
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def _result_namespace(frame: LazyFrame[Any]) -> ModuleType:
+    """Native namespace of the result of collecting `frame`."""
+    from narwhals._arrow.scan import ArrowScanFrame
+
+    compliant = frame._compliant_frame
+    if isinstance(compliant, ArrowScanFrame):
+        return compliant._target_namespace or get_pyarrow()  # type: ignore[no-any-return]
+    if frame.__native_namespace__() is get_dask():
+        return get_pandas()  # type: ignore[no-any-return]
+    return frame.__native_namespace__()  # type: ignore[no-any-return]
+
+
+# --- storage ---
+# Subdirectory of `cache_dir` in which results are written.
+_CACHE_SUBDIR = "narwhals-cache"
+
+
+def _copy(compliant: Any) -> Any:
+    """Copy of `compliant` if it's mutable (i.e. pandas-like), so that changes to
+    a result can't change the cached one, or other results read from it."""
+    from narwhals._pandas_like.dataframe import PandasLikeDataFrame
+
+    if isinstance(compliant, PandasLikeDataFrame):
+        return compliant._from_native_dataframe(
+            compliant._native_dataframe.copy(), validate_column_names=False
+        )
+    return compliant
+
+
+def _get_from_memory(key: str) -> Any:
+    with _LOCK:
+        if key not in _MEMORY:
+            return None
+        _MEMORY.move_to_end(key)
+        cached = _MEMORY[key][0]
+    return _copy(cached)
+
+
+def _put_in_memory(key: str, result: DataFrame[Any], max_bytes: int) -> None:
+    size = int(result.estimated_size())
+    if size > max_bytes:
+        return
+    cached = _copy(result._compliant_frame)
+    with _LOCK:
+        _MEMORY[key] = (cached, size)
+        total = sum(entry_size for _, entry_size in _MEMORY.values())
+        while total > max_bytes:
+            _, (_, evicted) = _MEMORY.popitem(last=False)
+            total -= evicted
+
+
+def _path(cache_dir: str, key: str, native_namespace: ModuleType) -> Path:
+    # Results are read back with the library they were computed with. They're
+    # kept in a subdirectory of their own, so that evicting them can't touch
+    # other files in `cache_dir`.
+    return Path(cache_dir) / _CACHE_SUBDIR / f"{key}-{native_namespace.__name__}.arrow"
+
+
+def _get_from_disk(path: Path, native_namespace: ModuleType) -> Any:
+    from narwhals.functions import read_ipc
+
+    try:
+        result = read_ipc(path, native_namespace=native_namespace)
+        os.utime(path)
+    except OSError:
+        return None
+    return result._compliant_frame
+
+
+def _stat(path: Path) -> os.stat_result | None:
+    try:
+        return path.stat()
+    except FileNotFoundError:
+        # Evicted by another process in the meantime.
+        return None
+
+
+def _put_on_disk(path: Path, result: DataFrame[Any], max_bytes: int) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write to a temporary file first, so that other processes never read a
+    # partially-written result.
+    tmp = path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+    try:
+        result.write_ipc(tmp)
+        tmp.replace(path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    files = [
+        (stat, file)
+        for file in path.parent.glob("*.arrow")
+        if (stat := _stat(file)) is not None
+    ]
+    total = sum(stat.st_size for stat, _ in files)
+    for stat, file in sorted(files, key=lambda item: item[0].st_mtime_ns):
+        if total <= max_bytes:
+            break
+        file.unlink(missing_ok=True)
+        total -= stat.st_size
+
+
+def cached_collect(frame: LazyFrame[Any]) -> Any:
+    """Collect `frame`'s compliant frame, from the cache if it's there."""
+    from narwhals.dataframe import DataFrame
+
+    compliant = frame._compliant_frame
+    if _is_evaluated(compliant) or (key := fingerprint(frame)) is None:
+        return compliant.collect()
+    max_bytes = get_option("cache_max_bytes")
+    cache_dir = get_option("cache_dir")
+    native_namespace = _result_namespace(frame)
+    if cache_dir:
+        path = _path(cache_dir, key, native_namespace)
+        if (cached := _get_from_disk(path, native_namespace)) is not None:
+            return cached
+    elif (cached := _get_from_memory(key)) is not None:
+        return cached
+    result: DataFrame[Any] = DataFrame(
+        compliant.collect(),
+        is_polars=frame._is_polars,
+        backend_version=frame._backend_version,
+        level=frame._level,
+    )
+    if cache_dir:
+        _put_on_disk(path, result, max_bytes)
+    else:
+        _put_in_memory(key, result, max_bytes)
+    return result._compliant_frame
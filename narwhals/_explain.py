@@ -0,0 +1,315 @@
+"""Query plans of non-Polars LazyFrames, for `LazyFrame.explain`.
+
+Only Polars builds a query plan: for the other backends, each `LazyFrame`
+operation is evaluated as soon as it's called. So that they can still be
+explained, each LazyFrame keeps track of the operations which produced it (but
+not of the intermediate results), and backends note the physical strategy they
+chose for each operation with `note_strategy`. `analyze=True` then replays the
+operations from the source frame, timing each of them.
+
+Plans hold strong references to their source frames and to the arguments of
+each operation (weak references wouldn't do: a source only referenced by a chain
+of operations, e.g. `nw.from_native(df).lazy().filter(...)` once `df` is
+deleted, would be gone before it could be analyzed). For frames which are
+already evaluated, that could keep much more data alive than the frame itself,
+so their plans are only kept with `nw.Config(keep_plans=True)`. Frames which
+aren't evaluated yet (Polars, Dask, and PyArrow read with `scan_*`) reference
+their inputs anyway, so their plans are always kept.
+
+Plans can be thousands of operations deep, so they're walked without recursion.
+"""
+
+from __future__ import annotations
+
+import threading
+from functools import wraps
+from time import perf_counter_ns
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import Iterator
+from typing import TypeVar
+
+from narwhals.config import get_option
+from narwhals.utils import flatten
+
+if TYPE_CHECKING:
+    from narwhals.dataframe import BaseFrame
+    from narwhals.dataframe import LazyFrame
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_LOCAL = threading.local()
+
+
+class PlanNode:
+    """One operation of a LazyFrame's plan, or its source (if `func` is `None`)."""
+
+    __slots__ = (
+        "operation",
+        "func",
+        "args",
+        "kwargs",
+        "source",
+        "strategies",
+        "duration_ns",
+        "n_rows",
+    )
+
+    def __init__(
+        self,
+        operation: str,
+        func: Callable[..., Any] | None = None,
+        args: tuple[Any, ...] = (),
+        kwargs: dict[str, Any] | None = None,
+        source: Any = None,
+    ) -> None:
+        self.operation = operation
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs or {}
+        self.source = source
+        self.strategies: list[str] = []
+        self.duration_ns: int | None = None
+        self.n_rows: int | None = None
+
+    @property
+    def inputs(self) -> list[PlanNode]:
+        return [arg for arg in self.args if isinstance(arg, PlanNode)]
+
+
+def note_strategy(strategy: str) -> None:
+    """Record the physical strategy chosen for the operation being planned, e.g.
+    `"group_by: apply fallback"`. Does nothing outside of LazyFrame operations."""
+    node = getattr(_LOCAL, "node", None)
+    if node is not None:
+        node.strategies.append(strategy)
+
+
+def _plan_of(frame: BaseFrame[Any]) -> PlanNode:
+    plan = getattr(frame, "_plan", None)
+    if plan is None:
+        plan = PlanNode("SOURCE", source=frame._compliant_frame)
+    return plan
+
+
+def _is_evaluated(compliant: Any) -> bool:
+    from narwhals._arrow.dataframe import ArrowDataFrame
+    from narwhals._pandas_like.dataframe import PandasLikeDataFrame
+    from narwhals._pandas_like.utils import Implementation
+
+    if isinstance(compliant, PandasLikeDataFrame):
+        return compliant._implementation is not Implementation.DASK
+    return isinstance(compliant, ArrowDataFrame)
+
+
+def _keep_plan(frame: LazyFrame[Any]) -> bool:
+    return (
+        get_option("keep_plans")
+        or getattr(_LOCAL, "replaying", False)
+        or not _is_evaluated(frame._compliant_frame)
+    )
+
+
+def _call(node: PlanNode, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    previous = getattr(_LOCAL, "node", None)
+    _LOCAL.node = node
+    try:
+        return func(*args, **kwargs)
+    finally:
+        _LOCAL.node = previous
+
+
+def record_plan(func: F) -> F:
+    """Add the LazyFrame operation `func` to the plan of its result.
+
+    Polars LazyFrames keep a plan too, but only to fingerprint them for the
+    result cache (see `narwhals._cache`): Polars explains its own plans.
+
+    Any LazyFrame in the arguments (e.g. the right-hand side of a join) is part
+    of the plan too. `func` may also be `LazyGroupBy.agg`.
+    """
+
+    @wraps(func)
+    def wrapper(obj: Any, *args: Any, **kwargs: Any) -> Any:
+        from narwhals.dataframe import LazyFrame
+
+        frame = obj._df if hasattr(obj, "_grouped") else obj
+        if not isinstance(frame, LazyFrame):
+            return func(obj, *args, **kwargs)
+        # How to run the operation again (through the public API, so that
+        # the result gets a plan too).
+        if frame is obj:
+            operation = func.__name__
+
+            def replay(frame: LazyFrame[Any], *args: Any, **kwargs: Any) -> Any:
+                return getattr(frame, operation)(*args, **kwargs)
+
+        else:
+            keys = list(flatten(obj._keys))
+            operation = (
+                f"group_by({', '.join(repr(key) for key in keys)}).{func.__name__}"
+            )
+
+            def replay(frame: LazyFrame[Any], *args: Any, **kwargs: Any) -> Any:
+                return frame.group_by(*keys).agg(*args, **kwargs)
+
+        # Iterators (e.g. generators of expressions) can only be consumed once.
+        args = tuple(list(arg) if isinstance(arg, Iterator) else arg for arg in args)
+        node = PlanNode(
+            operation,
+            replay,
+            (
+                _plan_of(frame),
+                *(_plan_of(arg) if isinstance(arg, LazyFrame) else arg for arg in args),
+            ),
+            kwargs,
+        )
+        result = _call(node, func, obj, *args, **kwargs)
+        if isinstance(result, LazyFrame) and result is not frame and _keep_plan(result):
+            result._plan = node
+        return result
+
+    return wrapper  # type: ignore[return-value]
+
+
+# --- replaying ---
+def _n_rows(frame: BaseFrame[Any]) -> int | None:
+    from narwhals.profiling import _compliant_n_rows
+
+    return _compliant_n_rows(frame._compliant_frame)
+
+
+def _replay(node: PlanNode, template: LazyFrame[Any]) -> LazyFrame[Any]:
+    """Evaluate the plan of `node` again, returning a LazyFrame whose plan is
+    annotated with timings and row counts."""
+    replayed: dict[int, LazyFrame[Any]] = {}
+    previous = getattr(_LOCAL, "replaying", False)
+    # Results need plans to be annotated, even if plans aren't kept otherwise.
+    _LOCAL.replaying = True
+    try:
+        # Depth-first, so that each node's inputs are replayed before it.
+        stack = [node]
+        while stack:
+            current = stack[-1]
+            if id(current) in replayed:
+                stack.pop()
+                continue
+            pending = [arg for arg in current.inputs if id(arg) not in replayed]
+            if pending:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            replayed[id(current)] = _replay_node(current, replayed, template)
+    finally:
+        _LOCAL.replaying = previous
+    return replayed[id(node)]
+
+
+def _replay_node(
+    node: PlanNode, replayed: dict[int, LazyFrame[Any]], template: LazyFrame[Any]
+) -> LazyFrame[Any]:
+    if node.func is None:
+        result = template._from_compliant_dataframe(node.source)
+        result._plan = PlanNode("SOURCE", source=node.source)
+        result._plan.n_rows = _n_rows(result)
+        return result
+    args = [replayed[id(arg)] if isinstance(arg, PlanNode) else arg for arg in node.args]
+    start = perf_counter_ns()
+    result = node.func(*args, **node.kwargs)
+    duration = perf_counter_ns() - start
+    result._plan.duration_ns = duration
+    result._plan.n_rows = _n_rows(result)
+    return result  # type: ignore[no-any-return]
+
+
+# --- formatting ---
+def _describe_expr(expr: Any, plx: Any) -> str:
+    from narwhals._expression_parsing import POSITIONAL_OPERAND
+    from narwhals.expression import Expr
+
+    if not isinstance(expr, Expr):
+        return repr(expr)
+    compliant = expr._call(plx)
+    root, *methods = compliant._function_name.split("->")
+    roots = compliant._root_names
+    description = (
+        f"{root}({', '.join(repr(name) for name in roots)})"
+        if root == "col" and roots is not None
+        else f"{root}()"
+    )
+    # Methods applied to a Series operand already end with `(series)`.
+    description += "".join(
+        f".{method}" if method.endswith(POSITIONAL_OPERAND) else f".{method}()"
+        for method in methods
+    )
+    outputs = compliant._output_names
+    if outputs is not None and len(outputs) == 1 and outputs != roots:
+        description += f".alias({outputs[0]!r})"
+    return description
+
+
+def _describe_args(node: PlanNode, plx: Any) -> str:
+    parts = [
+        "[" + ", ".join(_describe_expr(item, plx) for item in arg) + "]"
+        if isinstance(arg, (list, tuple))
+        else _describe_expr(arg, plx)
+        for arg in node.args[1:]
+        if not isinstance(arg, PlanNode)
+    ]
+    parts.extend(
+        f"{key}={_describe_expr(value, plx)}" for key, value in node.kwargs.items()
+    )
+    return ", ".join(parts)
+
+
+def _backend(native_object: Any) -> str:
+    from narwhals.profiling import _backend
+
+    return _backend(native_object)
+
+
+def _format(
+    plan: PlanNode, plx: Any, *, strategies: bool, analyzed: bool
+) -> Iterator[str]:
+    stack = [(plan, 0)]
+    while stack:
+        node, depth = stack.pop()
+        indent = "  " * depth
+        if node.source is not None:
+            line = f"{type(node.source).__name__}"
+            native = getattr(node.source, "_native_dataframe", None)
+            if native is not None:
+                line = f"{_backend(native)}.{type(native).__name__}"
+            line = f"SOURCE: {line}"
+        else:
+            line = f"{node.operation}({_describe_args(node, plx)})"
+        if analyzed:
+            timing = (
+                ""
+                if node.duration_ns is None
+                else f"time: {node.duration_ns / 1e6:.3f} ms, "
+            )
+            rows = "?" if node.n_rows is None else f"{node.n_rows}"
+            line += f"  ({timing}rows: {rows})"
+        yield indent + line
+        if strategies:
+            yield from (f"{indent}  -> {strategy}" for strategy in node.strategies)
+        stack.extend((child, depth + 1) for child in reversed(node.inputs))
+
+
+def explain(frame: LazyFrame[Any], *, optimized: bool, analyze: bool) -> str:
+    """Implementation of `LazyFrame.explain` for non-Polars backends."""
+    plan = _plan_of(frame)
+    analyzed = False
+    if analyze:
+        replayed = _replay(plan, frame)
+        collect = PlanNode("collect", args=(replayed._plan,))
+        start = perf_counter_ns()
+        result = _call(collect, replayed.collect)
+        collect.duration_ns = perf_counter_ns() - start
+        collect.n_rows = _n_rows(result)
+        plan = collect
+        analyzed = True
+    plx = frame.__narwhals_namespace__()
+    return "\n".join(_format(plan, plx, strategies=optimized, analyzed=analyzed))
@@ -0,0 +1,225 @@
+"""How each expression was built, for `Expr.meta` and `Expr.deserialize`.
+
+An `Expr` wraps a function of the namespace it's evaluated with, which can't be
+inspected, compared, or pickled. So the public functions and methods which
+build expressions also give their result the call which built it, as
+`Expr._node`: `(name, args, kwargs)`, where methods are named with a leading
+dot (e.g. `".alias"`, `".str.contains"`) and take the expression they're
+called on as their first argument. Replaying those calls rebuilds the
+expression.
+"""
+
+from __future__ import annotations
+
+import inspect
+import json
+from datetime import date
+from datetime import datetime
+from datetime import timedelta
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Tuple
+from typing import TypeVar
+
+from narwhals import dtypes
+
+if TYPE_CHECKING:
+    import sys
+
+    if sys.version_info >= (3, 10):
+        from typing import TypeAlias
+    else:
+        from typing_extensions import TypeAlias
+
+    from narwhals.expression import Expr
+
+F = TypeVar("F", bound=Callable[..., Any])
+T = TypeVar("T", bound=type)
+ExprT = TypeVar("ExprT", bound="Expr")
+
+# The call which built an expression: `(name, args, kwargs)`.
+ExprNode: TypeAlias = Tuple[str, Tuple[Any, ...], Dict[str, Any]]
+
+# Version of the serialized format.
+_VERSION = 1
+
+# Name -> function, for the functions which build expressions.
+_FUNCTIONS: dict[str, Callable[..., Any]] = {}
+# Names of the methods which build expressions, e.g. `"str.contains"`.
+_METHODS: set[str] = set()
+
+
+def expr_function(func: F) -> F:
+    """Register `func`, a public function which builds an expression, so that
+    it can be deserialized."""
+    module = func.__module__.rsplit(".", 1)[-1]
+    name = func.__name__ if module == "expression" else f"{module}.{func.__name__}"
+    _FUNCTIONS[name] = func
+    return func
+
+
+def expr_methods(namespace: str = "") -> Callable[[T], T]:
+    """Class decorator registering the public methods (and operators) of `Expr`,
+    or of one of its namespaces (e.g. `"str"`), so that they can be
+    deserialized."""
+
+    def decorator(cls: T) -> T:
+        prefix = f"{namespace}." if namespace else ""
+        for attr, method in vars(cls).items():
+            if not inspect.isfunction(method):
+                continue
+            if attr.startswith("_") and (
+                not attr.startswith("__")
+                or attr in {"__init__", "__hash__", "__reduce__"}
+            ):
+                continue
+            _METHODS.add(prefix + attr)
+        return cls
+
+    return decorator
+
+
+# --- serialization ---
+def _to_json(value: Any) -> Any:
+    from narwhals.expression import Expr
+
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Expr):
+        return {"expr": node_to_json(value)}
+    if isinstance(value, (list, tuple)):
+        return [_to_json(item) for item in value]
+    if isinstance(value, dict):
+        return {"dict": [[_to_json(k), _to_json(v)] for k, v in value.items()]}
+    if isinstance(value, type) and issubclass(value, dtypes.DType):
+        return {"dtype": value.__name__}
+    if isinstance(value, dtypes.DType):
+        return {"dtype": type(value).__name__, "instance": True}
+    if isinstance(value, datetime):
+        return {"datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"date": value.isoformat()}
+    if isinstance(value, timedelta):
+        return {"timedelta": [value.days, value.seconds, value.microseconds]}
+    msg = f"Cannot serialize expression: unsupported argument of type {type(value)}."
+    raise TypeError(msg)
+
+
+def node_to_json(expr: Expr) -> dict[str, Any]:
+    if expr._node is None:
+        msg = (
+            "Cannot serialize expression: it wasn't built with the public "
+            "Narwhals API."
+        )
+        raise TypeError(msg)
+    name, args, kwargs = expr._node
+    if name.startswith("."):
+        node = {"method": name[1:], "expr": node_to_json(args[0])}
+        args = args[1:]
+    else:
+        node = {"function": name}
+    if args:
+        node["args"] = [_to_json(arg) for arg in args]
+    if kwargs:
+        node["kwargs"] = {key: _to_json(value) for key, value in kwargs.items()}
+    return node
+
+
+def serialize(expr: Expr) -> str:
+    return json.dumps({"version": _VERSION, "expr": node_to_json(expr)})
+
+
+def _from_json(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_from_json(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if "expr" in value:
+        return node_from_json(value["expr"])
+    if "dict" in value:
+        return {_from_json(k): _from_json(v) for k, v in value["dict"]}
+    if "dtype" in value:
+        dtype = getattr(dtypes, value["dtype"], None)
+        if not (isinstance(dtype, type) and issubclass(dtype, dtypes.DType)):
+            msg = f"Cannot deserialize expression: unknown dtype {value['dtype']!r}."
+            raise ValueError(msg)
+        return dtype() if value.get("instance") else dtype
+    if "datetime" in value:
+        return datetime.fromisoformat(value["datetime"])
+    if "date" in value:
+        return date.fromisoformat(value["date"])
+    if "timedelta" in value:
+        return timedelta(*value["timedelta"])
+    msg = f"Cannot deserialize expression: invalid value {value!r}."
+    raise ValueError(msg)
+
+
+def node_from_json(node: dict[str, Any]) -> Expr:
+    args = [_from_json(arg) for arg in node.get("args", [])]
+    kwargs = {key: _from_json(value) for key, value in node.get("kwargs", {}).items()}
+    if "function" in node:
+        if node["function"] not in _FUNCTIONS:
+            msg = f"Cannot deserialize expression: unknown function {node['function']!r}."
+            raise ValueError(msg)
+        return _FUNCTIONS[node["function"]](*args, **kwargs)  # type: ignore[no-any-return]
+    if node["method"] not in _METHODS:
+        msg = f"Cannot deserialize expression: unknown method {node['method']!r}."
+        raise ValueError(msg)
+    obj: Any = node_from_json(node["expr"])
+    *namespaces, method = node["method"].split(".")
+    for namespace in namespaces:
+        obj = getattr(obj, namespace)
+    return getattr(obj, method)(*args, **kwargs)  # type: ignore[no-any-return]
+
+
+def deserialize(source: str, cls: type[ExprT]) -> ExprT:
+    """Rebuild the expression serialized in `source`, as an instance of `cls`
+    (e.g. the `Expr` of `narwhals.stable.v1`)."""
+    import narwhals.selectors  # noqa: F401  (registers the selector functions)
+
+    data = json.loads(source)
+    if data.get("version") != _VERSION:
+        msg = (
+            f"Cannot deserialize expression: unsupported version {data.get('version')!r}."
+        )
+        raise ValueError(msg)
+    expr = node_from_json(data["expr"])
+    if isinstance(expr, cls):
+        return expr
+    return cls(expr._call, expr._node)
+
+
+# --- comparison ---
+def _freeze(value: Any) -> Any:
+    from narwhals.expression import Expr
+
+    if isinstance(value, Expr):
+        return structure(value)
+    if isinstance(value, (list, tuple)):
+        return ("list", *(_freeze(item) for item in value))
+    if isinstance(value, dict):
+        items = sorted(((_freeze(k), _freeze(v)) for k, v in value.items()), key=repr)
+        return ("dict", *items)
+    if isinstance(value, float):
+        # So that `nan` is equal to itself.
+        return ("float", repr(value))
+    if isinstance(value, type) and issubclass(value, dtypes.DType):
+        return ("dtype", value.__name__)
+    if isinstance(value, dtypes.DType):
+        return ("dtype", type(value).__name__, "instance")
+    if value is None or isinstance(
+        value, (bool, int, str, bytes, date, datetime, timedelta)
+    ):
+        return (type(value).__name__, value)
+    # Anything else (e.g. a Series) is only equal to itself.
+    return ("object", id(value))
+
+
+def structure(expr: Expr) -> Any:
+    """Hashable description of `expr`, equal for expressions built the same way."""
+    if expr._node is None:
+        return ("object", id(expr))
+    name, args, kwargs = expr._node
+    return (name, _freeze(args), _freeze(kwargs))
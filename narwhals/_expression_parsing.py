@@ -3,6 +3,8 @@
 # and pandas or PyArrow.
 from __future__ import annotations
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from copy import copy
 from typing import TYPE_CHECKING
 from typing import Any
@@ -11,6 +13,8 @@ from typing import Union
 from typing import cast
 from typing import overload
 
+from narwhals._explain import note_strategy
+from narwhals.config import get_option
 from narwhals.dependencies import get_numpy
 from narwhals.utils import flatten
 
@@ -69,13 +73,15 @@ def evaluate_into_exprs(
     **named_exprs: IntoCompliantExprT,
 ) -> ListOfCompliantSeries:
     """Evaluate each expr into Series."""
+    into_exprs = [*flatten(exprs), *named_exprs.values()]
+    results = _evaluate_in_threads(df, into_exprs)
+    if results is None:
+        results = [evaluate_into_expr(df, into_expr) for into_expr in into_exprs]
+    n_unnamed = len(into_exprs) - len(named_exprs)
     series: ListOfCompliantSeries = [  # type: ignore[assignment]
-        item
-        for sublist in [evaluate_into_expr(df, into_expr) for into_expr in flatten(exprs)]
-        for item in sublist
+        item for sublist in results[:n_unnamed] for item in sublist
     ]
-    for name, expr in named_exprs.items():
-        evaluated_expr = evaluate_into_expr(df, expr)
+    for name, evaluated_expr in zip(named_exprs, results[n_unnamed:]):
         if len(evaluated_expr) > 1:
             msg = "Named expressions must return a single column"  # pragma: no cover
             raise AssertionError(msg)
@@ -83,6 +89,78 @@ def evaluate_into_exprs(
     return series
 
 
+_THREAD_NAME_PREFIX = "narwhals-evaluate"
+
+
+# The thread pool, and its number of threads. Only one is kept: changing
+# `n_threads` shuts the previous one down. Guarded by `_EXECUTOR_LOCK`.
+_EXECUTOR: tuple[ThreadPoolExecutor, int] | None = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_executor(n_threads: int) -> ThreadPoolExecutor:
+    """Return the thread pool, with `n_threads` threads.
+
+    Must be called with `_EXECUTOR_LOCK` held, until work has been submitted to
+    the pool: otherwise, another thread may shut it down in the meantime.
+    """
+    global _EXECUTOR  # noqa: PLW0603
+    if _EXECUTOR is not None and _EXECUTOR[1] == n_threads:
+        return _EXECUTOR[0]
+    if _EXECUTOR is not None:
+        # Work which was already submitted still runs, then its threads exit.
+        _EXECUTOR[0].shutdown(wait=False)
+    executor = ThreadPoolExecutor(n_threads, thread_name_prefix=_THREAD_NAME_PREFIX)
+    _EXECUTOR = (executor, n_threads)
+    return executor
+
+
+# In the pool's threads: the thread which submitted the work they're doing.
+_POOL_LOCAL = threading.local()
+
+
+def caller_thread_id() -> int:
+    """Identifier of the thread on whose behalf the current one is running: the
+    thread which submitted the expressions, in the `n_threads` pool, else itself."""
+    caller: int | None = getattr(_POOL_LOCAL, "caller", None)
+    return threading.get_ident() if caller is None else caller
+
+
+def _evaluate_in_threads(
+    df: CompliantDataFrame, into_exprs: list[Any]
+) -> list[ListOfCompliantSeries] | None:
+    """Evaluate independent expressions concurrently, if enabled.
+
+    Returns `None` if they should be evaluated sequentially instead: if
+    `nw.Config(n_threads=...)` isn't set, if there's only one expression, for Dask
+    (which is lazy anyway), or if we're already in one of the worker threads.
+    """
+    from narwhals._pandas_like.utils import Implementation
+
+    n_threads = get_option("n_threads")
+    if (
+        n_threads <= 1
+        or len(into_exprs) <= 1
+        or getattr(df, "_implementation", None) is Implementation.DASK
+        or threading.current_thread().name.startswith(_THREAD_NAME_PREFIX)
+    ):
+        return None
+    note_strategy(f"expressions: evaluated in {n_threads} threads")
+    namespace = df.__narwhals_namespace__()
+    exprs = [parse_into_expr(into_expr, namespace=namespace) for into_expr in into_exprs]
+    caller = caller_thread_id()
+
+    def evaluate(expr: CompliantExpr) -> ListOfCompliantSeries:
+        _POOL_LOCAL.caller = caller
+        return expr._call(df)  # type: ignore[arg-type]
+
+    # pyarrow.compute kernels and most NumPy operations release the GIL.
+    with _EXECUTOR_LOCK:
+        # `map` submits all the work straight away.
+        results = _get_executor(n_threads).map(evaluate, exprs)
+    return list(results)
+
+
 def maybe_evaluate_expr(
     df: CompliantDataFrame, expr: CompliantExpr | T
 ) -> ListOfCompliantSeries | T:
@@ -154,6 +232,15 @@ def parse_into_expr(
     raise AssertionError(msg)
 
 
+POSITIONAL_OPERAND = "(series)"
+
+
+def _is_positional_operand(arg: Any) -> bool:
+    if hasattr(arg, "__narwhals_series__"):
+        return True
+    return (np := get_numpy()) is not None and isinstance(arg, np.ndarray)
+
+
 def reuse_series_implementation(
     expr: CompliantExprT,
     attr: str,
@@ -221,10 +308,17 @@ def reuse_series_implementation(
         msg = "Safety assertion failed, please report a bug to https://github.com/narwhals-dev/narwhals/issues"
         raise AssertionError(msg)
 
+    # Series and array operands are aligned by position with the whole frame, so
+    # they're marked for `is_elementwise`: evaluating such an expression on a slice
+    # of the frame would give a different result.
+    function_name = f"{expr._function_name}->{attr}"
+    if any(_is_positional_operand(arg) for arg in (*args, *kwargs.values())):
+        function_name += POSITIONAL_OPERAND
+
     return plx._create_expr_from_callable(  # type: ignore[return-value]
         func,  # type: ignore[arg-type]
         depth=expr._depth + 1,
-        function_name=f"{expr._function_name}->{attr}",
+        function_name=function_name,
         root_names=root_names,
         output_names=output_names,
     )
@@ -264,3 +358,69 @@ def is_simple_aggregation(expr: CompliantExpr) -> bool:
     because then, we can use a fastpath in pandas.
     """
     return expr._depth < 2
+
+
+# Operations whose output at each row only depends on the input at that row.
+ELEMENTWISE_FUNCTIONS = {
+    "__eq__",
+    "__ne__",
+    "__ge__",
+    "__gt__",
+    "__le__",
+    "__lt__",
+    "__and__",
+    "__or__",
+    "__invert__",
+    "__add__",
+    "__radd__",
+    "__sub__",
+    "__rsub__",
+    "__mul__",
+    "__rmul__",
+    "__pow__",
+    "__rpow__",
+    "__truediv__",
+    "__rtruediv__",
+    "__floordiv__",
+    "__rfloordiv__",
+    "__mod__",
+    "__rmod__",
+    "abs",
+    "alias",
+    "cast",
+    "fill_null",
+    "is_between",
+    "is_in",
+    "is_null",
+    "round",
+    "dt.to_string",
+    "dt.year",
+    "dt.month",
+    "dt.day",
+    "dt.hour",
+    "dt.minute",
+    "dt.second",
+    "str.contains",
+    "str.ends_with",
+    "str.slice",
+    "str.starts_with",
+    "str.to_lowercase",
+    "str.to_uppercase",
+}
+
+
+def is_elementwise(expr: CompliantExpr) -> bool:
+    """Whether `expr` is a chain of elementwise operations on a single column.
+
+    Expressions don't record their arguments, so we require exactly one root
+    column: otherwise, `nw.col('a') == nw.col('a').max()` would look elementwise.
+    Functions applied to a Series or array operand (e.g. `nw.col('a') + s`) are
+    marked with `POSITIONAL_OPERAND`, and aren't elementwise either.
+    """
+    root, *functions = expr._function_name.split("->")
+    return (
+        root == "col"
+        and expr._root_names is not None
+        and len(expr._root_names) == 1
+        and all(function in ELEMENTWISE_FUNCTIONS for function in functions)
+    )
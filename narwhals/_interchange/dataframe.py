@@ -3,11 +3,16 @@ from __future__ import annotations
 import enum
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import Literal
 from typing import NoReturn
 
 from narwhals import dtypes
 
 if TYPE_CHECKING:
+    from typing_extensions import Self
+
+    from narwhals._arrow.dataframe import ArrowDataFrame
+    from narwhals._arrow.namespace import ArrowNamespace
     from narwhals._interchange.series import InterchangeSeries
 
 
@@ -74,6 +79,14 @@ class InterchangeFrame:
     def __narwhals_dataframe__(self) -> Any:
         return self
 
+    def __narwhals_namespace__(self) -> ArrowNamespace:
+        from narwhals._arrow.namespace import get_arrow_namespace
+
+        return get_arrow_namespace(_pyarrow_version())
+
+    def _from_native_dataframe(self, df: Any) -> Self:
+        return self.__class__(df)
+
     def __getitem__(self, item: str) -> InterchangeSeries:
         from narwhals._interchange.series import InterchangeSeries
 
@@ -88,6 +101,73 @@ class InterchangeFrame:
             for column_name in self._native_dataframe.column_names()
         }
 
+    @property
+    def columns(self) -> list[str]:
+        return list(self._native_dataframe.column_names())
+
+    def _to_arrow_dataframe(self, columns: list[str] | None = None) -> ArrowDataFrame:
+        # Only the requested columns are materialized. PyArrow wraps the
+        # interchange buffers without copying whenever the memory layout allows it.
+        import pyarrow.interchange as pai
+
+        from narwhals._arrow.dataframe import ArrowDataFrame
+
+        df = self._native_dataframe
+        if columns is not None and columns != self.columns:
+            df = df.select_columns_by_name(columns)
+        return ArrowDataFrame(
+            pai.from_dataframe(df, allow_copy=True),
+            backend_version=_pyarrow_version(),
+        )
+
+    def _from_arrow_dataframe(self, df: ArrowDataFrame) -> Self:
+        # PyArrow tables implement the interchange protocol themselves, so
+        # results stay at the interchange level without any further copy.
+        return self._from_native_dataframe(df._native_dataframe.__dataframe__())
+
+    def select(self, *exprs: Any, **named_exprs: Any) -> Self:
+        if not named_exprs and all(isinstance(x, str) for x in exprs):
+            # Pure projection: defer materialization until the data is needed.
+            return self._from_native_dataframe(
+                self._native_dataframe.select_columns_by_name(list(exprs))
+            )
+        arrow_df = self._to_arrow_dataframe(_root_names([*exprs, *named_exprs.values()]))
+        return self._from_arrow_dataframe(arrow_df.select(*exprs, **named_exprs))
+
+    def filter(self, *predicates: Any) -> Self:
+        arrow_df = self._to_arrow_dataframe()
+        return self._from_arrow_dataframe(arrow_df.filter(*predicates))
+
+    def head(self, n: int) -> Self:
+        if n < 0:
+            return self._from_arrow_dataframe(self._to_arrow_dataframe().head(n))
+        import pyarrow as pa
+        import pyarrow.interchange as pai
+
+        # Only convert as many chunks as are needed to get `n` rows.
+        tables = []
+        n_rows = 0
+        for chunk in self._native_dataframe.get_chunks():
+            if n_rows >= n:
+                break
+            table = pai.from_dataframe(chunk, allow_copy=True)
+            tables.append(table)
+            n_rows += table.num_rows
+        if tables:
+            table = pa.concat_tables(tables).slice(0, n)
+        else:  # pragma: no cover
+            table = pai.from_dataframe(self._native_dataframe, allow_copy=True)
+        return self._from_native_dataframe(table.__dataframe__())
+
+    def to_arrow(self) -> Any:
+        return self._to_arrow_dataframe()._native_dataframe
+
+    def to_pandas(self) -> Any:
+        return self._to_arrow_dataframe().to_pandas()
+
+    def to_numpy(self, order: Literal["c", "fortran"] = "fortran") -> Any:
+        return self._to_arrow_dataframe().to_numpy(order=order)
+
     def __getattr__(self, attr: str) -> NoReturn:
         msg = (
             f"Attribute {attr} is not supported for metadata-only dataframes.\n\n"
@@ -97,3 +177,24 @@ class InterchangeFrame:
             "at https://github.com/narwhals-dev/narwhals/issues."
         )
         raise NotImplementedError(msg)
+
+
+def _root_names(exprs: list[Any]) -> list[str] | None:
+    """Return the columns needed to evaluate `exprs`, or `None` if all of them are."""
+    names: list[str] = []
+    for expr in exprs:
+        if isinstance(expr, str):
+            names.append(expr)
+        elif (root_names := getattr(expr, "_root_names", None)) is not None:
+            names.extend(root_names)
+        else:
+            return None
+    return list(dict.fromkeys(names))
+
+
+def _pyarrow_version() -> tuple[int, ...]:
+    import pyarrow as pa
+
+    from narwhals.utils import parse_version
+
+    return parse_version(pa.__version__)
@@ -9,12 +9,16 @@ from typing import Literal
 from typing import Sequence
 from typing import overload
 
+from narwhals._explain import note_strategy
 from narwhals._expression_parsing import evaluate_into_exprs
 from narwhals._pandas_like.expr import PandasLikeExpr
+from narwhals._pandas_like.parallel import maybe_map_partitions
 from narwhals._pandas_like.utils import Implementation
 from narwhals._pandas_like.utils import create_native_series
 from narwhals._pandas_like.utils import generate_unique_token
 from narwhals._pandas_like.utils import horizontal_concat
+from narwhals._pandas_like.utils import maybe_reset_index
+from narwhals._pandas_like.utils import native_null_count
 from narwhals._pandas_like.utils import translate_dtype
 from narwhals._pandas_like.utils import validate_dataframe_comparand
 from narwhals._pandas_like.utils import validate_indices
@@ -23,7 +27,9 @@ from narwhals.dependencies import get_dask
 from narwhals.dependencies import get_modin
 from narwhals.dependencies import get_numpy
 from narwhals.dependencies import get_pandas
+from narwhals.diagnostics import record_slow_path
 from narwhals.utils import flatten
+from narwhals.utils import scale_bytes
 
 if TYPE_CHECKING:
     from typing_extensions import Self
@@ -36,6 +42,12 @@ if TYPE_CHECKING:
 
 
 class PandasLikeDataFrame:
+    __slots__ = (
+        "_native_dataframe",
+        "_implementation",
+        "_backend_version",
+    )
+
     # --- not in the spec ---
     def __init__(
         self,
@@ -43,9 +55,15 @@ class PandasLikeDataFrame:
         *,
         implementation: Implementation,
         backend_version: tuple[int, ...],
+        validate_column_names: bool = True,
     ) -> None:
-        self._validate_columns(native_dataframe.columns)
-        self._native_dataframe = native_dataframe
+        if validate_column_names:
+            self._validate_columns(native_dataframe.columns)
+        self._native_dataframe = maybe_reset_index(
+            native_dataframe,
+            implementation=implementation,
+            backend_version=backend_version,
+        )
         self._implementation = implementation
         self._backend_version = backend_version
 
@@ -56,9 +74,9 @@ class PandasLikeDataFrame:
         return self
 
     def __narwhals_namespace__(self) -> PandasLikeNamespace:
-        from narwhals._pandas_like.namespace import PandasLikeNamespace
+        from narwhals._pandas_like.namespace import get_pandas_like_namespace
 
-        return PandasLikeNamespace(self._implementation, self._backend_version)
+        return get_pandas_like_namespace(self._implementation, self._backend_version)
 
     def __native_namespace__(self) -> Any:
         if self._implementation is Implementation.PANDAS:
@@ -85,11 +103,16 @@ class PandasLikeDataFrame:
             msg = "Please report a bug"  # pragma: no cover
             raise AssertionError(msg)
 
-    def _from_native_dataframe(self, df: Any) -> Self:
+    def _from_native_dataframe(
+        self, df: Any, *, validate_column_names: bool = True
+    ) -> Self:
+        # Operations which can't change the column names (e.g. `filter`, `sort`)
+        # pass `validate_column_names=False`, as `self` has already been validated.
         return self.__class__(
             df,
             implementation=self._implementation,
             backend_version=self._backend_version,
+            validate_column_names=validate_column_names,
         )
 
     def get_column(self, name: str) -> PandasLikeSeries:
@@ -147,7 +170,9 @@ class PandasLikeDataFrame:
             and isinstance(item, np.ndarray)
             and item.ndim == 1
         ):
-            return self._from_native_dataframe(self._native_dataframe.iloc[item])
+            return self._from_native_dataframe(
+                self._native_dataframe.iloc[item], validate_column_names=False
+            )
 
         else:  # pragma: no cover
             msg = f"Expected str or slice, got: {type(item)}"
@@ -200,6 +225,10 @@ class PandasLikeDataFrame:
         *exprs: IntoPandasLikeExpr,
         **named_exprs: IntoPandasLikeExpr,
     ) -> Self:
+        if (
+            result := maybe_map_partitions(self, "select", *exprs, **named_exprs)
+        ) is not None:
+            return result
         new_series = evaluate_into_exprs(self, *exprs, **named_exprs)
         if not new_series:
             # return empty dataframe, like Polars does
@@ -216,41 +245,60 @@ class PandasLikeDataFrame:
         return self._from_native_dataframe(df)
 
     def drop_nulls(self) -> Self:
-        return self._from_native_dataframe(self._native_dataframe.dropna(axis=0))
-
-    def with_row_index(self, name: str) -> Self:
-        row_index = create_native_series(
-            range(len(self._native_dataframe)),
-            index=self._native_dataframe.index,
-            implementation=self._implementation,
-            backend_version=self._backend_version,
-        ).alias(name)
         return self._from_native_dataframe(
-            horizontal_concat(
-                [row_index._native_series, self._native_dataframe],
+            self._native_dataframe.dropna(axis=0), validate_column_names=False
+        )
+
+    def with_row_index(self, name: str, offset: int) -> Self:
+        if self._implementation is Implementation.DASK:
+            row_index = create_native_series(
+                range(offset, offset + len(self._native_dataframe)),
+                index=self._native_dataframe.index,
                 implementation=self._implementation,
                 backend_version=self._backend_version,
+            ).alias(name)
+            return self._from_native_dataframe(
+                horizontal_concat(
+                    [row_index._native_series, self._native_dataframe],
+                    implementation=self._implementation,
+                    backend_version=self._backend_version,
+                )
             )
-        )
+        np = get_numpy()
+        # A shallow copy shares the existing columns, so inserting the new
+        # one doesn't copy (or modify) them.
+        df = self._native_dataframe.copy(deep=False)
+        df.insert(0, name, np.arange(offset, offset + len(df)))
+        return self._from_native_dataframe(df)
 
     def filter(
         self,
         *predicates: IntoPandasLikeExpr,
     ) -> Self:
-        from narwhals._pandas_like.namespace import PandasLikeNamespace
+        from narwhals._pandas_like.namespace import get_pandas_like_namespace
+
+        if (result := maybe_map_partitions(self, "filter", *predicates)) is not None:
+            return result
 
-        plx = PandasLikeNamespace(self._implementation, self._backend_version)
+        note_strategy("filter: boolean mask")
+        plx = get_pandas_like_namespace(self._implementation, self._backend_version)
         expr = plx.all_horizontal(*predicates)
         # Safety: all_horizontal's expression only returns a single column.
         mask = expr._call(self)[0]
         _mask = validate_dataframe_comparand(self._native_dataframe.index, mask)
-        return self._from_native_dataframe(self._native_dataframe.loc[_mask])
+        return self._from_native_dataframe(
+            self._native_dataframe.loc[_mask], validate_column_names=False
+        )
 
     def with_columns(
         self,
         *exprs: IntoPandasLikeExpr,
         **named_exprs: IntoPandasLikeExpr,
     ) -> Self:
+        if (
+            result := maybe_map_partitions(self, "with_columns", *exprs, **named_exprs)
+        ) is not None:
+            return result
         index = self._native_dataframe.index
         new_columns = evaluate_into_exprs(self, *exprs, **named_exprs)
         # If the inputs are all Expressions which return full columns
@@ -258,8 +306,11 @@ class PandasLikeDataFrame:
         # We can't use the fastpath if any input is not an expression (e.g.
         # if it's a Series) because then we might be changing its flags.
         # See `test_memmap` for an example of where this is necessary.
+        # Compare to the frame's length rather than to 1, so that columns of a
+        # one-row frame aren't mistaken for scalars.
+        n_rows = len(index)
         fast_path = (
-            all(len(s) > 1 for s in new_columns)
+            all(len(s) == n_rows for s in new_columns)
             and all(isinstance(x, PandasLikeExpr) for x in exprs)
             and all(isinstance(x, PandasLikeExpr) for (_, x) in named_exprs.items())
         )
@@ -272,13 +323,17 @@ class PandasLikeDataFrame:
                 if name in new_column_name_to_new_column_map:
                     to_concat.append(
                         validate_dataframe_comparand(
-                            index, new_column_name_to_new_column_map.pop(name)
+                            index,
+                            new_column_name_to_new_column_map.pop(name),
+                            broadcast=False,
                         )
                     )
                 else:
                     to_concat.append(self._native_dataframe.loc[:, name])
             to_concat.extend(
-                validate_dataframe_comparand(index, new_column_name_to_new_column_map[s])
+                validate_dataframe_comparand(
+                    index, new_column_name_to_new_column_map[s], broadcast=False
+                )
                 for s in new_column_name_to_new_column_map
             )
 
@@ -288,17 +343,20 @@ class PandasLikeDataFrame:
                 backend_version=self._backend_version,
             )
         else:
+            record_slow_path("with_columns.assign")
             df = self._native_dataframe.assign(
                 **{s.name: validate_dataframe_comparand(index, s) for s in new_columns}
             )
-        return self._from_native_dataframe(df)
+        # New columns either replace existing ones or are appended, by name.
+        return self._from_native_dataframe(df, validate_column_names=False)
 
     def rename(self, mapping: dict[str, str]) -> Self:
         return self._from_native_dataframe(self._native_dataframe.rename(columns=mapping))
 
     def drop(self, *columns: str | Iterable[str]) -> Self:
         return self._from_native_dataframe(
-            self._native_dataframe.drop(columns=list(flatten(columns)))
+            self._native_dataframe.drop(columns=list(flatten(columns))),
+            validate_column_names=False,
         )
 
     # --- transform ---
@@ -314,7 +372,9 @@ class PandasLikeDataFrame:
             ascending: bool | list[bool] = not descending
         else:
             ascending = [not d for d in descending]
-        return self._from_native_dataframe(df.sort_values(flat_keys, ascending=ascending))
+        return self._from_native_dataframe(
+            df.sort_values(flat_keys, ascending=ascending), validate_column_names=False
+        )
 
     # --- convert ---
     def collect(self) -> PandasLikeDataFrame:
@@ -328,6 +388,7 @@ class PandasLikeDataFrame:
             return_df,
             implementation=return_implementation,
             backend_version=self._backend_version,
+            validate_column_names=False,
         )
 
     # --- actions ---
@@ -353,6 +414,7 @@ class PandasLikeDataFrame:
             right_on = [right_on]
 
         if how == "cross":
+            note_strategy("join: cross join (merge)")
             if (
                 self._implementation is Implementation.MODIN
                 or self._implementation is Implementation.CUDF
@@ -383,6 +445,9 @@ class PandasLikeDataFrame:
                 )
 
         if how == "anti":
+            note_strategy(
+                "join: anti join (outer merge on distinct keys, with indicator)"
+            )
             indicator_token = generate_unique_token(
                 n_bytes=8, columns=[*self.columns, *other.columns]
             )
@@ -403,10 +468,12 @@ class PandasLikeDataFrame:
                     right_on=left_on,
                 )
                 .loc[lambda t: t[indicator_token] == "left_only"]
-                .drop(columns=[indicator_token])
+                .drop(columns=[indicator_token]),
+                validate_column_names=False,
             )
 
         if how == "semi":
+            note_strategy("join: semi join (inner merge on distinct keys)")
             other_native = (
                 other._native_dataframe.loc[:, right_on]
                 .rename(  # rename to avoid creating extra columns in join
@@ -420,9 +487,11 @@ class PandasLikeDataFrame:
                     how="inner",
                     left_on=left_on,
                     right_on=left_on,
-                )
+                ),
+                validate_column_names=False,
             )
 
+        note_strategy(f"join: hash join (merge, how={how!r})")
         if how == "left":
             other_native = other._native_dataframe
             result_native = self._native_dataframe.merge(
@@ -453,15 +522,20 @@ class PandasLikeDataFrame:
     # --- partial reduction ---
 
     def head(self, n: int) -> Self:
-        return self._from_native_dataframe(self._native_dataframe.head(n))
+        return self._from_native_dataframe(
+            self._native_dataframe.head(n), validate_column_names=False
+        )
 
     def tail(self, n: int) -> Self:
-        return self._from_native_dataframe(self._native_dataframe.tail(n))
+        return self._from_native_dataframe(
+            self._native_dataframe.tail(n), validate_column_names=False
+        )
 
     def unique(self, subset: str | list[str]) -> Self:
         subset = flatten(subset)
         return self._from_native_dataframe(
-            self._native_dataframe.drop_duplicates(subset=subset)
+            self._native_dataframe.drop_duplicates(subset=subset),
+            validate_column_names=False,
         )
 
     # --- lazy-only ---
@@ -487,21 +561,62 @@ class PandasLikeDataFrame:
             }
         return self._native_dataframe.to_dict(orient="list")  # type: ignore[no-any-return]
 
-    def to_numpy(self) -> Any:
+    def to_numpy(self, order: Literal["c", "fortran"] = "fortran") -> Any:
         from narwhals._pandas_like.series import PANDAS_TO_NUMPY_DTYPE_MISSING
+        from narwhals._pandas_like.series import PANDAS_TO_NUMPY_DTYPE_NO_MISSING
 
-        # pandas return `object` dtype for nullable dtypes, so we cast each
-        # Series to numpy and let numpy find a common dtype.
-        # If there aren't any dtypes where `to_numpy()` is "broken" (i.e. it
-        # returns Object) then we just call `to_numpy()` on the DataFrame.
-        for dtype in self._native_dataframe.dtypes:
-            if str(dtype) in PANDAS_TO_NUMPY_DTYPE_MISSING:
-                import numpy as np
-
-                return np.hstack([self[col].to_numpy()[:, None] for col in self.columns])
+        np = get_numpy()
+        df = self._native_dataframe
         if self._implementation is Implementation.DASK:
-            return self._native_dataframe.compute().to_numpy()
-        return self._native_dataframe.to_numpy()
+            df = df.compute()
+
+        # pandas returns `object` dtype for nullable dtypes. If there aren't any,
+        # then `to_numpy()` gives the right result (and, if the frame is a single
+        # numpy block, a view of it).
+        if not any(str(dtype) in PANDAS_TO_NUMPY_DTYPE_MISSING for dtype in df.dtypes):
+            result = df.to_numpy()
+            if order == "c":
+                return np.ascontiguousarray(result)
+            return np.asfortranarray(result)
+
+        # Otherwise, find each column's numpy dtype and the result dtype, then
+        # fill a preallocated array column by column.
+        record_slow_path("to_numpy.nullable")
+        if self._implementation is Implementation.PANDAS and self._backend_version < (
+            1,
+        ):  # pragma: no cover
+            kwargs = {}
+        else:
+            kwargs = {"na_value": float("nan")}
+        columns = []
+        for i in range(df.shape[1]):
+            series = df.iloc[:, i]
+            dtype = str(series.dtype)
+            if (
+                dtype in PANDAS_TO_NUMPY_DTYPE_MISSING
+                and native_null_count(series, self._implementation) > 0
+            ):
+                columns.append(
+                    (series, np.dtype(PANDAS_TO_NUMPY_DTYPE_MISSING[dtype]), kwargs)
+                )
+            elif dtype in PANDAS_TO_NUMPY_DTYPE_NO_MISSING:
+                columns.append(
+                    (series, np.dtype(PANDAS_TO_NUMPY_DTYPE_NO_MISSING[dtype]), {})
+                )
+            else:
+                columns.append((series, series.iloc[:0].to_numpy().dtype, {}))
+        try:
+            result_dtype = np.result_type(*(dtype for _, dtype, _ in columns))
+        except TypeError:
+            # e.g. datetimes and numbers
+            result_dtype = np.dtype("object")
+
+        result = np.empty(
+            df.shape, dtype=result_dtype, order="C" if order == "c" else "F"
+        )
+        for i, (series, dtype, to_numpy_kwargs) in enumerate(columns):
+            result[:, i] = series.to_numpy(dtype=dtype, **to_numpy_kwargs)
+        return result
 
     def to_pandas(self) -> Any:
         if self._implementation is Implementation.PANDAS:
@@ -512,8 +627,20 @@ class PandasLikeDataFrame:
             return self._native_dataframe.compute()
         return self._native_dataframe.to_pandas()  # pragma: no cover
 
-    def write_parquet(self, file: Any) -> Any:
-        self._native_dataframe.to_parquet(file)
+    def to_arrow(self) -> Any:
+        if self._implementation is Implementation.CUDF:  # pragma: no cover
+            return self._native_dataframe.to_arrow(preserve_index=False)
+        import pyarrow as pa
+
+        return pa.Table.from_pandas(self.to_pandas(), preserve_index=False)
+
+    def write_parquet(self, file: Any, **kwargs: Any) -> Any:
+        self._native_dataframe.to_parquet(file, **kwargs)
+
+    def write_ipc(self, file: Any, *, compression: str | None) -> Any:
+        from narwhals._arrow.utils import write_ipc_file
+
+        write_ipc_file(self.to_arrow(), file, compression=compression)
 
     # --- descriptive ---
     def is_duplicated(self: Self) -> PandasLikeSeries:
@@ -525,6 +652,12 @@ class PandasLikeDataFrame:
             backend_version=self._backend_version,
         )
 
+    def estimated_size(self, unit: str = "b") -> int | float:
+        sz = self._native_dataframe.memory_usage(deep=True, index=True).sum()
+        if self._implementation is Implementation.DASK:
+            sz = sz.compute()
+        return scale_bytes(int(sz), unit)
+
     def is_empty(self: Self) -> bool:
         return self._native_dataframe.empty  # type: ignore[no-any-return]
 
@@ -538,10 +671,24 @@ class PandasLikeDataFrame:
         )
 
     def null_count(self: Self) -> PandasLikeDataFrame:
+        df = self._native_dataframe
+        if self._implementation is Implementation.DASK:
+            return PandasLikeDataFrame(
+                df.isna().sum(axis=0).to_frame().transpose(),
+                implementation=self._implementation,
+                backend_version=self._backend_version,
+            )
+        # Count column by column, so that metadata can be used where available
+        # instead of building a full boolean frame.
+        counts = {
+            name: [native_null_count(df.iloc[:, i], self._implementation)]
+            for i, name in enumerate(df.columns)
+        }
         return PandasLikeDataFrame(
-            self._native_dataframe.isna().sum(axis=0).to_frame().transpose(),
+            df.__class__(counts, columns=df.columns, dtype="int64"),
             implementation=self._implementation,
             backend_version=self._backend_version,
+            validate_column_names=False,
         )
 
     def item(self: Self, row: int | None = None, column: int | str | None = None) -> Any:
@@ -563,4 +710,6 @@ class PandasLikeDataFrame:
         return self._native_dataframe.iloc[row, _col]
 
     def clone(self: Self) -> Self:
-        return self._from_native_dataframe(self._native_dataframe.copy())
+        return self._from_native_dataframe(
+            self._native_dataframe.copy(), validate_column_names=False
+        )
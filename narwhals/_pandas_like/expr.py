@@ -18,6 +18,16 @@ if TYPE_CHECKING:
 
 
 class PandasLikeExpr:
+    __slots__ = (
+        "_call",
+        "_depth",
+        "_function_name",
+        "_root_names",
+        "_output_names",
+        "_implementation",
+        "_backend_version",
+    )
+
     def __init__(
         self,
         call: Callable[[PandasLikeDataFrame], list[PandasLikeSeries]],
@@ -48,9 +58,9 @@ class PandasLikeExpr:
         )
 
     def __narwhals_namespace__(self) -> PandasLikeNamespace:
-        from narwhals._pandas_like.namespace import PandasLikeNamespace
+        from narwhals._pandas_like.namespace import get_pandas_like_namespace
 
-        return PandasLikeNamespace(self._implementation, self._backend_version)
+        return get_pandas_like_namespace(self._implementation, self._backend_version)
 
     def __narwhals_expr__(self) -> None: ...
 
@@ -217,9 +227,9 @@ class PandasLikeExpr:
         return reuse_series_implementation(self, "is_in", other=other)
 
     def filter(self, *predicates: Any) -> Self:
-        from narwhals._pandas_like.namespace import PandasLikeNamespace
+        from narwhals._pandas_like.namespace import get_pandas_like_namespace
 
-        plx = PandasLikeNamespace(self._implementation, self._backend_version)
+        plx = get_pandas_like_namespace(self._implementation, self._backend_version)
         expr = plx.all_horizontal(*predicates)
         return reuse_series_implementation(self, "filter", other=expr)
 
@@ -8,10 +8,14 @@ from typing import Any
 from typing import Callable
 from typing import Iterator
 
+from narwhals._explain import note_strategy
 from narwhals._expression_parsing import is_simple_aggregation
 from narwhals._expression_parsing import parse_into_exprs
+from narwhals._pandas_like.parallel import maybe_agg_partitions
+from narwhals._pandas_like.parallel import maybe_apply_partitions
 from narwhals._pandas_like.utils import Implementation
 from narwhals._pandas_like.utils import native_series_from_iterable
+from narwhals.diagnostics import record_slow_path
 from narwhals.utils import remove_prefix
 
 if TYPE_CHECKING:
@@ -34,7 +38,6 @@ class PandasLikeGroupBy:
         self._grouped = self._df._native_dataframe.groupby(
             list(self._keys),
             sort=False,
-            as_index=True,
             dropna=False,
             **keywords,
         )
@@ -61,12 +64,18 @@ class PandasLikeGroupBy:
                 raise ValueError(msg)
             output_names.extend(expr._output_names)
 
+        if (
+            result := maybe_agg_partitions(self._df, self._keys, exprs, output_names)
+        ) is not None:
+            return self._from_native_dataframe(result)
+
         dataframe_is_empty = (
             self._df._native_dataframe.empty
             if self._df._implementation != Implementation.DASK
             else len(self._df._native_dataframe) == 0
         )
         return agg_pandas(
+            self._df,
             self._grouped,
             exprs,
             self._keys,
@@ -84,6 +93,7 @@ class PandasLikeGroupBy:
             df,
             implementation=self._df._implementation,
             backend_version=self._df._backend_version,
+            validate_column_names=False,
         )
 
     def __iter__(self) -> Iterator[tuple[Any, PandasLikeDataFrame]]:
@@ -102,6 +112,7 @@ class PandasLikeGroupBy:
 
 
 def agg_pandas(
+    df: PandasLikeDataFrame,
     grouped: Any,
     exprs: list[PandasLikeExpr],
     keys: list[str],
@@ -125,6 +136,7 @@ def agg_pandas(
             break
 
     if all_simple_aggs:
+        note_strategy("group_by: vectorized agg")
         simple_aggregations: dict[str, tuple[str, str]] = {}
         for expr in exprs:
             if expr._depth == 0:
@@ -182,6 +194,8 @@ def agg_pandas(
         )
         raise ValueError(msg)
 
+    note_strategy("group_by: apply fallback (Python function called on each group)")
+    record_slow_path("group_by.apply")
     warnings.warn(
         "Found complex group-by expression, which can't be expressed efficiently with the "
         "pandas API. If you can, please rewrite your query such that group-by aggregations "
@@ -205,11 +219,13 @@ def agg_pandas(
             implementation=implementation,
         )
 
-    if implementation is Implementation.PANDAS and backend_version >= (2, 2):
-        result_complex = grouped.apply(func, include_groups=False)
-    else:  # pragma: no cover
-        result_complex = grouped.apply(func)
-
-    result = result_complex.reset_index()
+    def apply(grouped: Any) -> Any:
+        if implementation is Implementation.PANDAS and backend_version >= (2, 2):
+            result_complex = grouped.apply(func, include_groups=False)
+        else:  # pragma: no cover
+            result_complex = grouped.apply(func)
+        return result_complex.reset_index().loc[:, output_names]
 
-    return from_dataframe(result.loc[:, output_names])
+    if (result := maybe_apply_partitions(df, keys, apply)) is not None:
+        return from_dataframe(result)
+    return from_dataframe(apply(grouped))
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from functools import reduce
 from typing import TYPE_CHECKING
 from typing import Any
@@ -251,3 +252,15 @@ class PandasLikeNamespace:
                 backend_version=self._backend_version,
             )
         raise NotImplementedError
+
+
+@lru_cache(maxsize=None)
+def get_pandas_like_namespace(
+    implementation: Implementation, backend_version: tuple[int, ...]
+) -> PandasLikeNamespace:
+    """Return the (shared) namespace for `implementation` and `backend_version`.
+
+    Namespaces hold no state besides these two, so compliant objects can reuse
+    one instance rather than building a new one for every expression node.
+    """
+    return PandasLikeNamespace(implementation, backend_version)
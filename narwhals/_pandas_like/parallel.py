@@ -0,0 +1,308 @@
+"""Partitioned execution of pandas operations in a pool of processes.
+
+See the `n_processes` option of `narwhals.Config`. Compliant expressions are
+closures, so they can't be sent to other processes. Instead, each call forks a
+new pool of worker processes, which are given the frame and the operation
+through the pool's initializer: forked workers inherit them (copy-on-write,
+without copying or pickling the input), and only need to be told which
+partition to process. Their results are pickled back, and then concatenated in
+order.
+
+Forking has a fixed cost, and so does pickling the results, so this only pays
+off for large inputs:
+
+- elementwise `select`, `with_columns` and `filter`, over partitions of rows,
+  when the expressions are expensive compared to copying their results;
+- `group_by(...).agg` with `sum`, `mean`, `min`, `max`, `count` and `len`, as
+  partial aggregations of partitions of rows which are then combined;
+- `group_by(...).agg` with other aggregations which pandas can't compute
+  natively, and which would otherwise call a Python function on each group one
+  after the other, over partitions of the groups.
+
+Forking a process which runs other threads isn't safe (they may hold locks
+which then stay locked forever in the child), so everything runs sequentially
+while other Python threads are running. The threads of the `n_threads` pool
+don't count: they only run while another thread waits for them.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import Sequence
+from typing import TypeVar
+
+from narwhals._explain import note_strategy
+from narwhals._expression_parsing import _THREAD_NAME_PREFIX
+from narwhals._expression_parsing import is_elementwise
+from narwhals._expression_parsing import is_simple_aggregation
+from narwhals._expression_parsing import parse_into_exprs
+from narwhals._pandas_like.expr import PandasLikeExpr
+from narwhals._pandas_like.utils import Implementation
+from narwhals._pandas_like.utils import vertical_concat
+from narwhals.config import _OPTIONS
+from narwhals.config import get_option
+from narwhals.dependencies import get_numpy
+from narwhals.dependencies import get_pandas
+from narwhals.utils import remove_prefix
+
+if TYPE_CHECKING:
+    from narwhals._pandas_like.dataframe import PandasLikeDataFrame
+    from narwhals._pandas_like.typing import IntoPandasLikeExpr
+
+PandasLikeDataFrameT = TypeVar("PandasLikeDataFrameT", bound="PandasLikeDataFrame")
+
+# Frames with fewer rows than this (per process) aren't worth forking for.
+MIN_ROWS_PER_PARTITION = 100_000
+# Same, for the number of groups when calling a Python function on each group.
+MIN_GROUPS_PER_PARTITION = 1_000
+
+# Aggregations which can be computed per partition and then combined. The
+# values are the aggregations used to combine the partial results.
+COMBINABLE_AGGREGATIONS = {
+    "sum": "sum",
+    "count": "sum",
+    "size": "sum",
+    "min": "min",
+    "max": "max",
+}
+
+# In worker processes only: the function to call on each partition.
+_TASK: Callable[[Any], Any] | None = None
+_IN_WORKER = False
+
+
+def _init_worker(task: Callable[[Any], Any]) -> None:
+    global _TASK, _IN_WORKER  # noqa: PLW0603
+    _TASK = task
+    _IN_WORKER = True
+    # The parent's threads (if any) don't exist in a forked child.
+    _OPTIONS["n_threads"] = 1
+
+
+def _run_partition(partition: Any) -> Any:
+    if _TASK is None:  # pragma: no cover
+        msg = "Safety assertion failed, please report a bug to https://github.com/narwhals-dev/narwhals/issues"
+        raise AssertionError(msg)
+    return _TASK(partition)
+
+
+def _n_partitions(df: PandasLikeDataFrame, size: int, min_size: int) -> int:
+    """Number of partitions to split `size` rows (or groups) of `df` into, or `1`
+    to run sequentially."""
+    n_processes: int = get_option("n_processes")
+    if (
+        n_processes <= 1
+        or _IN_WORKER
+        or df._implementation is not Implementation.PANDAS
+        or "fork" not in multiprocessing.get_all_start_methods()
+        or _other_threads_running()
+    ):
+        return 1
+    return max(1, min(n_processes, size // min_size))
+
+
+def _other_threads_running() -> bool:
+    """Whether threads other than the current one are running.
+
+    The threads of `n_threads`' pool are left out: they're idle unless some other
+    thread is waiting for them, and then that thread counts.
+    """
+    current = threading.current_thread()
+    return any(
+        thread is not current and not thread.name.startswith(_THREAD_NAME_PREFIX)
+        for thread in threading.enumerate()
+    )
+
+
+def _map_partitions(func: Callable[[Any], Any], partitions: Sequence[Any]) -> list[Any]:
+    """Call `func` on each partition, each in its own forked process."""
+    # Workers get `func` from the initializer, rather than from a global, so that
+    # concurrent calls (from different threads) can't see each other's task.
+    with ProcessPoolExecutor(
+        len(partitions),
+        mp_context=multiprocessing.get_context("fork"),
+        initializer=_init_worker,
+        initargs=(func,),
+    ) as executor:
+        return list(executor.map(_run_partition, partitions))
+
+
+def _row_bounds(df: PandasLikeDataFrame, n_partitions: int) -> list[tuple[int, int]]:
+    n_rows = len(df._native_dataframe)
+    bounds = [n_rows * i // n_partitions for i in range(n_partitions + 1)]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _concat(df: PandasLikeDataFrame, native_frames: list[Any]) -> Any:
+    return vertical_concat(
+        native_frames,
+        implementation=df._implementation,
+        backend_version=df._backend_version,
+    )
+
+
+def maybe_map_partitions(
+    df: PandasLikeDataFrameT,
+    method_name: str,
+    *exprs: IntoPandasLikeExpr,
+    **named_exprs: IntoPandasLikeExpr,
+) -> PandasLikeDataFrameT | None:
+    """Run `df.<method_name>(*exprs, **named_exprs)` over row partitions of `df`.
+
+    This is only possible if all expressions are elementwise, so that each row of
+    the result only depends on the corresponding row of `df`. Returns `None` if
+    the operation should be run sequentially instead.
+    """
+    n_partitions = _n_partitions(df, len(df._native_dataframe), MIN_ROWS_PER_PARTITION)
+    if n_partitions == 1:
+        return None
+    inputs = [*exprs, *named_exprs.values()]
+    if not all(isinstance(x, (str, PandasLikeExpr)) for x in inputs):
+        return None
+    parsed = parse_into_exprs(*inputs, namespace=df.__narwhals_namespace__())
+    if not all(is_elementwise(expr) for expr in parsed):
+        return None
+
+    def func(bounds: tuple[int, int]) -> Any:
+        partition = df._from_native_dataframe(
+            df._native_dataframe.iloc[bounds[0] : bounds[1]],
+            validate_column_names=False,
+        )
+        return getattr(partition, method_name)(*exprs, **named_exprs)._native_dataframe
+
+    note_strategy(f"{method_name}: {n_partitions} row partitions in parallel processes")
+    results = _map_partitions(func, _row_bounds(df, n_partitions))
+    return df._from_native_dataframe(_concat(df, results), validate_column_names=False)
+
+
+def maybe_agg_partitions(
+    df: PandasLikeDataFrame,
+    keys: list[str],
+    exprs: list[PandasLikeExpr],
+    output_names: list[str],
+) -> Any | None:
+    """Compute a group-by aggregation as partial aggregations over row partitions.
+
+    Each partition is aggregated separately, and the partial results are then
+    combined (e.g. the sum of the partial sums, or the sum of the partial sums
+    divided by the sum of the partial counts, for `mean`). Returns `None` if the
+    aggregations can't be split like this, or if it should be run sequentially.
+    """
+    n_partitions = _n_partitions(df, len(df._native_dataframe), MIN_ROWS_PER_PARTITION)
+    if n_partitions == 1 or not all(is_simple_aggregation(expr) for expr in exprs):
+        return None
+
+    # Map each output name to its (root name, aggregation), like `agg_pandas`.
+    aggregations: dict[str, tuple[str, str]] = {}
+    for expr in exprs:
+        if expr._output_names is None:  # pragma: no cover
+            return None
+        if expr._depth == 0:
+            if expr._function_name != "len":  # pragma: no cover
+                return None
+            for output_name in expr._output_names:
+                aggregations[output_name] = (keys[0], "size")
+            continue
+        if expr._root_names is None:  # pragma: no cover
+            return None
+        function_name = remove_prefix(expr._function_name, "col->")
+        if function_name not in {*COMBINABLE_AGGREGATIONS, "mean"}:
+            return None
+        for root_name, output_name in zip(expr._root_names, expr._output_names):
+            aggregations[output_name] = (root_name, function_name)
+
+    partial_aggregations: dict[str, tuple[str, str]] = {}
+    final_aggregations: dict[str, tuple[str, str]] = {}
+    for i, (root_name, function_name) in enumerate(aggregations.values()):
+        for partial_function_name in (
+            ("sum", "count") if function_name == "mean" else (function_name,)
+        ):
+            partial_name = f"__nw_partial_{i}_{partial_function_name}"
+            partial_aggregations[partial_name] = (root_name, partial_function_name)
+            final_aggregations[partial_name] = (
+                partial_name,
+                COMBINABLE_AGGREGATIONS[partial_function_name],
+            )
+
+    def func(bounds: tuple[int, int]) -> Any:
+        return (
+            df._native_dataframe.iloc[bounds[0] : bounds[1]]
+            .groupby(keys, sort=False, dropna=False)
+            .agg(**partial_aggregations)
+            .reset_index()
+        )
+
+    note_strategy(
+        f"group_by: partial aggregations of {n_partitions} row partitions "
+        "in parallel processes"
+    )
+    results = _map_partitions(func, _row_bounds(df, n_partitions))
+    combined = (
+        _concat(df, results)
+        .groupby(keys, sort=False, dropna=False)
+        .agg(**final_aggregations)
+        .reset_index()
+    )
+    new_columns = {}
+    for i, (output_name, (_, function_name)) in enumerate(aggregations.items()):
+        if function_name == "mean":
+            new_columns[output_name] = (
+                combined[f"__nw_partial_{i}_sum"] / combined[f"__nw_partial_{i}_count"]
+            )
+        else:
+            new_columns[output_name] = combined[f"__nw_partial_{i}_{function_name}"]
+    return combined.assign(**new_columns).loc[:, output_names]
+
+
+def maybe_apply_partitions(
+    df: PandasLikeDataFrame,
+    keys: list[str],
+    apply: Callable[[Any], Any],
+) -> Any | None:
+    """Call `apply` on a grouping of `df` by `keys`, over partitions of the groups.
+
+    `apply` must return one row per group, in the order the groups first appear
+    in. Each process gets a partition of the groups (with all of their rows), and
+    the results are put back in the order of the groups. Returns `None` if this
+    should be run sequentially instead.
+    """
+    native_frame = df._native_dataframe
+    pd = get_pandas()
+    if _n_partitions(df, len(native_frame), 1) == 1 or any(
+        isinstance(native_frame[key].dtype, pd.CategoricalDtype) for key in keys
+    ):
+        # Categorical keys may have unobserved categories, which aren't groups of
+        # any partition.
+        return None
+    # Groups are numbered in the order they first appear in.
+    codes = native_frame.groupby(keys, sort=False, dropna=False).ngroup().to_numpy()
+    n_groups = int(codes.max()) + 1 if len(codes) else 0
+    n_partitions = _n_partitions(df, n_groups, MIN_GROUPS_PER_PARTITION)
+    if n_partitions == 1:
+        return None
+
+    np = get_numpy()
+
+    def func(partition: int) -> Any:
+        rows = np.flatnonzero(codes % n_partitions == partition)
+        grouped = native_frame.iloc[rows].groupby(
+            keys, sort=False, dropna=False, as_index=True
+        )
+        return apply(grouped)
+
+    note_strategy(
+        f"group_by: {n_partitions} partitions of the groups in parallel processes"
+    )
+    results = _map_partitions(func, range(n_partitions))
+    # Partition `i` has groups `i`, `i + n_partitions`, ..., in this order.
+    group_numbers = [np.arange(i, n_groups, n_partitions) for i in range(n_partitions)]
+    if [len(result) for result in results] != [len(x) for x in group_numbers]:
+        msg = "Safety assertion failed, please report a bug to https://github.com/narwhals-dev/narwhals/issues"
+        raise AssertionError(msg)
+    order = np.argsort(np.concatenate(group_numbers), kind="stable")
+    return _concat(df, results).iloc[order].reset_index(drop=True)
@@ -8,6 +8,8 @@ from typing import Sequence
 
 from narwhals._pandas_like.utils import Implementation
 from narwhals._pandas_like.utils import int_dtype_mapper
+from narwhals._pandas_like.utils import maybe_reset_index
+from narwhals._pandas_like.utils import native_null_count
 from narwhals._pandas_like.utils import native_series_from_iterable
 from narwhals._pandas_like.utils import not_implemented_in
 from narwhals._pandas_like.utils import reverse_translate_dtype
@@ -73,6 +75,15 @@ PANDAS_TO_NUMPY_DTYPE_MISSING = {
 
 
 class PandasLikeSeries:
+    __slots__ = (
+        "_name",
+        "_native_series",
+        "_implementation",
+        "_backend_version",
+        "_use_copy_false",
+        "_null_count",
+    )
+
     def __init__(
         self,
         native_series: Any,
@@ -81,9 +92,14 @@ class PandasLikeSeries:
         backend_version: tuple[int, ...],
     ) -> None:
         self._name = native_series.name
-        self._native_series = native_series
+        self._native_series = maybe_reset_index(
+            native_series,
+            implementation=implementation,
+            backend_version=backend_version,
+        )
         self._implementation = implementation
         self._backend_version = backend_version
+        self._null_count: int | None = None
 
         # In pandas, copy-on-write becomes the default in version 3.
         # So, before that, we need to explicitly avoid unnecessary
@@ -98,9 +114,9 @@ class PandasLikeSeries:
             self._use_copy_false = False
 
     def __narwhals_namespace__(self) -> PandasLikeNamespace:
-        from narwhals._pandas_like.namespace import PandasLikeNamespace
+        from narwhals._pandas_like.namespace import get_pandas_like_namespace
 
-        return PandasLikeNamespace(self._implementation, self._backend_version)
+        return get_pandas_like_namespace(self._implementation, self._backend_version)
 
     def __native_namespace__(self) -> Any:
         if self._implementation is Implementation.PANDAS:
@@ -475,7 +491,7 @@ class PandasLikeSeries:
         # https://numpy.org/doc/stable/reference/generated/numpy.ndarray.__array__.html
         copy = copy or False
 
-        has_missing = self._native_series.isna().any()
+        has_missing = self.has_nulls()
         if (
             has_missing
             and str(self._native_series.dtype) in PANDAS_TO_NUMPY_DTYPE_MISSING
@@ -527,7 +543,15 @@ class PandasLikeSeries:
         return self._from_native_series(~self._native_series.duplicated(keep=False))
 
     def null_count(self: Self) -> int:
-        return self._native_series.isna().sum()  # type: ignore[no-any-return]
+        # Series are immutable, so the count can be reused (e.g. by `to_numpy`).
+        if self._null_count is None:
+            self._null_count = native_null_count(
+                self._native_series, self._implementation
+            )
+        return self._null_count
+
+    def has_nulls(self: Self) -> bool:
+        return self.null_count() > 0
 
     @not_implemented_in(Implementation.DASK)
     def is_first_distinct(self: Self) -> Self:
@@ -10,10 +10,13 @@ from typing import Callable
 from typing import Iterable
 from typing import TypeVar
 
+from narwhals.config import get_option
 from narwhals.dependencies import get_cudf
 from narwhals.dependencies import get_dask
 from narwhals.dependencies import get_modin
+from narwhals.dependencies import get_numpy
 from narwhals.dependencies import get_pandas
+from narwhals.diagnostics import record_slow_path
 from narwhals.utils import isinstance_or_issubclass
 
 T = TypeVar("T")
@@ -56,11 +59,11 @@ def validate_column_comparand(index: Any, other: Any) -> Any:
     if isinstance(other, PandasLikeSeries):
         if other.len() == 1:
             # broadcast
-            return other.item()
-        if (
-            other._native_series.index is not index
-            and other._implementation is not Implementation.DASK
+            return other._native_series.iloc[0]
+        if other._implementation is not Implementation.DASK and not is_same_index(
+            other._native_series.index, index
         ):
+            record_slow_path("set_axis")
             return set_axis(
                 other._native_series,
                 index,
@@ -80,11 +83,15 @@ def validate_column_comparand(index: Any, other: Any) -> Any:
     return other
 
 
-def validate_dataframe_comparand(index: Any, other: Any) -> Any:
+def validate_dataframe_comparand(
+    index: Any, other: Any, *, broadcast: bool = True
+) -> Any:
     """Validate RHS of binary operation.
 
     If the comparison isn't supported, return `NotImplemented` so that the
-    "right-hand-side" operation (e.g. `__radd__`) can be tried.
+    "right-hand-side" operation (e.g. `__radd__`) can be tried. Series of length
+    1 are broadcast as scalars, unless `broadcast=False` (e.g. if they're known to
+    be full columns of a one-row frame).
     """
     from narwhals._pandas_like.dataframe import PandasLikeDataFrame
     from narwhals._pandas_like.series import PandasLikeSeries
@@ -92,13 +99,13 @@ def validate_dataframe_comparand(index: Any, other: Any) -> Any:
     if isinstance(other, PandasLikeDataFrame):
         return NotImplemented
     if isinstance(other, PandasLikeSeries):
-        if other.len() == 1:
+        if broadcast and other.len() == 1:
             # broadcast
             return other._native_series.iloc[0]
-        if (
-            other._native_series.index is not index
-            and other._implementation is not Implementation.DASK
+        if other._implementation is not Implementation.DASK and not is_same_index(
+            other._native_series.index, index
         ):
+            record_slow_path("set_axis")
             return set_axis(
                 other._native_series,
                 index,
@@ -238,6 +245,70 @@ def native_series_from_iterable(
     raise TypeError(msg)  # pragma: no cover
 
 
+def is_same_index(left: Any, right: Any) -> bool:
+    """Check, in O(1), whether `left` and `right` are known to be the same index.
+
+    This is the case if they're the same object, views of one another, or equal
+    `RangeIndex`es. A `False` result doesn't mean they're different, just that
+    relabelling (`set_axis`) is needed to be sure.
+    """
+    if left is right:
+        return True
+    if (
+        type(left) is type(right)
+        and hasattr(left, "step")  # RangeIndex
+        and (left.start, left.stop, left.step, left.name)
+        == (right.start, right.stop, right.step, right.name)
+    ):
+        return True
+    # cuDF's Index doesn't have `is_`.
+    return hasattr(left, "is_") and left.is_(right)
+
+
+def maybe_reset_index(
+    obj: T, *, implementation: Implementation, backend_version: tuple[int, ...]
+) -> T:
+    """Reset the index of native `obj` to a default RangeIndex, in positional mode.
+
+    See `narwhals.Config(positional_index=...)`.
+    """
+    if implementation is Implementation.DASK or not get_option("positional_index"):
+        return obj
+    index = obj.index  # type: ignore[attr-defined]
+    if getattr(index, "start", None) == 0 and index.step == 1 and index.name is None:
+        return obj
+    return set_axis(
+        obj,
+        range(len(index)),
+        implementation=implementation,
+        backend_version=backend_version,
+    )
+
+
+def native_null_count(series: Any, implementation: Implementation) -> Any:
+    """Count the missing values in native `series`, from metadata where possible.
+
+    NumPy integer and boolean arrays can't hold missing values, masked arrays
+    (e.g. `Int64`, `boolean`, `Float64`) keep a boolean mask of them, and
+    PyArrow-backed arrays know their null count, so only other dtypes need a full
+    `isna` scan.
+    """
+    if implementation is Implementation.PANDAS:
+        dtype = series.dtype
+        if isinstance(dtype, get_numpy().dtype) and dtype.kind in {"i", "u", "b"}:
+            return 0
+        if (mask := getattr(series.array, "_mask", None)) is not None:
+            return int(mask.sum())
+        if str(dtype).endswith("[pyarrow]") or getattr(dtype, "storage", None) in {
+            "pyarrow",
+            "pyarrow_numpy",
+        }:
+            return series.array.__arrow_array__().null_count
+    if implementation is Implementation.DASK:
+        return series.isna().sum()
+    return int(series.isna().sum())
+
+
 def set_axis(
     obj: T,
     index: Any,
@@ -468,10 +539,16 @@ def reverse_translate_dtype(  # noqa: PLR0915
 
 
 def validate_indices(series: list[PandasLikeSeries]) -> list[Any]:
+    if series[0]._implementation is not Implementation.DASK:
+        series = broadcast_scalars(series)
     idx = series[0]._native_series.index
     reindexed = [series[0]._native_series]
     for s in series[1:]:
-        if s._native_series.index is not idx:
+        if s._native_series.index is not idx and (
+            s._implementation is Implementation.DASK
+            or not is_same_index(s._native_series.index, idx)
+        ):
+            record_slow_path("set_axis")
             reindexed.append(
                 set_axis(
                     s._native_series,
@@ -485,6 +562,31 @@ def validate_indices(series: list[PandasLikeSeries]) -> list[Any]:
     return reindexed
 
 
+def broadcast_scalars(series: list[PandasLikeSeries]) -> list[PandasLikeSeries]:
+    """Broadcast length-1 series to the length of the others, if they differ.
+
+    The scalar is repeated by the native constructor (keeping its dtype), rather
+    than by building a Python list.
+    """
+    lengths = [s.len() for s in series]
+    if 1 not in lengths or max(lengths) == 1:
+        return series
+    index = series[lengths.index(max(lengths))]._native_series.index
+    return [
+        s._from_native_series(
+            s._native_series.__class__(
+                s._native_series.iloc[0],
+                index=index,
+                dtype=s._native_series.dtype,
+                name=s._native_series.name,
+            )
+        )
+        if length == 1
+        else s
+        for s, length in zip(series, lengths)
+    ]
+
+
 def to_datetime(implementation: Implementation) -> Any:
     if implementation is Implementation.PANDAS:
         return get_pandas().to_datetime
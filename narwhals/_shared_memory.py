@@ -0,0 +1,184 @@
+"""Hand DataFrames over to other processes, see `DataFrame.to_shared_memory`.
+
+Frames are written as uncompressed Arrow IPC files to a RAM-backed directory
+(`/dev/shm`, where `multiprocessing.shared_memory` keeps its segments on
+Linux), or to the temporary directory if there isn't one. Readers memory-map
+the file, so that its data isn't copied: PyArrow tables and Polars frames read
+from it directly, and so do the numeric columns without nulls of pandas frames.
+
+Memory-mapped files are used rather than `multiprocessing.shared_memory`
+segments because Arrow reference-counts its memory maps: a mapping stays valid
+for as long as any frame uses its data, and is released with the last one.
+
+The file itself belongs to the process which wrote it, and is removed once its
+handle is garbage-collected there (or when `close` is called), while frames
+which were already read from it stay valid. This is deliberately simpler than
+counting references to the file across processes, which would need every
+reader to report back to the writer: readers which need the data for longer
+than the writer keeps its handle should copy it. In `/dev/shm`, the file is
+also registered with the `multiprocessing` resource tracker (like
+`multiprocessing.shared_memory` segments are), which removes it if the writer
+exits without doing so, e.g. if it's killed or calls `os._exit`.
+
+pandas frames keep their index: it's written as columns described by the
+pandas metadata of the Arrow schema (like `pyarrow.Table.from_pandas` does),
+which pandas restores when reading, and which are dropped for other libraries.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import importlib
+import os
+import sys
+import tempfile
+import uuid
+import weakref
+from multiprocessing import resource_tracker
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+
+from narwhals.dependencies import get_dask
+from narwhals.dependencies import get_pandas
+from narwhals.dependencies import get_pyarrow
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+    from narwhals.dataframe import DataFrame
+
+_SHM_DIR = Path("/dev/shm")  # noqa: S108
+
+
+def _directory() -> Path:
+    if _SHM_DIR.is_dir() and os.access(_SHM_DIR, os.W_OK):
+        return _SHM_DIR
+    return Path(tempfile.gettempdir())
+
+
+def _tracker_name(path: Path) -> str | None:
+    """Name of `path` as a POSIX shared memory segment, if it is one."""
+    if sys.platform.startswith("linux") and path.parent == _SHM_DIR:
+        # On Linux, `shm_open(name)` opens `/dev/shm/<name>`.
+        return f"/{path.name}"
+    return None
+
+
+def _remove(path: Path, pid: int) -> None:
+    # Forked children inherit the handle, but the file isn't theirs to remove.
+    if os.getpid() == pid:
+        # On Windows, files can't be removed while they're mapped.
+        with contextlib.suppress(OSError):
+            path.unlink(missing_ok=True)
+        if (name := _tracker_name(path)) is not None:
+            resource_tracker.unregister(name, "shared_memory")
+
+
+class SharedFrameHandle:
+    """
+    Handle to a DataFrame in shared memory, see `DataFrame.to_shared_memory`.
+
+    Handles are small, and are meant to be sent to other processes (e.g. as an
+    argument of a `multiprocessing` worker), which read the frame with
+    `nw.from_shared_memory`.
+    """
+
+    def __init__(
+        self, path: Path, native_namespace: str, index_columns: list[str] | None = None
+    ) -> None:
+        self._path = path
+        self._native_namespace = native_namespace
+        # Columns which hold a pandas index, for libraries other than pandas.
+        self._index_columns = index_columns or []
+        self._finalizer: Callable[[], Any] | None = None
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Copies of the handle don't own the file.
+        return (
+            SharedFrameHandle,
+            (self._path, self._native_namespace, self._index_columns),
+        )
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"SharedFrameHandle({str(self._path)!r})"
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the shared data, in bytes."""
+        return self._path.stat().st_size
+
+    def close(self) -> None:
+        """
+        Remove the shared data, if this is the handle `to_shared_memory` returned.
+
+        Frames which were already read from it stay valid. This happens
+        automatically once the handle is garbage-collected.
+        """
+        if self._finalizer is not None:
+            self._finalizer()
+
+
+def _write_with_index(df: DataFrame[Any], path: Path) -> list[str]:
+    """Write a pandas `df` along with its index, and return the names of the
+    columns which hold it (none for a default `RangeIndex`)."""
+    from narwhals._arrow.utils import write_ipc_file
+
+    table = get_pyarrow().Table.from_pandas(
+        df._compliant_frame.to_pandas(), preserve_index=None
+    )
+    write_ipc_file(table, path, compression=None)
+    return [
+        column
+        for column in table.schema.pandas_metadata["index_columns"]
+        if isinstance(column, str)
+    ]
+
+
+def to_shared_memory(df: DataFrame[Any]) -> SharedFrameHandle:
+    path = _directory() / f"narwhals-{uuid.uuid4().hex}.arrow"
+    native_namespace = df.__native_namespace__()
+    index_columns = None
+    try:
+        if native_namespace is get_pandas():
+            index_columns = _write_with_index(df, path)
+        else:
+            df.write_ipc(path)
+    except BaseException:
+        path.unlink(missing_ok=True)
+        raise
+    if native_namespace is get_dask():
+        # Dask frames are read back computed, as pandas ones.
+        native_namespace = get_pandas()
+    handle = SharedFrameHandle(path, native_namespace.__name__, index_columns)
+    if (name := _tracker_name(path)) is not None:
+        # Removes the file if this process exits without running the finalizer.
+        resource_tracker.register(name, "shared_memory")
+    handle._finalizer = weakref.finalize(handle, _remove, path, os.getpid())
+    return handle
+
+
+def from_shared_memory(
+    handle: SharedFrameHandle, native_namespace: ModuleType | None
+) -> DataFrame[Any]:
+    from narwhals.functions import read_ipc
+
+    if not isinstance(handle, SharedFrameHandle):
+        msg = f"Expected a handle returned by `DataFrame.to_shared_memory`, got {type(handle)}."
+        raise TypeError(msg)
+    if native_namespace is None:
+        native_namespace = importlib.import_module(handle._native_namespace)
+    try:
+        result = read_ipc(handle._path, native_namespace=native_namespace)
+    except FileNotFoundError:
+        msg = (
+            "The shared data was already removed.\n\n"
+            "Hint: keep the handle returned by `DataFrame.to_shared_memory` alive "
+            "until all the processes it was sent to have read it."
+        )
+        raise FileNotFoundError(msg) from None
+    # pandas restores the index from them, other libraries read them as columns.
+    if index_columns := [c for c in handle._index_columns if c in result.columns]:
+        return result.drop(*index_columns)
+    return result
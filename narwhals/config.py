@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+__all__ = ["Config"]
+
+# Current values of the global options, see `Config`.
+_OPTIONS: dict[str, Any] = {
+    "positional_index": False,
+    "n_threads": 1,
+    "n_processes": 1,
+    "raise_on_slow_path": False,
+    "cache_max_bytes": 0,
+    "cache_dir": "",
+    "keep_plans": False,
+}
+
+
+def get_option(name: str) -> Any:
+    return _OPTIONS[name]
+
+
+class Config:
+    """
+    Configure Narwhals' global options.
+
+    Options passed to `Config` are set immediately. When used as a context manager,
+    the previous values are restored on exit.
+
+    Arguments:
+        n_threads: Number of threads used to evaluate independent expressions in
+            `select` and `with_columns` concurrently, for pandas-like (except Dask)
+            and PyArrow backends. The default, `1`, evaluates them one at a time.
+            This helps when there are many expressions with expensive
+            computations, as PyArrow and NumPy release the GIL.
+        n_processes: pandas only, on platforms which support forking processes
+            (i.e. not Windows). Number of processes used to evaluate `select`,
+            `with_columns`, and `filter` over partitions of rows, when all
+            expressions are elementwise, and `group_by(...).agg` over partitions
+            of rows when all aggregations are `sum`, `mean`, `min`, `max`,
+            `count`, or `len`, or over partitions of the groups when some can
+            only be computed by calling a Python function on each group. Results
+            are put back in their original order. Only frames with at least
+            100,000 rows (or 1,000 groups) per process are partitioned, as each
+            call starts new processes and sends their results back, and nothing
+            is partitioned while other threads are running, as forking them
+            isn't safe (the idle threads of `n_threads` don't count, so both
+            options can be combined). The default, `1`, disables this.
+        positional_index: pandas-like backends only. If `True`, frames and series are
+            kept on a default `RangeIndex` (i.e. the index is reset after operations
+            such as `filter` or `sort`), so intermediate results never need to be
+            aligned to each other. Note that this means that the original index is
+            **not** preserved, see [What about the pandas Index?](../other/pandas_index.md).
+        raise_on_slow_path: If `True`, raise `narwhals.diagnostics.SlowPathError`
+            when Narwhals would fall back to a slow implementation, instead of
+            counting it in `narwhals.diagnostics.slow_paths()`.
+        cache_max_bytes: If positive, results of `LazyFrame.collect` are cached, so
+            that collecting the same plan over unchanged inputs again returns the
+            cached result without evaluating it. Up to this many bytes (as
+            measured by `DataFrame.estimated_size`, or by file size on disk) are
+            kept, evicting the least recently used results first. Only
+            LazyFrames which are evaluated by `collect` are cached: Polars ones,
+            and Dask ones and filters and selections on PyArrow read with
+            `scan_*` (the other backends have already evaluated each operation
+            by then). Files read with `scan_*` are identified by their path,
+            size and modification time, and in-memory Polars data by object
+            identity. Native LazyFrames which read files themselves (e.g.
+            `polars.scan_parquet`), and other Dask frames, aren't cached, as
+            their inputs could change unnoticed. Cached pandas results are
+            copied on each hit. The default, `0`, disables the cache.
+        cache_dir: Directory in which to keep cached results, as Arrow IPC files
+            which are memory-mapped when read back, rather than in memory.
+            Results cached on disk can be reused by other processes if they only
+            depend on files. `""` (the default) keeps them in memory. Results
+            are written to its `narwhals-cache` subdirectory, and only files
+            there are ever evicted.
+        keep_plans: If `True`, LazyFrames which are evaluated as soon as each
+            operation is called (pandas-like except Dask, and PyArrow) keep the
+            operations which produced them, and the frame they were created
+            from, so that `LazyFrame.explain` can show (and analyze) them, and
+            `LazyFrame.collect(track_memory=True)` can measure them. This keeps
+            that frame, and the arguments of each operation, alive for as long
+            as any LazyFrame derived from it. The default, `False`, only keeps
+            the LazyFrame's own data. Other LazyFrames always keep their plans.
+
+    Examples:
+        >>> import pandas as pd
+        >>> import narwhals as nw
+        >>> df_pd = pd.DataFrame({"a": [3, 1, 2]}, index=[7, 8, 9])
+        >>> with nw.Config(positional_index=True):
+        ...     df = nw.from_native(df_pd).sort("a")
+        >>> nw.to_native(df)
+           a
+        0  1
+        1  2
+        2  3
+    """
+
+    def __init__(
+        self,
+        *,
+        n_threads: int | None = None,
+        n_processes: int | None = None,
+        positional_index: bool | None = None,
+        raise_on_slow_path: bool | None = None,
+        cache_max_bytes: int | None = None,
+        cache_dir: str | Path | None = None,
+        keep_plans: bool | None = None,
+    ) -> None:
+        self._previous = dict(_OPTIONS)
+        if n_threads is not None:
+            if n_threads < 1:
+                msg = f"`n_threads` must be at least 1, got {n_threads}"
+                raise ValueError(msg)
+            _OPTIONS["n_threads"] = n_threads
+        if n_processes is not None:
+            if n_processes < 1:
+                msg = f"`n_processes` must be at least 1, got {n_processes}"
+                raise ValueError(msg)
+            _OPTIONS["n_processes"] = n_processes
+        if positional_index is not None:
+            _OPTIONS["positional_index"] = positional_index
+        if raise_on_slow_path is not None:
+            _OPTIONS["raise_on_slow_path"] = raise_on_slow_path
+        if cache_max_bytes is not None:
+            if cache_max_bytes < 0:
+                msg = f"`cache_max_bytes` must be non-negative, got {cache_max_bytes}"
+                raise ValueError(msg)
+            _OPTIONS["cache_max_bytes"] = cache_max_bytes
+        if cache_dir is not None:
+            _OPTIONS["cache_dir"] = str(cache_dir)
+        if keep_plans is not None:
+            _OPTIONS["keep_plans"] = keep_plans
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        _OPTIONS.update(self._previous)
@@ -11,10 +11,13 @@ from typing import Sequence
 from typing import TypeVar
 from typing import overload
 
+from narwhals._explain import record_plan
+from narwhals.config import get_option
 from narwhals.dependencies import get_numpy
 from narwhals.dependencies import get_polars
 from narwhals.dtypes import to_narwhals_dtype
 from narwhals.schema import Schema
+from narwhals.utils import collect_converted_scans
 from narwhals.utils import flatten
 from narwhals.utils import validate_same_library
 
@@ -25,6 +28,8 @@ if TYPE_CHECKING:
     import numpy as np
     from typing_extensions import Self
 
+    from narwhals._explain import PlanNode
+    from narwhals._shared_memory import SharedFrameHandle
     from narwhals.group_by import GroupBy
     from narwhals.group_by import LazyGroupBy
     from narwhals.series import Series
@@ -113,15 +118,20 @@ class BaseFrame(Generic[FrameT]):
     def pipe(self, function: Callable[[Any], Self], *args: Any, **kwargs: Any) -> Self:
         return function(self, *args, **kwargs)
 
-    def with_row_index(self, name: str = "index") -> Self:
+    @record_plan
+    def with_row_index(self, name: str = "index", offset: int = 0) -> Self:
+        if offset < 0:
+            msg = f"`offset` input for `with_row_index` cannot be negative, got {offset}"
+            raise ValueError(msg)
         if self._is_polars and self._backend_version < (0, 20, 4):  # pragma: no cover
             return self._from_compliant_dataframe(
-                self._compliant_frame.with_row_count(name),
+                self._compliant_frame.with_row_count(name, offset),
             )
         return self._from_compliant_dataframe(
-            self._compliant_frame.with_row_index(name),
+            self._compliant_frame.with_row_index(name, offset),
         )
 
+    @record_plan
     def drop_nulls(self) -> Self:
         return self._from_compliant_dataframe(
             self._compliant_frame.drop_nulls(),
@@ -139,6 +149,7 @@ class BaseFrame(Generic[FrameT]):
             level=self._level,
         )
 
+    @record_plan
     def with_columns(
         self, *exprs: IntoExpr | Iterable[IntoExpr], **named_exprs: IntoExpr
     ) -> Self:
@@ -147,6 +158,7 @@ class BaseFrame(Generic[FrameT]):
             self._compliant_frame.with_columns(*exprs, **named_exprs),
         )
 
+    @record_plan
     def select(
         self,
         *exprs: IntoExpr | Iterable[IntoExpr],
@@ -157,27 +169,34 @@ class BaseFrame(Generic[FrameT]):
             self._compliant_frame.select(*exprs, **named_exprs),
         )
 
+    @record_plan
     def rename(self, mapping: dict[str, str]) -> Self:
         return self._from_compliant_dataframe(self._compliant_frame.rename(mapping))
 
+    @record_plan
     def head(self, n: int) -> Self:
         return self._from_compliant_dataframe(self._compliant_frame.head(n))
 
+    @record_plan
     def tail(self, n: int) -> Self:
         return self._from_compliant_dataframe(self._compliant_frame.tail(n))
 
+    @record_plan
     def drop(self, *columns: str | Iterable[str]) -> Self:
         return self._from_compliant_dataframe(self._compliant_frame.drop(*columns))
 
+    @record_plan
     def unique(self, subset: str | list[str]) -> Self:
         return self._from_compliant_dataframe(self._compliant_frame.unique(subset=subset))
 
+    @record_plan
     def filter(self, *predicates: IntoExpr | Iterable[IntoExpr]) -> Self:
         predicates, _ = self._flatten_and_extract(*predicates)
         return self._from_compliant_dataframe(
             self._compliant_frame.filter(*predicates),
         )
 
+    @record_plan
     def sort(
         self,
         by: str | Iterable[str],
@@ -188,6 +207,7 @@ class BaseFrame(Generic[FrameT]):
             self._compliant_frame.sort(by, *more_by, descending=descending)
         )
 
+    @record_plan
     def join(
         self,
         other: Self,
@@ -206,9 +226,10 @@ class BaseFrame(Generic[FrameT]):
             msg = "Can not pass left_on, right_on for cross join"
             raise ValueError(msg)
 
-        validate_same_library([self, other])
+        left, other = collect_converted_scans([self, other])
+        validate_same_library([left, other])
         return self._from_compliant_dataframe(
-            self._compliant_frame.join(
+            left._compliant_frame.join(
                 self._extract_compliant(other),
                 how=how,
                 left_on=left_on,
@@ -216,6 +237,7 @@ class BaseFrame(Generic[FrameT]):
             )
         )
 
+    @record_plan
     def clone(self) -> Self:
         return self._from_compliant_dataframe(self._compliant_frame.clone())
 
@@ -336,10 +358,77 @@ class DataFrame(BaseFrame[FrameT]):
         """
         return self._compliant_frame.to_pandas()
 
-    def write_parquet(self, file: str | Path | BytesIO) -> Any:
+    def to_arrow(self) -> Any:
+        """
+        Convert this DataFrame to a PyArrow Table.
+
+        Notes:
+            For objects which only implement the Dataframe Interchange Protocol,
+            only the columns which are still selected are materialized, and the
+            interchange buffers are reused without copying whenever possible.
+
+        Examples:
+            Construct pandas and Polars DataFrames:
+
+            >>> import pandas as pd
+            >>> import polars as pl
+            >>> import narwhals as nw
+            >>> df = {"foo": [1, 2, 3], "bar": ["a", "b", "c"]}
+            >>> df_pd = pd.DataFrame(df)
+            >>> df_pl = pl.DataFrame(df)
+
+            We define a library agnostic function:
+
+            >>> def func(df_any):
+            ...     df = nw.from_native(df_any)
+            ...     return df.to_arrow()
+
+            We can then pass either pandas or Polars to `func`:
+
+            >>> func(df_pd)
+            pyarrow.Table
+            foo: int64
+            bar: string
+            ----
+            foo: [[1,2,3]]
+            bar: [["a","b","c"]]
+            >>> func(df_pl)
+            pyarrow.Table
+            foo: int64
+            bar: large_string
+            ----
+            foo: [[1,2,3]]
+            bar: [["a","b","c"]]
+        """
+        return self._compliant_frame.to_arrow()
+
+    def write_parquet(
+        self,
+        file: str | Path | BytesIO,
+        *,
+        partition_by: str | list[str] | None = None,
+        row_group_size: int | None = None,
+        compression: str | None = None,
+        max_rows_per_file: int | None = None,
+    ) -> Any:
         """
         Write dataframe to parquet file.
 
+        If `partition_by` or `max_rows_per_file` is given, `file` is instead
+        treated as a directory, and a dataset is written to it with
+        `pyarrow.dataset.write_dataset`, which writes files in parallel.
+        Partitioned datasets use Hive-style `key=value` directories, and
+        can be read back with `nw.scan_parquet(..., hive_partitioning=True)`.
+
+        Arguments:
+            file: Path to write to, or a file-like object.
+            partition_by: Column(s) to partition the dataset by.
+            row_group_size: Number of rows per row group. Uses the backend's
+                default if not given.
+            compression: Compression codec, such as `"snappy"`, `"zstd"`, or
+                `"gzip"`. Uses the backend's default if not given.
+            max_rows_per_file: Maximum number of rows in each file of the dataset.
+
         Examples:
             Construct pandas and Polars DataFrames:
 
@@ -360,13 +449,120 @@ class DataFrame(BaseFrame[FrameT]):
 
             >>> func(df_pd)  # doctest:+SKIP
             >>> func(df_pl)  # doctest:+SKIP
+
+            Write a Hive-partitioned dataset instead:
+
+            >>> df = nw.from_native(df_pl)
+            >>> df.write_parquet("foo", partition_by="ham")  # doctest:+SKIP
         """
-        self._compliant_frame.write_parquet(file)
+        if partition_by is not None or max_rows_per_file is not None:
+            from narwhals._arrow.utils import write_parquet_dataset
 
-    def to_numpy(self) -> Any:
+            write_parquet_dataset(
+                self.to_arrow(),
+                str(file),
+                partition_by=flatten([partition_by]) if partition_by else None,
+                row_group_size=row_group_size,
+                compression=compression,
+                max_rows_per_file=max_rows_per_file,
+            )
+            return
+        kwargs = {"row_group_size": row_group_size, "compression": compression}
+        self._compliant_frame.write_parquet(
+            file, **{key: value for key, value in kwargs.items() if value is not None}
+        )
+
+    def write_ipc(
+        self,
+        file: str | Path | BytesIO,
+        *,
+        compression: Literal["lz4", "zstd"] | None = None,
+    ) -> Any:
+        """
+        Write dataframe to an Arrow IPC (Feather v2) file.
+
+        Uncompressed files can be read back without copying or decoding,
+        see `nw.read_ipc`.
+
+        Arguments:
+            file: Path to write to, or a file-like object.
+            compression: Compression codec, either `"lz4"` or `"zstd"`.
+                Data is not compressed if not given.
+
+        Examples:
+            Construct pandas and Polars DataFrames:
+
+            >>> import pandas as pd
+            >>> import polars as pl
+            >>> import narwhals as nw
+            >>> df = {"foo": [1, 2, 3], "bar": [6.0, 7.0, 8.0], "ham": ["a", "b", "c"]}
+            >>> df_pd = pd.DataFrame(df)
+            >>> df_pl = pl.DataFrame(df)
+
+            We define a library agnostic function:
+
+            >>> def func(df_any):
+            ...     df = nw.from_native(df_any)
+            ...     df.write_ipc("foo.arrow")
+
+            We can then pass either pandas or Polars to `func`:
+
+            >>> func(df_pd)  # doctest:+SKIP
+            >>> func(df_pl)  # doctest:+SKIP
+        """
+        if self._is_polars:
+            self._compliant_frame.write_ipc(
+                file, compression=compression or "uncompressed"
+            )
+        else:
+            self._compliant_frame.write_ipc(file, compression=compression)
+
+    def to_shared_memory(self) -> SharedFrameHandle:
+        """
+        Share this DataFrame with other processes, without copying it.
+
+        The data is written once, as an uncompressed Arrow IPC file, to shared
+        memory (`/dev/shm` if available, otherwise the temporary directory). The
+        returned handle is small and can be pickled, so it can be sent to
+        `multiprocessing` workers, which read the frame with
+        `nw.from_shared_memory`: PyArrow and Polars frames then use the shared
+        data directly, as do numeric columns without nulls of pandas frames.
+        pandas frames keep their index when they're read with pandas.
+
+        The shared data belongs to this process: it's removed once the returned
+        handle is garbage-collected (or its `close` method is called), so keep it
+        alive until the workers have read the frame. Frames which were already
+        read stay valid. On Linux, it's also removed if this process exits
+        without doing so (e.g. if it's killed).
+
+        Examples:
+            >>> import pandas as pd
+            >>> import narwhals as nw
+            >>> df = nw.from_native(pd.DataFrame({"a": [1, 2], "b": [4.0, 5.0]}))
+            >>> handle = df.to_shared_memory()
+
+            In a worker process, with a copy of `handle`:
+
+            >>> nw.to_native(nw.from_shared_memory(handle))
+               a    b
+            0  1  4.0
+            1  2  5.0
+        """
+        from narwhals._shared_memory import to_shared_memory
+
+        return to_shared_memory(self)
+
+    def to_numpy(self, order: Literal["c", "fortran"] = "fortran") -> Any:
         """
         Convert this DataFrame to a NumPy ndarray.
 
+        The result dtype is the common dtype of all columns. If the frame is backed
+        by a single NumPy block of that dtype, a view of it may be returned.
+
+        Arguments:
+            order: Memory layout of the result: `"fortran"` (column-major) or `"c"`
+                (row-major). Column-major is faster to build.
+
         Examples:
             Construct pandas and polars DataFrames:
 
@@ -395,7 +591,7 @@ class DataFrame(BaseFrame[FrameT]):
                    [2, 7.0, 'b'],
                    [3, 8.5, 'c']], dtype=object)
         """
-        return self._compliant_frame.to_numpy()
+        return self._compliant_frame.to_numpy(order=order)
 
     @property
     def shape(self) -> tuple[int, int]:
@@ -703,10 +899,14 @@ class DataFrame(BaseFrame[FrameT]):
         """
         return super().drop_nulls()
 
-    def with_row_index(self, name: str = "index") -> Self:
+    def with_row_index(self, name: str = "index", offset: int = 0) -> Self:
         """
         Insert column which enumerates rows.
 
+        Arguments:
+            name: Name of the index column.
+            offset: Start the index at this offset. Cannot be negative.
+
         Examples:
             Construct pandas as polars DataFrames:
 
@@ -743,7 +943,7 @@ class DataFrame(BaseFrame[FrameT]):
             │ 2     ┆ 3   ┆ 6   │
             └───────┴─────┴─────┘
         """
-        return super().with_row_index(name)
+        return super().with_row_index(name, offset)
 
     @property
     def schema(self) -> Schema:
@@ -1762,6 +1962,62 @@ class DataFrame(BaseFrame[FrameT]):
             level=self._level,
         )
 
+    def estimated_size(
+        self: Self,
+        unit: Literal[
+            "b",
+            "kb",
+            "mb",
+            "gb",
+            "tb",
+            "bytes",
+            "kilobytes",
+            "megabytes",
+            "gigabytes",
+            "terabytes",
+        ] = "b",
+    ) -> int | float:
+        r"""
+        Return an estimation of the total (heap) allocated size of the DataFrame.
+
+        For pandas-like dataframes, this is `memory_usage(deep=True)` (including
+        the index), for PyArrow tables it's the size of all the buffers which the
+        table references (`get_total_buffer_size`), and for Polars it's
+        `estimated_size`. Buffers which are shared with other objects are counted
+        in full.
+
+        Arguments:
+            unit: Scale the returned size to the given unit, e.g. `"mb"`
+                (with 1 mb = 1024 kb). Sizes in bytes are integers, other units
+                return floats.
+
+        Examples:
+            >>> import narwhals as nw
+            >>> import pandas as pd
+            >>> import polars as pl
+            >>> import pyarrow as pa
+            >>> data = {"foo": [1, 2, 3], "bar": [6.0, 7.0, 8.0]}
+            >>> df_pd = pd.DataFrame(data)
+            >>> df_pl = pl.DataFrame(data)
+            >>> df_pa = pa.table(data)
+
+            Let's define a dataframe-agnostic function:
+
+            >>> def func(df_any):
+            ...     df = nw.from_native(df_any)
+            ...     return df.estimated_size()
+
+            We can then pass either pandas, Polars or PyArrow to `func`:
+
+            >>> func(df_pd)
+            180
+            >>> func(df_pl)
+            48
+            >>> func(df_pa)
+            48
+        """
+        return self._compliant_frame.estimated_size(unit=unit)  # type: ignore[no-any-return]
+
     def is_empty(self: Self) -> bool:
         r"""
         Check if the dataframe is empty.
@@ -1982,6 +2238,9 @@ class LazyFrame(BaseFrame[FrameT]):
     `narwhals.from_native`.
     """
 
+    # Operations which produced this frame, for non-Polars backends.
+    _plan: PlanNode | None = None
+
     def __init__(
         self,
         df: Any,
@@ -2021,12 +2280,43 @@ class LazyFrame(BaseFrame[FrameT]):
         msg = "Slicing is not supported on LazyFrame"
         raise TypeError(msg)
 
-    def collect(self) -> DataFrame[Any]:
+    @overload
+    def collect(self, *, track_memory: Literal[False] = ...) -> DataFrame[Any]: ...
+
+    @overload
+    def collect(self, *, track_memory: Literal[True]) -> tuple[DataFrame[Any], int]: ...
+
+    @overload
+    def collect(
+        self, *, track_memory: bool
+    ) -> DataFrame[Any] | tuple[DataFrame[Any], int]: ...
+
+    def collect(
+        self, *, track_memory: bool = False
+    ) -> DataFrame[Any] | tuple[DataFrame[Any], int]:
         r"""
         Materialize this LazyFrame into a DataFrame.
 
+        With `nw.Config(cache_max_bytes=...)`, results are cached, so that
+        collecting the same plan over unchanged inputs again returns the cached
+        result instead of evaluating it, see `Config`.
+
+        Arguments:
+            track_memory: Also return the peak number of bytes allocated while
+                evaluating the plan, by Python (as traced by `tracemalloc`, which
+                includes NumPy and pandas) and by PyArrow's default memory pool
+                (sampled, so very short-lived allocations may be missed).
+                Backends other than Polars and Dask evaluate each operation as
+                soon as it's called, so with `nw.Config(keep_plans=True)`, the
+                operations which produced this LazyFrame are run again to measure
+                them, from the frame it was created from (see `explain`);
+                otherwise, only `collect` itself is measured.
+                Memory allocated by Polars itself isn't visible to either
+                tracker, so for Polars this only covers converting the result.
+                Tracking slows down evaluation, and the result cache isn't used.
+
         Returns:
-            DataFrame
+            DataFrame, or a tuple `(DataFrame, peak_bytes)` if `track_memory=True`.
 
         Examples:
             >>> import narwhals as nw
@@ -2056,14 +2346,101 @@ class LazyFrame(BaseFrame[FrameT]):
             │ b   ┆ 11  ┆ 10  │
             │ c   ┆ 6   ┆ 1   │
             └─────┴─────┴─────┘
-        """
+
+            To find out how much memory evaluating the plan needs:
+
+            >>> df, peak_bytes = lf.collect(track_memory=True)
+            >>> peak_bytes >= 0
+            True
+        """
+        if track_memory:
+            from narwhals._explain import _is_evaluated
+            from narwhals._explain import _plan_of
+            from narwhals._explain import _replay
+            from narwhals.profiling import peak_memory
+
+            if _is_evaluated(self._compliant_frame):
+                # Measure the operations which produced this LazyFrame, but
+                # return its own result.
+                _, peak = peak_memory(lambda: _replay(_plan_of(self), self).collect())
+                return self.collect(), peak
+            compliant, peak = peak_memory(self._compliant_frame.collect)
+            return self._from_collected(compliant), peak
+        if get_option("cache_max_bytes"):
+            from narwhals._cache import cached_collect
+
+            compliant = cached_collect(self)
+        else:
+            compliant = self._compliant_frame.collect()
+        return self._from_collected(compliant)
+
+    def _from_collected(self, compliant: Any) -> DataFrame[Any]:
         return DataFrame(
-            self._compliant_frame.collect(),
+            compliant,
             is_polars=self._is_polars,
             backend_version=self._backend_version,
             level=self._level,
         )
 
+    def explain(self, *, optimized: bool = True, analyze: bool = False) -> str:
+        r"""
+        Create a string representation of the query plan.
+
+        For Polars, this is Polars' own (optimized) query plan. Other backends
+        evaluate each operation as soon as it's called, so their plan is the list
+        of operations which produced this LazyFrame, starting from the frame it
+        was created from (e.g. with `from_native` or `DataFrame.lazy`). With
+        `optimized=True`, each operation is followed by the strategies which the
+        backend chose to run it (for example, whether `group_by(...).agg` could use
+        vectorized aggregations, or had to fall back to applying a Python function
+        to each group).
+
+        pandas-like (except Dask) and PyArrow LazyFrames only keep their plan
+        with `nw.Config(keep_plans=True)`, as it holds a reference to the frame
+        they were created from, and to the arguments of each operation: that
+        frame then stays in memory for as long as any LazyFrame derived from it
+        does, even if the LazyFrame's own data is much smaller. Otherwise, their
+        plan is only their own data.
+
+        Arguments:
+            optimized: Whether to show the optimized plan (for Polars), or the
+                physical strategies (for other backends).
+            analyze: Run the query again, and annotate each operation with its
+                wall time and the number of rows it produced (`?` if that isn't
+                known without computing it, e.g. for Dask). For Polars, the
+                timings from `polars.LazyFrame.profile` are appended.
+
+        Examples:
+            >>> import pandas as pd
+            >>> import narwhals as nw
+            >>> df_pd = pd.DataFrame({"a": [1, 2, 1], "b": [4, 5, 6]})
+            >>> lf = nw.from_native(df_pd).lazy()
+            >>> with nw.Config(keep_plans=True):
+            ...     result = lf.filter(nw.col("b") > 4).group_by("a").agg(nw.col("b").sum())
+            >>> print(result.explain())
+            group_by('a').agg(col('b').sum())
+              -> group_by: vectorized agg
+              filter(col('b').__gt__())
+                -> filter: boolean mask
+                SOURCE: pandas.DataFrame
+            >>> print(result.explain(analyze=True))  # doctest: +ELLIPSIS
+            collect()  (time: ... ms, rows: 2)
+              group_by('a').agg(col('b').sum())  (time: ... ms, rows: 2)
+                -> group_by: vectorized agg
+                filter(col('b').__gt__())  (time: ... ms, rows: 2)
+                  -> filter: boolean mask
+                  SOURCE: pandas.DataFrame  (rows: 3)
+        """
+        if self._is_polars:
+            plan: str = self._compliant_frame.explain(optimized=optimized)
+            if analyze:
+                _, timings = self._compliant_frame.profile()
+                plan = f"{plan}\n\n{timings}"
+            return plan
+        from narwhals._explain import explain
+
+        return explain(self, optimized=optimized, analyze=analyze)
+
     # inherited
     def pipe(self, function: Callable[[Any], Self], *args: Any, **kwargs: Any) -> Self:
         """
@@ -2145,10 +2522,14 @@ class LazyFrame(BaseFrame[FrameT]):
         """
         return super().drop_nulls()
 
-    def with_row_index(self, name: str = "index") -> Self:
+    def with_row_index(self, name: str = "index", offset: int = 0) -> Self:
         """
         Insert column which enumerates rows.
 
+        Arguments:
+            name: Name of the index column.
+            offset: Start the index at this offset. Cannot be negative.
+
         Examples:
             >>> import polars as pl
             >>> import pandas as pd
@@ -2183,7 +2564,7 @@ class LazyFrame(BaseFrame[FrameT]):
             │ 2     ┆ 3   ┆ 6   │
             └───────┴─────┴─────┘
         """
-        return super().with_row_index(name)
+        return super().with_row_index(name, offset)
 
     @property
     def schema(self) -> Schema:
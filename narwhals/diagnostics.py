@@ -0,0 +1,99 @@
+"""
+Count the slow paths which Narwhals takes.
+
+Some operations can't always be expressed efficiently with the native API, so
+Narwhals falls back to a slower implementation (for example, calling a Python
+function on each group in a pandas group-by). These are counted here, so that
+critical pipelines can check that none were taken, and with
+`nw.Config(raise_on_slow_path=True)` they raise `SlowPathError` instead.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import Counter
+
+from narwhals.config import get_option
+
+__all__ = ["SLOW_PATHS", "SlowPathError", "reset_slow_paths", "slow_paths"]
+
+# Name of each slow path -> what it is.
+SLOW_PATHS = {
+    "group_by.apply": (
+        "pandas-like `group_by(...).agg` with non-elementary aggregations, which "
+        "calls a Python function on each group"
+    ),
+    "with_columns.assign": (
+        "pandas-like `with_columns` with scalar or non-expression inputs, which uses "
+        "`DataFrame.assign` instead of concatenating columns"
+    ),
+    "set_axis": (
+        "pandas-like series whose index differs from the frame's, which is "
+        "relabelled with `set_axis`"
+    ),
+    "to_numpy.nullable": (
+        "pandas-like `DataFrame.to_numpy` with nullable dtypes (whether or not they "
+        "contain missing values), which converts column by column"
+    ),
+    "concat.combine_chunks": (
+        "PyArrow vertical `concat`, which copies the chunks of the result into "
+        "contiguous memory"
+    ),
+    "zip_with.combine_chunks": (
+        "PyArrow `Series.zip_with`, which copies its inputs into contiguous memory"
+    ),
+}
+
+_COUNTS: Counter[str] = Counter()
+_LOCK = threading.Lock()
+
+
+class SlowPathError(RuntimeError):
+    """Raised when a slow path is taken with `nw.Config(raise_on_slow_path=True)`."""
+
+
+def record_slow_path(name: str) -> None:
+    """Count that slow path `name` (one of `SLOW_PATHS`) was taken."""
+    if get_option("raise_on_slow_path"):
+        msg = (
+            f"Slow path {name!r} was taken: {SLOW_PATHS[name]}.\n\n"
+            "Hint: set `nw.Config(raise_on_slow_path=False)` to allow it."
+        )
+        raise SlowPathError(msg)
+    with _LOCK:
+        _COUNTS[name] += 1
+
+
+def slow_paths() -> dict[str, int]:
+    """
+    Number of times each slow path was taken, since Narwhals was imported or
+    `reset_slow_paths` was last called.
+
+    The keys are all the slow paths which are tracked, see `SLOW_PATHS` for what
+    each of them means.
+
+    Examples:
+        >>> import pandas as pd
+        >>> import narwhals as nw
+        >>> nw.diagnostics.reset_slow_paths()
+        >>> df = nw.from_native(pd.DataFrame({"a": [1, 1, 2], "b": [4, 5, 6]}))
+        >>> result = df.group_by("a").agg(nw.col("b").sum())
+        >>> nw.diagnostics.slow_paths()["group_by.apply"]
+        0
+
+        In strict mode, slow paths raise instead:
+
+        >>> with nw.Config(raise_on_slow_path=True):
+        ...     df.group_by("a").agg((nw.col("b") * 2).sum())
+        Traceback (most recent call last):
+        ...
+        narwhals.diagnostics.SlowPathError: Slow path 'group_by.apply' was taken: ...
+    """
+    with _LOCK:
+        return {name: _COUNTS[name] for name in SLOW_PATHS}
+
+
+def reset_slow_paths() -> None:
+    """Set the count of each slow path back to zero."""
+    with _LOCK:
+        _COUNTS.clear()
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+from io import IOBase
+from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Callable
 from typing import Iterable
 from typing import Literal
+from typing import overload
 
+from narwhals._expression_nodes import deserialize
+from narwhals._expression_nodes import expr_function
+from narwhals._expression_nodes import expr_methods
+from narwhals._expression_nodes import serialize
+from narwhals._expression_nodes import structure
 from narwhals.dependencies import get_numpy
 from narwhals.dependencies import get_polars
 from narwhals.dtypes import DType
@@ -16,6 +24,7 @@ from narwhals.utils import parse_version
 if TYPE_CHECKING:
     from typing_extensions import Self
 
+    from narwhals._expression_nodes import ExprNode
     from narwhals.typing import IntoExpr
 
 
@@ -29,10 +38,54 @@ def extract_native(expr: Expr, other: Any) -> Any:
     return other
 
 
+@expr_methods()
 class Expr:
-    def __init__(self, call: Callable[[Any], Any]) -> None:
+    def __init__(self, call: Callable[[Any], Any], node: ExprNode | None = None) -> None:
         # callable from namespace to expr
         self._call = call
+        # How this expression was built, see `narwhals._expression_nodes`.
+        self._node = node
+
+    def __hash__(self) -> int:
+        return hash(structure(self))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Expressions are pickled as their serialized form.
+        return (deserialize, (serialize(self), type(self)))
+
+    @classmethod
+    def deserialize(cls, source: str | Path | IOBase) -> Self:
+        """
+        Read an expression serialized with `Expr.meta.serialize`.
+
+        Arguments:
+            source: Path to a file, or a file-like object (by file-like object, we
+                refer to objects that have a `read()` method, such as a file
+                handler like the builtin `open` function, or a `StringIO`).
+
+        Examples:
+            >>> import io
+            >>> import polars as pl
+            >>> import narwhals as nw
+            >>> json = nw.col("a").sum().alias("b").meta.serialize()
+            >>> expr = nw.Expr.deserialize(io.StringIO(json))
+
+            We can use it like any other expression:
+
+            >>> df = nw.from_native(pl.DataFrame({"a": [1, 2]}))
+            >>> nw.to_native(df.select(expr))
+            shape: (1, 1)
+            ┌─────┐
+            │ b   │
+            │ --- │
+            │ i64 │
+            ╞═════╡
+            │ 3   │
+            └─────┘
+        """
+        if isinstance(source, IOBase):
+            return deserialize(source.read(), cls)
+        return deserialize(Path(source).read_text(), cls)
 
     def _taxicab_norm(self) -> Self:
         # This is just used to test out the stable api feature in a realistic-ish way.
@@ -77,7 +130,9 @@ class Expr:
             │ 15  │
             └─────┘
         """
-        return self.__class__(lambda plx: self._call(plx).alias(name))
+        return self.__class__(
+            lambda plx: self._call(plx).alias(name), (".alias", (self, name), {})
+        )
 
     def cast(
         self,
@@ -127,132 +182,159 @@ class Expr:
 
         return self.__class__(
             lambda plx: self._call(plx).cast(translate_dtype(plx, dtype)),
+            (".cast", (self, dtype), {}),
         )
 
     # --- binary ---
     def __eq__(self, other: object) -> Self:  # type: ignore[override]
         return self.__class__(
-            lambda plx: self._call(plx).__eq__(extract_native(plx, other))
+            lambda plx: self._call(plx).__eq__(extract_native(plx, other)),
+            (".__eq__", (self, other), {}),
         )
 
     def __ne__(self, other: object) -> Self:  # type: ignore[override]
         return self.__class__(
-            lambda plx: self._call(plx).__ne__(extract_native(plx, other))
+            lambda plx: self._call(plx).__ne__(extract_native(plx, other)),
+            (".__ne__", (self, other), {}),
         )
 
     def __and__(self, other: Any) -> Self:
         return self.__class__(
-            lambda plx: self._call(plx).__and__(extract_native(plx, other))
+            lambda plx: self._call(plx).__and__(extract_native(plx, other)),
+            (".__and__", (self, other), {}),
         )
 
     def __rand__(self, other: Any) -> Self:
         return self.__class__(
-            lambda plx: self._call(plx).__rand__(extract_native(plx, other))
+            lambda plx: self._call(plx).__rand__(extract_native(plx, other)),
+            (".__rand__", (self, other), {}),
         )
 
     def __or__(self, other: Any) -> Self:
         return self.__class__(
-            lambda plx: self._call(plx).__or__(extract_native(plx, other))
+            lambda plx: self._call(plx).__or__(extract_native(plx, other)),
+            (".__or__", (self, other), {}),
         )
 
     def __ror__(self, other: Any) -> Self:
         return self.__class__(
-            lambda plx: self._call(plx).__ror__(extract_native(plx, other))
+            lambda plx: self._call(plx).__ror__(extract_native(plx, other)),
+            (".__ror__", (self, other), {}),
         )
 
     def __add__(self, other: Any) -> Self:
         return self.__class__(
-            lambda plx: self._call(plx).__add__(extract_native(plx, other))
+            lambda plx: self._call(plx).__add__(extract_native(plx, other)),
+            (".__add__", (self, other), {}),
         )
 
     def __radd__(self, other: Any) -> Self:
         return self.__class__(
-            lambda plx: self._call(plx).__radd__(extract_native(plx, other))
+            lambda plx: self._call(plx).__radd__(extract_native(plx, other)),
+            (".__radd__", (self, other), {}),
         )
 
     def __sub__(self, other: Any) -> Self:
         return self.__class__(
-            lambda plx: self._call(plx).__sub__(extract_native(plx, other))
+            lambda plx: self._call(plx).__sub__(extract_native(plx, other)),
+            (".__sub__", (self, other), {}),
         )
 
     def __rsub__(self, other: Any) -> Self:
         return self.__class__(
-            lambda plx: self._call(plx).__rsub__(extract_native(plx, other))
+            lambda plx: self._call(plx).__rsub__(extract_native(plx, other)),
+            (".__rsub__", (self, other), {}),
         )
 
     def __truediv__(self, other: Any) -> Self:
         return self.__class__(
-            lambda plx: self._call(plx).__truediv__(extract_native(plx, other))
+            lambda plx: self._call(plx).__truediv__(extract_native(plx, other)),
+            (".__truediv__", (self, other), {}),
         )
 
     def __rtruediv__(self, other: Any) -> Self:
         return self.__class__(
-            lambda plx: self._call(plx).__rtruediv__(extract_native(plx, other))
+            lambda plx: self._call(plx).__rtruediv__(extract_native(plx, other)),
+            (".__rtruediv__", (self, other), {}),
         )
 
     def __mul__(self, other: Any) -> Self:
         return self.__class__(
-            lambda plx: self._call(plx).__mul__(extract_native(plx, other))
+            lambda plx: self._call(plx).__mul__(extract_native(plx, other)),
+            (".__mul__", (self, other), {}),
         )
 
     def __rmul__(self, other: Any) -> Self:
         return self.__class__(
-            lambda plx: self._call(plx).__rmul__(extract_native(plx, other))
+            lambda plx: self._call(plx).__rmul__(extract_native(plx, other)),
+            (".__rmul__", (self, other), {}),
         )
 
     def __le__(self, other: Any) -> Self:
         return self.__class__(
-            lambda plx: self._call(plx).__le__(extract_native(plx, other))
+            lambda plx: self._call(plx).__le__(extract_native(plx, other)),
+            (".__le__", (self, other), {}),
         )
 
     def __lt__(self, other: Any) -> Self:
         return self.__class__(
-            lambda plx: self._call(plx).__lt__(extract_native(plx, other))
+            lambda plx: self._call(plx).__lt__(extract_native(plx, other)),
+            (".__lt__", (self, other), {}),
         )
 
     def __gt__(self, other: Any) -> Self:
         return self.__class__(
-            lambda plx: self._call(plx).__gt__(extract_native(plx, other))
+            lambda plx: self._call(plx).__gt__(extract_native(plx, other)),
+            (".__gt__", (self, other), {}),
         )
 
     def __ge__(self, other: Any) -> Self:
         return self.__class__(
-            lambda plx: self._call(plx).__ge__(extract_native(plx, other))
+            lambda plx: self._call(plx).__ge__(extract_native(plx, other)),
+            (".__ge__", (self, other), {}),
         )
 
     def __pow__(self, other: Any) -> Self:
         return self.__class__(
-            lambda plx: self._call(plx).__pow__(extract_native(plx, other))
+            lambda plx: self._call(plx).__pow__(extract_native(plx, other)),
+            (".__pow__", (self, other), {}),
         )
 
     def __rpow__(self, other: Any) -> Self:
         return self.__class__(
-            lambda plx: self._call(plx).__rpow__(extract_native(plx, other))
+            lambda plx: self._call(plx).__rpow__(extract_native(plx, other)),
+            (".__rpow__", (self, other), {}),
         )
 
     def __floordiv__(self, other: Any) -> Self:
         return self.__class__(
-            lambda plx: self._call(plx).__floordiv__(extract_native(plx, other))
+            lambda plx: self._call(plx).__floordiv__(extract_native(plx, other)),
+            (".__floordiv__", (self, other), {}),
         )
 
     def __rfloordiv__(self, other: Any) -> Self:
         return self.__class__(
-            lambda plx: self._call(plx).__rfloordiv__(extract_native(plx, other))
+            lambda plx: self._call(plx).__rfloordiv__(extract_native(plx, other)),
+            (".__rfloordiv__", (self, other), {}),
         )
 
     def __mod__(self, other: Any) -> Self:
         return self.__class__(
-            lambda plx: self._call(plx).__mod__(extract_native(plx, other))
+            lambda plx: self._call(plx).__mod__(extract_native(plx, other)),
+            (".__mod__", (self, other), {}),
         )
 
     def __rmod__(self, other: Any) -> Self:
         return self.__class__(
-            lambda plx: self._call(plx).__rmod__(extract_native(plx, other))
+            lambda plx: self._call(plx).__rmod__(extract_native(plx, other)),
+            (".__rmod__", (self, other), {}),
         )
 
     # --- unary ---
     def __invert__(self) -> Self:
-        return self.__class__(lambda plx: self._call(plx).__invert__())
+        return self.__class__(
+            lambda plx: self._call(plx).__invert__(), (".__invert__", (self,), {})
+        )
 
     def any(self) -> Self:
         """
@@ -286,7 +368,7 @@ class Expr:
             │ true ┆ true │
             └──────┴──────┘
         """
-        return self.__class__(lambda plx: self._call(plx).any())
+        return self.__class__(lambda plx: self._call(plx).any(), (".any", (self,), {}))
 
     def all(self) -> Self:
         """
@@ -320,7 +402,7 @@ class Expr:
             │ false ┆ true │
             └───────┴──────┘
         """
-        return self.__class__(lambda plx: self._call(plx).all())
+        return self.__class__(lambda plx: self._call(plx).all(), (".all", (self,), {}))
 
     def mean(self) -> Self:
         """
@@ -354,7 +436,7 @@ class Expr:
             │ 0.0 ┆ 4.0 │
             └─────┴─────┘
         """
-        return self.__class__(lambda plx: self._call(plx).mean())
+        return self.__class__(lambda plx: self._call(plx).mean(), (".mean", (self,), {}))
 
     def std(self, *, ddof: int = 1) -> Self:
         """
@@ -393,7 +475,9 @@ class Expr:
             └──────────┴──────────┘
 
         """
-        return self.__class__(lambda plx: self._call(plx).std(ddof=ddof))
+        return self.__class__(
+            lambda plx: self._call(plx).std(ddof=ddof), (".std", (self,), {"ddof": ddof})
+        )
 
     def sum(self) -> Expr:
         """
@@ -427,7 +511,7 @@ class Expr:
             │ 15  ┆ 150 │
             └─────┴─────┘
         """
-        return self.__class__(lambda plx: self._call(plx).sum())
+        return self.__class__(lambda plx: self._call(plx).sum(), (".sum", (self,), {}))
 
     def min(self) -> Self:
         """
@@ -461,7 +545,7 @@ class Expr:
             └─────┴─────┘
         """
 
-        return self.__class__(lambda plx: self._call(plx).min())
+        return self.__class__(lambda plx: self._call(plx).min(), (".min", (self,), {}))
 
     def max(self) -> Self:
         """
@@ -495,7 +579,7 @@ class Expr:
             │ 20  ┆ 100 │
             └─────┴─────┘
         """
-        return self.__class__(lambda plx: self._call(plx).max())
+        return self.__class__(lambda plx: self._call(plx).max(), (".max", (self,), {}))
 
     def count(self) -> Self:
         """
@@ -529,7 +613,9 @@ class Expr:
             │ 3   ┆ 2   │
             └─────┴─────┘
         """
-        return self.__class__(lambda plx: self._call(plx).count())
+        return self.__class__(
+            lambda plx: self._call(plx).count(), (".count", (self,), {})
+        )
 
     def n_unique(self) -> Self:
         """
@@ -563,7 +649,9 @@ class Expr:
             │ 5   ┆ 3   │
             └─────┴─────┘
         """
-        return self.__class__(lambda plx: self._call(plx).n_unique())
+        return self.__class__(
+            lambda plx: self._call(plx).n_unique(), (".n_unique", (self,), {})
+        )
 
     def unique(self) -> Self:
         """
@@ -601,7 +689,9 @@ class Expr:
             │ 5   ┆ 6   │
             └─────┴─────┘
         """
-        return self.__class__(lambda plx: self._call(plx).unique())
+        return self.__class__(
+            lambda plx: self._call(plx).unique(), (".unique", (self,), {})
+        )
 
     def abs(self) -> Self:
         """
@@ -638,7 +728,7 @@ class Expr:
             │ 2   ┆ 4   │
             └─────┴─────┘
         """
-        return self.__class__(lambda plx: self._call(plx).abs())
+        return self.__class__(lambda plx: self._call(plx).abs(), (".abs", (self,), {}))
 
     def cum_sum(self) -> Self:
         """
@@ -680,7 +770,9 @@ class Expr:
             │ 15  ┆ 22  │
             └─────┴─────┘
         """
-        return self.__class__(lambda plx: self._call(plx).cum_sum())
+        return self.__class__(
+            lambda plx: self._call(plx).cum_sum(), (".cum_sum", (self,), {})
+        )
 
     def diff(self) -> Self:
         """
@@ -731,7 +823,7 @@ class Expr:
             │ 0      │
             └────────┘
         """
-        return self.__class__(lambda plx: self._call(plx).diff())
+        return self.__class__(lambda plx: self._call(plx).diff(), (".diff", (self,), {}))
 
     def shift(self, n: int) -> Self:
         """
@@ -782,7 +874,9 @@ class Expr:
             │ 5       │
             └─────────┘
         """
-        return self.__class__(lambda plx: self._call(plx).shift(n))
+        return self.__class__(
+            lambda plx: self._call(plx).shift(n), (".shift", (self, n), {})
+        )
 
     def sort(self, *, descending: bool = False) -> Self:
         """
@@ -850,7 +944,10 @@ class Expr:
             │ 1    │
             └──────┘
         """
-        return self.__class__(lambda plx: self._call(plx).sort(descending=descending))
+        return self.__class__(
+            lambda plx: self._call(plx).sort(descending=descending),
+            (".sort", (self,), {"descending": descending}),
+        )
 
     # --- transform ---
     def is_between(
@@ -903,7 +1000,8 @@ class Expr:
             └───────┘
         """
         return self.__class__(
-            lambda plx: self._call(plx).is_between(lower_bound, upper_bound, closed)
+            lambda plx: self._call(plx).is_between(lower_bound, upper_bound, closed),
+            (".is_between", (self, lower_bound, upper_bound, closed), {}),
         )
 
     def is_in(self, other: Any) -> Self:
@@ -949,7 +1047,9 @@ class Expr:
             └─────┴───────┘
         """
         if isinstance(other, Iterable) and not isinstance(other, (str, bytes)):
-            return self.__class__(lambda plx: self._call(plx).is_in(other))
+            return self.__class__(
+                lambda plx: self._call(plx).is_in(other), (".is_in", (self, other), {})
+            )
         else:
             msg = "Narwhals `is_in` doesn't accept expressions as an argument, as opposed to Polars. You should provide an iterable instead."
             raise NotImplementedError(msg)
@@ -996,7 +1096,8 @@ class Expr:
         return self.__class__(
             lambda plx: self._call(plx).filter(
                 *[extract_native(plx, pred) for pred in flatten(predicates)]
-            )
+            ),
+            (".filter", (self, *predicates), {}),
         )
 
     def is_null(self) -> Self:
@@ -1050,7 +1151,9 @@ class Expr:
             │ 5    ┆ 5.0 ┆ false     ┆ false     │
             └──────┴─────┴───────────┴───────────┘
         """
-        return self.__class__(lambda plx: self._call(plx).is_null())
+        return self.__class__(
+            lambda plx: self._call(plx).is_null(), (".is_null", (self,), {})
+        )
 
     def fill_null(self, value: Any) -> Self:
         """
@@ -1101,7 +1204,10 @@ class Expr:
             │ 5   ┆ 5.0 │
             └─────┴─────┘
         """
-        return self.__class__(lambda plx: self._call(plx).fill_null(value))
+        return self.__class__(
+            lambda plx: self._call(plx).fill_null(value),
+            (".fill_null", (self, value), {}),
+        )
 
     # --- partial reduction ---
     def drop_nulls(self) -> Self:
@@ -1148,7 +1254,9 @@ class Expr:
             │ 5.0 │
             └─────┘
         """
-        return self.__class__(lambda plx: self._call(plx).drop_nulls())
+        return self.__class__(
+            lambda plx: self._call(plx).drop_nulls(), (".drop_nulls", (self,), {})
+        )
 
     def sample(
         self,
@@ -1203,7 +1311,8 @@ class Expr:
         return self.__class__(
             lambda plx: self._call(plx).sample(
                 n, fraction=fraction, with_replacement=with_replacement
-            )
+            ),
+            (".sample", (self, n, fraction), {"with_replacement": with_replacement}),
         )
 
     def over(self, *keys: str | Iterable[str]) -> Self:
@@ -1248,7 +1357,9 @@ class Expr:
             │ 3   ┆ 2   ┆ 3               │
             └─────┴─────┴─────────────────┘
         """
-        return self.__class__(lambda plx: self._call(plx).over(flatten(keys)))
+        return self.__class__(
+            lambda plx: self._call(plx).over(flatten(keys)), (".over", (self, *keys), {})
+        )
 
     def is_duplicated(self) -> Self:
         r"""
@@ -1289,7 +1400,9 @@ class Expr:
             │ true  ┆ false │
             └───────┴───────┘
         """
-        return self.__class__(lambda plx: self._call(plx).is_duplicated())
+        return self.__class__(
+            lambda plx: self._call(plx).is_duplicated(), (".is_duplicated", (self,), {})
+        )
 
     def is_unique(self) -> Self:
         r"""
@@ -1331,7 +1444,9 @@ class Expr:
             └───────┴───────┘
         """
 
-        return self.__class__(lambda plx: self._call(plx).is_unique())
+        return self.__class__(
+            lambda plx: self._call(plx).is_unique(), (".is_unique", (self,), {})
+        )
 
     def null_count(self) -> Self:
         r"""
@@ -1370,7 +1485,9 @@ class Expr:
             │ 1   ┆ 2   │
             └─────┴─────┘
         """
-        return self.__class__(lambda plx: self._call(plx).null_count())
+        return self.__class__(
+            lambda plx: self._call(plx).null_count(), (".null_count", (self,), {})
+        )
 
     def is_first_distinct(self) -> Self:
         r"""
@@ -1411,7 +1528,10 @@ class Expr:
             │ false ┆ true  │
             └───────┴───────┘
         """
-        return self.__class__(lambda plx: self._call(plx).is_first_distinct())
+        return self.__class__(
+            lambda plx: self._call(plx).is_first_distinct(),
+            (".is_first_distinct", (self,), {}),
+        )
 
     def is_last_distinct(self) -> Self:
         r"""Return a boolean mask indicating the last occurrence of each distinct value.
@@ -1451,7 +1571,10 @@ class Expr:
             │ true  ┆ true  │
             └───────┴───────┘
         """
-        return self.__class__(lambda plx: self._call(plx).is_last_distinct())
+        return self.__class__(
+            lambda plx: self._call(plx).is_last_distinct(),
+            (".is_last_distinct", (self,), {}),
+        )
 
     def quantile(
         self,
@@ -1500,7 +1623,8 @@ class Expr:
             └──────┴──────┘
         """
         return self.__class__(
-            lambda plx: self._call(plx).quantile(quantile, interpolation)
+            lambda plx: self._call(plx).quantile(quantile, interpolation),
+            (".quantile", (self, quantile, interpolation), {}),
         )
 
     def head(self, n: int = 10) -> Self:
@@ -1545,7 +1669,9 @@ class Expr:
             └─────┘
         """
 
-        return self.__class__(lambda plx: self._call(plx).head(n))
+        return self.__class__(
+            lambda plx: self._call(plx).head(n), (".head", (self, n), {})
+        )
 
     def tail(self, n: int = 10) -> Self:
         r"""
@@ -1589,7 +1715,9 @@ class Expr:
             └─────┘
         """
 
-        return self.__class__(lambda plx: self._call(plx).tail(n))
+        return self.__class__(
+            lambda plx: self._call(plx).tail(n), (".tail", (self, n), {})
+        )
 
     def round(self, decimals: int = 0) -> Self:
         r"""
@@ -1641,7 +1769,9 @@ class Expr:
             └─────┘
         """
 
-        return self.__class__(lambda plx: self._call(plx).round(decimals))
+        return self.__class__(
+            lambda plx: self._call(plx).round(decimals), (".round", (self, decimals), {})
+        )
 
     def len(self) -> Self:
         r"""
@@ -1681,7 +1811,7 @@ class Expr:
             │ 2   ┆ 1   │
             └─────┴─────┘
         """
-        return self.__class__(lambda plx: self._call(plx).len())
+        return self.__class__(lambda plx: self._call(plx).len(), (".len", (self,), {}))
 
     @property
     def str(self) -> ExprStringNamespace:
@@ -1695,7 +1825,74 @@ class Expr:
     def cat(self) -> ExprCatNamespace:
         return ExprCatNamespace(self)
 
+    @property
+    def meta(self) -> ExprMetaNamespace:
+        return ExprMetaNamespace(self)
+
+
+class ExprMetaNamespace:
+    def __init__(self, expr: Expr) -> None:
+        self._expr = expr
+
+    def eq(self, other: Expr) -> bool:
+        """
+        Indicate if this expression is the same as another expression.
+
+        Expressions are the same if they were built with the same functions and
+        methods, called with equal arguments (other than Series, which are
+        only equal to themselves). Equal expressions also have equal hashes.
+
+        Examples:
+            >>> import narwhals as nw
+            >>> foo_bar = nw.col("foo").alias("bar")
+            >>> foo = nw.col("foo")
+            >>> foo_bar.meta.eq(foo)
+            False
+            >>> foo_bar.meta.eq(nw.col("foo").alias("bar"))
+            True
+            >>> hash(foo_bar) == hash(nw.col("foo").alias("bar"))
+            True
+        """
+        return structure(self._expr) == structure(other)  # type: ignore[no-any-return]
+
+    @overload
+    def serialize(self, file: None = ...) -> str: ...
 
+    @overload
+    def serialize(self, file: str | Path | IOBase) -> None: ...
+
+    def serialize(self, file: str | Path | IOBase | None = None) -> str | None:
+        """
+        Serialize this expression to JSON.
+
+        The JSON lists the Narwhals functions and methods which built the
+        expression, and their arguments, so it can be stored, or sent to another
+        process, and read back with `Expr.deserialize`. Expressions with
+        arguments which can't be represented in JSON, such as Series, can't be
+        serialized.
+
+        Arguments:
+            file: File path or writable file-like object to which the result will
+                be written. If set to `None` (default), the output is returned as
+                a string instead.
+
+        Examples:
+            >>> import narwhals as nw
+            >>> expr = nw.col("foo").sum().over("bar")
+            >>> expr.meta.serialize()
+            '{"version": 1, "expr": {"method": "over", "expr": {"method": "sum", "expr": {"function": "col", "args": ["foo"]}}, "args": ["bar"]}}'
+        """
+        json = serialize(self._expr)
+        if file is None:
+            return json
+        if isinstance(file, IOBase):
+            file.write(json)
+        else:
+            Path(file).write_text(json)
+        return None
+
+
+@expr_methods("cat")
 class ExprCatNamespace:
     def __init__(self, expr: Expr) -> None:
         self._expr = expr
@@ -1739,10 +1936,12 @@ class ExprCatNamespace:
             └────────┘
         """
         return self._expr.__class__(
-            lambda plx: self._expr._call(plx).cat.get_categories()
+            lambda plx: self._expr._call(plx).cat.get_categories(),
+            (".cat.get_categories", (self._expr,), {}),
         )
 
 
+@expr_methods("str")
 class ExprStringNamespace:
     def __init__(self, expr: Expr) -> None:
         self._expr = expr
@@ -1789,7 +1988,8 @@ class ExprStringNamespace:
             └────────┴────────────┘
         """
         return self._expr.__class__(
-            lambda plx: self._expr._call(plx).str.starts_with(prefix)
+            lambda plx: self._expr._call(plx).str.starts_with(prefix),
+            (".str.starts_with", (self._expr, prefix), {}),
         )
 
     def ends_with(self, suffix: str) -> Expr:
@@ -1834,7 +2034,8 @@ class ExprStringNamespace:
             └────────┴────────────┘
         """
         return self._expr.__class__(
-            lambda plx: self._expr._call(plx).str.ends_with(suffix)
+            lambda plx: self._expr._call(plx).str.ends_with(suffix),
+            (".str.ends_with", (self._expr, suffix), {}),
         )
 
     def contains(self, pattern: str, *, literal: bool = False) -> Expr:
@@ -1891,7 +2092,8 @@ class ExprStringNamespace:
         """
 
         return self._expr.__class__(
-            lambda plx: self._expr._call(plx).str.contains(pattern, literal=literal)
+            lambda plx: self._expr._call(plx).str.contains(pattern, literal=literal),
+            (".str.contains", (self._expr, pattern), {"literal": literal}),
         )
 
     def slice(self, offset: int, length: int | None = None) -> Expr:
@@ -1966,7 +2168,8 @@ class ExprStringNamespace:
             └─────────────┴──────────┘
         """
         return self._expr.__class__(
-            lambda plx: self._expr._call(plx).str.slice(offset=offset, length=length)
+            lambda plx: self._expr._call(plx).str.slice(offset=offset, length=length),
+            (".str.slice", (self._expr, offset, length), {}),
         )
 
     def head(self, n: int = 5) -> Expr:
@@ -2015,7 +2218,10 @@ class ExprStringNamespace:
             │ zukkyun   ┆ zukky       │
             └───────────┴─────────────┘
         """
-        return self._expr.__class__(lambda plx: self._expr._call(plx).str.slice(0, n))
+        return self._expr.__class__(
+            lambda plx: self._expr._call(plx).str.slice(0, n),
+            (".str.head", (self._expr, n), {}),
+        )
 
     def tail(self, n: int = 5) -> Expr:
         r"""
@@ -2063,7 +2269,10 @@ class ExprStringNamespace:
             │ zukkyun   ┆ kkyun       │
             └───────────┴─────────────┘
         """
-        return self._expr.__class__(lambda plx: self._expr._call(plx).str.slice(-n))
+        return self._expr.__class__(
+            lambda plx: self._expr._call(plx).str.slice(-n),
+            (".str.tail", (self._expr, n), {}),
+        )
 
     def to_datetime(self, format: str) -> Expr:  # noqa: A002
         """
@@ -2111,7 +2320,8 @@ class ExprStringNamespace:
             └─────────────────────┘
         """
         return self._expr.__class__(
-            lambda plx: self._expr._call(plx).str.to_datetime(format=format)
+            lambda plx: self._expr._call(plx).str.to_datetime(format=format),
+            (".str.to_datetime", (self._expr, format), {}),
         )
 
     def to_uppercase(self) -> Expr:
@@ -2158,7 +2368,10 @@ class ExprStringNamespace:
             └────────┴───────────┘
 
         """
-        return self._expr.__class__(lambda plx: self._expr._call(plx).str.to_uppercase())
+        return self._expr.__class__(
+            lambda plx: self._expr._call(plx).str.to_uppercase(),
+            (".str.to_uppercase", (self._expr,), {}),
+        )
 
     def to_lowercase(self) -> Expr:
         r"""
@@ -2198,9 +2411,13 @@ class ExprStringNamespace:
             │ null   ┆ null      │
             └────────┴───────────┘
         """
-        return self._expr.__class__(lambda plx: self._expr._call(plx).str.to_lowercase())
+        return self._expr.__class__(
+            lambda plx: self._expr._call(plx).str.to_lowercase(),
+            (".str.to_lowercase", (self._expr,), {}),
+        )
 
 
+@expr_methods("dt")
 class ExprDateTimeNamespace:
     def __init__(self, expr: Expr) -> None:
         self._expr = expr
@@ -2251,7 +2468,9 @@ class ExprDateTimeNamespace:
             │ 2065-01-01 00:00:00 ┆ 2065 │
             └─────────────────────┴──────┘
         """
-        return self._expr.__class__(lambda plx: self._expr._call(plx).dt.year())
+        return self._expr.__class__(
+            lambda plx: self._expr._call(plx).dt.year(), (".dt.year", (self._expr,), {})
+        )
 
     def month(self) -> Expr:
         """
@@ -2302,7 +2521,9 @@ class ExprDateTimeNamespace:
             │ 2065-01-01 00:00:00 ┆ 2065 ┆ 1     │
             └─────────────────────┴──────┴───────┘
         """
-        return self._expr.__class__(lambda plx: self._expr._call(plx).dt.month())
+        return self._expr.__class__(
+            lambda plx: self._expr._call(plx).dt.month(), (".dt.month", (self._expr,), {})
+        )
 
     def day(self) -> Expr:
         """
@@ -2354,7 +2575,9 @@ class ExprDateTimeNamespace:
             │ 2065-01-01 00:00:00 ┆ 2065 ┆ 1     ┆ 1   │
             └─────────────────────┴──────┴───────┴─────┘
         """
-        return self._expr.__class__(lambda plx: self._expr._call(plx).dt.day())
+        return self._expr.__class__(
+            lambda plx: self._expr._call(plx).dt.day(), (".dt.day", (self._expr,), {})
+        )
 
     def hour(self) -> Expr:
         """
@@ -2402,7 +2625,9 @@ class ExprDateTimeNamespace:
             │ 2065-01-01 10:00:00 ┆ 10   │
             └─────────────────────┴──────┘
         """
-        return self._expr.__class__(lambda plx: self._expr._call(plx).dt.hour())
+        return self._expr.__class__(
+            lambda plx: self._expr._call(plx).dt.hour(), (".dt.hour", (self._expr,), {})
+        )
 
     def minute(self) -> Expr:
         """
@@ -2453,7 +2678,10 @@ class ExprDateTimeNamespace:
             │ 2065-01-01 10:20:00 ┆ 10   ┆ 20     │
             └─────────────────────┴──────┴────────┘
         """
-        return self._expr.__class__(lambda plx: self._expr._call(plx).dt.minute())
+        return self._expr.__class__(
+            lambda plx: self._expr._call(plx).dt.minute(),
+            (".dt.minute", (self._expr,), {}),
+        )
 
     def second(self) -> Expr:
         """
@@ -2503,7 +2731,10 @@ class ExprDateTimeNamespace:
             │ 2065-01-01 10:20:30 ┆ 10   ┆ 20     ┆ 30     │
             └─────────────────────┴──────┴────────┴────────┘
         """
-        return self._expr.__class__(lambda plx: self._expr._call(plx).dt.second())
+        return self._expr.__class__(
+            lambda plx: self._expr._call(plx).dt.second(),
+            (".dt.second", (self._expr,), {}),
+        )
 
     def millisecond(self) -> Expr:
         """
@@ -2554,7 +2785,10 @@ class ExprDateTimeNamespace:
             │ 2065-01-01 10:20:30.067 ┆ 10   ┆ 20     ┆ 30     ┆ 67          │
             └─────────────────────────┴──────┴────────┴────────┴─────────────┘
         """
-        return self._expr.__class__(lambda plx: self._expr._call(plx).dt.millisecond())
+        return self._expr.__class__(
+            lambda plx: self._expr._call(plx).dt.millisecond(),
+            (".dt.millisecond", (self._expr,), {}),
+        )
 
     def microsecond(self) -> Expr:
         """
@@ -2605,7 +2839,10 @@ class ExprDateTimeNamespace:
             │ 2065-01-01 10:20:30.067 ┆ 10   ┆ 20     ┆ 30     ┆ 67000       │
             └─────────────────────────┴──────┴────────┴────────┴─────────────┘
         """
-        return self._expr.__class__(lambda plx: self._expr._call(plx).dt.microsecond())
+        return self._expr.__class__(
+            lambda plx: self._expr._call(plx).dt.microsecond(),
+            (".dt.microsecond", (self._expr,), {}),
+        )
 
     def nanosecond(self) -> Expr:
         """
@@ -2656,7 +2893,10 @@ class ExprDateTimeNamespace:
             │ 2065-01-01 10:20:30.060 ┆ 10   ┆ 20     ┆ 30     ┆ 60000000   │
             └─────────────────────────┴──────┴────────┴────────┴────────────┘
         """
-        return self._expr.__class__(lambda plx: self._expr._call(plx).dt.nanosecond())
+        return self._expr.__class__(
+            lambda plx: self._expr._call(plx).dt.nanosecond(),
+            (".dt.nanosecond", (self._expr,), {}),
+        )
 
     def ordinal_day(self) -> Expr:
         """
@@ -2694,7 +2934,10 @@ class ExprDateTimeNamespace:
             │ 2020-08-03 00:00:00 ┆ 216           │
             └─────────────────────┴───────────────┘
         """
-        return self._expr.__class__(lambda plx: self._expr._call(plx).dt.ordinal_day())
+        return self._expr.__class__(
+            lambda plx: self._expr._call(plx).dt.ordinal_day(),
+            (".dt.ordinal_day", (self._expr,), {}),
+        )
 
     def total_minutes(self) -> Expr:
         """
@@ -2737,7 +2980,10 @@ class ExprDateTimeNamespace:
             │ 20m 40s      ┆ 20              │
             └──────────────┴─────────────────┘
         """
-        return self._expr.__class__(lambda plx: self._expr._call(plx).dt.total_minutes())
+        return self._expr.__class__(
+            lambda plx: self._expr._call(plx).dt.total_minutes(),
+            (".dt.total_minutes", (self._expr,), {}),
+        )
 
     def total_seconds(self) -> Expr:
         """
@@ -2780,7 +3026,10 @@ class ExprDateTimeNamespace:
             │ 20s 40ms     ┆ 20              │
             └──────────────┴─────────────────┘
         """
-        return self._expr.__class__(lambda plx: self._expr._call(plx).dt.total_seconds())
+        return self._expr.__class__(
+            lambda plx: self._expr._call(plx).dt.total_seconds(),
+            (".dt.total_seconds", (self._expr,), {}),
+        )
 
     def total_milliseconds(self) -> Expr:
         """
@@ -2831,7 +3080,8 @@ class ExprDateTimeNamespace:
             └──────────────┴──────────────────────┘
         """
         return self._expr.__class__(
-            lambda plx: self._expr._call(plx).dt.total_milliseconds()
+            lambda plx: self._expr._call(plx).dt.total_milliseconds(),
+            (".dt.total_milliseconds", (self._expr,), {}),
         )
 
     def total_microseconds(self) -> Expr:
@@ -2883,7 +3133,8 @@ class ExprDateTimeNamespace:
             └──────────────┴──────────────────────┘
         """
         return self._expr.__class__(
-            lambda plx: self._expr._call(plx).dt.total_microseconds()
+            lambda plx: self._expr._call(plx).dt.total_microseconds(),
+            (".dt.total_microseconds", (self._expr,), {}),
         )
 
     def total_nanoseconds(self) -> Expr:
@@ -2932,7 +3183,8 @@ class ExprDateTimeNamespace:
             └───────────────────────────────┴──────────────────────────┘
         """
         return self._expr.__class__(
-            lambda plx: self._expr._call(plx).dt.total_nanoseconds()
+            lambda plx: self._expr._call(plx).dt.total_nanoseconds(),
+            (".dt.total_nanoseconds", (self._expr,), {}),
         )
 
     def to_string(self, format: str) -> Expr:  # noqa: A002
@@ -3010,10 +3262,12 @@ class ExprDateTimeNamespace:
             └─────────────────────┘
         """
         return self._expr.__class__(
-            lambda plx: self._expr._call(plx).dt.to_string(format)
+            lambda plx: self._expr._call(plx).dt.to_string(format),
+            (".dt.to_string", (self._expr, format), {}),
         )
 
 
+@expr_function
 def col(*names: str | Iterable[str]) -> Expr:
     """
     Creates an expression that references one or more columns by their name(s).
@@ -3051,9 +3305,10 @@ def col(*names: str | Iterable[str]) -> Expr:
         │ 8   │
         └─────┘
     """
-    return Expr(lambda plx: plx.col(*names))
+    return Expr(lambda plx: plx.col(*names), ("col", names, {}))
 
 
+@expr_function
 def all() -> Expr:
     """
     Instantiate an expression representing all columns.
@@ -3090,9 +3345,10 @@ def all() -> Expr:
         │ 6   ┆ 12  │
         └─────┴─────┘
     """
-    return Expr(lambda plx: plx.all())
+    return Expr(lambda plx: plx.all(), ("all", (), {}))
 
 
+@expr_function
 def len() -> Expr:
     """
     Return the number of rows.
@@ -3135,9 +3391,10 @@ def len() -> Expr:
             return plx.count().alias("len")
         return plx.len()
 
-    return Expr(func)
+    return Expr(func, ("len", (), {}))
 
 
+@expr_function
 def sum(*columns: str) -> Expr:
     """
     Sum all values.
@@ -3177,9 +3434,10 @@ def sum(*columns: str) -> Expr:
         └─────┘
     """
 
-    return Expr(lambda plx: plx.sum(*columns))
+    return Expr(lambda plx: plx.sum(*columns), ("sum", columns, {}))
 
 
+@expr_function
 def mean(*columns: str) -> Expr:
     """
     Get the mean value.
@@ -3220,9 +3478,10 @@ def mean(*columns: str) -> Expr:
         └─────┘
     """
 
-    return Expr(lambda plx: plx.mean(*columns))
+    return Expr(lambda plx: plx.mean(*columns), ("mean", columns, {}))
 
 
+@expr_function
 def min(*columns: str) -> Expr:
     """
     Return the minimum value.
@@ -3261,9 +3520,10 @@ def min(*columns: str) -> Expr:
         │ 5   │
         └─────┘
     """
-    return Expr(lambda plx: plx.min(*columns))
+    return Expr(lambda plx: plx.min(*columns), ("min", columns, {}))
 
 
+@expr_function
 def max(*columns: str) -> Expr:
     """
     Return the maximum value.
@@ -3302,9 +3562,10 @@ def max(*columns: str) -> Expr:
         │ 2   │
         └─────┘
     """
-    return Expr(lambda plx: plx.max(*columns))
+    return Expr(lambda plx: plx.max(*columns), ("max", columns, {}))
 
 
+@expr_function
 def sum_horizontal(*exprs: IntoExpr | Iterable[IntoExpr]) -> Expr:
     """
     Sum all values horizontally across columns
@@ -3345,10 +3606,12 @@ def sum_horizontal(*exprs: IntoExpr | Iterable[IntoExpr]) -> Expr:
         └─────┘
     """
     return Expr(
-        lambda plx: plx.sum_horizontal([extract_native(plx, v) for v in flatten(exprs)])
+        lambda plx: plx.sum_horizontal([extract_native(plx, v) for v in flatten(exprs)]),
+        ("sum_horizontal", exprs, {}),
     )
 
 
+@expr_function
 def all_horizontal(*exprs: IntoExpr | Iterable[IntoExpr]) -> Expr:
     r"""
     Compute the bitwise AND horizontally across columns.
@@ -3403,10 +3666,12 @@ def all_horizontal(*exprs: IntoExpr | Iterable[IntoExpr]) -> Expr:
         └───────┴───────┴───────┘
     """
     return Expr(
-        lambda plx: plx.all_horizontal([extract_native(plx, v) for v in flatten(exprs)])
+        lambda plx: plx.all_horizontal([extract_native(plx, v) for v in flatten(exprs)]),
+        ("all_horizontal", exprs, {}),
     )
 
 
+@expr_function
 def lit(value: Any, dtype: DType | None = None) -> Expr:
     """
     Return an expression representing a literal value.
@@ -3458,8 +3723,11 @@ def lit(value: Any, dtype: DType | None = None) -> Expr:
         raise NotImplementedError(msg)
 
     if dtype is None:
-        return Expr(lambda plx: plx.lit(value, dtype))
-    return Expr(lambda plx: plx.lit(value, translate_dtype(plx, dtype)))
+        return Expr(lambda plx: plx.lit(value, dtype), ("lit", (value, dtype), {}))
+    return Expr(
+        lambda plx: plx.lit(value, translate_dtype(plx, dtype)),
+        ("lit", (value, dtype), {}),
+    )
 
 
 __all__ = [
@@ -9,8 +9,18 @@ from typing import Literal
 from typing import TypeVar
 from typing import Union
 
+from narwhals._explain import PlanNode
 from narwhals.dataframe import DataFrame
 from narwhals.dataframe import LazyFrame
+from narwhals.dependencies import get_cudf
+from narwhals.dependencies import get_dask
+from narwhals.dependencies import get_modin
+from narwhals.dependencies import get_pandas
+from narwhals.dependencies import get_polars
+from narwhals.dependencies import get_pyarrow
+from narwhals.translate import from_native
+from narwhals.utils import collect_converted_scans
+from narwhals.utils import parse_version
 from narwhals.utils import validate_laziness
 from narwhals.utils import validate_same_library
 
@@ -20,6 +30,11 @@ from narwhals.utils import validate_same_library
 FrameT = TypeVar("FrameT", bound=Union[DataFrame, LazyFrame])  # type: ignore[type-arg]
 
 if TYPE_CHECKING:
+    from pathlib import Path
+    from types import ModuleType
+
+    from narwhals._shared_memory import SharedFrameHandle
+    from narwhals.schema import Schema
     from narwhals.series import Series
 
 
@@ -34,7 +49,7 @@ def concat(
     if not items:
         msg = "No items to concatenate"
         raise ValueError(msg)
-    items = list(items)
+    items = collect_converted_scans(list(items))
     validate_same_library(items)
     validate_laziness(items)
     first_item = items[0]
@@ -44,6 +59,318 @@ def concat(
     )
 
 
+def _scan_result(native_frame: Any, operation: str, **kwargs: Any) -> LazyFrame[Any]:
+    # The plan starts with the scan, so that the files it reads (rather than
+    # the object which reads them) identify it, see `narwhals._cache`.
+    lf = from_native(native_frame).lazy()
+    lf._plan = PlanNode(operation, kwargs=kwargs, source=lf._compliant_frame)
+    return lf
+
+
+def scan_parquet(
+    source: str | Path,
+    *,
+    native_namespace: ModuleType,
+    hive_partitioning: bool = False,
+) -> LazyFrame[Any]:
+    """
+    Lazily read from a parquet file.
+
+    For Polars, this uses `polars.scan_parquet`. For PyArrow, the file is
+    opened as a `pyarrow.dataset.Dataset`: column selections and filters are
+    only applied when the data is read, and `len`, `null_count`, `min`, `max`
+    and `collect_schema` are answered from the Parquet footer statistics
+    without reading any data pages, when the statistics are complete.
+    Other libraries read the file eagerly.
+
+    With `hive_partitioning=True`, `source` is read as a dataset laid out in
+    Hive-style `key=value` directories (such as the ones written by
+    `DataFrame.write_parquet(..., partition_by=...)`), and the keys are
+    added as columns. For PyArrow, filters on partition columns are then used
+    to skip whole partitions: this applies to `filter` calls whose predicates
+    only combine a single column with literals, such as
+    `nw.col("year") == 2024` or `nw.col("key").is_in(["a", "b"])`.
+
+    Arguments:
+        source: Path to a file, or to a directory of files.
+        native_namespace: The native library to use for reading, such as `polars`
+            or `pyarrow`.
+        hive_partitioning: Whether to discover Hive-style partitions in `source`.
+            pandas-like libraries always discover them.
+
+    Examples:
+        >>> import pyarrow as pa
+        >>> import narwhals as nw
+        >>> lf = nw.scan_parquet("file.parquet", native_namespace=pa)  # doctest:+SKIP
+        >>> lf.select(nw.col("a").min(), nw.col("b").null_count()).collect()  # doctest:+SKIP
+
+        Read a partitioned dataset, only reading the files under `year=2024`:
+
+        >>> lf = nw.scan_parquet(
+        ...     "dataset", native_namespace=pa, hive_partitioning=True
+        ... )  # doctest:+SKIP
+        >>> lf.filter(nw.col("year") == 2024).collect()  # doctest:+SKIP
+    """
+    if native_namespace is get_polars():
+        native_frame = native_namespace.scan_parquet(
+            source, hive_partitioning=hive_partitioning
+        )
+    elif native_namespace is get_pyarrow():
+        import pyarrow.dataset as ds
+
+        from narwhals._arrow.scan import ArrowScanFrame
+
+        native_frame = ArrowScanFrame(
+            ds.dataset(
+                source,
+                format="parquet",
+                partitioning="hive" if hive_partitioning else None,
+            ),
+            backend_version=parse_version(native_namespace.__version__),
+        )
+    elif native_namespace in (get_pandas(), get_modin(), get_cudf(), get_dask()):
+        native_frame = native_namespace.read_parquet(source)
+    else:
+        msg = f"Unsupported native namespace: {native_namespace}"
+        raise NotImplementedError(msg)
+    return _scan_result(
+        native_frame,
+        "scan_parquet",
+        source=source,
+        native_namespace=native_namespace,
+        hive_partitioning=hive_partitioning,
+    )
+
+
+def scan_csv(
+    source: str | Path,
+    *,
+    native_namespace: ModuleType,
+    schema: Schema | None = None,
+    batch_size: int | None = None,
+) -> LazyFrame[Any]:
+    """
+    Lazily read from a CSV file.
+
+    For Polars, this uses `polars.scan_csv`, and for Dask, `dask.dataframe.read_csv`.
+    For PyArrow and pandas-like libraries, the file is streamed in batches with
+    PyArrow's CSV reader: only the selected columns are converted, and
+    elementwise filters are applied to each batch as it's read, so only
+    the matching rows are kept in memory. For libraries other than PyArrow,
+    results are converted once they've been computed.
+
+    Arguments:
+        source: Path to a file, or to a directory of files.
+        native_namespace: The native library to use for reading, such as `polars`,
+            `pyarrow` or `pandas`.
+        schema: Data type of each column. If given, the data types aren't
+            inferred from the file. Dask still infers them, and then casts to
+            the given types.
+        batch_size: Maximum number of rows in each batch, for libraries which
+            read through PyArrow.
+
+    Examples:
+        >>> import pandas as pd
+        >>> import narwhals as nw
+        >>> schema = nw.Schema({"a": nw.Int64(), "b": nw.String()})
+        >>> lf = nw.scan_csv("file.csv", native_namespace=pd, schema=schema)  # doctest:+SKIP
+        >>> nw.to_native(lf.filter(nw.col("a") > 1).select("b").collect())  # doctest:+SKIP
+    """
+    if native_namespace is get_polars():
+        kwargs: dict[str, Any] = {}
+        if schema is not None:
+            from narwhals.dtypes import translate_dtype
+
+            kwargs["schema"] = {
+                name: translate_dtype(native_namespace, dtype)
+                for name, dtype in schema.items()
+            }
+        native_frame = native_namespace.scan_csv(source, **kwargs)
+    elif native_namespace is get_dask():
+        lf = _scan_result(
+            native_namespace.read_csv(source),
+            "scan_csv",
+            source=source,
+            native_namespace=native_namespace,
+            schema=schema,
+            batch_size=batch_size,
+        )
+        if schema is None:
+            return lf
+        from narwhals.expression import col
+
+        return lf.with_columns(col(name).cast(dtype) for name, dtype in schema.items())
+    elif native_namespace in (get_pyarrow(), get_pandas(), get_modin(), get_cudf()):
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+
+        from narwhals._arrow.scan import ArrowScanFrame
+        from narwhals._arrow.utils import reverse_translate_dtype
+
+        arrow_schema = None
+        if schema is not None:
+            arrow_schema = pa.schema(
+                [(name, reverse_translate_dtype(dtype)) for name, dtype in schema.items()]
+            )
+        native_frame = ArrowScanFrame(
+            ds.dataset(source, format="csv", schema=arrow_schema),
+            backend_version=parse_version(pa.__version__),
+            batch_size=batch_size,
+            target_namespace=None if native_namespace is pa else native_namespace,
+        )
+    else:
+        msg = f"Unsupported native namespace: {native_namespace}"
+        raise NotImplementedError(msg)
+    return _scan_result(
+        native_frame,
+        "scan_csv",
+        source=source,
+        native_namespace=native_namespace,
+        schema=schema,
+        batch_size=batch_size,
+    )
+
+
+def read_ipc(
+    source: str | Path,
+    *,
+    native_namespace: ModuleType,
+    memory_map: bool = True,
+) -> DataFrame[Any]:
+    """
+    Read an Arrow IPC (Feather v2) file into a DataFrame.
+
+    With `memory_map=True`, the file is memory-mapped rather than read: for
+    PyArrow, the data of uncompressed files isn't copied at all, and for pandas,
+    numeric columns without nulls are (read-only) views of the mapped file.
+
+    Arguments:
+        source: Path to a file.
+        native_namespace: The native library to use for reading, such as `polars`,
+            `pyarrow` or `pandas`.
+        memory_map: Whether to memory-map the file.
+
+    Examples:
+        >>> import pyarrow as pa
+        >>> import narwhals as nw
+        >>> df = nw.read_ipc("file.arrow", native_namespace=pa)  # doctest:+SKIP
+    """
+    if native_namespace is get_polars():
+        native_frame = native_namespace.read_ipc(source, memory_map=memory_map)
+    elif native_namespace in (get_pyarrow(), get_pandas(), get_modin(), get_cudf()):
+        import pyarrow as pa
+
+        from narwhals._arrow.utils import convert_table
+
+        file = pa.memory_map(str(source)) if memory_map else pa.OSFile(str(source))
+        with file:
+            table = pa.ipc.open_file(file).read_all()
+        native_frame = (
+            table if native_namespace is pa else convert_table(table, native_namespace)
+        )
+    else:
+        msg = f"Unsupported native namespace: {native_namespace}"
+        raise NotImplementedError(msg)
+    return from_native(native_frame, eager_only=True)
+
+
+def scan_ipc(
+    source: str | Path,
+    *,
+    native_namespace: ModuleType,
+    memory_map: bool = True,
+) -> LazyFrame[Any]:
+    """
+    Lazily read from an Arrow IPC (Feather v2) file.
+
+    For Polars, this uses `polars.scan_ipc`. For PyArrow and pandas-like
+    libraries, the file is opened as a `pyarrow.dataset.Dataset`: column
+    selections and filters are applied as the data is read, and results are
+    converted to the target library once they've been computed.
+
+    Arguments:
+        source: Path to a local file, or to a directory of files.
+        native_namespace: The native library to use for reading, such as `polars`,
+            `pyarrow` or `pandas`.
+        memory_map: Whether to memory-map the files.
+
+    Examples:
+        >>> import pandas as pd
+        >>> import narwhals as nw
+        >>> lf = nw.scan_ipc("file.arrow", native_namespace=pd)  # doctest:+SKIP
+        >>> nw.to_native(lf.filter(nw.col("a") > 1).collect())  # doctest:+SKIP
+    """
+    if native_namespace is get_polars():
+        native_frame = native_namespace.scan_ipc(source, memory_map=memory_map)
+    elif native_namespace in (get_pyarrow(), get_pandas(), get_modin(), get_cudf()):
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+        import pyarrow.fs as pa_fs
+
+        from narwhals._arrow.scan import ArrowScanFrame
+
+        native_frame = ArrowScanFrame(
+            ds.dataset(
+                source,
+                format="ipc",
+                filesystem=pa_fs.LocalFileSystem(use_mmap=memory_map),
+            ),
+            backend_version=parse_version(pa.__version__),
+            target_namespace=None if native_namespace is pa else native_namespace,
+        )
+    else:
+        msg = f"Unsupported native namespace: {native_namespace}"
+        raise NotImplementedError(msg)
+    return _scan_result(
+        native_frame,
+        "scan_ipc",
+        source=source,
+        native_namespace=native_namespace,
+        memory_map=memory_map,
+    )
+
+
+def from_shared_memory(
+    handle: SharedFrameHandle,
+    *,
+    native_namespace: ModuleType | None = None,
+) -> DataFrame[Any]:
+    """
+    Read a DataFrame shared by another process with `DataFrame.to_shared_memory`.
+
+    The shared data is memory-mapped rather than copied: PyArrow and Polars frames
+    use it directly, as do numeric columns without nulls of pandas frames (as
+    read-only views). It stays mapped for as long as the result uses it, even if
+    the process which shared it removes it in the meantime.
+
+    Arguments:
+        handle: Handle returned by `DataFrame.to_shared_memory`.
+        native_namespace: The native library to read the frame with, such as
+            `polars`, `pyarrow` or `pandas`. Defaults to the library of the frame
+            which was shared.
+
+    Examples:
+        >>> import pandas as pd
+        >>> import pyarrow as pa
+        >>> import narwhals as nw
+        >>> df = nw.from_native(pd.DataFrame({"a": [1, 2], "b": [4.0, 5.0]}))
+        >>> handle = df.to_shared_memory()
+
+        In a worker process, with a copy of `handle`:
+
+        >>> nw.to_native(nw.from_shared_memory(handle, native_namespace=pa))
+        pyarrow.Table
+        a: int64
+        b: double
+        ----
+        a: [[1,2]]
+        b: [[4,5]]
+    """
+    from narwhals._shared_memory import from_shared_memory
+
+    return from_shared_memory(handle, native_namespace)
+
+
 def _get_sys_info() -> dict[str, str]:
     """System information
 
@@ -8,6 +8,7 @@ from typing import Iterator
 from typing import TypeVar
 from typing import cast
 
+from narwhals._explain import record_plan
 from narwhals.dataframe import DataFrame
 from narwhals.dataframe import LazyFrame
 from narwhals.utils import flatten
@@ -127,6 +128,7 @@ class LazyGroupBy(Generic[LazyFrameT]):
         self._keys = keys
         self._grouped = self._df._compliant_frame.group_by(*self._keys)
 
+    @record_plan
     def agg(
         self, *aggs: IntoExpr | Iterable[IntoExpr], **named_aggs: IntoExpr
     ) -> LazyFrameT:
@@ -0,0 +1,484 @@
+"""Record what each frame operation and expression costs.
+
+Expressions on pandas-like and PyArrow backends are evaluated through nested
+closures (see `reuse_series_implementation`), so a regular profiler only shows
+the same few Narwhals functions over and over. `profile` instead records one
+event per frame operation (e.g. `DataFrame.filter`) and, for pandas-like and
+PyArrow backends, one per expression node (e.g. `col->abs`), nested the way
+they were called.
+
+Instrumentation is only installed while a profile is active, so there's no
+cost when profiling is off. It's installed on the classes themselves, so it
+sees every thread: only the events of the thread which entered the profile (and
+of the `n_threads` pool, while it evaluates expressions for that thread) are
+kept.
+"""
+
+from __future__ import annotations
+
+import inspect
+import json
+import os
+import threading
+import tracemalloc
+from pathlib import Path
+from time import perf_counter_ns
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+
+from narwhals.dependencies import get_polars
+from narwhals.dependencies import get_pyarrow
+
+if TYPE_CHECKING:
+    from types import ModuleType
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+__all__ = ["Profile", "profile"]
+
+# The profile which is currently recording, if any.
+_ACTIVE: Profile | None = None
+
+
+def _frame_classes() -> list[type]:
+    from narwhals.dataframe import BaseFrame
+    from narwhals.dataframe import DataFrame
+    from narwhals.dataframe import LazyFrame
+    from narwhals.group_by import GroupBy
+    from narwhals.group_by import LazyGroupBy
+
+    return [BaseFrame, DataFrame, LazyFrame, GroupBy, LazyGroupBy]
+
+
+def _expr_classes() -> list[type]:
+    from narwhals._arrow.expr import ArrowExpr
+    from narwhals._pandas_like.expr import PandasLikeExpr
+
+    return [ArrowExpr, PandasLikeExpr]
+
+
+def _backend(native_object: Any) -> str:
+    module = type(native_object).__module__.split(".")[0]
+    return "dask" if module == "dask_expr" else module
+
+
+def _compliant_n_rows(compliant: Any) -> int | None:
+    """Number of rows, if it's known without computing anything."""
+    from narwhals._arrow.dataframe import ArrowDataFrame
+    from narwhals._arrow.series import ArrowSeries
+    from narwhals._pandas_like.dataframe import PandasLikeDataFrame
+    from narwhals._pandas_like.series import PandasLikeSeries
+    from narwhals._pandas_like.utils import Implementation
+
+    if isinstance(compliant, (PandasLikeDataFrame, PandasLikeSeries)):
+        if compliant._implementation is Implementation.DASK:
+            return None
+        return len(compliant)
+    if isinstance(compliant, (ArrowDataFrame, ArrowSeries)) or (
+        (pl := get_polars()) is not None
+        and isinstance(compliant, (pl.DataFrame, pl.Series))
+    ):
+        return len(compliant)
+    return None
+
+
+def _n_rows(obj: Any) -> int | None:
+    """Number of rows of a public eager frame or series, else `None`."""
+    from narwhals.dataframe import DataFrame
+    from narwhals.series import Series
+
+    if isinstance(obj, DataFrame):
+        return _compliant_n_rows(obj._compliant_frame)
+    if isinstance(obj, Series):
+        return _compliant_n_rows(obj._compliant_series)
+    return None
+
+
+class Profile:
+    """
+    Events recorded by `narwhals.profile`.
+
+    Each event is a dictionary with keys:
+
+    - `name`: the operation, e.g. `"DataFrame.filter"`, or the expression's
+      function name, e.g. `"col->abs"`.
+    - `category`: `"frame"` or `"expr"`.
+    - `backend`: top-level module of the native object, e.g. `"pandas"`.
+    - `call`: the backend implementation which was called, e.g.
+      `"PandasLikeDataFrame.filter"` for frame operations (which for Polars is
+      the native method itself), or the expression's method, e.g. `"abs"`.
+    - `thread`: identifier of the thread it ran in.
+    - `start_ns`: start time, in nanoseconds since the profile started.
+    - `duration_ns`: wall time, including nested events.
+    - `self_ns`: wall time, excluding nested events in the same thread.
+    - `rows_in`, `rows_out`: number of rows of the input frame and of the
+      result (summed over output series, for expressions), or `None` if it's not
+      known without computing it (e.g. for lazy frames).
+    - `allocated_bytes`: change in memory allocated by Python (as traced by
+      `tracemalloc`, which includes NumPy) and by PyArrow's memory pool, or
+      `None` if `trace_memory=False`.
+    """
+
+    def __init__(self, *, trace_memory: bool = False) -> None:
+        self.events: list[dict[str, Any]] = []
+        self._trace_memory = trace_memory
+        self._started_tracemalloc = False
+        self._start_ns = 0
+        self._thread_id: int | None = None
+        self._local = threading.local()
+        self._patched: list[tuple[type, str, Any]] = []
+
+    def __enter__(self) -> Self:
+        global _ACTIVE  # noqa: PLW0603
+        if _ACTIVE is not None:
+            msg = "Another `narwhals.profile` is already active."
+            raise RuntimeError(msg)
+        _ACTIVE = self
+        self._thread_id = threading.get_ident()
+        if self._trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self._start_ns = perf_counter_ns()
+        for cls in _frame_classes():
+            for name, method in list(vars(cls).items()):
+                if inspect.isfunction(method) and (
+                    not name.startswith("_") or name == "__getitem__"
+                ):
+                    self._patch(cls, name, self._wrap_frame_method(name, method))
+        for cls in _expr_classes():
+            self._patch(cls, "__init__", self._wrap_expr_init(vars(cls)["__init__"]))
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        global _ACTIVE  # noqa: PLW0603
+        for cls, name, original in reversed(self._patched):
+            setattr(cls, name, original)
+        self._patched = []
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        _ACTIVE = None
+
+    def _patch(self, cls: type, name: str, replacement: Any) -> None:
+        self._patched.append((cls, name, vars(cls)[name]))
+        setattr(cls, name, replacement)
+
+    # --- recording ---
+    def _stack(self) -> list[dict[str, Any]]:
+        try:
+            return self._local.stack  # type: ignore[no-any-return]
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack  # type: ignore[no-any-return]
+
+    def _is_profiled_thread(self) -> bool:
+        from narwhals._expression_parsing import caller_thread_id
+
+        return caller_thread_id() == self._thread_id
+
+    def _allocated(self) -> int:
+        allocated = tracemalloc.get_traced_memory()[0]
+        if (pa := get_pyarrow()) is not None:
+            allocated += pa.total_allocated_bytes()
+        return allocated
+
+    def _record(
+        self,
+        event: dict[str, Any],
+        func: Callable[..., Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        stack = self._stack()
+        event["children_ns"] = 0
+        stack.append(event)
+        allocated = self._allocated() if self._trace_memory else None
+        start = perf_counter_ns()
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            end = perf_counter_ns()
+            stack.pop()
+            duration = end - start
+            if stack:
+                stack[-1]["children_ns"] += duration
+            event.update(
+                thread=threading.get_ident(),
+                start_ns=start - self._start_ns,
+                duration_ns=duration,
+                self_ns=duration - event.pop("children_ns"),
+                allocated_bytes=(
+                    None if allocated is None else self._allocated() - allocated
+                ),
+            )
+            event.pop("key", None)
+            self.events.append(event)
+        return result
+
+    def _wrap_frame_method(
+        self, name: str, method: Callable[..., Any]
+    ) -> Callable[..., Any]:
+        def wrapper(obj: Any, *args: Any, **kwargs: Any) -> Any:
+            if not self._is_profiled_thread():
+                return method(obj, *args, **kwargs)
+            stack = self._stack()
+            key = (id(obj), name)
+            if stack and stack[-1].get("key") == key:
+                # e.g. `DataFrame.filter` calling `BaseFrame.filter`.
+                return method(obj, *args, **kwargs)
+            if hasattr(obj, "_grouped"):
+                frame, compliant = obj._df, obj._grouped
+            else:
+                frame = obj
+                compliant = obj._compliant_frame
+            native = frame._compliant_frame
+            native = getattr(native, "_native_dataframe", native)
+            event = {
+                "name": f"{type(obj).__name__}.{name}",
+                "category": "frame",
+                "backend": _backend(native),
+                "call": f"{type(compliant).__name__}.{name}",
+                "rows_in": _n_rows(frame),
+                "key": key,
+            }
+            result = self._record(event, method, obj, *args, **kwargs)
+            event["rows_out"] = _n_rows(result)
+            return result
+
+        wrapper.__name__ = method.__name__
+        wrapper.__qualname__ = method.__qualname__
+        wrapper.__doc__ = method.__doc__
+        return wrapper
+
+    def _wrap_expr_init(self, init: Callable[..., None]) -> Callable[..., None]:
+        def __init__(  # noqa: N807
+            expr: Any, call: Callable[[Any], Any], *args: Any, **kwargs: Any
+        ) -> None:
+            function_name = kwargs["function_name"]
+
+            def profiled_call(df: Any) -> Any:
+                if not self._is_profiled_thread():
+                    return call(df)
+                rows_in = _compliant_n_rows(df)
+                event = {
+                    "name": function_name,
+                    "category": "expr",
+                    "backend": _backend(df._native_dataframe),
+                    "call": function_name.rsplit("->", 1)[-1],
+                    "rows_in": rows_in,
+                }
+                result = self._record(event, call, df)
+                event["rows_out"] = (
+                    None if rows_in is None else sum(len(series) for series in result)
+                )
+                return result
+
+            init(expr, profiled_call, *args, **kwargs)
+
+        return __init__
+
+    # --- exporting ---
+    def to_chrome_trace(self, file: str | Path | None = None) -> dict[str, Any]:
+        """
+        Export the events in Chrome's Trace Event Format.
+
+        The result can be opened in `chrome://tracing` or in
+        [Perfetto](https://ui.perfetto.dev).
+
+        Arguments:
+            file: If given, also write the trace to this file, as JSON.
+        """
+        pid = os.getpid()
+        trace = {
+            "traceEvents": [
+                {
+                    "name": event["name"],
+                    "cat": event["category"],
+                    "ph": "X",
+                    "ts": event["start_ns"] / 1_000,
+                    "dur": event["duration_ns"] / 1_000,
+                    "pid": pid,
+                    "tid": event["thread"],
+                    "args": {
+                        key: event[key]
+                        for key in (
+                            "backend",
+                            "call",
+                            "rows_in",
+                            "rows_out",
+                            "allocated_bytes",
+                        )
+                    },
+                }
+                for event in sorted(self.events, key=lambda event: event["start_ns"])
+            ],
+            "displayTimeUnit": "ms",
+        }
+        if file is not None:
+            Path(file).write_text(json.dumps(trace))
+        return trace
+
+    def summary(self, native_namespace: ModuleType) -> Any:
+        """
+        Summarise the events per operation, as a native table.
+
+        There's one row per (`category`, `name`, `backend`, `call`), with the
+        number of `calls`, the `total_s`, `self_s` and `mean_s` wall time, and the
+        total `rows_in`, `rows_out` and `allocated_bytes` (`None` if not known).
+        Rows are sorted by `self_s`, slowest first.
+
+        Arguments:
+            native_namespace: The native library to build the table with, e.g.
+                `pandas`, `polars`, or `pyarrow`.
+        """
+        groups: dict[tuple[str, str, str, str], list[dict[str, Any]]] = {}
+        for event in self.events:
+            key = (event["category"], event["name"], event["backend"], event["call"])
+            groups.setdefault(key, []).append(event)
+
+        def total(events: list[dict[str, Any]], key: str) -> int | None:
+            values = [event[key] for event in events]
+            return None if None in values else sum(values)
+
+        rows = sorted(
+            (
+                {
+                    "category": category,
+                    "name": name,
+                    "backend": backend,
+                    "call": call,
+                    "calls": len(events),
+                    "total_s": sum(event["duration_ns"] for event in events) / 1e9,
+                    "self_s": sum(event["self_ns"] for event in events) / 1e9,
+                    "mean_s": sum(event["duration_ns"] for event in events)
+                    / len(events)
+                    / 1e9,
+                    "rows_in": total(events, "rows_in"),
+                    "rows_out": total(events, "rows_out"),
+                    "allocated_bytes": total(events, "allocated_bytes"),
+                }
+                for (category, name, backend, call), events in groups.items()
+            ),
+            key=lambda row: -row["self_s"],
+        )
+        columns = [
+            "category",
+            "name",
+            "backend",
+            "call",
+            "calls",
+            "total_s",
+            "self_s",
+            "mean_s",
+            "rows_in",
+            "rows_out",
+            "allocated_bytes",
+        ]
+        data = {column: [row[column] for row in rows] for column in columns}
+        if native_namespace is get_pyarrow():
+            return native_namespace.table(data)
+        return native_namespace.DataFrame(data)
+
+
+class _ArrowPeakSampler:
+    """Sample the bytes allocated by PyArrow's default memory pool in a thread.
+
+    The pool's own high-water mark can't be reset, and swapping in a proxy pool
+    isn't safe (buffers allocated from it must not outlive it), so allocations
+    which are freed again within `interval` seconds can be missed.
+    """
+
+    def __init__(self, pa: ModuleType, interval: float = 0.001) -> None:
+        self._pa = pa
+        self._interval = interval
+        self._stop = threading.Event()
+        self._start = pa.total_allocated_bytes()
+        self._peak = self._start
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            self._peak = max(self._peak, self._pa.total_allocated_bytes())
+
+    def __enter__(self) -> Self:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self._stop.set()
+        self._thread.join()
+        self._peak = max(self._peak, self._pa.total_allocated_bytes())
+
+    @property
+    def peak(self) -> int:
+        return self._peak - self._start  # type: ignore[no-any-return]
+
+
+def peak_memory(func: Callable[..., Any], *args: Any, **kwargs: Any) -> tuple[Any, int]:
+    """Call `func`, and return its result along with the peak number of bytes
+    allocated while it ran, by Python (including NumPy) and by PyArrow."""
+    started_tracemalloc = not tracemalloc.is_tracing()
+    if started_tracemalloc:
+        tracemalloc.start()
+    elif hasattr(tracemalloc, "reset_peak"):
+        # Python 3.9+ only: on 3.8, the peak may predate calling `func`.
+        tracemalloc.reset_peak()
+    python_start = tracemalloc.get_traced_memory()[0]
+    arrow: _ArrowPeakSampler | None = None
+    try:
+        if (pa := get_pyarrow()) is not None:
+            with _ArrowPeakSampler(pa) as arrow:
+                result = func(*args, **kwargs)
+        else:  # pragma: no cover
+            result = func(*args, **kwargs)
+        python_peak = tracemalloc.get_traced_memory()[1] - python_start
+    finally:
+        if started_tracemalloc:
+            tracemalloc.stop()
+    return result, max(python_peak, 0) + (arrow.peak if arrow is not None else 0)
+
+
+def profile(*, trace_memory: bool = False) -> Profile:
+    """
+    Profile the Narwhals operations run inside a `with` block.
+
+    Records the wall time, number of rows in and out, and (optionally) memory
+    allocated by each frame operation and, for pandas-like and PyArrow backends,
+    by each node of each expression. Use `Profile.summary` to find the slowest
+    operations, or `Profile.to_chrome_trace` to view them on a timeline.
+    For Polars, only frame operations are recorded, as Polars evaluates
+    expressions itself.
+
+    Only one profile can be active at a time. It only records what runs in the
+    thread which entered it (including the expressions which that thread
+    evaluates in the pool of `nw.Config(n_threads=...)`), not other threads.
+
+    Arguments:
+        trace_memory: Whether to record how much memory each operation allocates,
+            using `tracemalloc` and PyArrow's memory pool. This slows down the
+            profiled code.
+
+    Examples:
+        >>> import pandas as pd
+        >>> import narwhals as nw
+        >>> df = nw.from_native(pd.DataFrame({"a": [1, -2, 3]}))
+        >>> with nw.profile() as prof:
+        ...     result = df.select(nw.col("a").abs()).filter(nw.col("a") > 1)
+        >>> summary = prof.summary(pd)
+        >>> columns = ["category", "name", "calls", "rows_in", "rows_out"]
+        >>> summary.sort_values("name", ignore_index=True)[columns]
+          category              name  calls  rows_in  rows_out
+        0    frame  DataFrame.filter      1        3         2
+        1    frame  DataFrame.select      1        3         3
+        2     expr               col      2        6         6
+        3     expr       col->__gt__      1        3         3
+        4     expr          col->abs      1        3         3
+    """
+    return Profile(trace_memory=trace_memory)
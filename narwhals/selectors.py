@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from narwhals._expression_nodes import expr_function
 from narwhals.dtypes import translate_dtype
 from narwhals.expression import Expr
 from narwhals.utils import flatten
@@ -10,6 +11,7 @@ from narwhals.utils import flatten
 class Selector(Expr): ...
 
 
+@expr_function
 def by_dtype(*dtypes: Any) -> Expr:
     """
     Select columns based on their dtype.
@@ -55,10 +57,12 @@ def by_dtype(*dtypes: Any) -> Expr:
     return Selector(
         lambda plx: plx.selectors.by_dtype(
             [translate_dtype(plx, dtype) for dtype in flatten(dtypes)]
-        )
+        ),
+        ("selectors.by_dtype", dtypes, {}),
     )
 
 
+@expr_function
 def numeric() -> Expr:
     """
     Select numeric columns.
@@ -98,9 +102,10 @@ def numeric() -> Expr:
         │ 4   ┆ 4.6 │
         └─────┴─────┘
     """
-    return Selector(lambda plx: plx.selectors.numeric())
+    return Selector(lambda plx: plx.selectors.numeric(), ("selectors.numeric", (), {}))
 
 
+@expr_function
 def boolean() -> Expr:
     """
     Select boolean columns.
@@ -140,9 +145,10 @@ def boolean() -> Expr:
         │ true  │
         └───────┘
     """
-    return Selector(lambda plx: plx.selectors.boolean())
+    return Selector(lambda plx: plx.selectors.boolean(), ("selectors.boolean", (), {}))
 
 
+@expr_function
 def string() -> Expr:
     """
     Select string columns.
@@ -182,9 +188,10 @@ def string() -> Expr:
         │ y   │
         └─────┘
     """
-    return Selector(lambda plx: plx.selectors.string())
+    return Selector(lambda plx: plx.selectors.string(), ("selectors.string", (), {}))
 
 
+@expr_function
 def categorical() -> Expr:
     """
     Select categorical columns.
@@ -224,9 +231,12 @@ def categorical() -> Expr:
         │ y   │
         └─────┘
     """
-    return Selector(lambda plx: plx.selectors.categorical())
+    return Selector(
+        lambda plx: plx.selectors.categorical(), ("selectors.categorical", (), {})
+    )
 
 
+@expr_function
 def all() -> Expr:
     """
     Select all columns.
@@ -266,4 +276,4 @@ def all() -> Expr:
         │ 2   ┆ y   ┆ true  │
         └─────┴─────┴───────┘
     """
-    return Selector(lambda plx: plx.selectors.all())
+    return Selector(lambda plx: plx.selectors.all(), ("selectors.all", (), {}))
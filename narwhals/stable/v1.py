@@ -11,7 +11,9 @@ from typing import TypeVar
 from typing import overload
 
 import narwhals as nw
+from narwhals import diagnostics
 from narwhals import selectors
+from narwhals.config import Config as NwConfig
 from narwhals.dataframe import DataFrame as NwDataFrame
 from narwhals.dataframe import LazyFrame as NwLazyFrame
 from narwhals.dtypes import Boolean
@@ -36,6 +38,8 @@ from narwhals.dtypes import Unknown
 from narwhals.expression import Expr as NwExpr
 from narwhals.functions import concat
 from narwhals.functions import show_versions
+from narwhals.profiling import Profile
+from narwhals.profiling import profile as nw_profile
 from narwhals.schema import Schema as NwSchema
 from narwhals.series import Series as NwSeries
 from narwhals.translate import get_native_namespace as nw_get_native_namespace
@@ -48,8 +52,12 @@ from narwhals.utils import maybe_convert_dtypes as nw_maybe_convert_dtypes
 from narwhals.utils import maybe_set_index as nw_maybe_set_index
 
 if TYPE_CHECKING:
+    from pathlib import Path
+    from types import ModuleType
+
     from typing_extensions import Self
 
+    from narwhals._shared_memory import SharedFrameHandle
     from narwhals.dtypes import DType
     from narwhals.typing import IntoExpr
 
@@ -277,12 +285,43 @@ class LazyFrame(NwLazyFrame[IntoFrameT]):
     `narwhals.from_native`.
     """
 
-    def collect(self) -> DataFrame[Any]:
+    @overload
+    def collect(self, *, track_memory: Literal[False] = ...) -> DataFrame[Any]: ...
+
+    @overload
+    def collect(self, *, track_memory: Literal[True]) -> tuple[DataFrame[Any], int]: ...
+
+    @overload
+    def collect(
+        self, *, track_memory: bool
+    ) -> DataFrame[Any] | tuple[DataFrame[Any], int]: ...
+
+    def collect(
+        self, *, track_memory: bool = False
+    ) -> DataFrame[Any] | tuple[DataFrame[Any], int]:
         r"""
         Materialize this LazyFrame into a DataFrame.
 
+        With `nw.Config(cache_max_bytes=...)`, results are cached, so that
+        collecting the same plan over unchanged inputs again returns the cached
+        result instead of evaluating it, see `Config`.
+
+        Arguments:
+            track_memory: Also return the peak number of bytes allocated while
+                evaluating the plan, by Python (as traced by `tracemalloc`, which
+                includes NumPy and pandas) and by PyArrow's default memory pool
+                (sampled, so very short-lived allocations may be missed).
+                Backends other than Polars and Dask evaluate each operation as
+                soon as it's called, so with `nw.Config(keep_plans=True)`, the
+                operations which produced this LazyFrame are run again to measure
+                them, from the frame it was created from (see `explain`);
+                otherwise, only `collect` itself is measured.
+                Memory allocated by Polars itself isn't visible to either
+                tracker, so for Polars this only covers converting the result.
+                Tracking slows down evaluation, and the result cache isn't used.
+
         Returns:
-            DataFrame
+            DataFrame, or a tuple `(DataFrame, peak_bytes)` if `track_memory=True`.
 
         Examples:
             >>> import narwhals as nw
@@ -312,7 +351,16 @@ class LazyFrame(NwLazyFrame[IntoFrameT]):
             │ b   ┆ 11  ┆ 10  │
             │ c   ┆ 6   ┆ 1   │
             └─────┴─────┴─────┘
+
+            To find out how much memory evaluating the plan needs:
+
+            >>> df, peak_bytes = lf.collect(track_memory=True)
+            >>> peak_bytes >= 0
+            True
         """
+        if track_memory:
+            df, peak = super().collect(track_memory=True)
+            return _stableify(df), peak
         return _stableify(super().collect())  # type: ignore[no-any-return]
 
 
@@ -418,6 +466,83 @@ class Expr(NwExpr):
         return super()._taxicab_norm()
 
 
+class Config(NwConfig):
+    """
+    Configure Narwhals' global options.
+
+    Options passed to `Config` are set immediately. When used as a context manager,
+    the previous values are restored on exit.
+
+    Arguments:
+        n_threads: Number of threads used to evaluate independent expressions in
+            `select` and `with_columns` concurrently, for pandas-like (except Dask)
+            and PyArrow backends. The default, `1`, evaluates them one at a time.
+            This helps when there are many expressions with expensive
+            computations, as PyArrow and NumPy release the GIL.
+        n_processes: pandas only, on platforms which support forking processes
+            (i.e. not Windows). Number of processes used to evaluate `select`,
+            `with_columns`, and `filter` over partitions of rows, when all
+            expressions are elementwise, and `group_by(...).agg` over partitions
+            of rows when all aggregations are `sum`, `mean`, `min`, `max`,
+            `count`, or `len`, or over partitions of the groups when some can
+            only be computed by calling a Python function on each group. Results
+            are put back in their original order. Only frames with at least
+            100,000 rows (or 1,000 groups) per process are partitioned, as each
+            call starts new processes and sends their results back, and nothing
+            is partitioned while other threads are running, as forking them
+            isn't safe (the idle threads of `n_threads` don't count, so both
+            options can be combined). The default, `1`, disables this.
+        positional_index: pandas-like backends only. If `True`, frames and series are
+            kept on a default `RangeIndex` (i.e. the index is reset after operations
+            such as `filter` or `sort`), so intermediate results never need to be
+            aligned to each other. Note that this means that the original index is
+            **not** preserved, see [What about the pandas Index?](../other/pandas_index.md).
+        raise_on_slow_path: If `True`, raise `narwhals.diagnostics.SlowPathError`
+            when Narwhals would fall back to a slow implementation, instead of
+            counting it in `narwhals.diagnostics.slow_paths()`.
+        cache_max_bytes: If positive, results of `LazyFrame.collect` are cached, so
+            that collecting the same plan over unchanged inputs again returns the
+            cached result without evaluating it. Up to this many bytes (as
+            measured by `DataFrame.estimated_size`, or by file size on disk) are
+            kept, evicting the least recently used results first. Only
+            LazyFrames which are evaluated by `collect` are cached: Polars ones,
+            and Dask ones and filters and selections on PyArrow read with
+            `scan_*` (the other backends have already evaluated each operation
+            by then). Files read with `scan_*` are identified by their path,
+            size and modification time, and in-memory Polars data by object
+            identity. Native LazyFrames which read files themselves (e.g.
+            `polars.scan_parquet`), and other Dask frames, aren't cached, as
+            their inputs could change unnoticed. Cached pandas results are
+            copied on each hit. The default, `0`, disables the cache.
+        cache_dir: Directory in which to keep cached results, as Arrow IPC files
+            which are memory-mapped when read back, rather than in memory.
+            Results cached on disk can be reused by other processes if they only
+            depend on files. `""` (the default) keeps them in memory. Results
+            are written to its `narwhals-cache` subdirectory, and only files
+            there are ever evicted.
+        keep_plans: If `True`, LazyFrames which are evaluated as soon as each
+            operation is called (pandas-like except Dask, and PyArrow) keep the
+            operations which produced them, and the frame they were created
+            from, so that `LazyFrame.explain` can show (and analyze) them, and
+            `LazyFrame.collect(track_memory=True)` can measure them. This keeps
+            that frame, and the arguments of each operation, alive for as long
+            as any LazyFrame derived from it. The default, `False`, only keeps
+            the LazyFrame's own data. Other LazyFrames always keep their plans.
+
+    Examples:
+        >>> import pandas as pd
+        >>> import narwhals.stable.v1 as nw
+        >>> df_pd = pd.DataFrame({"a": [3, 1, 2]}, index=[7, 8, 9])
+        >>> with nw.Config(positional_index=True):
+        ...     df = nw.from_native(df_pd).sort("a")
+        >>> nw.to_native(df)
+           a
+        0  1
+        1  2
+        2  3
+    """
+
+
 class Schema(NwSchema):
     """
     Ordered mapping of column names to their data type.
@@ -482,12 +607,14 @@ def _stableify(
             level=obj._level,
         )
     if isinstance(obj, NwLazyFrame):
-        return LazyFrame(
+        lf: LazyFrame[IntoFrameT] = LazyFrame(
             obj._compliant_frame,
             is_polars=obj._is_polars,
             backend_version=obj._backend_version,
             level=obj._level,
         )
+        lf._plan = obj._plan
+        return lf
     if isinstance(obj, NwSeries):
         return Series(
             obj._compliant_series,
@@ -496,7 +623,7 @@ def _stableify(
             level=obj._level,
         )
     if isinstance(obj, NwExpr):
-        return Expr(obj._call)
+        return Expr(obj._call, obj._node)
     return obj
 
 
@@ -1381,6 +1508,204 @@ def maybe_set_index(df: T, column_names: str | list[str]) -> T:
     return nw_maybe_set_index(df, column_names)
 
 
+def scan_parquet(
+    source: str | Path,
+    *,
+    native_namespace: ModuleType,
+    hive_partitioning: bool = False,
+) -> LazyFrame[Any]:
+    """
+    Lazily read from a parquet file.
+
+    For Polars, this uses `polars.scan_parquet`. For PyArrow, the file is
+    opened as a `pyarrow.dataset.Dataset`: column selections and filters are
+    only applied when the data is read, and `len`, `null_count`, `min`, `max`
+    and `collect_schema` are answered from the Parquet footer statistics
+    without reading any data pages, when the statistics are complete.
+    Other libraries read the file eagerly.
+
+    With `hive_partitioning=True`, `source` is read as a dataset laid out in
+    Hive-style `key=value` directories (such as the ones written by
+    `DataFrame.write_parquet(..., partition_by=...)`), and the keys are
+    added as columns. For PyArrow, filters on partition columns are then used
+    to skip whole partitions: this applies to `filter` calls whose predicates
+    only combine a single column with literals, such as
+    `nw.col("year") == 2024` or `nw.col("key").is_in(["a", "b"])`.
+
+    Arguments:
+        source: Path to a file, or to a directory of files.
+        native_namespace: The native library to use for reading, such as `polars`
+            or `pyarrow`.
+        hive_partitioning: Whether to discover Hive-style partitions in `source`.
+            pandas-like libraries always discover them.
+
+    Examples:
+        >>> import pyarrow as pa
+        >>> import narwhals.stable.v1 as nw
+        >>> lf = nw.scan_parquet("file.parquet", native_namespace=pa)  # doctest:+SKIP
+        >>> lf.select(nw.col("a").min(), nw.col("b").null_count()).collect()  # doctest:+SKIP
+
+        Read a partitioned dataset, only reading the files under `year=2024`:
+
+        >>> lf = nw.scan_parquet(
+        ...     "dataset", native_namespace=pa, hive_partitioning=True
+        ... )  # doctest:+SKIP
+        >>> lf.filter(nw.col("year") == 2024).collect()  # doctest:+SKIP
+    """
+    return _stableify(  # type: ignore[no-any-return]
+        nw.scan_parquet(
+            source,
+            native_namespace=native_namespace,
+            hive_partitioning=hive_partitioning,
+        )
+    )
+
+
+def scan_csv(
+    source: str | Path,
+    *,
+    native_namespace: ModuleType,
+    schema: Schema | None = None,
+    batch_size: int | None = None,
+) -> LazyFrame[Any]:
+    """
+    Lazily read from a CSV file.
+
+    For Polars, this uses `polars.scan_csv`, and for Dask, `dask.dataframe.read_csv`.
+    For PyArrow and pandas-like libraries, the file is streamed in batches with
+    PyArrow's CSV reader: only the selected columns are converted, and
+    elementwise filters are applied to each batch as it's read, so only
+    the matching rows are kept in memory. For libraries other than PyArrow,
+    results are converted once they've been computed.
+
+    Arguments:
+        source: Path to a file, or to a directory of files.
+        native_namespace: The native library to use for reading, such as `polars`,
+            `pyarrow` or `pandas`.
+        schema: Data type of each column. If given, the data types aren't
+            inferred from the file. Dask still infers them, and then casts to
+            the given types.
+        batch_size: Maximum number of rows in each batch, for libraries which
+            read through PyArrow.
+
+    Examples:
+        >>> import pandas as pd
+        >>> import narwhals.stable.v1 as nw
+        >>> schema = nw.Schema({"a": nw.Int64(), "b": nw.String()})
+        >>> lf = nw.scan_csv("file.csv", native_namespace=pd, schema=schema)  # doctest:+SKIP
+        >>> nw.to_native(lf.filter(nw.col("a") > 1).select("b").collect())  # doctest:+SKIP
+    """
+    return _stableify(  # type: ignore[no-any-return]
+        nw.scan_csv(
+            source,
+            native_namespace=native_namespace,
+            schema=schema,
+            batch_size=batch_size,
+        )
+    )
+
+
+def read_ipc(
+    source: str | Path,
+    *,
+    native_namespace: ModuleType,
+    memory_map: bool = True,
+) -> DataFrame[Any]:
+    """
+    Read an Arrow IPC (Feather v2) file into a DataFrame.
+
+    With `memory_map=True`, the file is memory-mapped rather than read: for
+    PyArrow, the data of uncompressed files isn't copied at all, and for pandas,
+    numeric columns without nulls are (read-only) views of the mapped file.
+
+    Arguments:
+        source: Path to a file.
+        native_namespace: The native library to use for reading, such as `polars`,
+            `pyarrow` or `pandas`.
+        memory_map: Whether to memory-map the file.
+
+    Examples:
+        >>> import pyarrow as pa
+        >>> import narwhals.stable.v1 as nw
+        >>> df = nw.read_ipc("file.arrow", native_namespace=pa)  # doctest:+SKIP
+    """
+    return _stableify(  # type: ignore[no-any-return]
+        nw.read_ipc(source, native_namespace=native_namespace, memory_map=memory_map)
+    )
+
+
+def scan_ipc(
+    source: str | Path,
+    *,
+    native_namespace: ModuleType,
+    memory_map: bool = True,
+) -> LazyFrame[Any]:
+    """
+    Lazily read from an Arrow IPC (Feather v2) file.
+
+    For Polars, this uses `polars.scan_ipc`. For PyArrow and pandas-like
+    libraries, the file is opened as a `pyarrow.dataset.Dataset`: column
+    selections and filters are applied as the data is read, and results are
+    converted to the target library once they've been computed.
+
+    Arguments:
+        source: Path to a local file, or to a directory of files.
+        native_namespace: The native library to use for reading, such as `polars`,
+            `pyarrow` or `pandas`.
+        memory_map: Whether to memory-map the files.
+
+    Examples:
+        >>> import pandas as pd
+        >>> import narwhals.stable.v1 as nw
+        >>> lf = nw.scan_ipc("file.arrow", native_namespace=pd)  # doctest:+SKIP
+        >>> nw.to_native(lf.filter(nw.col("a") > 1).collect())  # doctest:+SKIP
+    """
+    return _stableify(  # type: ignore[no-any-return]
+        nw.scan_ipc(source, native_namespace=native_namespace, memory_map=memory_map)
+    )
+
+
+def from_shared_memory(
+    handle: SharedFrameHandle,
+    *,
+    native_namespace: ModuleType | None = None,
+) -> DataFrame[Any]:
+    """
+    Read a DataFrame shared by another process with `DataFrame.to_shared_memory`.
+
+    The shared data is memory-mapped rather than copied: PyArrow and Polars frames
+    use it directly, as do numeric columns without nulls of pandas frames (as
+    read-only views). It stays mapped for as long as the result uses it, even if
+    the process which shared it removes it in the meantime.
+
+    Arguments:
+        handle: Handle returned by `DataFrame.to_shared_memory`.
+        native_namespace: The native library to read the frame with, such as
+            `polars`, `pyarrow` or `pandas`. Defaults to the library of the frame
+            which was shared.
+
+    Examples:
+        >>> import pandas as pd
+        >>> import pyarrow as pa
+        >>> import narwhals.stable.v1 as nw
+        >>> df = nw.from_native(pd.DataFrame({"a": [1, 2], "b": [4.0, 5.0]}))
+        >>> handle = df.to_shared_memory()
+
+        In a worker process, with a copy of `handle`:
+
+        >>> nw.to_native(nw.from_shared_memory(handle, native_namespace=pa))
+        pyarrow.Table
+        a: int64
+        b: double
+        ----
+        a: [[1,2]]
+        b: [[4,5]]
+    """
+    return _stableify(  # type: ignore[no-any-return]
+        nw.from_shared_memory(handle, native_namespace=native_namespace)
+    )
+
+
 def get_native_namespace(obj: Any) -> Any:
     """
     Get native namespace from object.
@@ -1413,7 +1738,45 @@ def get_level(
     return nw.get_level(obj)
 
 
+def profile(*, trace_memory: bool = False) -> Profile:
+    """
+    Profile the Narwhals operations run inside a `with` block.
+
+    Records the wall time, number of rows in and out, and (optionally) memory
+    allocated by each frame operation and, for pandas-like and PyArrow backends,
+    by each node of each expression. Use `Profile.summary` to find the slowest
+    operations, or `Profile.to_chrome_trace` to view them on a timeline.
+    For Polars, only frame operations are recorded, as Polars evaluates
+    expressions itself.
+
+    Only one profile can be active at a time.
+
+    Arguments:
+        trace_memory: Whether to record how much memory each operation allocates,
+            using `tracemalloc` and PyArrow's memory pool. This slows down the
+            profiled code.
+
+    Examples:
+        >>> import pandas as pd
+        >>> import narwhals.stable.v1 as nw
+        >>> df = nw.from_native(pd.DataFrame({"a": [1, -2, 3]}))
+        >>> with nw.profile() as prof:
+        ...     result = df.select(nw.col("a").abs()).filter(nw.col("a") > 1)
+        >>> summary = prof.summary(pd)
+        >>> columns = ["category", "name", "calls", "rows_in", "rows_out"]
+        >>> summary.sort_values("name", ignore_index=True)[columns]
+          category              name  calls  rows_in  rows_out
+        0    frame  DataFrame.filter      1        3         2
+        1    frame  DataFrame.select      1        3         3
+        2     expr               col      2        6         6
+        3     expr       col->__gt__      1        3         3
+        4     expr          col->abs      1        3         3
+    """
+    return nw_profile(trace_memory=trace_memory)
+
+
 __all__ = [
+    "diagnostics",
     "selectors",
     "concat",
     "to_native",
@@ -1424,6 +1787,11 @@ __all__ = [
     "maybe_set_index",
     "get_native_namespace",
     "get_level",
+    "from_shared_memory",
+    "read_ipc",
+    "scan_csv",
+    "scan_ipc",
+    "scan_parquet",
     "all",
     "all_horizontal",
     "col",
@@ -1459,5 +1827,7 @@ __all__ = [
     "Date",
     "narwhalify",
     "show_versions",
+    "profile",
     "Schema",
+    "Config",
 ]
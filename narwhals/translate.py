@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import lru_cache
+from functools import partial
 from functools import wraps
 from typing import TYPE_CHECKING
 from typing import Any
@@ -259,7 +261,7 @@ def from_native(
 ) -> Any: ...
 
 
-def from_native(  # noqa: PLR0915
+def from_native(
     native_object: Any,
     *,
     strict: bool = True,
@@ -294,16 +296,9 @@ def from_native(  # noqa: PLR0915
     Returns:
         narwhals.DataFrame or narwhals.LazyFrame or narwhals.Series
     """
-    from narwhals._arrow.dataframe import ArrowDataFrame
-    from narwhals._arrow.series import ArrowSeries
-    from narwhals._interchange.dataframe import InterchangeFrame
-    from narwhals._pandas_like.dataframe import PandasLikeDataFrame
-    from narwhals._pandas_like.series import PandasLikeSeries
-    from narwhals._pandas_like.utils import Implementation
     from narwhals.dataframe import DataFrame
     from narwhals.dataframe import LazyFrame
     from narwhals.series import Series
-    from narwhals.utils import parse_version
 
     # Early returns
     if isinstance(native_object, (DataFrame, LazyFrame)) and not series_only:
@@ -320,98 +315,14 @@ def from_native(  # noqa: PLR0915
         msg = "Invalid parameter combination: `eager_only=True` and `eager_or_interchange_only=True`"
         raise ValueError(msg)
 
-    if (pl := get_polars()) is not None and isinstance(native_object, pl.DataFrame):
-        if series_only:
-            msg = "Cannot only use `series_only` with polars.DataFrame"
-            raise TypeError(msg)
-        return DataFrame(
+    constructor = _get_native_constructor(type(native_object))  # type: ignore[arg-type]
+    if constructor is not None:
+        return constructor(
             native_object,
-            is_polars=True,
-            backend_version=parse_version(pl.__version__),
-            level="full",
-        )
-    elif (pl := get_polars()) is not None and isinstance(native_object, pl.LazyFrame):
-        if series_only:
-            msg = "Cannot only use `series_only` with polars.LazyFrame"
-            raise TypeError(msg)
-        if eager_only or eager_or_interchange_only:
-            msg = "Cannot only use `eager_only` or `eager_or_interchange_only` with polars.LazyFrame"
-            raise TypeError(msg)
-        return LazyFrame(
-            native_object,
-            is_polars=True,
-            backend_version=parse_version(pl.__version__),
-            level="full",
-        )
-    elif (pd := get_pandas()) is not None and isinstance(native_object, pd.DataFrame):
-        if series_only:
-            msg = "Cannot only use `series_only` with dataframe"
-            raise TypeError(msg)
-        return DataFrame(
-            PandasLikeDataFrame(
-                native_object,
-                backend_version=parse_version(pd.__version__),
-                implementation=Implementation.PANDAS,
-            ),
-            is_polars=False,
-            backend_version=parse_version(pd.__version__),
-            level="full",
-        )
-    elif (mpd := get_modin()) is not None and isinstance(native_object, mpd.DataFrame):
-        if series_only:
-            msg = "Cannot only use `series_only` with modin.DataFrame"
-            raise TypeError(msg)
-        return DataFrame(
-            PandasLikeDataFrame(
-                native_object,
-                implementation=Implementation.MODIN,
-                backend_version=parse_version(mpd.__version__),
-            ),
-            is_polars=False,
-            backend_version=parse_version(mpd.__version__),
-            level="full",
-        )
-    elif (cudf := get_cudf()) is not None and isinstance(  # pragma: no cover
-        native_object, cudf.DataFrame
-    ):
-        if series_only:
-            msg = "Cannot only use `series_only` with modin.DataFrame"
-            raise TypeError(msg)
-        return DataFrame(
-            PandasLikeDataFrame(
-                native_object,
-                implementation=Implementation.CUDF,
-                backend_version=parse_version(cudf.__version__),
-            ),
-            is_polars=False,
-            backend_version=parse_version(cudf.__version__),
-            level="full",
-        )
-    elif (pa := get_pyarrow()) is not None and isinstance(native_object, pa.Table):
-        if series_only:
-            msg = "Cannot only use `series_only` with arrow table"
-            raise TypeError(msg)
-        return DataFrame(
-            ArrowDataFrame(native_object, backend_version=parse_version(pa.__version__)),
-            is_polars=False,
-            backend_version=parse_version(pa.__version__),
-            level="full",
-        )
-    elif (dd := get_dask()) is not None and isinstance(native_object, dd.DataFrame):
-        if series_only:  # pragma: no cover (todo)
-            msg = "Cannot only use `series_only` with dask.dataframe.DataFrame"
-            raise TypeError(msg)
-        import dask
-
-        return DataFrame(
-            PandasLikeDataFrame(
-                native_object,
-                implementation=Implementation.DASK,
-                backend_version=parse_version(dask.__version__),
-            ),
-            is_polars=False,
-            backend_version=parse_version(dask.__version__),
-            level="full",
+            eager_only=eager_only,
+            eager_or_interchange_only=eager_or_interchange_only,
+            series_only=series_only,
+            allow_series=allow_series,
         )
     elif hasattr(native_object, "__dataframe__"):
         if eager_only or series_only:
@@ -420,6 +331,8 @@ def from_native(  # noqa: PLR0915
                 "with object which only implements __dataframe__"
             )
             raise TypeError(msg)
+        from narwhals._interchange.dataframe import InterchangeFrame
+
         # placeholder (0,) version here, as we wouldn't use it in this case anyway.
         return DataFrame(
             InterchangeFrame(native_object.__dataframe__()),
@@ -452,88 +365,6 @@ def from_native(  # noqa: PLR0915
             backend_version=(0,),
             level="full",
         )
-    elif (pl := get_polars()) is not None and isinstance(native_object, pl.Series):
-        if not allow_series:
-            msg = "Please set `allow_series=True`"
-            raise TypeError(msg)
-        return Series(
-            native_object,
-            is_polars=True,
-            backend_version=parse_version(pl.__version__),
-            level="full",
-        )
-    elif (pd := get_pandas()) is not None and isinstance(native_object, pd.Series):
-        if not allow_series:
-            msg = "Please set `allow_series=True`"
-            raise TypeError(msg)
-        return Series(
-            PandasLikeSeries(
-                native_object,
-                implementation=Implementation.PANDAS,
-                backend_version=parse_version(pd.__version__),
-            ),
-            is_polars=False,
-            backend_version=parse_version(pd.__version__),
-            level="full",
-        )
-    elif (mpd := get_modin()) is not None and isinstance(native_object, mpd.Series):
-        if not allow_series:
-            msg = "Please set `allow_series=True`"
-            raise TypeError(msg)
-        return Series(
-            PandasLikeSeries(
-                native_object,
-                implementation=Implementation.MODIN,
-                backend_version=parse_version(mpd.__version__),
-            ),
-            is_polars=False,
-            backend_version=parse_version(mpd.__version__),
-            level="full",
-        )
-    elif (cudf := get_cudf()) is not None and isinstance(
-        native_object, cudf.Series
-    ):  # pragma: no cover
-        if not allow_series:
-            msg = "Please set `allow_series=True`"
-            raise TypeError(msg)
-        return Series(
-            PandasLikeSeries(
-                native_object,
-                implementation=Implementation.CUDF,
-                backend_version=parse_version(cudf.__version__),
-            ),
-            is_polars=False,
-            backend_version=parse_version(cudf.__version__),
-            level="full",
-        )
-    elif (pa := get_pyarrow()) is not None and isinstance(native_object, pa.ChunkedArray):
-        if not allow_series:
-            msg = "Please set `allow_series=True`"
-            raise TypeError(msg)
-        return Series(
-            ArrowSeries(
-                native_object, backend_version=parse_version(pa.__version__), name=""
-            ),
-            is_polars=False,
-            backend_version=parse_version(pa.__version__),
-            level="full",
-        )
-    elif (dd := get_dask()) is not None and isinstance(native_object, dd.Series):
-        if not allow_series:  # pragma: no cover (todo)
-            msg = "Please set `allow_series=True`"
-            raise TypeError(msg)
-        import dask
-
-        return Series(
-            PandasLikeSeries(
-                native_object,
-                implementation=Implementation.DASK,
-                backend_version=parse_version(dask.__version__),
-            ),
-            is_polars=False,
-            backend_version=parse_version(dask.__version__),
-            level="full",
-        )
     elif hasattr(native_object, "__narwhals_series__"):
         if not allow_series:
             msg = "Please set `allow_series=True`"
@@ -551,6 +382,188 @@ def from_native(  # noqa: PLR0915
     return native_object
 
 
+@lru_cache(maxsize=256)
+def _get_native_constructor(
+    native_type: type,
+) -> Callable[..., Any] | None:
+    """
+    Return the function which wraps instances of `native_type` in Narwhals objects.
+
+    This is cached, so the type checks, imports, and version parsing only
+    happen once per type. Returns `None` for types which aren't known native
+    objects (e.g. which only implement one of the dataframe protocols).
+    """
+    from narwhals._arrow.dataframe import ArrowDataFrame
+    from narwhals._arrow.series import ArrowSeries
+    from narwhals._pandas_like.dataframe import PandasLikeDataFrame
+    from narwhals._pandas_like.series import PandasLikeSeries
+    from narwhals._pandas_like.utils import Implementation
+    from narwhals.utils import parse_version
+
+    if (pl := get_polars()) is not None:
+        backend_version = parse_version(pl.__version__)
+        if issubclass(native_type, pl.DataFrame):
+            return partial(_polars_dataframe_constructor, backend_version=backend_version)
+        if issubclass(native_type, pl.LazyFrame):
+            return partial(_polars_lazyframe_constructor, backend_version=backend_version)
+        if issubclass(native_type, pl.Series):
+            return partial(_polars_series_constructor, backend_version=backend_version)
+    if (pa := get_pyarrow()) is not None:
+        backend_version = parse_version(pa.__version__)
+        if issubclass(native_type, pa.Table):
+            return partial(
+                _compliant_dataframe_constructor,
+                compliant_frame=partial(ArrowDataFrame, backend_version=backend_version),
+                backend_version=backend_version,
+                name="arrow table",
+            )
+        if issubclass(native_type, pa.ChunkedArray):
+            return partial(
+                _compliant_series_constructor,
+                compliant_series=partial(
+                    ArrowSeries, backend_version=backend_version, name=""
+                ),
+                backend_version=backend_version,
+            )
+    pandas_like = (
+        (get_pandas(), Implementation.PANDAS, "dataframe"),
+        (get_modin(), Implementation.MODIN, "modin.DataFrame"),
+        (get_cudf(), Implementation.CUDF, "cudf.DataFrame"),
+        (get_dask(), Implementation.DASK, "dask.dataframe.DataFrame"),
+    )
+    for native_namespace, implementation, name in pandas_like:
+        if native_namespace is None:
+            continue
+        if implementation is Implementation.DASK:
+            import dask
+
+            backend_version = parse_version(dask.__version__)
+        else:
+            backend_version = parse_version(native_namespace.__version__)
+        if issubclass(native_type, native_namespace.DataFrame):
+            return partial(
+                _compliant_dataframe_constructor,
+                compliant_frame=partial(
+                    PandasLikeDataFrame,
+                    implementation=implementation,
+                    backend_version=backend_version,
+                ),
+                backend_version=backend_version,
+                name=name,
+            )
+        if issubclass(native_type, native_namespace.Series):
+            return partial(
+                _compliant_series_constructor,
+                compliant_series=partial(
+                    PandasLikeSeries,
+                    implementation=implementation,
+                    backend_version=backend_version,
+                ),
+                backend_version=backend_version,
+            )
+    return None
+
+
+def _polars_dataframe_constructor(
+    native_object: Any, *, backend_version: tuple[int, ...], series_only: bool, **_: Any
+) -> DataFrame[Any]:
+    from narwhals.dataframe import DataFrame
+
+    if series_only:
+        msg = "Cannot only use `series_only` with polars.DataFrame"
+        raise TypeError(msg)
+    return DataFrame(
+        native_object,
+        is_polars=True,
+        backend_version=backend_version,
+        level="full",
+    )
+
+
+def _polars_lazyframe_constructor(
+    native_object: Any,
+    *,
+    backend_version: tuple[int, ...],
+    series_only: bool,
+    eager_only: bool,
+    eager_or_interchange_only: bool,
+    **_: Any,
+) -> LazyFrame[Any]:
+    from narwhals.dataframe import LazyFrame
+
+    if series_only:
+        msg = "Cannot only use `series_only` with polars.LazyFrame"
+        raise TypeError(msg)
+    if eager_only or eager_or_interchange_only:
+        msg = "Cannot only use `eager_only` or `eager_or_interchange_only` with polars.LazyFrame"
+        raise TypeError(msg)
+    return LazyFrame(
+        native_object,
+        is_polars=True,
+        backend_version=backend_version,
+        level="full",
+    )
+
+
+def _polars_series_constructor(
+    native_object: Any, *, backend_version: tuple[int, ...], allow_series: bool, **_: Any
+) -> Series:
+    from narwhals.series import Series
+
+    if not allow_series:
+        msg = "Please set `allow_series=True`"
+        raise TypeError(msg)
+    return Series(
+        native_object,
+        is_polars=True,
+        backend_version=backend_version,
+        level="full",
+    )
+
+
+def _compliant_dataframe_constructor(
+    native_object: Any,
+    *,
+    compliant_frame: Callable[[Any], Any],
+    backend_version: tuple[int, ...],
+    name: str,
+    series_only: bool,
+    **_: Any,
+) -> DataFrame[Any]:
+    from narwhals.dataframe import DataFrame
+
+    if series_only:
+        msg = f"Cannot only use `series_only` with {name}"
+        raise TypeError(msg)
+    return DataFrame(
+        compliant_frame(native_object),
+        is_polars=False,
+        backend_version=backend_version,
+        level="full",
+    )
+
+
+def _compliant_series_constructor(
+    native_object: Any,
+    *,
+    compliant_series: Callable[[Any], Any],
+    backend_version: tuple[int, ...],
+    allow_series: bool,
+    **_: Any,
+) -> Series:
+    from narwhals.series import Series
+
+    if not allow_series:
+        msg = "Please set `allow_series=True`"
+        raise TypeError(msg)
+    return Series(
+        compliant_series(native_object),
+        is_polars=False,
+        backend_version=backend_version,
+        level="full",
+    )
+
+
 def get_native_namespace(obj: Any) -> Any:
     """
     Get native namespace from object.
@@ -8,7 +8,6 @@ from typing import Sequence
 from typing import TypeVar
 from typing import cast
 
-from narwhals import dtypes
 from narwhals.dependencies import get_cudf
 from narwhals.dependencies import get_modin
 from narwhals.dependencies import get_pandas
@@ -77,6 +76,25 @@ def parse_version(version: Sequence[str | int]) -> tuple[int, ...]:
     return tuple(int(re.sub(r"\D", "", str(v))) for v in version)
 
 
+def scale_bytes(sz: int, unit: str) -> int | float:
+    """Scale a size in bytes to `unit`, as in Polars' `estimated_size`."""
+    if unit in {"b", "bytes"}:
+        return sz
+    if unit in {"kb", "kilobytes"}:
+        return sz / 1024
+    if unit in {"mb", "megabytes"}:
+        return sz / 1024**2
+    if unit in {"gb", "gigabytes"}:
+        return sz / 1024**3
+    if unit in {"tb", "terabytes"}:
+        return sz / 1024**4
+    msg = (
+        "`unit` must be one of {'b', 'kb', 'mb', 'gb', 'tb', 'bytes', 'kilobytes', "
+        f"'megabytes', 'gigabytes', 'terabytes'}}, got {unit!r}"
+    )
+    raise ValueError(msg)
+
+
 def isinstance_or_issubclass(obj: Any, cls: Any) -> bool:
     from narwhals.dtypes import DType
 
@@ -96,6 +114,21 @@ def validate_same_library(items: Iterable[Any]) -> None:
     raise NotImplementedError(msg)
 
 
+def collect_converted_scans(items: list[T]) -> list[T]:
+    """Collect the LazyFrames in `items` which `scan_*` reads into another library
+    than PyArrow (e.g. `scan_csv(..., native_namespace=pd)`).
+
+    These are backed by PyArrow until they're collected, so they need to be
+    converted before they can be combined with frames of that library.
+    """
+    return [
+        item._from_compliant_dataframe(item._compliant_frame.collect())  # type: ignore[attr-defined]
+        if getattr(item._compliant_frame, "_target_namespace", None) is not None  # type: ignore[attr-defined]
+        else item
+        for item in items
+    ]
+
+
 def validate_laziness(items: Iterable[Any]) -> None:
     from narwhals.dataframe import DataFrame
     from narwhals.dataframe import LazyFrame
@@ -152,7 +185,8 @@ def maybe_align_index(lhs: T, rhs: Series | BaseFrame[Any]) -> T:
             lhs_any._compliant_frame._from_native_dataframe(
                 lhs_any._compliant_frame._native_dataframe.loc[
                     rhs_any._compliant_frame._native_dataframe.index
-                ]
+                ],
+                validate_column_names=False,
             )
         )
     if isinstance(
@@ -164,7 +198,8 @@ def maybe_align_index(lhs: T, rhs: Series | BaseFrame[Any]) -> T:
             lhs_any._compliant_frame._from_native_dataframe(
                 lhs_any._compliant_frame._native_dataframe.loc[
                     rhs_any._compliant_series._native_series.index
-                ]
+                ],
+                validate_column_names=False,
             )
         )
     if isinstance(
@@ -263,7 +298,8 @@ def maybe_convert_dtypes(df: T, *args: bool, **kwargs: bool | str) -> T:
     if isinstance(getattr(df_any, "_compliant_frame", None), PandasLikeDataFrame):
         return df_any._from_compliant_dataframe(  # type: ignore[no-any-return]
             df_any._compliant_frame._from_native_dataframe(
-                df_any._compliant_frame._native_dataframe.convert_dtypes(*args, **kwargs)
+                df_any._compliant_frame._native_dataframe.convert_dtypes(*args, **kwargs),
+                validate_column_names=False,
             )
         )
     return df
@@ -306,6 +342,7 @@ def is_ordered_categorical(series: Series) -> bool:
         >>> func(s_pl)
         True
     """
+    from narwhals import dtypes
     from narwhals._interchange.series import InterchangeSeries
 
     if (
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from typing import Iterator
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+import narwhals.stable.v1 as nw
+from narwhals.diagnostics import SLOW_PATHS
+from narwhals.diagnostics import SlowPathError
+
+
+@pytest.fixture(autouse=True)
+def _reset() -> Iterator[None]:
+    nw.diagnostics.reset_slow_paths()
+    yield
+    nw.diagnostics.reset_slow_paths()
+
+
+def test_slow_paths_keys() -> None:
+    assert nw.diagnostics.slow_paths() == dict.fromkeys(SLOW_PATHS, 0)
+
+
+def test_fast_paths_not_counted() -> None:
+    df = nw.from_native(pd.DataFrame({"a": [1, 1, 2], "b": [4, 5, 6]}), eager_only=True)
+    df.group_by("a").agg(nw.col("b").sum())
+    df.with_columns(c=nw.col("a") + nw.col("b"))
+    df.to_numpy()
+    assert not any(nw.diagnostics.slow_paths().values())
+
+
+def test_group_by_apply() -> None:
+    df = nw.from_native(pd.DataFrame({"a": [1, 1, 2], "b": [4, 5, 6]}), eager_only=True)
+    with pytest.warns(UserWarning, match="complex group-by"):
+        df.group_by("a").agg((nw.col("b") * 2).sum())
+    assert nw.diagnostics.slow_paths()["group_by.apply"] == 1
+    with nw.Config(raise_on_slow_path=True), pytest.raises(
+        SlowPathError, match="'group_by.apply'"
+    ):
+        df.group_by("a").agg((nw.col("b") * 2).sum())
+    assert nw.diagnostics.slow_paths()["group_by.apply"] == 1
+
+
+def test_with_columns_assign() -> None:
+    df = nw.from_native(pd.DataFrame({"a": [1, 2]}), eager_only=True)
+    df.with_columns(b=nw.lit(1))
+    assert nw.diagnostics.slow_paths()["with_columns.assign"] == 1
+
+
+def test_with_columns_one_row() -> None:
+    df = nw.from_native(pd.DataFrame({"a": [1]}, index=[7]), eager_only=True)
+    # Full columns of a one-row frame aren't mistaken for scalars.
+    with nw.Config(raise_on_slow_path=True):
+        result = df.with_columns(b=nw.col("a") + 1, a=nw.col("a") * 3)
+    expected = pd.DataFrame({"a": [3], "b": [2]}, index=[7])
+    pd.testing.assert_frame_equal(nw.to_native(result), expected)
+    result = df.with_columns(b=nw.col("a").sum(), c=nw.lit(5))
+    expected = pd.DataFrame({"a": [1], "b": [1], "c": [5]}, index=[7])
+    pd.testing.assert_frame_equal(nw.to_native(result), expected, check_dtype=False)
+
+
+def test_set_axis() -> None:
+    df = nw.from_native(pd.DataFrame({"a": [1, 2]}), eager_only=True)
+    s = nw.from_native(pd.Series([3, 4], index=[5, 6]), series_only=True)
+    df.with_columns(b=s)
+    assert nw.diagnostics.slow_paths()["set_axis"] == 1
+    with nw.Config(raise_on_slow_path=True), pytest.raises(SlowPathError):
+        df.with_columns(b=s)
+
+
+def test_to_numpy_nullable() -> None:
+    df = nw.from_native(pd.DataFrame({"a": [1, None]}).convert_dtypes(), eager_only=True)
+    df.to_numpy()
+    assert nw.diagnostics.slow_paths()["to_numpy.nullable"] == 1
+    # Nullable dtypes are converted column by column even without missing values.
+    df = nw.from_native(pd.DataFrame({"a": [1, 2]}).convert_dtypes(), eager_only=True)
+    df.to_numpy()
+    assert nw.diagnostics.slow_paths()["to_numpy.nullable"] == 2
+
+
+def test_arrow_combine_chunks() -> None:
+    df = nw.from_native(pa.table({"a": [1, 2]}), eager_only=True)
+    result = nw.concat([df, df])
+    assert nw.diagnostics.slow_paths()["concat.combine_chunks"] == 1
+    s = result["a"]
+    s.zip_with(s > 1, s)
+    assert nw.diagnostics.slow_paths()["zip_with.combine_chunks"] == 0
+    chunked = nw.from_native(
+        pa.chunked_array([[1], [2]]), series_only=True, allow_series=True
+    )
+    chunked.zip_with(chunked > 1, chunked)
+    assert nw.diagnostics.slow_paths()["zip_with.combine_chunks"] == 1
+
+
+def test_reset_slow_paths() -> None:
+    df = nw.from_native(pd.DataFrame({"a": [1, 2]}), eager_only=True)
+    df.with_columns(b=nw.lit(1))
+    nw.diagnostics.reset_slow_paths()
+    assert not any(nw.diagnostics.slow_paths().values())
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import io
+import json
+import pickle
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+import pandas as pd
+import polars as pl
+import pytest
+
+import narwhals as nw_main
+import narwhals.selectors as ncs
+import narwhals.stable.v1 as nw
+from tests.utils import compare_dicts
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+data = {"a": [1, 3, 2], "b": ["x", "yy", "x"], "c": [4.0, 5.0, 6.0]}
+
+exprs = [
+    nw.col("a") * 2 + nw.lit(1),
+    (nw.col("a").cast(nw.Float64()) > nw.col("c").mean()).alias("d"),
+    nw.col("b").str.starts_with("y") | nw.col("a").is_in([1, 2]),
+    nw.sum_horizontal("a", nw.col("c")).round(1),
+    ncs.numeric() - 1,
+    nw.all().head(2),
+]
+
+
+@pytest.mark.parametrize("expr", exprs)
+def test_serialize_roundtrip(expr: nw.Expr) -> None:
+    df = nw.from_native(pl.DataFrame(data), eager_only=True)
+    result = nw.Expr.deserialize(io.StringIO(expr.meta.serialize()))
+    assert isinstance(result, nw.Expr)
+    assert result.meta.eq(expr)
+    assert hash(result) == hash(expr)
+    compare_dicts(df.select(result), df.select(expr).to_dict(as_series=False))
+
+
+def test_serialize_format() -> None:
+    expr = nw.col("a").fill_null(0).cast(nw.Int64).alias("b")
+    assert json.loads(expr.meta.serialize()) == {
+        "version": 1,
+        "expr": {
+            "method": "alias",
+            "expr": {
+                "method": "cast",
+                "expr": {
+                    "method": "fill_null",
+                    "expr": {"function": "col", "args": ["a"]},
+                    "args": [0],
+                },
+                "args": [{"dtype": "Int64"}],
+            },
+            "args": ["b"],
+        },
+    }
+
+
+def test_serialize_file(tmp_path: Path) -> None:
+    expr = nw.col("a").dt.year() == datetime(2020, 1, 1).year
+    file = tmp_path / "expr.json"
+    expr.meta.serialize(file)
+    assert nw.Expr.deserialize(file).meta.eq(expr)
+    assert nw.Expr.deserialize(str(file)).meta.eq(expr)
+
+
+def test_serialize_unsupported() -> None:
+    s = nw.from_native(pd.Series([1, 2]), series_only=True)
+    with pytest.raises(TypeError, match="unsupported argument"):
+        (nw.col("a") + s).meta.serialize()
+    with pytest.raises(TypeError, match="public Narwhals API"):
+        nw.Expr(lambda plx: plx.col("a")).meta.serialize()
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        '{"version": 2, "expr": {"function": "col", "args": ["a"]}}',
+        '{"version": 1, "expr": {"function": "__import__", "args": ["os"]}}',
+        '{"version": 1, "expr": {"method": "_call", "expr": {"function": "all"}}}',
+        '{"version": 1, "expr": {"function": "lit", "args": [1, {"dtype": "get_polars"}]}}',
+    ],
+)
+def test_deserialize_invalid(source: str) -> None:
+    with pytest.raises(ValueError, match="Cannot deserialize expression"):
+        nw.Expr.deserialize(io.StringIO(source))
+
+
+def test_meta_eq() -> None:
+    assert nw.col("a").meta.eq(nw.col("a"))
+    assert not nw.col("a").meta.eq(nw.col("b"))
+    assert not nw.lit(1).meta.eq(nw.lit(value=True))
+    assert not nw.lit(1).meta.eq(nw.lit(1.0))
+    assert nw.lit(float("nan")).meta.eq(nw.lit(float("nan")))
+    assert not nw.col("a").sum().meta.eq(nw.col("a").mean())
+    assert not nw.col("a").cast(nw.Int64).meta.eq(nw.col("a").cast(nw.Int32))
+    # Series are only equal to themselves.
+    s = nw.from_native(pd.Series([1, 2]), series_only=True)
+    assert (nw.col("a") + s).meta.eq(nw.col("a") + s)
+    other = nw.from_native(pd.Series([1, 2]), series_only=True)
+    assert not (nw.col("a") + s).meta.eq(nw.col("a") + other)
+    # The stable and main APIs build the same expressions.
+    assert nw.col("a").alias("b").meta.eq(nw_main.col("a").alias("b"))
+
+
+def test_hash_as_key() -> None:
+    cache = {nw.col("a").sum(): 1}
+    assert cache[nw.col("a").sum()] == 1
+    assert nw.col("a").max() not in cache
+
+
+def test_pickle() -> None:
+    expr = nw.col("a").str.contains("x").alias("b")
+    result = pickle.loads(pickle.dumps(expr))  # noqa: S301
+    assert type(result) is nw.Expr
+    assert result.meta.eq(expr)
@@ -1,5 +1,8 @@
 from typing import Any
 
+import pandas as pd
+import pytest
+
 import narwhals.stable.v1 as nw
 from tests.utils import compare_dicts
 
@@ -17,3 +20,36 @@ def test_null_count(constructor: Any) -> None:
         "b": [1],
     }
     compare_dicts(result, expected)
+
+
+@pytest.mark.parametrize(
+    "dtype",
+    [
+        "int64",
+        "Int64",
+        "Float64",
+        "boolean",
+        "int64[pyarrow]",
+        "string[pyarrow]",
+        "float64",
+    ],
+)
+def test_null_count_pandas_metadata(monkeypatch: pytest.MonkeyPatch, dtype: str) -> None:
+    values: list[Any] = [1, None, 3]
+    if dtype == "int64":
+        values = [1, 2, 3]
+    elif dtype == "boolean":
+        values = [True, None, False]
+    elif dtype.startswith("string"):
+        values = ["1", None, "3"]
+    series = nw.from_native(pd.Series(values, dtype=dtype), series_only=True)
+    compliant = series._compliant_series
+    expected = 0 if dtype == "int64" else 1
+    if dtype != "float64":
+        # Answered from metadata, without scanning.
+        monkeypatch.setattr(pd.Series, "isna", lambda _: pytest.fail("scanned"))
+    assert series.null_count() == expected
+    assert compliant.has_nulls() is bool(expected)
+    # Memoized on the (immutable) series.
+    monkeypatch.setattr(pd.Series, "isna", lambda _: pytest.fail("scanned"))
+    assert series.null_count() == expected
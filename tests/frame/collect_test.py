@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any
+from typing import Iterator
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+import narwhals.stable.v1 as nw
+from narwhals import _cache
+from tests.utils import compare_dicts
+
+data = {"a": [1, 2, 3], "b": [4, 5, 6]}
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache() -> Iterator[None]:
+    _cache._MEMORY.clear()
+    yield
+    _cache._MEMORY.clear()
+
+
+def query(lf: nw.LazyFrame[Any], threshold: int = 1) -> nw.LazyFrame[Any]:
+    return lf.filter(nw.col("a") > threshold).with_columns(c=nw.col("b") * 2)
+
+
+def test_collect_track_memory(constructor: Any) -> None:
+    lf = nw.from_native(constructor({"a": list(range(10_000))})).lazy()
+    with nw.Config(keep_plans=True):
+        result, peak = lf.with_columns(b=nw.col("a") * 2).collect(track_memory=True)
+    compare_dicts(result.select(nw.col("b").sum()), {"b": [99_990_000]})
+    assert isinstance(result, nw.DataFrame)
+    if "polars" not in str(constructor):
+        # The new column needs at least 8 bytes per row.
+        assert peak >= 80_000
+    compare_dicts(lf.collect().select(nw.len()), {"len": [10_000]})
+
+
+def test_collect_track_memory_result() -> None:
+    lf = nw.from_native(pd.DataFrame(data)).lazy()
+    with nw.Config(keep_plans=True):
+        selected = lf.select(nw.col(name) * 2 for name in ["a", "b"])
+        chained = lf
+        for i in range(1500):
+            chained = chained.with_columns(c=nw.col("a") + i)
+    result, _ = selected.collect(track_memory=True)
+    compare_dicts(result, {"a": [2, 4, 6], "b": [8, 10, 12]})
+    # The result is this LazyFrame's own, not the one which was measured.
+    assert nw.to_native(result) is nw.to_native(selected.collect())
+    result, _ = chained.collect(track_memory=True)
+    compare_dicts(result.select("c"), {"c": [1500, 1501, 1502]})
+
+
+def test_collect_cache_long_chain() -> None:
+    lf = nw.from_native(pl.LazyFrame(data))
+    for i in range(1500):
+        lf = lf.with_columns(c=nw.col("a") + i)
+    with nw.Config(cache_max_bytes=1024**2):
+        result = lf.collect()
+    compare_dicts(result.select("c"), {"c": [1500, 1501, 1502]})
+
+
+def test_collect_cache_polars() -> None:
+    lf = nw.from_native(pl.LazyFrame(data))
+    expected = {"a": [2, 3], "b": [5, 6], "c": [10, 12]}
+    with nw.Config(cache_max_bytes=1024**2):
+        first = query(lf).collect()
+        second = query(lf).collect()
+        other = query(lf, threshold=2).collect()
+    compare_dicts(first, expected)
+    assert isinstance(second, nw.DataFrame)
+    assert nw.to_native(second) is nw.to_native(first)
+    assert nw.to_native(other) is not nw.to_native(first)
+    compare_dicts(other, {"a": [3], "b": [6], "c": [12]})
+    # Other inputs aren't the same input, even if their data is equal.
+    with nw.Config(cache_max_bytes=1024**2):
+        result = query(nw.from_native(pl.LazyFrame(data))).collect()
+    assert nw.to_native(result) is not nw.to_native(first)
+    # Disabled by default.
+    assert nw.to_native(query(lf).collect()) is not nw.to_native(first)
+
+
+def test_collect_cache_eviction() -> None:
+    lf = nw.from_native(pl.LazyFrame(data))
+    size = query(lf).collect().estimated_size()
+    with nw.Config(cache_max_bytes=size):
+        first = query(lf).collect()
+        query(lf, threshold=2).collect()
+        assert nw.to_native(query(lf).collect()) is not nw.to_native(first)
+    assert len(_cache._MEMORY) == 1
+
+
+def test_collect_cache_uncacheable() -> None:
+    lf = nw.from_native(pl.LazyFrame(data))
+    assert _cache.fingerprint(query(lf)) is not None
+    assert _cache.fingerprint(lf.filter(nw.col("a").is_in([1, 2]))) is not None
+    # Arrays aren't hashed.
+    assert _cache.fingerprint(lf.filter(nw.col("a").is_in(np.array([1, 2])))) is None
+
+
+def test_collect_cache_eager_not_cached() -> None:
+    # pandas has already evaluated the plan.
+    lf = nw.from_native(pd.DataFrame(data)).lazy()
+    with nw.Config(cache_max_bytes=1024**2):
+        compare_dicts(query(lf).collect(), {"a": [2, 3], "b": [5, 6], "c": [10, 12]})
+    assert not _cache._MEMORY
+
+
+def test_collect_cache_scan(tmp_path: Path) -> None:
+    path = tmp_path / "data.parquet"
+    pq.write_table(pa.table(data), path)
+
+    def collect() -> Any:
+        lf = nw.scan_parquet(path, native_namespace=pa)
+        return nw.to_native(lf.filter(nw.col("a") > 1).select("a").collect())
+
+    with nw.Config(cache_max_bytes=1024**2):
+        first = collect()
+        # The same file, scanned again.
+        assert collect() is first
+        pq.write_table(pa.table({"a": [5, 6], "b": [7, 8]}), path)
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert collect().to_pydict() == {"a": [5, 6]}
+
+
+def test_collect_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    lf = nw.from_native(pl.LazyFrame(data))
+    cache = tmp_path / "narwhals-cache"
+    with nw.Config(cache_max_bytes=1024**2, cache_dir=tmp_path):
+        first = query(lf).collect()
+        assert len(list(cache.glob("*.arrow"))) == 1
+        second = query(lf).collect()
+    assert not _cache._MEMORY
+    assert isinstance(nw.to_native(second), pl.DataFrame)
+    compare_dicts(second, nw.to_native(first).to_dict(as_series=False))
+
+    # Other files in the directory are never evicted.
+    user_file = tmp_path / "user_data.arrow"
+    nw.from_native(pa.table(data), eager_only=True).write_ipc(user_file)
+    # Nor does it matter if a file is evicted by another process while they're
+    # listed.
+    (cache / "gone.arrow").touch()
+    stat = Path.stat
+
+    def racy_stat(self: Path, **kwargs: Any) -> Any:
+        if self.name == "gone.arrow":
+            raise FileNotFoundError(self)
+        return stat(self, **kwargs)
+
+    monkeypatch.setattr(Path, "stat", racy_stat)
+    with nw.Config(cache_max_bytes=1, cache_dir=tmp_path):
+        query(lf, threshold=0).collect()
+    monkeypatch.undo()
+    assert list(cache.glob("*.arrow")) == [cache / "gone.arrow"]
+    assert user_file.exists()
+
+
+def test_collect_cache_pandas_copied(tmp_path: Path) -> None:
+    path = tmp_path / "data.arrow"
+    nw.from_native(pa.table(data), eager_only=True).write_ipc(path)
+    lf = nw.scan_ipc(path, native_namespace=pd)
+    with nw.Config(cache_max_bytes=1024**2):
+        first = nw.to_native(lf.filter(nw.col("a") > 0).collect())
+        first["a"] = -1
+        second = nw.to_native(lf.filter(nw.col("a") > 0).collect())
+        second["b"] = -1
+        third = nw.to_native(lf.filter(nw.col("a") > 0).collect())
+    assert len(_cache._MEMORY) == 1
+    assert second is not first
+    assert third["a"].tolist() == [1, 2, 3]
+    assert third["b"].tolist() == [4, 5, 6]
+
+
+def test_collect_cache_native_sources(tmp_path: Path) -> None:
+    import dask.dataframe as dd
+
+    path = tmp_path / "data.parquet"
+    pq.write_table(pa.table(data), path)
+    # Native scans can read files which change, unlike in-memory Polars data.
+    lf = nw.from_native(pl.scan_parquet(path))
+    assert _cache.fingerprint(query(lf)) is None
+    with nw.Config(cache_max_bytes=1024**2):
+        compare_dicts(lf.select(nw.col("a").sum()).collect(), {"a": [6]})
+        pq.write_table(pa.table({"a": [100, 200, 300], "b": [4, 5, 6]}), path)
+        compare_dicts(lf.select(nw.col("a").sum()).collect(), {"a": [600]})
+    joined = nw.from_native(pl.LazyFrame(data)).join(lf, left_on="a", right_on="a")
+    assert _cache.fingerprint(joined) is None
+    # Dask frames may read files, or pandas frames which can change in place.
+    lf = nw.from_native(dd.from_pandas(pd.DataFrame(data), npartitions=1))
+    assert _cache.fingerprint(query(lf)) is None
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+import narwhals.stable.v1 as nw
+
+data = {"a": [1, 3, 2], "b": [4.0, 4, 6]}
+
+
+def test_estimated_size(constructor: Any) -> None:
+    df = nw.from_native(constructor(data), eager_only=True)
+    result = df.estimated_size()
+    assert isinstance(result, int)
+    # At least 8 bytes per value.
+    assert result >= 48
+    assert df.estimated_size("kb") == result / 1024
+    assert df.estimated_size("megabytes") == result / 1024**2
+
+
+def test_estimated_size_pandas_deep() -> None:
+    df_pd = pd.DataFrame({"a": ["x" * 1000, "y"]})
+    df = nw.from_native(df_pd, eager_only=True)
+    assert df.estimated_size() == df_pd.memory_usage(deep=True).sum()
+    assert df.estimated_size() > 1000
+
+
+def test_estimated_size_pyarrow_slice() -> None:
+    # Slices still hold on to the whole buffers.
+    tbl = pa.table(data)
+    df = nw.from_native(tbl.slice(0, 1), eager_only=True)
+    assert df.estimated_size() == tbl.get_total_buffer_size()
+
+
+def test_estimated_size_invalid_unit() -> None:
+    df = nw.from_native(pd.DataFrame(data), eager_only=True)
+    with pytest.raises(ValueError, match="`unit` must be one of"):
+        df.estimated_size("kib")  # type: ignore[arg-type]
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import gc
+import weakref
+from typing import Any
+from typing import Iterator
+
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+import narwhals.stable.v1 as nw
+from narwhals.config import Config
+from tests.utils import compare_dicts
+
+data = {"a": [1, 2, 1], "b": [4, 5, 6]}
+
+
+@pytest.fixture(autouse=True)
+def _keep_plans() -> Iterator[None]:
+    with Config(keep_plans=True):
+        yield
+
+
+def test_explain(constructor: Any) -> None:
+    lf = nw.from_native(constructor(data)).lazy()
+    result = lf.with_columns(c=nw.col("b") * 2).filter(nw.col("b") > 4)
+    plan = result.explain()
+    if "polars" in str(constructor):
+        assert "SELECTION" in plan
+        return
+    lines = plan.splitlines()
+    assert lines[0] == "filter(col('b').__gt__())"
+    assert lines[1] == "  -> filter: boolean mask"
+    assert lines[2] == "  with_columns(c=col('b').__mul__())"
+    assert lines[3].startswith("    SOURCE: ")
+    assert result.explain(optimized=False).splitlines() == [
+        line for line in lines if "->" not in line
+    ]
+
+
+def test_explain_analyze(constructor: Any) -> None:
+    lf = nw.from_native(constructor(data)).lazy()
+    result = lf.filter(nw.col("b") > 4).group_by("a").agg(nw.col("b").sum())
+    plan = result.explain(analyze=True)
+    if "polars" in str(constructor):
+        assert "AGGREGATE" in plan
+        assert "start" in plan
+        return
+    lines = plan.splitlines()
+    assert lines[0].startswith("collect()  (time: ")
+    assert lines[0].endswith("rows: 2)")
+    assert lines[1].startswith("  group_by('a').agg(col('b').sum())  (time: ")
+    assert "    -> group_by: vectorized agg" in lines
+    rows = "?" if "dask" in str(constructor) else "3"
+    assert lines[-1].endswith(f"SOURCE: {lines[-1].split()[1]}  (rows: {rows})")
+    # Analyzing doesn't change the result.
+    compare_dicts(result, {"a": [2, 1], "b": [5, 6]})
+
+
+def test_explain_apply_fallback() -> None:
+    lf = nw.from_native(pd.DataFrame(data)).lazy()
+    with pytest.warns(UserWarning, match="complex group-by"):
+        result = lf.group_by("a").agg(nw.col("b").round(1).mean())
+    assert "-> group_by: apply fallback" in result.explain()
+    assert "-> group_by: apply fallback" not in result.explain(optimized=False)
+
+
+@pytest.mark.parametrize(
+    ("how", "strategy"),
+    [
+        ("inner", "join: hash join (merge, how='inner')"),
+        ("semi", "join: semi join (inner merge on distinct keys)"),
+        ("anti", "join: anti join"),
+    ],
+)
+def test_explain_join(how: str, strategy: str) -> None:
+    lf = nw.from_native(pd.DataFrame(data)).lazy()
+    other = lf.rename({"b": "c"}).head(1)
+    result = lf.join(other, left_on="a", right_on="a", how=how)  # type: ignore[arg-type]
+    lines = result.explain().splitlines()
+    assert lines[0] == f"join(how={how!r}, left_on='a', right_on='a')"
+    assert lines[1].startswith(f"  -> {strategy}")
+    # Both inputs are part of the plan.
+    assert "  head(1)" in lines
+    assert "    rename({'b': 'c'})" in lines
+    assert sum(line.strip().startswith("SOURCE") for line in lines) == 2
+
+
+def test_explain_threads() -> None:
+    lf = nw.from_native(pa.table(data)).lazy()
+    with Config(n_threads=2):
+        result = lf.select(nw.col("a") + 1, nw.col("b") + 1)
+    assert "-> expressions: evaluated in 2 threads" in result.explain()
+
+
+def test_explain_scan(tmpdir: pytest.TempdirFactory) -> None:
+    path = str(tmpdir / "data.parquet")  # type: ignore[operator]
+    pq.write_table(pa.table(data), path)
+    lf = nw.scan_parquet(path, native_namespace=pa)
+    result = lf.filter(nw.col("b") > 4).select("a")
+    plan = result.explain()
+    assert "-> filter: pushed into scan" in plan
+    assert "-> select: projection pushed into scan" in plan
+    plan = result.explain(analyze=True)
+    assert "-> scan: read columns ['a']" in plan
+    assert "-> scan: filters applied to each record batch while reading" in plan
+
+
+def test_explain_generator() -> None:
+    lf = nw.from_native(pd.DataFrame(data)).lazy()
+    result = lf.select(nw.col(name) + 1 for name in ["a", "b"])
+    lines = result.explain(analyze=True).splitlines()
+    assert lines[1].startswith(
+        "  select([col('a').__add__(), col('b').__add__()])  (time: "
+    )
+    assert lines[1].endswith("rows: 3)")
+    compare_dicts(result, {"a": [2, 3, 2], "b": [5, 6, 7]})
+
+
+def test_explain_long_chain() -> None:
+    lf = nw.from_native(pd.DataFrame(data)).lazy()
+    result = lf
+    for i in range(1500):
+        result = result.with_columns(c=nw.col("a") + i)
+    lines = result.explain(analyze=True).splitlines()
+    assert len(lines) == 1 + 1500 + 1
+    assert lines[-1].endswith("SOURCE: pandas.DataFrame  (rows: 3)")
+
+
+def test_explain_plans_not_kept() -> None:
+    df_pd = pd.DataFrame(data)
+    ref = weakref.ref(df_pd)
+    with Config(keep_plans=False):
+        result = nw.from_native(df_pd).lazy().filter(nw.col("b") > 4)
+    del df_pd
+    gc.collect()
+    # The source frame isn't kept alive by the plan.
+    assert ref() is None
+    assert result.explain().splitlines() == ["SOURCE: pandas.DataFrame"]
+    compare_dicts(result, {"a": [2, 1], "b": [5, 6]})
+
+
+def test_explain_dataframe_not_recorded() -> None:
+    df = nw.from_native(pd.DataFrame(data), eager_only=True)
+    lf = df.filter(nw.col("b") > 4).lazy()
+    assert lf.explain().splitlines() == ["SOURCE: pandas.DataFrame"]
+
+
+def test_explain_polars_lazy() -> None:
+    lf = nw.from_native(pl.LazyFrame(data))
+    result = lf.filter(nw.col("b") > 4)
+    assert result.explain() == pl.LazyFrame(data).filter(pl.col("b") > 4).explain()
@@ -80,7 +80,7 @@ def test_invalid() -> None:
     with pytest.raises(
         NotImplementedError, match="is not supported for metadata-only dataframes"
     ):
-        nw.from_native(tbl, eager_or_interchange_only=True).select("a")
+        nw.from_native(tbl, eager_or_interchange_only=True).group_by("a")
     with pytest.raises(TypeError, match="Cannot only use `series_only=True`"):
         nw.from_native(tbl, eager_only=True)
     with pytest.raises(ValueError, match="Invalid parameter combination"):
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import ibis
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+
+import narwhals.stable.v1 as nw
+from narwhals.utils import parse_version
+
+data = {"a": [1, 2, 3], "b": [4.0, 5.0, 6.0], "z": ["x", "y", "z"]}
+
+
+@pytest.mark.skipif(
+    parse_version(ibis.__version__) < (6, 0),
+    reason="too old, requires interchange protocol",
+)
+def test_interchange_select() -> None:
+    tbl = ibis.memtable(pl.DataFrame(data))
+    df = nw.from_native(tbl, eager_or_interchange_only=True)
+    result = df.select("a", "z")
+    assert nw.get_level(result) == "interchange"
+    assert result.columns == ["a", "z"]
+    assert result.to_arrow().column_names == ["a", "z"]
+    result = df.select((nw.col("a") * 2).alias("c"))
+    assert result.to_arrow().to_pydict() == {"c": [2, 4, 6]}
+
+
+@pytest.mark.skipif(
+    parse_version(ibis.__version__) < (6, 0),
+    reason="too old, requires interchange protocol",
+)
+def test_interchange_filter_head() -> None:
+    tbl = ibis.memtable(pl.DataFrame(data))
+    df = nw.from_native(tbl, eager_or_interchange_only=True)
+    result = df.filter(nw.col("a") > 1).head(1)
+    assert nw.get_level(result) == "interchange"
+    assert result.to_arrow().to_pydict() == {"a": [2], "b": [5.0], "z": ["y"]}
+    assert df.head(-1).to_arrow().to_pydict()["a"] == [1, 2]
+
+
+@pytest.mark.skipif(
+    parse_version(ibis.__version__) < (6, 0),
+    reason="too old, requires interchange protocol",
+)
+def test_interchange_conversions() -> None:
+    tbl = ibis.memtable(pl.DataFrame(data))
+    df = nw.from_native(tbl, eager_or_interchange_only=True).select("a", "b")
+    pd.testing.assert_frame_equal(
+        df.to_pandas(), pd.DataFrame({"a": [1, 2, 3], "b": [4.0, 5.0, 6.0]})
+    )
+    np.testing.assert_array_equal(
+        df.to_numpy(), np.array([[1.0, 4.0], [2.0, 5.0], [3.0, 6.0]])
+    )
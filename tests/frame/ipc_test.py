@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pytest
+
+import narwhals.stable.v1 as nw
+from tests.utils import compare_dicts
+
+data = {"a": [1, 2, 3], "b": [4.0, 5.0, 6.0], "c": ["x", "y", "z"]}
+
+
+@pytest.mark.parametrize("compression", [None, "lz4", "zstd"])
+def test_write_ipc(
+    constructor: Any, compression: Any, tmpdir: pytest.TempdirFactory
+) -> None:
+    path = str(tmpdir / "foo.arrow")  # type: ignore[operator]
+    nw.from_native(constructor(data), eager_only=True).write_ipc(
+        path, compression=compression
+    )
+    with pa.ipc.open_file(path) as reader:
+        compare_dicts(reader.read_all().to_pydict(), data)
+
+
+@pytest.mark.parametrize("native_namespace", [pa, pl, pd])
+@pytest.mark.parametrize("memory_map", [True, False])
+def test_read_ipc(
+    native_namespace: Any, *, memory_map: bool, tmpdir: pytest.TempdirFactory
+) -> None:
+    path = str(tmpdir / "foo.arrow")  # type: ignore[operator]
+    nw.from_native(pa.table(data)).write_ipc(path)
+    result = nw.read_ipc(path, native_namespace=native_namespace, memory_map=memory_map)
+    assert isinstance(result, nw.DataFrame)
+    assert nw.get_native_namespace(result) is native_namespace
+    compare_dicts(result, data)
+
+
+def test_read_ipc_zero_copy(tmpdir: pytest.TempdirFactory) -> None:
+    path = str(tmpdir / "foo.arrow")  # type: ignore[operator]
+    nw.from_native(pa.table(data)).write_ipc(path)
+    allocated = pa.total_allocated_bytes()
+    table = nw.to_native(nw.read_ipc(path, native_namespace=pa))
+    assert pa.total_allocated_bytes() == allocated
+    assert table["a"].to_pylist() == data["a"]
+    # Numeric columns are read-only views of the mapped file.
+    df = nw.to_native(nw.read_ipc(path, native_namespace=pd))
+    assert not df["a"].to_numpy().flags.writeable
+    assert not df["b"].to_numpy().flags.writeable
+
+
+@pytest.mark.parametrize("native_namespace", [pa, pl, pd])
+def test_scan_ipc(native_namespace: Any, tmpdir: pytest.TempdirFactory) -> None:
+    path = str(tmpdir / "foo.arrow")  # type: ignore[operator]
+    nw.from_native(pa.table(data)).write_ipc(path, compression="zstd")
+    lf = nw.scan_ipc(path, native_namespace=native_namespace)
+    assert isinstance(lf, nw.LazyFrame)
+    result = lf.filter(nw.col("a") > 1).select("c", "a").collect()
+    assert nw.get_native_namespace(result) is native_namespace
+    compare_dicts(result, {"c": ["y", "z"], "a": [2, 3]})
+
+
+def test_read_ipc_invalid(tmpdir: pytest.TempdirFactory) -> None:
+    path = str(tmpdir / "foo.arrow")  # type: ignore[operator]
+    with pytest.raises(NotImplementedError, match="Unsupported native namespace"):
+        nw.read_ipc(path, native_namespace=pytest)
+    with pytest.raises(NotImplementedError, match="Unsupported native namespace"):
+        nw.scan_ipc(path, native_namespace=pytest)
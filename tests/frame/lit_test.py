@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 from typing import Any
 
 import numpy as np
+import pyarrow as pa
 import pytest
 
 import narwhals.stable.v1 as nw
@@ -49,3 +50,23 @@ def test_lit_error(constructor_with_lazy: Any) -> None:
         NotImplementedError, match="Nested datatypes are not supported yet."
     ):
         _ = df.with_columns(nw.lit([1, 2]).alias("lit"))
+
+
+def test_lit_broadcast(request: pytest.FixtureRequest, constructor: Any) -> None:
+    if "dask" in str(constructor):
+        request.applymarker(pytest.mark.xfail)
+    data = {"a": [1, 3, 2]}
+    df = nw.from_native(constructor(data), eager_only=True)
+    result = df.select("a", nw.lit(2).alias("lit"), a_sum=nw.col("a").sum())
+    compare_dicts(result, {"a": [1, 3, 2], "lit": [2, 2, 2], "a_sum": [6, 6, 6]})
+
+
+def test_lit_broadcast_keeps_arrow_type() -> None:
+    df = nw.from_native(pa.table({"a": [1, 3, 2]}), eager_only=True)
+    result = df.with_columns(
+        nw.lit(None, nw.Int8).alias("null"), nw.lit(2, nw.Int16).alias("int16")
+    )
+    expected = {"a": [1, 3, 2], "null": [None, None, None], "int16": [2, 2, 2]}
+    compare_dicts(result, expected)
+    assert result.schema["null"] == nw.Int8
+    assert result.schema["int16"] == nw.Int16
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pytest
+
+import narwhals.stable.v1 as nw
+from narwhals._arrow.scan import ArrowScanFrame
+from tests.utils import compare_dicts
+
+
+@pytest.fixture()
+def path(tmpdir: pytest.TempdirFactory) -> str:
+    path = str(tmpdir / "data.csv")  # type: ignore[operator]
+    with Path(path).open("w") as f:
+        f.write("a,b,c\n")
+        f.writelines(f"{i},{i % 3},x{i}\n" for i in range(10))
+    return path
+
+
+@pytest.mark.parametrize("native_namespace", [pa, pl, pd])
+def test_scan_csv(path: str, native_namespace: Any) -> None:
+    lf = nw.scan_csv(path, native_namespace=native_namespace)
+    assert isinstance(lf, nw.LazyFrame)
+    result = lf.filter(nw.col("b") == 1, nw.col("a") > 1).select("a", "c").collect()
+    assert nw.get_native_namespace(result) is native_namespace
+    compare_dicts(result, {"a": [4, 7], "c": ["x4", "x7"]})
+
+
+@pytest.mark.parametrize("native_namespace", [pa, pl, pd])
+def test_scan_csv_schema(path: str, native_namespace: Any) -> None:
+    schema = nw.Schema({"a": nw.Int32(), "b": nw.Float64(), "c": nw.String()})
+    lf = nw.scan_csv(path, native_namespace=native_namespace, schema=schema)
+    assert lf.collect().schema == schema
+
+
+@pytest.mark.parametrize("native_namespace", [pa, pl, pd])
+def test_scan_csv_with_native_frames(path: str, native_namespace: Any) -> None:
+    lf = nw.scan_csv(path, native_namespace=native_namespace).filter(nw.col("a") < 3)
+    native_frame = native_namespace.DataFrame if native_namespace is not pa else pa.table
+    other = nw.from_native(native_frame({"a": [0, 2], "d": [5, 6]})).lazy()
+    result = lf.join(other, left_on="a", right_on="a").collect()
+    assert nw.get_native_namespace(result) is native_namespace
+    compare_dicts(result, {"a": [0, 2], "b": [0, 2], "c": ["x0", "x2"], "d": [5, 6]})
+    result = other.join(lf, left_on="a", right_on="a").select("a", "c").collect()
+    compare_dicts(result, {"a": [0, 2], "c": ["x0", "x2"]})
+    result = nw.concat([lf.select("a"), other.select("a")]).collect()
+    assert nw.get_native_namespace(result) is native_namespace
+    compare_dicts(result, {"a": [0, 1, 2, 0, 2]})
+
+
+def test_scan_csv_batches(path: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    lf = nw.scan_csv(path, native_namespace=pd, batch_size=3)
+    tables = []
+    original = ArrowScanFrame._from_native_table
+
+    def from_native_table(self: ArrowScanFrame, table: Any) -> Any:
+        tables.append(table)
+        return original(self, table)
+
+    monkeypatch.setattr(ArrowScanFrame, "_from_native_table", from_native_table)
+    result = lf.filter(nw.col("a") >= 5).select(nw.col("a").sum()).collect()
+    assert isinstance(nw.to_native(result), pd.DataFrame)
+    compare_dicts(result, {"a": [35]})
+    # Each batch is filtered as it's read, and only the needed column is read.
+    assert [t.num_rows for t in tables] == [3, 3, 3, 1, 5]
+    assert all(t.column_names == ["a"] for t in tables)
+
+    # Non-elementwise filters see the whole column.
+    result = lf.filter(nw.col("a") == nw.col("a").max()).collect()
+    compare_dicts(result, {"a": [9], "b": [0], "c": ["x9"]})
+
+
+def test_scan_csv_fallback(path: str) -> None:
+    lf = nw.scan_csv(path, native_namespace=pd)
+    result = (
+        lf.filter(nw.col("a") < 6)
+        .group_by("b")
+        .agg(nw.col("a").sum())
+        .sort("b")
+        .collect()
+    )
+    assert isinstance(nw.to_native(result), pd.DataFrame)
+    compare_dicts(result, {"b": [0, 1, 2], "a": [3, 5, 7]})
+
+
+def test_scan_csv_invalid(path: str) -> None:
+    with pytest.raises(NotImplementedError, match="Unsupported native namespace"):
+        nw.scan_csv(path, native_namespace=pytest)
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Any
+
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+import narwhals.stable.v1 as nw
+from narwhals._arrow.scan import ArrowScanFrame
+from tests.utils import compare_dicts
+
+data = {
+    "a": [1, None, 3, 4],
+    "b": [4.5, 2.0, None, -1.0],
+    "c": ["x", "y", None, "z"],
+    "d": [date(2020, 1, 2), date(2020, 1, 1), None, None],
+}
+
+
+@pytest.fixture()
+def path(tmpdir: pytest.TempdirFactory) -> str:
+    path = str(tmpdir / "data.parquet")  # type: ignore[operator]
+    pq.write_table(pa.table(data), path, row_group_size=2)
+    return path
+
+
+@pytest.mark.parametrize("native_namespace", [pa, pl, pd])
+def test_scan_parquet(path: str, native_namespace: Any) -> None:
+    lf = nw.scan_parquet(path, native_namespace=native_namespace)
+    assert isinstance(lf, nw.LazyFrame)
+    result = lf.filter(nw.col("a") > 1).select("a", "b")
+    compare_dicts(result, {"a": [3, 4], "b": [float("nan"), -1.0]})
+
+
+def test_scan_parquet_invalid(path: str) -> None:
+    with pytest.raises(NotImplementedError, match="Unsupported native namespace"):
+        nw.scan_parquet(path, native_namespace=pytest)
+
+
+def test_scan_parquet_statistics(path: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    lf = nw.scan_parquet(path, native_namespace=pa)
+    expected_schema = lf.collect().collect_schema()
+    monkeypatch.setattr(
+        ArrowScanFrame, "_to_table", lambda *_: pytest.fail("data was read")
+    )
+    assert len(lf) == 4
+    assert lf.collect_schema() == expected_schema
+    result = lf.select(
+        nw.col("a", "b", "d").min(),
+        nw.col("a").max().alias("a_max"),
+        nw.len(),
+        b_max=nw.col("b").max(),
+    )
+    expected = {
+        "a": [1],
+        "b": [-1.0],
+        "d": [date(2020, 1, 1)],
+        "a_max": [4],
+        "len": [4],
+        "b_max": [4.5],
+    }
+    compare_dicts(result, expected)
+    result = lf.select(nw.all().null_count())
+    compare_dicts(result, {"a": [1], "b": [1], "c": [1], "d": [2]})
+
+
+def test_scan_parquet_statistics_fallback(path: str) -> None:
+    lf = nw.scan_parquet(path, native_namespace=pa)
+    # strings don't use footer statistics
+    compare_dicts(lf.select(nw.col("c").max()), {"c": ["z"]})
+    # neither do filtered frames
+    lf = lf.filter(nw.col("a") < 4)
+    assert len(lf) == 2
+    compare_dicts(lf.select(nw.col("a").max()), {"a": [3]})
+    compare_dicts(lf.head(1), {"a": [1], "b": [4.5], "c": ["x"], "d": [date(2020, 1, 2)]})
+
+
+@pytest.mark.parametrize("native_namespace", [pa, pl, pd])
+def test_scan_parquet_several_frames(path: str, native_namespace: Any) -> None:
+    lf = nw.scan_parquet(path, native_namespace=native_namespace)
+    lf = lf.filter(nw.col("a") > 1).select("a", "c")
+    result = nw.concat([lf, lf.filter(nw.col("a") > 3)])
+    compare_dicts(result, {"a": [3, 4, 4], "c": [None, "z", "z"]})
+    result = nw.concat([lf, lf.rename({"a": "e", "c": "f"})], how="horizontal")
+    compare_dicts(result.select("a", "f"), {"a": [3, 4], "f": [None, "z"]})
+    # The other frame's filters and selections are applied too.
+    result = lf.join(lf.filter(nw.col("a") > 3).select("a"), left_on="a", right_on="a")
+    compare_dicts(result, {"a": [4], "c": ["z"]})
+    assert nw.get_native_namespace(result.collect()) is native_namespace
+
+
+def test_scan_parquet_missing_statistics(tmpdir: pytest.TempdirFactory) -> None:
+    path = str(tmpdir / "no_stats.parquet")  # type: ignore[operator]
+    pq.write_table(pa.table(data), path, write_statistics=False)
+    lf = nw.scan_parquet(path, native_namespace=pa)
+    compare_dicts(
+        lf.select(nw.col("a").min(), nw.col("b").null_count()), {"a": [1], "b": [1]}
+    )
+    compare_dicts(lf.with_row_index().select("index"), {"index": [0, 1, 2, 3]})
+
+
+@pytest.fixture()
+def partitioned_path(tmpdir: pytest.TempdirFactory) -> str:
+    path = str(tmpdir / "dataset")  # type: ignore[operator]
+    df = nw.from_native(
+        pa.table(
+            {
+                "year": [2020, 2020, 2021, 2022],
+                "key": ["a", "b", "a", "a"],
+                "value": [1, 2, 3, 4],
+            }
+        )
+    )
+    df.write_parquet(path, partition_by=["year", "key"])
+    return path
+
+
+@pytest.mark.parametrize("native_namespace", [pa, pl])
+def test_scan_parquet_hive_partitioning(
+    partitioned_path: str, native_namespace: Any
+) -> None:
+    lf = nw.scan_parquet(
+        partitioned_path, native_namespace=native_namespace, hive_partitioning=True
+    )
+    result = (
+        lf.filter(nw.col("year") >= 2021, nw.col("value") < 4)
+        .select("value", "year", "key")
+        .collect()
+    )
+    compare_dicts(result, {"value": [3], "year": [2021], "key": ["a"]})
+
+
+def test_scan_parquet_partition_pruning(partitioned_path: str) -> None:
+    lf = nw.scan_parquet(partitioned_path, native_namespace=pa, hive_partitioning=True)
+    result = lf.filter(nw.col("key") == "a", nw.col("year").is_in([2020, 2022]))
+    dataset, predicates = result._compliant_frame._pruned()
+    assert len(dataset.files) == 2
+    assert predicates == []
+    assert len(result) == 2
+    compare_dicts(result.select("value").sort("value"), {"value": [1, 4]})
+
+    # Filters on other columns are still applied after reading the partitions.
+    result = lf.filter(nw.col("year") == 2020, nw.col("value") > 1)
+    dataset, predicates = result._compliant_frame._pruned()
+    assert len(dataset.files) == 2
+    compare_dicts(result.select("value", "key"), {"value": [2], "key": ["b"]})
+
+    # Non-elementwise predicates can't be evaluated per partition.
+    result = lf.filter(nw.col("year") == nw.col("year").max())
+    dataset, _ = result._compliant_frame._pruned()
+    assert len(dataset.files) == 4
+    compare_dicts(result.select("value"), {"value": [4]})
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import gc
+import pickle
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pytest
+
+import narwhals.stable.v1 as nw
+from narwhals._shared_memory import _SHM_DIR
+from narwhals._shared_memory import _directory
+from tests.utils import compare_dicts
+
+data = {"a": [1, 2, 3], "b": [4.0, 5.0, 6.0], "c": ["x", "y", "z"]}
+
+
+def _sum_in_worker(handle: Any) -> float:
+    df = nw.from_shared_memory(handle)
+    return (df["a"] + df["b"]).sum()  # type: ignore[no-any-return]
+
+
+def test_shared_memory(constructor: Any) -> None:
+    df = nw.from_native(constructor(data), eager_only=True)
+    handle = df.to_shared_memory()
+    result = nw.from_shared_memory(pickle.loads(pickle.dumps(handle)))  # noqa: S301
+    assert isinstance(result, nw.DataFrame)
+    expected = pd if "dask" in str(constructor) else nw.get_native_namespace(df)
+    assert nw.get_native_namespace(result) is expected
+    compare_dicts(result, data)
+
+
+@pytest.mark.parametrize("native_namespace", [pa, pl, pd])
+def test_shared_memory_native_namespace(native_namespace: Any) -> None:
+    handle = nw.from_native(pd.DataFrame(data), eager_only=True).to_shared_memory()
+    result = nw.from_shared_memory(handle, native_namespace=native_namespace)
+    assert nw.get_native_namespace(result) is native_namespace
+    compare_dicts(result, data)
+
+
+@pytest.mark.parametrize("native_namespace", [pa, pl, pd])
+def test_shared_memory_index(native_namespace: Any) -> None:
+    df_pd = pd.DataFrame(data, index=pd.Index([7, 8, 9], name="i"))
+    handle = nw.from_native(df_pd, eager_only=True).to_shared_memory()
+    result = nw.from_shared_memory(
+        pickle.loads(pickle.dumps(handle)),  # noqa: S301
+        native_namespace=native_namespace,
+    )
+    compare_dicts(result, data)
+    if native_namespace is pd:
+        pd.testing.assert_frame_equal(nw.to_native(result), df_pd)
+
+
+def test_shared_memory_zero_copy() -> None:
+    handle = nw.from_native(pa.table(data), eager_only=True).to_shared_memory()
+    allocated = pa.total_allocated_bytes()
+    table = nw.to_native(nw.from_shared_memory(handle))
+    assert pa.total_allocated_bytes() == allocated
+    assert table["a"].to_pylist() == data["a"]
+    df = nw.to_native(nw.from_shared_memory(handle, native_namespace=pd))
+    assert not df["a"].to_numpy().flags.writeable
+
+
+def test_shared_memory_cleanup() -> None:
+    handle = nw.from_native(pa.table(data), eager_only=True).to_shared_memory()
+    path = handle._path
+    assert handle.nbytes == path.stat().st_size
+    copy = pickle.loads(pickle.dumps(handle))  # noqa: S301
+    result = nw.from_shared_memory(copy)
+    # Copies of the handle don't own the data.
+    del copy
+    gc.collect()
+    assert path.exists()
+    del handle
+    gc.collect()
+    assert not path.exists()
+    # Frames which were already read stay valid.
+    compare_dicts(result, data)
+
+
+def test_shared_memory_close() -> None:
+    handle = nw.from_native(pa.table(data), eager_only=True).to_shared_memory()
+    copy = pickle.loads(pickle.dumps(handle))  # noqa: S301
+    handle.close()
+    with pytest.raises(FileNotFoundError, match="already removed"):
+        nw.from_shared_memory(copy)
+
+
+@pytest.mark.skipif(
+    not sys.platform.startswith("linux") or _directory() != _SHM_DIR,
+    reason="only tracked in /dev/shm",
+)
+def test_shared_memory_cleanup_on_exit() -> None:
+    # The writer exits without running the handle's finalizer.
+    code = (
+        "import os, pandas as pd, narwhals as nw\n"
+        "df = nw.from_native(pd.DataFrame({'a': [1, 2]}), eager_only=True)\n"
+        "handle = df.to_shared_memory()\n"
+        "print(handle._path, flush=True)\n"
+        "os._exit(0)\n"
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    path = Path(result.stdout.strip())
+    assert path.parent == _SHM_DIR
+    # The resource tracker removes it once the writer is gone.
+    for _ in range(100):
+        if not path.exists():
+            break
+        time.sleep(0.05)
+    assert not path.exists()
+
+
+def test_shared_memory_invalid() -> None:
+    with pytest.raises(TypeError, match="to_shared_memory"):
+        nw.from_shared_memory("foo")  # type: ignore[arg-type]
+
+
+def test_shared_memory_multiprocessing() -> None:
+    handle = nw.from_native(pd.DataFrame(data), eager_only=True).to_shared_memory()
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(_sum_in_worker, handle).result() == 21.0
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pyarrow as pa
+
+import narwhals.stable.v1 as nw
+
+
+def test_to_arrow(constructor: Any) -> None:
+    data = {"a": [1, 3, 2], "b": [4, 4, 6], "z": [7.1, 8, 9]}
+    df_raw = constructor(data)
+    result = nw.from_native(df_raw, eager_only=True).to_arrow()
+
+    expected = pa.table(data)
+    assert result.select(["a", "b", "z"]).cast(expected.schema).equals(expected)
@@ -3,6 +3,9 @@ from __future__ import annotations
 from typing import Any
 
 import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
 
 import narwhals.stable.v1 as nw
 
@@ -19,3 +22,36 @@ def test_convert_numpy(constructor: Any) -> None:
     result = nw.from_native(df_raw, eager_only=True).__array__()
     np.testing.assert_array_equal(result, expected)
     assert result.dtype == "float64"
+
+
+@pytest.mark.parametrize("order", ["c", "fortran"])
+def test_to_numpy_order(constructor: Any, order: Any) -> None:
+    data = {"a": [1, 3, 2], "b": [4, None, 6], "z": [7.1, 8, 9]}
+    df = nw.from_native(constructor(data), eager_only=True)
+    result = df.to_numpy(order=order)
+    expected = np.array([[1, 3, 2], [4, np.nan, 6], [7.1, 8, 9]]).T
+    np.testing.assert_array_equal(result, expected)
+    assert result.dtype == "float64"
+    if order == "c":
+        assert result.flags.c_contiguous
+    else:
+        assert result.flags.f_contiguous
+
+
+def test_to_numpy_mixed_dtypes(constructor: Any) -> None:
+    data = {"a": [1, 2], "b": ["x", "y"]}
+    result = nw.from_native(constructor(data), eager_only=True).to_numpy()
+    np.testing.assert_array_equal(result, np.array([[1, "x"], [2, "y"]], dtype=object))
+    assert result.dtype == "object"
+
+
+def test_to_numpy_chunked_arrow() -> None:
+    table = pa.concat_tables([pa.table({"a": [1, None]}), pa.table({"a": [3, 4]})])
+    result = nw.from_native(table, eager_only=True).to_numpy()
+    np.testing.assert_array_equal(result, np.array([[1.0], [np.nan], [3.0], [4.0]]))
+
+
+def test_to_numpy_pandas_zero_copy() -> None:
+    df_pd = pd.DataFrame({"a": [1.0, 2.0], "b": [3.0, 4.0]})
+    result = nw.from_native(df_pd, eager_only=True).to_numpy()
+    assert np.shares_memory(result, df_pd.to_numpy())
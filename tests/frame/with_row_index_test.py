@@ -1,5 +1,8 @@
 from typing import Any
 
+import pyarrow as pa
+import pytest
+
 import narwhals.stable.v1 as nw
 from tests.utils import compare_dicts
 
@@ -15,3 +18,22 @@ def test_with_row_index(constructor: Any) -> None:
     compare_dicts(result, expected)
     result = nw.from_native(constructor(data)).lazy().with_row_index()
     compare_dicts(result, expected)
+
+
+def test_with_row_index_offset(request: pytest.FixtureRequest, constructor: Any) -> None:
+    if "dask" in str(constructor):
+        request.applymarker(pytest.mark.xfail)
+    df = nw.from_native(constructor(data))
+    result = df.with_row_index("idx", offset=10)
+    expected = {"idx": [10, 11], "a": ["foo", "bars"], "ab": ["foo", "bars"]}
+    compare_dicts(result, expected)
+    assert result.columns == ["idx", "a", "ab"]
+    with pytest.raises(ValueError, match="cannot be negative"):
+        df.with_row_index(offset=-1)
+
+
+def test_with_row_index_chunked() -> None:
+    table = pa.concat_tables([pa.table(data), pa.table(data)])
+    result = nw.to_native(nw.from_native(table).with_row_index(offset=1))
+    assert result["index"].num_chunks == 2
+    assert result["index"].to_pylist() == [1, 2, 3, 4]
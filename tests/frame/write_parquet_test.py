@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+from pathlib import Path
 from typing import Any
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 
 import narwhals.stable.v1 as nw
 from narwhals.utils import parse_version
+from tests.utils import compare_dicts
 
 data = {"a": [1, 2, 3]}
 
@@ -18,3 +22,45 @@ def test_write_parquet(constructor: Any, tmpdir: pytest.TempdirFactory) -> None:
     path = tmpdir / "foo.parquet"  # type: ignore[operator]
     nw.from_native(constructor(data), eager_only=True).write_parquet(str(path))
     assert path.exists()
+
+
+@pytest.mark.skipif(
+    parse_version(pd.__version__) < parse_version("2.0.0"), reason="too old for pyarrow"
+)
+def test_write_parquet_options(
+    request: Any, constructor: Any, tmpdir: pytest.TempdirFactory
+) -> None:
+    if "dask" in str(constructor):
+        # Dask writes a directory of files.
+        request.applymarker(pytest.mark.xfail)
+    path = str(tmpdir / "foo.parquet")  # type: ignore[operator]
+    df = nw.from_native(constructor({"a": list(range(10))}), eager_only=True)
+    df.write_parquet(path, row_group_size=4, compression="gzip")
+    metadata = pq.ParquetFile(path).metadata
+    assert metadata.num_rows == 10
+    assert metadata.num_row_groups > 1
+    assert metadata.row_group(0).column(0).compression == "GZIP"
+
+
+@pytest.mark.skipif(
+    parse_version(pd.__version__) < parse_version("2.0.0"), reason="too old for pyarrow"
+)
+def test_write_parquet_partitioned(
+    constructor: Any, tmpdir: pytest.TempdirFactory
+) -> None:
+    path = Path(str(tmpdir)) / "dataset"
+    df = nw.from_native(
+        constructor({"a": [1, 2, 3, 4], "b": ["x", "y", "x", "x"], "c": [5, 6, 7, 8]}),
+        eager_only=True,
+    )
+    df.write_parquet(path, partition_by="b", max_rows_per_file=2)
+    assert sorted(p.name for p in path.iterdir()) == ["b=x", "b=y"]
+    assert len(list((path / "b=x").iterdir())) == 2
+    result = (
+        nw.scan_parquet(path, native_namespace=pa, hive_partitioning=True)
+        .collect()
+        .sort("a")
+        .select("a", "b", "c")
+    )
+    expected = {"a": [1, 2, 3, 4], "b": ["x", "y", "x", "x"], "c": [5, 6, 7, 8]}
+    compare_dicts(result, expected)
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import narwhals as nw_main
+import narwhals.stable.v1 as nw
+
+
+def _imported_modules(code: str) -> set[str]:
+    # `-X importtime` reports every module imported by the interpreter on stderr.
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {
+        line.rsplit("|", 1)[-1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "narwhals.dataframe",
+        "narwhals.series",
+        "narwhals.expression",
+        "narwhals.functions",
+        "narwhals.stable.v1",
+        "narwhals._pandas_like.dataframe",
+        "narwhals._arrow.dataframe",
+    ],
+)
+def test_import_is_lazy(module: str) -> None:
+    modules = _imported_modules("import narwhals")
+    assert "narwhals" in modules
+    assert module not in modules
+
+
+def test_attribute_access_imports() -> None:
+    code = (
+        "import sys, narwhals; narwhals.DataFrame; "
+        "assert 'narwhals.dataframe' in sys.modules; "
+        "assert 'narwhals.stable.v1' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+
+
+def test_getattr() -> None:
+    import narwhals
+
+    assert narwhals.DataFrame is nw.DataFrame.__mro__[1]
+    assert narwhals.selectors.numeric is not None
+    assert "DataFrame" in dir(narwhals)
+    with pytest.raises(AttributeError, match="has no attribute 'foo'"):
+        narwhals.foo  # noqa: B018
+
+
+# The submodules which `import narwhals` used to import (and so were its
+# attributes) before imports were lazy.
+EAGER_SUBMODULES = [
+    "dataframe",
+    "dependencies",
+    "dtypes",
+    "expression",
+    "functions",
+    "schema",
+    "selectors",
+    "series",
+    "stable",
+    "translate",
+    "typing",
+    "utils",
+]
+
+
+@pytest.mark.parametrize("name", EAGER_SUBMODULES)
+def test_submodule_attribute(name: str) -> None:
+    # Accessing any other attribute first may import the submodule, so each one
+    # is checked in a fresh interpreter.
+    code = (
+        "import sys, narwhals\n"
+        f"assert {name!r} in dir(narwhals)\n"
+        f"assert narwhals.{name} is sys.modules['narwhals.{name}']\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+
+
+def test_public_attributes() -> None:
+    code = (
+        "import narwhals\n"
+        f"assert set(dir(narwhals)) >= {set(nw_main.__all__)!r}\n"
+        f"for name in {nw_main.__all__!r}:\n"
+        "    getattr(narwhals, name)\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
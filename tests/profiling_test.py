@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import json
+import threading
+from typing import TYPE_CHECKING
+from typing import Any
+
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pytest
+
+import narwhals.stable.v1 as nw
+from narwhals.dataframe import DataFrame
+from narwhals.profiling import profile
+from tests.utils import compare_dicts
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_profile(constructor: Any) -> None:
+    df = nw.from_native(constructor({"a": [1, -2, 3], "b": [4, 5, 6]}))
+    with nw.profile() as prof:
+        result = df.with_columns(c=nw.col("a").abs() * 2).filter(nw.col("b") > 4)
+    compare_dicts(result, {"a": [-2, 3], "b": [5, 6], "c": [4, 6]})
+
+    frame_events = {
+        event["name"]: event for event in prof.events if event["category"] == "frame"
+    }
+    assert set(frame_events) == {"DataFrame.with_columns", "DataFrame.filter"}
+    for event in prof.events:
+        assert event["duration_ns"] >= event["self_ns"] >= 0
+        assert event["allocated_bytes"] is None
+    if "dask" in str(constructor):
+        # Counting rows would compute the frame.
+        assert frame_events["DataFrame.filter"]["rows_in"] is None
+    else:
+        assert frame_events["DataFrame.filter"]["rows_in"] == 3
+        assert frame_events["DataFrame.filter"]["rows_out"] == 2
+
+    expr_names = {event["name"] for event in prof.events if event["category"] == "expr"}
+    if "polars" in str(constructor):
+        assert not expr_names
+    else:
+        assert {"col", "col->abs", "col->abs->__mul__", "col->__gt__"} <= expr_names
+
+
+def test_profile_nesting() -> None:
+    df = nw.from_native(pd.DataFrame({"a": [1, -2, 3]}), eager_only=True)
+    with nw.profile() as prof:
+        df.select(nw.col("a").abs())
+    events = {event["name"]: event for event in prof.events}
+    select = events["DataFrame.select"]
+    abs_ = events["col->abs"]
+    assert select["call"] == "PandasLikeDataFrame.select"
+    assert abs_["call"] == "abs"
+    assert abs_["backend"] == "pandas"
+    assert select["start_ns"] <= abs_["start_ns"]
+    assert abs_["start_ns"] + abs_["duration_ns"] <= (
+        select["start_ns"] + select["duration_ns"]
+    )
+    assert select["self_ns"] == select["duration_ns"] - abs_["duration_ns"]
+    # `DataFrame.select` calls `BaseFrame.select`, which isn't recorded again.
+    assert len(prof.events) == 3
+
+
+def test_profile_other_threads() -> None:
+    df = nw.from_native(pd.DataFrame({"a": [1, -2, 3]}), eager_only=True)
+    with nw.profile() as prof:
+        thread = threading.Thread(target=lambda: df.select(nw.col("a") * 2))
+        thread.start()
+        thread.join()
+        with nw.Config(n_threads=2):
+            df.select(nw.col("a").abs(), b=nw.col("a") + 1)
+    # Only the thread which entered the profile, and the pool of `n_threads`
+    # evaluating its expressions, are recorded.
+    names = sorted(event["name"] for event in prof.events)
+    assert names == ["DataFrame.select", "col", "col", "col->__add__", "col->abs"]
+    main_thread = threading.get_ident()
+    assert all(
+        event["thread"] != main_thread
+        for event in prof.events
+        if event["category"] == "expr"
+    )
+
+
+def test_profile_restores_methods() -> None:
+    select = DataFrame.select
+    with nw.profile():
+        assert DataFrame.select is not select
+    assert DataFrame.select is select
+
+
+def test_profile_nested_raises() -> None:
+    with nw.profile(), pytest.raises(RuntimeError, match="already active"), profile():
+        pass
+    with nw.profile():
+        pass
+
+
+def test_profile_group_by() -> None:
+    df = nw.from_native(pl.DataFrame({"a": [1, 1, 2], "b": [4, 5, 6]}))
+    with nw.profile() as prof:
+        df.lazy().group_by("a").agg(nw.col("b").sum()).collect()
+    events = {event["name"]: event for event in prof.events}
+    assert events["LazyGroupBy.agg"]["call"] == "LazyGroupBy.agg"
+    assert events["LazyGroupBy.agg"]["rows_out"] is None
+    assert events["LazyFrame.collect"]["rows_out"] == 2
+    assert events["LazyFrame.collect"]["backend"] == "polars"
+
+
+def test_profile_trace_memory() -> None:
+    df = nw.from_native(pa.table({"a": list(range(10_000))}), eager_only=True)
+    with nw.profile(trace_memory=True) as prof:
+        df.select(nw.col("a") * 2)
+    events = {event["name"]: event for event in prof.events}
+    # The result needs at least 8 bytes per row.
+    assert events["col->__mul__"]["allocated_bytes"] >= 80_000
+
+
+def test_profile_to_chrome_trace(tmp_path: Path) -> None:
+    df = nw.from_native(pd.DataFrame({"a": [1, -2, 3]}), eager_only=True)
+    with nw.profile() as prof:
+        df.select(nw.col("a").abs())
+    file = tmp_path / "trace.json"
+    trace = prof.to_chrome_trace(file)
+    assert json.loads(file.read_text()) == trace
+    names = [event["name"] for event in trace["traceEvents"]]
+    assert names == ["DataFrame.select", "col->abs", "col"]
+    event = trace["traceEvents"][0]
+    assert event["ph"] == "X"
+    assert event["cat"] == "frame"
+    assert event["args"]["rows_out"] == 3
+
+
+@pytest.mark.parametrize("native_namespace", [pd, pl, pa])
+def test_profile_summary(native_namespace: Any) -> None:
+    df = nw.from_native(pd.DataFrame({"a": [1, -2, 3]}), eager_only=True)
+    with nw.profile() as prof:
+        df.select(nw.col("a").abs())
+        df.select(nw.col("a"))
+    result = nw.from_native(prof.summary(native_namespace), eager_only=True)
+    result = result.select("name", "calls", "rows_in", "rows_out").sort("name")
+    expected = {
+        "name": ["DataFrame.select", "col", "col->abs"],
+        "calls": [2, 2, 1],
+        "rows_in": [6, 6, 3],
+        "rows_out": [6, 6, 3],
+    }
+    compare_dicts(result, expected)
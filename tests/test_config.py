@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+import threading
+from typing import Any
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+from pandas.testing import assert_index_equal
+
+import narwhals.stable.v1 as nw
+from narwhals.config import get_option
+from tests.utils import compare_dicts
+
+
+def test_config_context_manager() -> None:
+    assert not get_option("positional_index")
+    with nw.Config(positional_index=True):
+        assert get_option("positional_index")
+        with nw.Config(positional_index=False):
+            assert not get_option("positional_index")
+        assert get_option("positional_index")
+    assert not get_option("positional_index")
+
+
+def test_config_without_context_manager() -> None:
+    config = nw.Config(positional_index=True)
+    try:
+        assert get_option("positional_index")
+    finally:
+        config.__exit__(None, None, None)
+    assert not get_option("positional_index")
+
+
+@pytest.mark.parametrize("positional_index", [True, False])
+def test_positional_index(positional_index: bool) -> None:  # noqa: FBT001
+    df_pd = pd.DataFrame({"a": [3, 1, 2], "b": [4, 5, 6]}, index=[7, 8, 9])
+    with nw.Config(positional_index=positional_index):
+        df = nw.from_native(df_pd, eager_only=True)
+        s = df["a"].sort()
+        result = nw.to_native(
+            df.filter(nw.col("a") > 1).with_columns(c=nw.col("b") * 2).sort("a")
+        )
+        result_series = nw.to_native(df.with_columns(a_sorted=s))
+    if positional_index:
+        expected = pd.DataFrame({"a": [2, 3], "b": [6, 4], "c": [12, 8]})
+        expected_index = pd.RangeIndex(3)
+    else:
+        expected = pd.DataFrame({"a": [2, 3], "b": [6, 4], "c": [12, 8]}, index=[9, 7])
+        expected_index = pd.Index([7, 8, 9])
+    assert_frame_equal(result, expected)
+    assert_index_equal(result_series.index, expected_index)
+    assert result_series["a_sorted"].tolist() == [1, 2, 3]
+
+
+def test_n_threads_invalid() -> None:
+    with pytest.raises(ValueError, match="at least 1"):
+        nw.Config(n_threads=0)
+
+
+def _record_evaluation_threads(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Record the name of the thread each expression is evaluated in, when
+    expressions are evaluated in threads."""
+    from narwhals import _expression_parsing
+
+    threads = []
+    get_executor = _expression_parsing._get_executor
+
+    class RecordingExecutor:
+        def __init__(self, n_threads: int) -> None:
+            self._executor = get_executor(n_threads)
+
+        def map(self, func: Callable[..., Any], *iterables: Any) -> Any:
+            def record(*args: Any) -> Any:
+                threads.append(threading.current_thread().name)
+                return func(*args)
+
+            return self._executor.map(record, *iterables)
+
+    monkeypatch.setattr(_expression_parsing, "_get_executor", RecordingExecutor)
+    return threads
+
+
+def test_n_threads(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch, constructor: Any
+) -> None:
+    if "dask" in str(constructor):
+        # Dask doesn't support broadcasting reductions here (and isn't threaded).
+        request.applymarker(pytest.mark.xfail)
+    data = {"a": [1, 3, 2], "b": [4, 4, 6], "z": [7.0, 8, 9]}
+    df = nw.from_native(constructor(data))
+    threads = _record_evaluation_threads(monkeypatch)
+    with nw.Config(n_threads=4):
+        result = df.select(
+            nw.col("a", "b") * 2,
+            nw.col("z").sum(),
+            c=nw.col("a") + nw.col("b"),
+            d=nw.col("z").max(),
+        ).with_columns(e=nw.col("c").mean(), f=nw.col("a") - 1)
+    expected = {
+        "a": [2, 6, 4],
+        "b": [8, 8, 12],
+        "z": [24.0, 24.0, 24.0],
+        "c": [5, 7, 8],
+        "d": [9.0, 9.0, 9.0],
+        "e": [20 / 3, 20 / 3, 20 / 3],
+        "f": [1, 5, 3],
+    }
+    compare_dicts(result, expected)
+    if "polars" in str(constructor):
+        # Polars evaluates expressions in parallel itself.
+        assert threads == []
+    else:
+        # The 4 expressions of `select`, and the 2 of `with_columns`.
+        assert len(threads) == 6
+        assert threading.main_thread().name not in threads
+        assert all(name.startswith("narwhals-evaluate") for name in threads)
+
+
+def test_n_threads_changed() -> None:
+    from narwhals._expression_parsing import _EXECUTOR_LOCK
+    from narwhals._expression_parsing import _get_executor
+
+    with _EXECUTOR_LOCK:
+        executor = _get_executor(2)
+        assert _get_executor(2) is executor
+        new_executor = _get_executor(3)
+    assert new_executor is not executor
+    # The previous pool is shut down, so that its threads don't leak.
+    with pytest.raises(RuntimeError, match="shutdown"):
+        executor.submit(int)
+
+
+def test_n_processes_invalid() -> None:
+    with pytest.raises(ValueError, match="at least 1"):
+        nw.Config(n_processes=0)
+
+
+def _record_partition_calls(set_attr: Callable[[Any, str, Any], None]) -> list[int]:
+    """Make everything worth partitioning, and record the number of partitions of
+    each call to `parallel._map_partitions`."""
+    from narwhals._pandas_like import parallel
+
+    set_attr(parallel, "MIN_ROWS_PER_PARTITION", 2)
+    set_attr(parallel, "MIN_GROUPS_PER_PARTITION", 1)
+    calls = []
+    map_partitions = parallel._map_partitions
+
+    def _map_partitions(func: Any, partitions: Any) -> Any:
+        calls.append(len(partitions))
+        return map_partitions(func, partitions)
+
+    set_attr(parallel, "_map_partitions", _map_partitions)
+    return calls
+
+
+def _n_processes_query(df: nw.DataFrame[Any]) -> list[Any]:
+    ones = np.ones(len(df))
+    with pytest.warns(UserWarning, match="complex group-by"):
+        complex_agg = df.group_by("c").agg(
+            (nw.col("a") * 2).sum(), nw.col("b").round(0).mean()
+        )
+    return [
+        nw.to_native(df.select("c", nw.col("a") * 2, d=nw.col("b").is_null())),
+        nw.to_native(df.with_columns(nw.col("c").str.to_uppercase(), e=1 - nw.col("a"))),
+        nw.to_native(df.filter(nw.col("a") > 1, nw.col("c") == "x")),
+        # Series and array operands are aligned with the whole frame: runs
+        # sequentially.
+        nw.to_native(df.with_columns(f=nw.col("a") + df["a"], g=nw.col("a") * ones)),
+        nw.to_native(df.filter(nw.col("a") * 2 > df["a"] + 1)),
+        nw.to_native(
+            df.group_by("c").agg(
+                nw.col("a").sum(),
+                nw.col("b").mean(),
+                nw.col("a").min().alias("a_min"),
+                nw.col("b").max().alias("b_max"),
+                nw.col("b").count().alias("b_count"),
+                nw.len(),
+            )
+        ),
+        nw.to_native(complex_agg),
+    ]
+
+
+n_processes_data = pd.DataFrame(
+    {
+        "a": [1, 3, 2, 1, 3, 2, 1],
+        "b": [4.0, None, 6.0, 1.0, 2.0, 3.0, 5.0],
+        "c": ["x", "y", "x", "y", "x", None, "z"],
+    },
+    index=[7, 6, 5, 4, 3, 2, 1],
+)
+
+
+def check_n_processes() -> None:
+    calls = _record_partition_calls(setattr)
+    df = nw.from_native(n_processes_data, eager_only=True)
+    expected = _n_processes_query(df)
+    assert calls == []
+    # Leave idle threads behind in the `n_threads` pool, which don't prevent
+    # forking.
+    with nw.Config(n_threads=2):
+        df.select(nw.col("a"), nw.col("b"))
+    assert threading.active_count() > 1
+    with nw.Config(n_processes=3):
+        result = _n_processes_query(df)
+        # Not elementwise, or not a combinable aggregation: runs sequentially.
+        df.select(nw.col("a") - nw.col("a").mean())
+        df.group_by("c").agg(nw.col("a").std())
+    assert calls == [3, 3, 3, 3, 3]
+    for left, right in zip(result, expected):
+        assert_frame_equal(left, right)
+
+
+def test_n_processes() -> None:
+    # In a new process: nothing is partitioned while other threads are running,
+    # and other tests may leave some behind.
+    code = "from tests.test_config import check_n_processes; check_n_processes()"
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+
+
+def test_n_processes_with_threads(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = _record_partition_calls(monkeypatch.setattr)
+    df = nw.from_native(n_processes_data, eager_only=True)
+    expected = _n_processes_query(df)
+    stop = threading.Event()
+    thread = threading.Thread(target=stop.wait)
+    thread.start()
+    try:
+        with nw.Config(n_processes=3):
+            result = _n_processes_query(df)
+    finally:
+        stop.set()
+        thread.join()
+    # Forking while other threads run isn't safe, so it runs sequentially.
+    assert calls == []
+    for left, right in zip(result, expected):
+        assert_frame_equal(left, right)
+
+
+def test_cache_max_bytes_invalid() -> None:
+    with pytest.raises(ValueError, match="non-negative"):
+        nw.Config(cache_max_bytes=-1)
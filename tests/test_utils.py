@@ -1,5 +1,8 @@
+from typing import Any
+
 import pandas as pd
 import polars as pl
+import pyarrow as pa
 import pytest
 from pandas.testing import assert_frame_equal
 from pandas.testing import assert_series_equal
@@ -84,3 +87,34 @@ def test_maybe_convert_dtypes_polars() -> None:
     df = nw.from_native(pl.DataFrame({"a": [1.1, np.nan]}))
     result = nw.maybe_convert_dtypes(df)
     assert result is df
+
+
+@pytest.mark.parametrize(
+    "native_frame", [pd.DataFrame({"a": [1, 2]}), pa.table({"a": [1, 2]})]
+)
+def test_namespace_is_shared(native_frame: Any) -> None:
+    df = nw.from_native(native_frame, eager_only=True)._compliant_frame
+    series = df["a"]
+    expr = df.__narwhals_namespace__().col("a")
+    assert df.__narwhals_namespace__() is series.__narwhals_namespace__()
+    assert df.__narwhals_namespace__() is expr.__narwhals_namespace__()
+    for obj in (df, series, expr):
+        assert not hasattr(obj, "__dict__")
+
+
+def test_is_same_index(monkeypatch: pytest.MonkeyPatch) -> None:
+    from narwhals._pandas_like import utils
+
+    assert utils.is_same_index(pd.RangeIndex(3), pd.RangeIndex(3))
+    assert not utils.is_same_index(pd.RangeIndex(3), pd.RangeIndex(1, 4))
+    assert not utils.is_same_index(pd.RangeIndex(3, name="a"), pd.RangeIndex(3))
+    index = pd.Index([3, 1, 2])
+    assert utils.is_same_index(index, index.view())
+    assert not utils.is_same_index(index, pd.Index([3, 1, 2]))
+
+    # Equal (but distinct) RangeIndexes don't need relabelling.
+    df = nw.from_native(pd.DataFrame({"a": [1, 2, 3]}), eager_only=True)
+    s = nw.from_native(pd.Series([4, 5, 6], name="b"), series_only=True)
+    monkeypatch.setattr(utils, "set_axis", lambda *_, **__: pytest.fail("relabelled"))
+    result = df.with_columns(s, c=nw.col("a") + s)
+    assert result["c"].to_list() == [5, 7, 9]
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import inspect
+
+import pytest
+
+from tests.utils import compare_dicts
+from tpch.data import TEST_DATA_DIR
+from tpch.data import read_table
+from tpch.queries import QUERIES
+from tpch.run import benchmark
+from tpch.run import execute
+
+# Queries which fail with pandas on the test data: query name -> why.
+PANDAS_FAILURES = {
+    "q11": (
+        "filter comparing a column with its sum, on an empty pandas frame: "
+        "ValueError (length of values (1) does not match length of index (0))"
+    ),
+    "q14": (
+        "select of arithmetic between sums, on an empty pandas frame: ValueError "
+        "(length of values (1) does not match length of index (0))"
+    ),
+    "q15": (
+        "filter comparing a column with its max, on a single-row pandas frame: "
+        "the mask is a NumPy scalar, and .loc raises KeyError(np.True_)"
+    ),
+    "q17": (
+        "select of a sum divided by a scalar, on an empty pandas frame: ValueError "
+        "(length of values (1) does not match length of index (0))"
+    ),
+    "q19": (
+        "select of a sum, on an empty pandas frame: ValueError "
+        "(length of values (1) does not match length of index (0))"
+    ),
+}
+
+
+@pytest.mark.parametrize("query_name", list(QUERIES))
+@pytest.mark.filterwarnings("ignore:.*Passing a BlockManager.*:DeprecationWarning")
+def test_queries_pandas(query_name: str, request: pytest.FixtureRequest) -> None:
+    if query_name in PANDAS_FAILURES:
+        request.applymarker(
+            pytest.mark.xfail(strict=True, reason=PANDAS_FAILURES[query_name])
+        )
+    query = QUERIES[query_name]
+    tables = inspect.signature(query).parameters
+    result = execute(
+        query, {name: read_table(TEST_DATA_DIR, name, "pandas") for name in tables}
+    )
+    expected = execute(
+        query,
+        {name: read_table(TEST_DATA_DIR, name, "polars[eager]") for name in tables},
+    )
+    assert list(result.columns) == expected.columns
+    compare_dicts(result, expected.to_dict(as_series=False))
+
+
+def test_benchmark() -> None:
+    result = benchmark("polars[eager]", "q1", TEST_DATA_DIR, 2)
+    assert result["error"] is None
+    assert len(result["timings_s"]) == 2
+    assert result["min_s"] <= result["median_s"]
+    assert 0 < result["narwhals_time_s"] < result["profiled_time_s"]
+
+
+def test_benchmark_error() -> None:
+    result = benchmark("pyarrow", "q4", TEST_DATA_DIR, 1)
+    assert "is_between" in result["error"]
+    assert "timings_s" not in result
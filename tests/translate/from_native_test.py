@@ -153,6 +153,32 @@ def test_pandas_like_validate() -> None:
         nw.from_native(df)
 
 
+def test_pandas_like_validate_only_when_columns_change(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from narwhals._pandas_like.dataframe import PandasLikeDataFrame
+
+    df = nw.from_native(pd.DataFrame({"a": [3, 1, 2], "b": [4, 5, 6]}), eager_only=True)
+    with pytest.raises(ValueError, match="Expected unique column names"):
+        df.rename({"b": "a"})
+    with pytest.raises(ValueError, match="Expected unique column names"):
+        df.select("a", nw.col("b").alias("a"))
+
+    def validate_columns(*_: Any) -> None:
+        pytest.fail("columns were validated")
+
+    monkeypatch.setattr(PandasLikeDataFrame, "_validate_columns", validate_columns)
+    result = (
+        df.filter(nw.col("a") > 1)
+        .sort("a")
+        .with_columns(nw.col("b") * 2)
+        .head(5)
+        .drop("b")
+        .unique("a")
+    )
+    assert result["a"].to_list() == [2, 3]
+
+
 @pytest.mark.parametrize(
     ("series", "is_polars", "context"),
     [
@@ -281,3 +307,21 @@ def test_init_already_narwhals_unstable() -> None:
     s = df["a"]
     result_s = unstable_nw.from_native(s, allow_series=True)
     assert result_s is s
+
+
+def test_native_constructor_cached() -> None:
+    from narwhals.translate import _get_native_constructor
+
+    class Subclass(pd.DataFrame):
+        pass
+
+    _get_native_constructor.cache_clear()
+    for _ in range(3):
+        nw.from_native(df_pd)
+        nw.from_native(series_pd, allow_series=True)
+    assert _get_native_constructor.cache_info().misses == 2
+    assert _get_native_constructor.cache_info().hits == 4
+    assert _get_native_constructor(MockDataFrame) is None
+    result = nw.from_native(Subclass(data))
+    assert isinstance(result, nw.DataFrame)
+    assert isinstance(nw.to_native(result), Subclass)
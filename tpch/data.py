@@ -0,0 +1,121 @@
+"""Reading (and generating) TPC-H tables for each backend."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any
+from typing import Callable
+
+TABLES = [
+    "customer",
+    "lineitem",
+    "nation",
+    "orders",
+    "part",
+    "partsupp",
+    "region",
+    "supplier",
+]
+
+# Small tables which are checked in, for quick runs and for tests.
+TEST_DATA_DIR = Path(__file__).parent.parent / "tests" / "data"
+DATA_DIR = Path(__file__).parent / "data"
+
+
+def generate(scale_factor: float, data_dir: Path) -> None:
+    """Write the TPC-H tables at `scale_factor` to Parquet files in `data_dir`.
+
+    Uses DuckDB's `tpch` extension. Decimals are written as doubles, which all
+    backends support.
+    """
+    import duckdb
+
+    data_dir.mkdir(parents=True, exist_ok=True)
+    con = duckdb.connect()
+    con.sql(f"CALL dbgen(sf={scale_factor})")
+    for table in TABLES:
+        columns = con.sql(f"DESCRIBE {table}").fetchall()
+        select = ", ".join(
+            f"CAST({name} AS DOUBLE) AS {name}" if dtype.startswith("DECIMAL") else name
+            for name, dtype, *_ in columns
+        )
+        con.sql(
+            f"COPY (SELECT {select} FROM {table}) TO '{data_dir / table}.parquet' "  # noqa: S608
+            "(FORMAT PARQUET)"
+        )
+
+
+def data_dir_for(scale_factor: float | None) -> Path:
+    """Directory with the tables at `scale_factor`, generating them if needed."""
+    if scale_factor is None:
+        return TEST_DATA_DIR
+    data_dir = DATA_DIR / f"sf{scale_factor:g}"
+    if not all((data_dir / f"{table}.parquet").exists() for table in TABLES):
+        generate(scale_factor, data_dir)
+    return data_dir
+
+
+def _read_arrow(data_dir: Path, table: str) -> Any:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    native = pq.read_table(data_dir / f"{table}.parquet")
+    # Dates are compared against `datetime` literals in the queries, so use
+    # timestamps (which all backends support) instead of dates.
+    schema = pa.schema(
+        field.with_type(pa.timestamp("ns")) if pa.types.is_date(field.type) else field
+        for field in native.schema
+    )
+    return native.cast(schema)
+
+
+def _read_pandas(data_dir: Path, table: str) -> Any:
+    return _read_arrow(data_dir, table).to_pandas()
+
+
+def _read_pandas_pyarrow(data_dir: Path, table: str) -> Any:
+    import pandas as pd
+
+    return _read_arrow(data_dir, table).to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def _read_modin(data_dir: Path, table: str) -> Any:
+    import modin.pandas as mpd
+
+    return mpd.DataFrame(_read_pandas(data_dir, table))
+
+
+def _read_dask(data_dir: Path, table: str) -> Any:
+    import dask.dataframe as dd
+
+    return dd.from_pandas(_read_pandas(data_dir, table), npartitions=os.cpu_count() or 1)
+
+
+def _read_polars(data_dir: Path, table: str) -> Any:
+    import polars as pl
+
+    return pl.from_arrow(_read_arrow(data_dir, table))
+
+
+def _read_polars_lazy(data_dir: Path, table: str) -> Any:
+    return _read_polars(data_dir, table).lazy()
+
+
+# Backend name -> (module it needs, function reading a table into memory).
+# Tables are read (and converted) before timing starts, so only the queries
+# themselves are timed.
+BACKENDS: dict[str, tuple[str, Callable[[Path, str], Any]]] = {
+    "pandas": ("pandas", _read_pandas),
+    "pandas[pyarrow]": ("pandas", _read_pandas_pyarrow),
+    "modin": ("modin", _read_modin),
+    "dask": ("dask.dataframe", _read_dask),
+    "pyarrow": ("pyarrow", _read_arrow),
+    "polars[eager]": ("polars", _read_polars),
+    "polars[lazy]": ("polars", _read_polars_lazy),
+}
+
+
+def read_table(data_dir: Path, table: str, backend: str) -> Any:
+    """Read `table` from `data_dir` as a native frame of `backend`."""
+    return BACKENDS[backend][1](data_dir, table)
@@ -0,0 +1,18 @@
+"""The 22 TPC-H queries, written once with Narwhals.
+
+Each query is a function which takes the tables it reads as `LazyFrame`s (the
+parameter names are the table names) and returns the (lazy) query result.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+from typing import Callable
+
+if TYPE_CHECKING:
+    import narwhals.stable.v1 as nw
+
+QUERIES: dict[str, Callable[..., nw.LazyFrame]] = {
+    f"q{i}": import_module(f"tpch.queries.q{i}").query for i in range(1, 23)
+}
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+import narwhals.stable.v1 as nw
+
+
+def query(lineitem: nw.LazyFrame) -> nw.LazyFrame:
+    var_1 = datetime(1998, 9, 2)
+
+    return (
+        lineitem.filter(nw.col("l_shipdate") <= var_1)
+        .with_columns(
+            disc_price=nw.col("l_extendedprice") * (1 - nw.col("l_discount")),
+            charge=(
+                nw.col("l_extendedprice")
+                * (1.0 - nw.col("l_discount"))
+                * (1.0 + nw.col("l_tax"))
+            ),
+        )
+        .group_by("l_returnflag", "l_linestatus")
+        .agg(
+            nw.col("l_quantity").sum().alias("sum_qty"),
+            nw.col("l_extendedprice").sum().alias("sum_base_price"),
+            nw.col("disc_price").sum().alias("sum_disc_price"),
+            nw.col("charge").sum().alias("sum_charge"),
+            nw.col("l_quantity").mean().alias("avg_qty"),
+            nw.col("l_extendedprice").mean().alias("avg_price"),
+            nw.col("l_discount").mean().alias("avg_disc"),
+            nw.len().alias("count_order"),
+        )
+        .sort("l_returnflag", "l_linestatus")
+    )
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+import narwhals.stable.v1 as nw
+
+
+def query(
+    customer: nw.LazyFrame,
+    nation: nw.LazyFrame,
+    lineitem: nw.LazyFrame,
+    orders: nw.LazyFrame,
+) -> nw.LazyFrame:
+    var_1 = datetime(1993, 10, 1)
+    var_2 = datetime(1994, 1, 1)
+
+    return (
+        customer.join(orders, left_on="c_custkey", right_on="o_custkey")
+        .join(lineitem, left_on="o_orderkey", right_on="l_orderkey")
+        .join(nation, left_on="c_nationkey", right_on="n_nationkey")
+        .filter(
+            nw.col("o_orderdate").is_between(var_1, var_2, closed="left"),
+            nw.col("l_returnflag") == "R",
+        )
+        .with_columns(revenue=nw.col("l_extendedprice") * (1 - nw.col("l_discount")))
+        .group_by(
+            "c_custkey",
+            "c_name",
+            "c_acctbal",
+            "c_phone",
+            "n_name",
+            "c_address",
+            "c_comment",
+        )
+        .agg(nw.col("revenue").sum())
+        .select(
+            "c_custkey",
+            "c_name",
+            "revenue",
+            "c_acctbal",
+            "n_name",
+            "c_address",
+            "c_phone",
+            "c_comment",
+        )
+        .sort(by=["revenue", "c_custkey"], descending=[True, False])
+        .head(20)
+    )
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import narwhals.stable.v1 as nw
+
+
+def query(
+    partsupp: nw.LazyFrame, supplier: nw.LazyFrame, nation: nw.LazyFrame
+) -> nw.LazyFrame:
+    var_1 = "GERMANY"
+    var_2 = 0.0001
+
+    return (
+        partsupp.join(supplier, left_on="ps_suppkey", right_on="s_suppkey")
+        .join(nation, left_on="s_nationkey", right_on="n_nationkey")
+        .filter(nw.col("n_name") == var_1)
+        .with_columns(value=nw.col("ps_supplycost") * nw.col("ps_availqty"))
+        .group_by("ps_partkey")
+        .agg(nw.col("value").sum())
+        # The sum of the per-part values is the total value.
+        .filter(nw.col("value") > nw.col("value").sum() * var_2)
+        .sort("value", descending=True)
+    )
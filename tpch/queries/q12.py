@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+import narwhals.stable.v1 as nw
+
+
+def query(orders: nw.LazyFrame, lineitem: nw.LazyFrame) -> nw.LazyFrame:
+    var_1 = "MAIL"
+    var_2 = "SHIP"
+    var_3 = datetime(1994, 1, 1)
+    var_4 = datetime(1995, 1, 1)
+
+    return (
+        orders.join(lineitem, left_on="o_orderkey", right_on="l_orderkey")
+        .filter(
+            nw.col("l_shipmode").is_in([var_1, var_2]),
+            nw.col("l_commitdate") < nw.col("l_receiptdate"),
+            nw.col("l_shipdate") < nw.col("l_commitdate"),
+            nw.col("l_receiptdate").is_between(var_3, var_4, closed="left"),
+        )
+        .with_columns(
+            high_line_count=nw.col("o_orderpriority")
+            .is_in(["1-URGENT", "2-HIGH"])
+            .cast(nw.Int64())
+        )
+        .with_columns(low_line_count=1 - nw.col("high_line_count"))
+        .group_by("l_shipmode")
+        .agg(nw.col("high_line_count").sum(), nw.col("low_line_count").sum())
+        .sort("l_shipmode")
+    )
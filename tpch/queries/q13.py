@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import narwhals.stable.v1 as nw
+
+
+def query(customer: nw.LazyFrame, orders: nw.LazyFrame) -> nw.LazyFrame:
+    var_1 = "special"
+    var_2 = "requests"
+
+    return (
+        customer.join(
+            orders.filter(~nw.col("o_comment").str.contains(f"{var_1}.*{var_2}")),
+            left_on="c_custkey",
+            right_on="o_custkey",
+            how="left",
+        )
+        .group_by("c_custkey")
+        .agg(nw.col("o_orderkey").count().alias("c_count"))
+        .group_by("c_count")
+        .agg(nw.len().alias("custdist"))
+        .sort(by=["custdist", "c_count"], descending=[True, True])
+    )
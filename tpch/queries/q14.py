@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+import narwhals.stable.v1 as nw
+
+
+def query(lineitem: nw.LazyFrame, part: nw.LazyFrame) -> nw.LazyFrame:
+    var_1 = datetime(1995, 9, 1)
+    var_2 = datetime(1995, 10, 1)
+
+    return (
+        lineitem.join(part, left_on="l_partkey", right_on="p_partkey")
+        .filter(nw.col("l_shipdate").is_between(var_1, var_2, closed="left"))
+        .with_columns(revenue=nw.col("l_extendedprice") * (1 - nw.col("l_discount")))
+        .with_columns(
+            promo_revenue=nw.col("p_type").str.starts_with("PROMO").cast(nw.Float64())
+            * nw.col("revenue")
+        )
+        .select(
+            (100.0 * nw.col("promo_revenue").sum() / nw.col("revenue").sum()).alias(
+                "promo_revenue"
+            )
+        )
+    )
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+import narwhals.stable.v1 as nw
+
+
+def query(lineitem: nw.LazyFrame, supplier: nw.LazyFrame) -> nw.LazyFrame:
+    var_1 = datetime(1996, 1, 1)
+    var_2 = datetime(1996, 4, 1)
+
+    revenue = (
+        lineitem.filter(nw.col("l_shipdate").is_between(var_1, var_2, closed="left"))
+        .with_columns(
+            total_revenue=nw.col("l_extendedprice") * (1 - nw.col("l_discount"))
+        )
+        .group_by("l_suppkey")
+        .agg(nw.col("total_revenue").sum())
+    )
+
+    return (
+        supplier.join(revenue, left_on="s_suppkey", right_on="l_suppkey")
+        .filter(nw.col("total_revenue") == nw.col("total_revenue").max())
+        .select("s_suppkey", "s_name", "s_address", "s_phone", "total_revenue")
+        .sort("s_suppkey")
+    )
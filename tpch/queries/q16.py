@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import narwhals.stable.v1 as nw
+
+
+def query(
+    part: nw.LazyFrame, partsupp: nw.LazyFrame, supplier: nw.LazyFrame
+) -> nw.LazyFrame:
+    var_1 = "Brand#45"
+
+    complaints = supplier.filter(
+        nw.col("s_comment").str.contains("Customer.*Complaints")
+    ).select("s_suppkey")
+
+    return (
+        part.join(partsupp, left_on="p_partkey", right_on="ps_partkey")
+        .filter(
+            nw.col("p_brand") != var_1,
+            ~nw.col("p_type").str.starts_with("MEDIUM POLISHED"),
+            nw.col("p_size").is_in([49, 14, 23, 45, 19, 3, 36, 9]),
+        )
+        .join(complaints, left_on="ps_suppkey", right_on="s_suppkey", how="anti")
+        .unique(subset=["p_brand", "p_type", "p_size", "ps_suppkey"])
+        .group_by("p_brand", "p_type", "p_size")
+        .agg(nw.len().alias("supplier_cnt"))
+        .sort(
+            by=["supplier_cnt", "p_brand", "p_type", "p_size"],
+            descending=[True, False, False, False],
+        )
+    )
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import narwhals.stable.v1 as nw
+
+
+def query(lineitem: nw.LazyFrame, part: nw.LazyFrame) -> nw.LazyFrame:
+    var_1 = "Brand#23"
+    var_2 = "MED BOX"
+
+    parts = part.filter(nw.col("p_brand") == var_1, nw.col("p_container") == var_2).join(
+        lineitem, left_on="p_partkey", right_on="l_partkey"
+    )
+    average_quantity = (
+        parts.group_by("p_partkey")
+        .agg(nw.col("l_quantity").mean().alias("avg_quantity"))
+        .select(
+            nw.col("p_partkey").alias("key"),
+            nw.col("avg_quantity") * 0.2,
+        )
+    )
+
+    return (
+        parts.join(average_quantity, left_on="p_partkey", right_on="key")
+        .filter(nw.col("l_quantity") < nw.col("avg_quantity"))
+        .select((nw.col("l_extendedprice").sum() / 7.0).alias("avg_yearly"))
+    )
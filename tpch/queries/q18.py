@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import narwhals.stable.v1 as nw
+
+
+def query(
+    customer: nw.LazyFrame, lineitem: nw.LazyFrame, orders: nw.LazyFrame
+) -> nw.LazyFrame:
+    var_1 = 300
+
+    large_orders = (
+        lineitem.group_by("l_orderkey")
+        .agg(nw.col("l_quantity").sum().alias("sum_quantity"))
+        .filter(nw.col("sum_quantity") > var_1)
+    )
+
+    return (
+        orders.join(large_orders, left_on="o_orderkey", right_on="l_orderkey", how="semi")
+        .join(lineitem, left_on="o_orderkey", right_on="l_orderkey")
+        .join(customer, left_on="o_custkey", right_on="c_custkey")
+        .group_by("c_name", "o_custkey", "o_orderkey", "o_orderdate", "o_totalprice")
+        .agg(nw.col("l_quantity").sum().alias("sum_quantity"))
+        .select(
+            "c_name",
+            nw.col("o_custkey").alias("c_custkey"),
+            "o_orderkey",
+            "o_orderdate",
+            "o_totalprice",
+            "sum_quantity",
+        )
+        .sort(by=["o_totalprice", "o_orderdate"], descending=[True, False])
+        .head(100)
+    )
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import narwhals.stable.v1 as nw
+
+
+def query(
+    region: nw.LazyFrame,
+    nation: nw.LazyFrame,
+    supplier: nw.LazyFrame,
+    part: nw.LazyFrame,
+    partsupp: nw.LazyFrame,
+) -> nw.LazyFrame:
+    var_1 = 15
+    var_2 = "BRASS"
+    var_3 = "EUROPE"
+
+    result = (
+        part.join(partsupp, left_on="p_partkey", right_on="ps_partkey")
+        .join(supplier, left_on="ps_suppkey", right_on="s_suppkey")
+        .join(nation, left_on="s_nationkey", right_on="n_nationkey")
+        .join(region, left_on="n_regionkey", right_on="r_regionkey")
+        .filter(
+            nw.col("p_size") == var_1,
+            nw.col("p_type").str.ends_with(var_2),
+            nw.col("r_name") == var_3,
+        )
+    )
+
+    return (
+        result.group_by("p_partkey")
+        .agg(nw.col("ps_supplycost").min())
+        .join(
+            result,
+            left_on=["p_partkey", "ps_supplycost"],
+            right_on=["p_partkey", "ps_supplycost"],
+        )
+        .select(
+            "s_acctbal",
+            "s_name",
+            "n_name",
+            "p_partkey",
+            "p_mfgr",
+            "s_address",
+            "s_phone",
+            "s_comment",
+        )
+        .sort(
+            by=["s_acctbal", "n_name", "s_name", "p_partkey"],
+            descending=[True, False, False, False],
+        )
+        .head(100)
+    )
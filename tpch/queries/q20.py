@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+import narwhals.stable.v1 as nw
+
+
+def query(
+    part: nw.LazyFrame,
+    partsupp: nw.LazyFrame,
+    nation: nw.LazyFrame,
+    lineitem: nw.LazyFrame,
+    supplier: nw.LazyFrame,
+) -> nw.LazyFrame:
+    var_1 = datetime(1994, 1, 1)
+    var_2 = datetime(1995, 1, 1)
+    var_3 = "CANADA"
+    var_4 = "forest"
+
+    shipped_quantity = (
+        lineitem.filter(nw.col("l_shipdate").is_between(var_1, var_2, closed="left"))
+        .group_by("l_partkey", "l_suppkey")
+        .agg(nw.col("l_quantity").sum().alias("sum_quantity"))
+        .with_columns(nw.col("sum_quantity") * 0.5)
+    )
+    forest_parts = part.filter(nw.col("p_name").str.starts_with(var_4))
+    excess_suppliers = (
+        partsupp.join(
+            forest_parts, left_on="ps_partkey", right_on="p_partkey", how="semi"
+        )
+        .join(
+            shipped_quantity,
+            left_on=["ps_suppkey", "ps_partkey"],
+            right_on=["l_suppkey", "l_partkey"],
+        )
+        .filter(nw.col("ps_availqty") > nw.col("sum_quantity"))
+    )
+
+    return (
+        supplier.join(nation, left_on="s_nationkey", right_on="n_nationkey")
+        .filter(nw.col("n_name") == var_3)
+        .join(excess_suppliers, left_on="s_suppkey", right_on="ps_suppkey", how="semi")
+        .select("s_name", "s_address")
+        .sort("s_name")
+    )
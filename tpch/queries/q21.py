@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import narwhals.stable.v1 as nw
+
+
+def query(
+    lineitem: nw.LazyFrame,
+    nation: nw.LazyFrame,
+    orders: nw.LazyFrame,
+    supplier: nw.LazyFrame,
+) -> nw.LazyFrame:
+    var_1 = "SAUDI ARABIA"
+
+    def n_suppliers(lineitems: nw.LazyFrame) -> nw.LazyFrame:
+        return (
+            lineitems.unique(subset=["l_orderkey", "l_suppkey"])
+            .group_by("l_orderkey")
+            .agg(nw.len().alias("n_suppliers"))
+        )
+
+    late = lineitem.filter(nw.col("l_receiptdate") > nw.col("l_commitdate"))
+    # Orders with more than one supplier, of which only one was late.
+    multi_supplier = n_suppliers(lineitem).filter(nw.col("n_suppliers") > 1)
+    single_late_supplier = n_suppliers(late).filter(nw.col("n_suppliers") == 1)
+
+    return (
+        late.join(multi_supplier, left_on="l_orderkey", right_on="l_orderkey", how="semi")
+        .join(
+            single_late_supplier,
+            left_on="l_orderkey",
+            right_on="l_orderkey",
+            how="semi",
+        )
+        .join(supplier, left_on="l_suppkey", right_on="s_suppkey")
+        .join(nation, left_on="s_nationkey", right_on="n_nationkey")
+        .join(orders, left_on="l_orderkey", right_on="o_orderkey")
+        .filter(nw.col("n_name") == var_1, nw.col("o_orderstatus") == "F")
+        .group_by("s_name")
+        .agg(nw.len().alias("numwait"))
+        .sort(by=["numwait", "s_name"], descending=[True, False])
+        .head(100)
+    )
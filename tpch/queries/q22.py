@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import narwhals.stable.v1 as nw
+
+
+def query(customer: nw.LazyFrame, orders: nw.LazyFrame) -> nw.LazyFrame:
+    var_1 = ["13", "31", "23", "29", "30", "18", "17"]
+
+    customers = customer.with_columns(cntrycode=nw.col("c_phone").str.slice(0, 2)).filter(
+        nw.col("cntrycode").is_in(var_1)
+    )
+    average_balance = customers.filter(nw.col("c_acctbal") > 0.0).select(
+        nw.col("c_acctbal").mean().alias("avg_acctbal")
+    )
+
+    return (
+        customers.join(orders, left_on="c_custkey", right_on="o_custkey", how="anti")
+        .join(average_balance, how="cross")
+        .filter(nw.col("c_acctbal") > nw.col("avg_acctbal"))
+        .group_by("cntrycode")
+        .agg(
+            nw.col("c_acctbal").count().alias("numcust"),
+            nw.col("c_acctbal").sum().alias("totacctbal"),
+        )
+        .sort("cntrycode")
+    )
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+import narwhals.stable.v1 as nw
+
+
+def query(
+    customer: nw.LazyFrame, orders: nw.LazyFrame, lineitem: nw.LazyFrame
+) -> nw.LazyFrame:
+    var_1 = var_2 = datetime(1995, 3, 15)
+    var_3 = "BUILDING"
+
+    return (
+        customer.filter(nw.col("c_mktsegment") == var_3)
+        .join(orders, left_on="c_custkey", right_on="o_custkey")
+        .join(lineitem, left_on="o_orderkey", right_on="l_orderkey")
+        .filter(nw.col("o_orderdate") < var_2, nw.col("l_shipdate") > var_1)
+        .with_columns(revenue=nw.col("l_extendedprice") * (1 - nw.col("l_discount")))
+        .group_by("o_orderkey", "o_orderdate", "o_shippriority")
+        .agg(nw.col("revenue").sum())
+        .select(
+            nw.col("o_orderkey").alias("l_orderkey"),
+            "revenue",
+            "o_orderdate",
+            "o_shippriority",
+        )
+        .sort(by=["revenue", "o_orderdate"], descending=[True, False])
+        .head(10)
+    )
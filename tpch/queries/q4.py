@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+import narwhals.stable.v1 as nw
+
+
+def query(lineitem: nw.LazyFrame, orders: nw.LazyFrame) -> nw.LazyFrame:
+    var_1 = datetime(1993, 7, 1)
+    var_2 = datetime(1993, 10, 1)
+
+    late_lineitems = lineitem.filter(nw.col("l_commitdate") < nw.col("l_receiptdate"))
+    return (
+        orders.filter(nw.col("o_orderdate").is_between(var_1, var_2, closed="left"))
+        .join(late_lineitems, left_on="o_orderkey", right_on="l_orderkey", how="semi")
+        .group_by("o_orderpriority")
+        .agg(nw.len().alias("order_count"))
+        .sort("o_orderpriority")
+    )
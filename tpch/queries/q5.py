@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+import narwhals.stable.v1 as nw
+
+
+def query(
+    region: nw.LazyFrame,
+    nation: nw.LazyFrame,
+    customer: nw.LazyFrame,
+    lineitem: nw.LazyFrame,
+    orders: nw.LazyFrame,
+    supplier: nw.LazyFrame,
+) -> nw.LazyFrame:
+    var_1 = "ASIA"
+    var_2 = datetime(1994, 1, 1)
+    var_3 = datetime(1995, 1, 1)
+
+    return (
+        region.join(nation, left_on="r_regionkey", right_on="n_regionkey")
+        .join(customer, left_on="n_nationkey", right_on="c_nationkey")
+        .join(orders, left_on="c_custkey", right_on="o_custkey")
+        .join(lineitem, left_on="o_orderkey", right_on="l_orderkey")
+        .join(
+            supplier,
+            left_on=["l_suppkey", "n_nationkey"],
+            right_on=["s_suppkey", "s_nationkey"],
+        )
+        .filter(
+            nw.col("r_name") == var_1,
+            nw.col("o_orderdate").is_between(var_2, var_3, closed="left"),
+        )
+        .with_columns(revenue=nw.col("l_extendedprice") * (1 - nw.col("l_discount")))
+        .group_by("n_name")
+        .agg(nw.col("revenue").sum())
+        .sort("revenue", descending=True)
+    )
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+import narwhals.stable.v1 as nw
+
+
+def query(
+    nation: nw.LazyFrame,
+    customer: nw.LazyFrame,
+    lineitem: nw.LazyFrame,
+    orders: nw.LazyFrame,
+    supplier: nw.LazyFrame,
+) -> nw.LazyFrame:
+    var_1 = "FRANCE"
+    var_2 = "GERMANY"
+    var_3 = datetime(1995, 1, 1)
+    var_4 = datetime(1996, 12, 31)
+
+    n1 = nation.filter(nw.col("n_name") == var_1).select("n_nationkey", "n_name")
+    n2 = nation.filter(nw.col("n_name") == var_2).select("n_nationkey", "n_name")
+
+    def shipments(cust_nation: nw.LazyFrame, supp_nation: nw.LazyFrame) -> nw.LazyFrame:
+        return (
+            customer.join(cust_nation, left_on="c_nationkey", right_on="n_nationkey")
+            .join(orders, left_on="c_custkey", right_on="o_custkey")
+            .rename({"n_name": "cust_nation"})
+            .join(lineitem, left_on="o_orderkey", right_on="l_orderkey")
+            .join(supplier, left_on="l_suppkey", right_on="s_suppkey")
+            .join(supp_nation, left_on="s_nationkey", right_on="n_nationkey")
+            .rename({"n_name": "supp_nation"})
+            .select(
+                "supp_nation",
+                "cust_nation",
+                "l_shipdate",
+                "l_extendedprice",
+                "l_discount",
+            )
+        )
+
+    return (
+        nw.concat([shipments(n1, n2), shipments(n2, n1)])
+        .filter(nw.col("l_shipdate").is_between(var_3, var_4))
+        .with_columns(
+            volume=nw.col("l_extendedprice") * (1 - nw.col("l_discount")),
+            l_year=nw.col("l_shipdate").dt.year(),
+        )
+        .group_by("supp_nation", "cust_nation", "l_year")
+        .agg(nw.col("volume").sum().alias("revenue"))
+        .sort("supp_nation", "cust_nation", "l_year")
+    )
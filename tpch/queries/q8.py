@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+import narwhals.stable.v1 as nw
+
+
+def query(
+    part: nw.LazyFrame,
+    supplier: nw.LazyFrame,
+    lineitem: nw.LazyFrame,
+    orders: nw.LazyFrame,
+    customer: nw.LazyFrame,
+    nation: nw.LazyFrame,
+    region: nw.LazyFrame,
+) -> nw.LazyFrame:
+    var_1 = "BRAZIL"
+    var_2 = "AMERICA"
+    var_3 = "ECONOMY ANODIZED STEEL"
+    var_4 = datetime(1995, 1, 1)
+    var_5 = datetime(1996, 12, 31)
+
+    customer_nation = nation.select("n_nationkey", "n_regionkey")
+    supplier_nation = nation.select(
+        nw.col("n_nationkey").alias("supp_nationkey"),
+        nw.col("n_name").alias("nation"),
+    )
+
+    return (
+        part.join(lineitem, left_on="p_partkey", right_on="l_partkey")
+        .join(supplier, left_on="l_suppkey", right_on="s_suppkey")
+        .join(orders, left_on="l_orderkey", right_on="o_orderkey")
+        .join(customer, left_on="o_custkey", right_on="c_custkey")
+        .join(customer_nation, left_on="c_nationkey", right_on="n_nationkey")
+        .join(region, left_on="n_regionkey", right_on="r_regionkey")
+        .join(supplier_nation, left_on="s_nationkey", right_on="supp_nationkey")
+        .filter(
+            nw.col("r_name") == var_2,
+            nw.col("p_type") == var_3,
+            nw.col("o_orderdate").is_between(var_4, var_5),
+        )
+        .with_columns(
+            o_year=nw.col("o_orderdate").dt.year(),
+            volume=nw.col("l_extendedprice") * (1 - nw.col("l_discount")),
+        )
+        .with_columns(
+            nation_volume=(nw.col("nation") == var_1).cast(nw.Float64())
+            * nw.col("volume")
+        )
+        .group_by("o_year")
+        .agg(nw.col("volume").sum(), nw.col("nation_volume").sum())
+        .select("o_year", mkt_share=nw.col("nation_volume") / nw.col("volume"))
+        .sort("o_year")
+    )
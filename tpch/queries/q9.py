@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import narwhals.stable.v1 as nw
+
+
+def query(
+    part: nw.LazyFrame,
+    partsupp: nw.LazyFrame,
+    nation: nw.LazyFrame,
+    lineitem: nw.LazyFrame,
+    orders: nw.LazyFrame,
+    supplier: nw.LazyFrame,
+) -> nw.LazyFrame:
+    var_1 = "green"
+
+    return (
+        part.join(partsupp, left_on="p_partkey", right_on="ps_partkey")
+        .join(supplier, left_on="ps_suppkey", right_on="s_suppkey")
+        .join(
+            lineitem,
+            left_on=["p_partkey", "ps_suppkey"],
+            right_on=["l_partkey", "l_suppkey"],
+        )
+        .join(orders, left_on="l_orderkey", right_on="o_orderkey")
+        .join(nation, left_on="s_nationkey", right_on="n_nationkey")
+        .filter(nw.col("p_name").str.contains(var_1))
+        .select(
+            nw.col("n_name").alias("nation"),
+            nw.col("o_orderdate").dt.year().alias("o_year"),
+            (
+                nw.col("l_extendedprice") * (1 - nw.col("l_discount"))
+                - nw.col("ps_supplycost") * nw.col("l_quantity")
+            ).alias("amount"),
+        )
+        .group_by("nation", "o_year")
+        .agg(nw.col("amount").sum().alias("sum_profit"))
+        .sort(by=["nation", "o_year"], descending=[False, True])
+    )
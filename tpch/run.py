@@ -0,0 +1,198 @@
+"""Run the TPC-H queries against each backend, and write the timings as JSON.
+
+Usage (from the root of the repository):
+
+    python -m tpch.run --scale-factor 1 --backends pandas "polars[lazy]" --output results.json
+
+Without `--scale-factor`, the small tables in `tests/data` are used. Otherwise,
+the tables are generated with DuckDB (once) into `tpch/data/sf<scale factor>`.
+
+Each query runs in a fresh process for each backend, so that peak memory usage
+can be attributed to it. For every (backend, query) pair, the output records:
+
+- `timings_s`: wall-clock times of each repetition. The query is run once
+  before these, so that one-off costs (such as lazy imports) aren't timed.
+- `peak_rss_bytes`: peak resident memory of the process, and
+  `query_peak_rss_bytes`: how much it grew while running the query (on top of
+  the memory needed to hold the input tables). `None` on Windows.
+- `narwhals_time_s`: time spent in Narwhals' own code (excluding the native
+  calls it makes), measured with `cProfile` in an extra repetition, together
+  with `profiled_time_s`, the total time of that repetition. Their ratio is the
+  overhead of using Narwhals instead of calling the backend directly.
+- `error`: if the query failed (e.g. because the backend doesn't support an
+  operation it uses), the exception, in which case there are no measurements.
+"""
+
+from __future__ import annotations
+
+import argparse
+import cProfile
+import inspect
+import json
+import multiprocessing
+import os
+import platform
+import pstats
+import statistics
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from importlib import import_module
+from importlib.util import find_spec
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+from typing import Callable
+
+import narwhals.stable.v1 as nw
+from tpch.data import BACKENDS
+from tpch.data import data_dir_for
+from tpch.data import read_table
+from tpch.queries import QUERIES
+
+NARWHALS_DIR = f"{Path(nw.__file__).parent.parent}{os.sep}"
+
+
+def execute(query: Callable[..., nw.LazyFrame], tables: dict[str, Any]) -> Any:
+    """Run `query` on native `tables`, and return the native result."""
+    frames = {name: nw.from_native(table).lazy() for name, table in tables.items()}
+    return nw.to_native(query(**frames).collect())
+
+
+def _peak_rss() -> int | None:
+    try:
+        import resource
+    except ImportError:  # pragma: no cover
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _narwhals_time(query: Callable[..., nw.LazyFrame], tables: dict[str, Any]) -> Any:
+    profile = cProfile.Profile()
+    profile.runcall(execute, query, tables)
+    stats = pstats.Stats(profile)
+    narwhals_time = sum(
+        own_time
+        for (filename, *_), (_, _, own_time, *_) in stats.stats.items()
+        if filename.startswith(NARWHALS_DIR)
+    )
+    return narwhals_time, stats.total_tt
+
+
+def benchmark(
+    backend: str, query_name: str, data_dir: Path, repeat: int
+) -> dict[str, Any]:
+    """Time `query_name` on `backend`. Meant to run in a fresh process."""
+    result: dict[str, Any] = {"backend": backend, "query": query_name}
+    query = QUERIES[query_name]
+    try:
+        tables = {
+            name: read_table(data_dir, name, backend)
+            for name in inspect.signature(query).parameters
+        }
+        loaded_rss = _peak_rss()
+        execute(query, tables)
+        timings = []
+        for _ in range(repeat):
+            start = perf_counter()
+            execute(query, tables)
+            timings.append(perf_counter() - start)
+        peak_rss = _peak_rss()
+        narwhals_time, profiled_time = _narwhals_time(query, tables)
+    except Exception:  # noqa: BLE001
+        result["error"] = traceback.format_exc(limit=-1).strip()
+        return result
+    return {
+        **result,
+        "timings_s": timings,
+        "min_s": min(timings),
+        "median_s": statistics.median(timings),
+        "peak_rss_bytes": peak_rss,
+        "query_peak_rss_bytes": (
+            None if peak_rss is None or loaded_rss is None else peak_rss - loaded_rss
+        ),
+        "narwhals_time_s": narwhals_time,
+        "profiled_time_s": profiled_time,
+        "error": None,
+    }
+
+
+def _versions(backends: list[str]) -> dict[str, str]:
+    modules = {"narwhals", *(BACKENDS[backend][0].split(".")[0] for backend in backends)}
+    return {
+        "python": platform.python_version(),
+        **{module: import_module(module).__version__ for module in sorted(modules)},
+    }
+
+
+def run(
+    backends: list[str],
+    queries: list[str],
+    *,
+    scale_factor: float | None,
+    repeat: int,
+) -> dict[str, Any]:
+    data_dir = data_dir_for(scale_factor)
+    results = []
+    context = multiprocessing.get_context("spawn")
+    for backend in backends:
+        for query_name in queries:
+            with ProcessPoolExecutor(1, mp_context=context) as executor:
+                result = executor.submit(
+                    benchmark, backend, query_name, data_dir, repeat
+                ).result()
+            status = result["error"] or f"{result['min_s']:.4f}s"
+            print(f"{backend:>16} {query_name:>3}: {status.splitlines()[-1]}")  # noqa: T201
+            results.append(result)
+    return {
+        "scale_factor": scale_factor,
+        "data_dir": str(data_dir),
+        "repeat": repeat,
+        "versions": _versions(backends),
+        "results": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        choices=list(BACKENDS),
+        help="Backends to run (default: all installed ones).",
+    )
+    parser.add_argument(
+        "--queries",
+        nargs="+",
+        choices=list(QUERIES),
+        default=list(QUERIES),
+        help="Queries to run (default: all).",
+    )
+    parser.add_argument(
+        "--scale-factor",
+        type=float,
+        help="TPC-H scale factor (default: use the small tables in tests/data).",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Timed repetitions of each query."
+    )
+    parser.add_argument(
+        "--output", type=Path, default=Path("tpch_results.json"), help="JSON file."
+    )
+    args = parser.parse_args(argv)
+
+    backends = args.backends or [
+        backend
+        for backend, (module, _) in BACKENDS.items()
+        if find_spec(module.split(".")[0]) is not None
+    ]
+    output = run(
+        backends, args.queries, scale_factor=args.scale_factor, repeat=args.repeat
+    )
+    args.output.write_text(json.dumps(output, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -121,7 +121,7 @@ documented = [
 if (
     missing := set(top_level_functions)
     .difference(documented)
-    .difference({"cat", "str", "dt"})
+    .difference({"cat", "str", "dt", "meta"})
 ):
     print("Expr: not documented")  # noqa: T201
     print(missing)  # noqa: T201
@@ -147,7 +147,7 @@ series = [
     if not i[0].isupper() and i[0] != "_"
 ]
 
-if missing := set(expr).difference(series).difference({"over"}):
+if missing := set(expr).difference(series).difference({"over", "meta", "deserialize"}):
     print("In expr but not in series")  # noqa: T201
     print(missing)  # noqa: T201
     ret = 1